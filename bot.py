@@ -135,6 +135,7 @@ EXTENSIONS: list[str] = [
         'cogs.quest',
         'cogs.reminders_custom',
         'cogs.reminders_lists',
+        'cogs.router',
         'cogs.settings',
         'cogs.slashboard',
         'cogs.sleepy_potion',
@@ -188,6 +189,15 @@ if __name__ == '__main__':
         logs.logger.error(error_message)
         sys.exit()
 
+    # Check if database connection profile is active
+    try:
+        if update_database.verify_connection_settings():
+            logs.logger.info('Database: Connection settings verified.')
+        else:
+            logs.logger.warning('Database: Connection settings differ from the .env file, see the warnings above.')
+    except sqlite3.Error as error:
+        logs.logger.error(f'Database: Got an error while trying to verify the connection settings: {error}')
+
     # Write startup time to database
     functions.await_coroutine(settings_db.update_setting('startup_time', utils.utcnow()))
 
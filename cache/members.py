@@ -0,0 +1,111 @@
+# members.py
+"""Contains the member name index. Index is kept up to date by cogs.cache.
+
+Guilds are indexed the first time a name is looked up in them, after that the member events keep the index current.
+Guilds that aren't chunked yet are not indexed, their members are scanned until the member list is complete.
+A guild that becomes available again (e.g. after a reconnect) is removed from the index and indexed again on the next
+lookup, because member events may have been missed in the meantime. Bots are not indexed.
+"""
+
+import discord
+
+from resources import functions
+
+
+_MEMBER_NAME_INDEX: dict[str, dict[int, set[int]]] = {} # Encoded name -> guild ID -> member IDs
+_INDEXED_MEMBER_NAMES: dict[int, dict[int, str]] = {} # Guild ID -> member ID -> encoded name
+
+
+async def _add_member(guild_id: int, member_id: int, name: str) -> None:
+    """Adds a member to the index of a guild. Replaces the old name if the member is already indexed."""
+    name = await functions.encode_text(name)
+    member_names: dict[int, str] = _INDEXED_MEMBER_NAMES[guild_id]
+    old_name: str | None = member_names.get(member_id, None)
+    if old_name == name: return
+    if old_name is not None: _remove_member(guild_id, member_id)
+    member_names[member_id] = name
+    _MEMBER_NAME_INDEX.setdefault(name, {}).setdefault(guild_id, set()).add(member_id)
+
+
+def _remove_member(guild_id: int, member_id: int) -> None:
+    """Removes a member from the index of a guild"""
+    name: str | None = _INDEXED_MEMBER_NAMES.get(guild_id, {}).pop(member_id, None)
+    if name is None: return
+    guild_member_ids: dict[int, set[int]] = _MEMBER_NAME_INDEX.get(name, {})
+    member_ids: set[int] = guild_member_ids.get(guild_id, set())
+    member_ids.discard(member_id)
+    if not member_ids: guild_member_ids.pop(guild_id, None)
+    if not guild_member_ids: _MEMBER_NAME_INDEX.pop(name, None)
+
+
+async def _scan_guild(guild: discord.Guild, name: str) -> set[int]:
+    """Returns the IDs of all members of a guild with the given encoded name without using the index"""
+    member_ids: set[int] = set()
+    member: discord.Member
+    for member in guild.members:
+        if not member.bot and await functions.encode_text(member.name) == name: member_ids.add(member.id)
+    return member_ids
+
+
+async def index_guild(guild: discord.Guild) -> None:
+    """Indexes all members of a guild. Replaces the existing index of that guild."""
+    remove_guild(guild.id)
+    _INDEXED_MEMBER_NAMES[guild.id] = {}
+    member: discord.Member
+    for member in guild.members:
+        if not member.bot: await _add_member(guild.id, member.id, member.name)
+
+
+def remove_guild(guild_id: int) -> None:
+    """Removes all members of a guild from the index"""
+    member_id: int
+    for member_id in list(_INDEXED_MEMBER_NAMES.get(guild_id, {}).keys()):
+        _remove_member(guild_id, member_id)
+    _INDEXED_MEMBER_NAMES.pop(guild_id, None)
+
+
+async def update_member(member: discord.Member) -> None:
+    """Adds a member to the index or updates their name. Does nothing if the guild isn't indexed yet."""
+    if member.guild.id not in _INDEXED_MEMBER_NAMES or member.bot: return
+    await _add_member(member.guild.id, member.id, member.name)
+
+
+async def update_user(user: discord.User) -> None:
+    """Updates the name of a user in all indexed guilds they are a member of"""
+    if user.bot: return
+    for guild_id, member_names in _INDEXED_MEMBER_NAMES.items():
+        if user.id in member_names: await _add_member(guild_id, user.id, user.name)
+
+
+def remove_member(member: discord.Member) -> None:
+    """Removes a member from the index"""
+    _remove_member(member.guild.id, member.id)
+
+
+async def get_member_ids(guild: discord.Guild, user_name: str) -> set[int]:
+    """Returns the IDs of all members of a guild with the given name. Indexes the guild if necessary.
+    Scans the members if the guild isn't chunked yet."""
+    user_name = await functions.encode_text(user_name)
+    if guild.id not in _INDEXED_MEMBER_NAMES:
+        if not guild.chunked: return await _scan_guild(guild, user_name)
+        await index_guild(guild)
+    return set(_MEMBER_NAME_INDEX.get(user_name, {}).get(guild.id, set()))
+
+
+async def get_member_ids_in_all_guilds(guilds: list[discord.Guild], user_name: str) -> dict[int, set[int]]:
+    """Returns the IDs of all members with the given name, grouped by guild ID. Indexes the guilds if necessary.
+    Scans the members of guilds that aren't chunked yet."""
+    user_name = await functions.encode_text(user_name)
+    guild_member_ids: dict[int, set[int]] = {}
+    guild: discord.Guild
+    for guild in guilds:
+        if guild.id in _INDEXED_MEMBER_NAMES: continue
+        if guild.chunked:
+            await index_guild(guild)
+            continue
+        member_ids: set[int] = await _scan_guild(guild, user_name)
+        if member_ids: guild_member_ids[guild.id] = member_ids
+    guild_member_ids.update(
+        {guild_id: set(member_ids) for guild_id, member_ids in _MEMBER_NAME_INDEX.get(user_name, {}).items()}
+    )
+    return guild_member_ids
@@ -3,22 +3,42 @@
 
 import asyncio
 from argparse import ArgumentError
+from collections import deque
 from datetime import timedelta
 import re
-from typing import Optional, Union
+from typing import NamedTuple, Optional, Union
 
 import discord
 from discord import utils
 
-from resources import functions, logs, settings
+from resources import functions, logs
+from resources import regex as regex_patterns
 
 
-_MESSAGE_CACHE = {}
+MESSAGES_PER_CHANNEL = 100
+FIND_MESSAGE_TIMEOUT = 0.5 # Seconds find_message waits for a matching message to arrive in a cached channel
+
+
+# Containers
+class CachedMessage(NamedTuple):
+    """Message in the message cache with the values find_message compares, normalized once when it is stored"""
+    author_id: int
+    author_name: str # Lowercased and encoded with functions.encode_text
+    content: str # Lowercased, EPIC RPG mention removed
+    message: discord.Message
+
+
+_MESSAGE_CACHE: dict[int, deque[CachedMessage]] = {} # Newest message first
+_AUTHOR_INDEX: dict[int, dict[int, deque[CachedMessage]]] = {} # Channel ID -> author ID -> messages, newest first
+_NEW_MESSAGE_EVENTS: dict[int, asyncio.Event] = {}
+
 
 async def find_message(channel_id: int, regex: Union[str, re.Pattern] = None,
                       user: Optional[discord.User | discord.Member] = None, user_name: Optional[str] = None) -> discord.Message:
-    """Looks through the last 50 messages in the channel history. If a message that matches regex is found, it returns
+    """Looks through the cached messages of a channel. If a message that matches regex is found, it returns
     the message. If user and/or user_name are defined, only messages from that user are returned.
+    If no message is found and the channel has cached messages, this waits up to FIND_MESSAGE_TIMEOUT seconds for a
+    matching message to be stored. Channels without cached messages return None right away.
 
     Arguments
     ---------
@@ -37,40 +57,70 @@ async def find_message(channel_id: int, regex: Union[str, re.Pattern] = None,
     ------
     ArgumentError if regex, user AND user_name are None.
     """
-    attempts = 1
-    while attempts <= 2:
-        if regex is None and user is None and user_name is None:
-            raise ArgumentError('At least one of these arguments has to be defined: regex, user, user_name.')
-        channel_messages = _MESSAGE_CACHE.get(channel_id, None)
-        if channel_messages is None: return None
-        for message in channel_messages:
-            if user is not None and message.author != user: continue
-            if (user_name is not None
-                and await functions.encode_text(user_name.lower()) != await functions.encode_text(message.author.name.lower())):
-                continue
-            if regex is None:
-                return message
-            else:
-                message_content = re.sub(rf'<@!?{settings.EPIC_RPG_ID}>', '', message.content.lower())
-                match = re.search(regex, message_content)
-                if match: return message
-        await asyncio.sleep(0.5)
-        logs.logger.info('Required a second attempt for getting a message from the message cache.')
-        attempts += 1
-    return None
-
-
-async def store_message(message: discord.Message) -> discord.Message:
-    """Adds a message to the message cache.
-    Also keeps the maximum amount of messages stored per channel at 100."""
-    channel_message_list = _MESSAGE_CACHE.get(message.channel.id, None)
-    if channel_message_list is None:
-        channel_message_list = [message,]
+    if regex is None and user is None and user_name is None:
+        raise ArgumentError('At least one of these arguments has to be defined: regex, user, user_name.')
+    if user_name is not None: user_name = await functions.encode_text(user_name.lower())
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + FIND_MESSAGE_TIMEOUT
+    waited = False
+    while True:
+        if user is not None:
+            channel_messages = _AUTHOR_INDEX.get(channel_id, {}).get(user.id, ())
+        else:
+            channel_messages = _MESSAGE_CACHE.get(channel_id, ())
+        for cached_message in channel_messages:
+            if user_name is not None and user_name != cached_message.author_name: continue
+            if regex is None or re.search(regex, cached_message.content):
+                return cached_message.message
+        # Channels without cached messages are channels Navi doesn't see commands in, so waiting is pointless there
+        if channel_id not in _MESSAGE_CACHE: return None
+        time_left = deadline - loop.time()
+        if time_left <= 0: return None
+        if not waited:
+            logs.logger.info('Required waiting for a message to arrive in the message cache.')
+            waited = True
+        event = _NEW_MESSAGE_EVENTS.get(channel_id, None)
+        if event is None:
+            event = _NEW_MESSAGE_EVENTS[channel_id] = asyncio.Event()
+        try:
+            await asyncio.wait_for(event.wait(), time_left)
+        except asyncio.TimeoutError:
+            return None
+
+
+async def store_message(message: discord.Message) -> None:
+    """Adds a message to the message cache and wakes up find_message calls that wait for a message in this channel.
+    Also keeps the maximum amount of messages stored per channel at MESSAGES_PER_CHANNEL."""
+    cached_message = CachedMessage(
+        author_id = message.author.id,
+        author_name = await functions.encode_text(message.author.name.lower()),
+        content = regex_patterns.EPIC_RPG_MENTION.sub('', message.content.lower()),
+        message = message,
+    )
+    channel_messages = _MESSAGE_CACHE.get(message.channel.id, None)
+    if channel_messages is None:
+        channel_messages = _MESSAGE_CACHE[message.channel.id] = deque(maxlen=MESSAGES_PER_CHANNEL)
+    author_index = _AUTHOR_INDEX.setdefault(message.channel.id, {})
+    if len(channel_messages) == MESSAGES_PER_CHANNEL:
+        _remove_from_author_index(author_index, channel_messages.pop())
+    channel_messages.appendleft(cached_message)
+    author_messages = author_index.get(cached_message.author_id, None)
+    if author_messages is None:
+        author_messages = author_index[cached_message.author_id] = deque()
+    author_messages.appendleft(cached_message)
+    event = _NEW_MESSAGE_EVENTS.pop(message.channel.id, None)
+    if event is not None: event.set()
+
+
+def _remove_from_author_index(author_index: dict[int, deque[CachedMessage]], cached_message: CachedMessage) -> None:
+    """Removes the oldest message of an author from the author index of a channel"""
+    author_messages = author_index.get(cached_message.author_id, None)
+    if not author_messages: return
+    if author_messages[-1] is cached_message:
+        author_messages.pop()
     else:
-        channel_message_list.insert(0, message)
-    if len(channel_message_list) > 100:
-        channel_message_list = channel_message_list[:100]
-    _MESSAGE_CACHE[message.channel.id] = channel_message_list
+        author_messages.remove(cached_message)
+    if not author_messages: del author_index[cached_message.author_id]
 
 
 async def delete_old_messages(timespan: timedelta) -> int:
@@ -80,15 +130,24 @@ async def delete_old_messages(timespan: timedelta) -> int:
     -------
     Amount of messages deleted: int
     """
-    current_time = utils.utcnow()
+    cutoff_time = utils.utcnow() - timespan
     message_count = 0
-    for channel_id, channel_messages in _MESSAGE_CACHE.items():
-        for message in channel_messages:
-            message_time = message.edited_at if message.edited_at else message.created_at
-            if message_time < (current_time - timespan):
-                _MESSAGE_CACHE[channel_id].remove(message)
-                message_count += 1
-    if message_count > 0:
-        for key in list(_MESSAGE_CACHE.keys()):
-            if not _MESSAGE_CACHE[key]: del _MESSAGE_CACHE[key]
-    return message_count
\ No newline at end of file
+    for channel_id in list(_MESSAGE_CACHE.keys()):
+        channel_messages = _MESSAGE_CACHE[channel_id]
+        kept_messages = deque(
+            (cached_message for cached_message in channel_messages
+             if (cached_message.message.edited_at or cached_message.message.created_at) >= cutoff_time),
+            maxlen=MESSAGES_PER_CHANNEL
+        )
+        if len(kept_messages) == len(channel_messages): continue
+        message_count += len(channel_messages) - len(kept_messages)
+        if not kept_messages:
+            del _MESSAGE_CACHE[channel_id]
+            del _AUTHOR_INDEX[channel_id]
+            continue
+        author_index: dict[int, deque[CachedMessage]] = {}
+        for cached_message in kept_messages:
+            author_index.setdefault(cached_message.author_id, deque()).append(cached_message)
+        _MESSAGE_CACHE[channel_id] = kept_messages
+        _AUTHOR_INDEX[channel_id] = author_index
+    return message_count
@@ -10,37 +10,41 @@ from discord import utils
 
 from cache import messages
 from database import errors, reminders, tracking, users
-from resources import emojis, exceptions, functions, regex, settings, strings
+from resources import emojis, exceptions, functions, regex, router, strings
+
+
+TRIGGERS = {
+    'adventure_cooldown': (
+        'you have already been on an adventure', #English
+        'ya has estado en una aventura', #Spanish
+        'você já esteve em uma aventura', #Portuguese
+    ),
+    'adventure_adventure': (
+        'found a', #English
+        'encontr', #Spanish, Portuguese
+    ),
+}
+
+ADVENTURE_HARDMODE_STRINGS = (
+    '(but stronger)', #English
+    '(pero más fuerte)', #Spanish
+    '(só que mais forte)', #Portuguese
+)
 
 
 class AdventureCog(commands.Cog):
     """Cog that contains the adventure detection commands"""
     def __init__(self, bot: bridge.AutoShardedBot):
         self.bot = bot
+        router.register_message_handler(self.qualified_name, self.on_message, triggers=TRIGGERS)
 
-    @commands.Cog.listener()
-    async def on_message_edit(self, message_before: discord.Message, message_after: discord.Message) -> None:
-        """Runs when a message is edited in a channel."""
-        if message_after.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-        if message_before.pinned != message_after.pinned: return
-        embed_data_before = await functions.parse_embed(message_before)
-        embed_data_after = await functions.parse_embed(message_after)
-        if (message_before.content == message_after.content and embed_data_before == embed_data_after
-            and message_before.components == message_after.components): return
-        row: discord.Component
-        for row in message_after.components:
-            if isinstance(row, discord.ActionRow):
-                for component in row.children:
-                    if isinstance(component, (discord.Button, discord.SelectMenu)):
-                        if component.disabled:
-                            return
-        await self.on_message(message_after)
+    def cog_unload(self) -> None:
+        """Removes the message handlers of this cog from the router."""
+        router.unregister_message_handler(self.qualified_name)
 
-    @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
-        """Runs when a message is sent in a channel."""
-        if message.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-
+        """Runs when EPIC RPG sends or edits a message. Called by the message router."""
+        parsed_message: router.ParsedMessage = router.get_parsed_message(message)
         if message.embeds:
             embed: discord.Embed = message.embeds[0]
             message_author = message_title = icon_url = ''
@@ -50,12 +54,7 @@ class AdventureCog(commands.Cog):
             if embed.title is not None: message_title = str(embed.title)
 
             # Adventure cooldown
-            search_strings: list[str] = [
-                'you have already been on an adventure', #English
-                'ya has estado en una aventura', #Spanish
-                'você já esteve em uma aventura', #Portuguese
-            ]
-            if any(search_string in message_title.lower() for search_string in search_strings):
+            if parsed_message.matches('adventure_cooldown', 'title'):
                 user_id = user_name = user_command = user_command_message = None
                 user = await functions.get_interaction_user(message)
                 slash_command: bool = True if user is not None else False
@@ -123,30 +122,18 @@ class AdventureCog(commands.Cog):
                     message_content = f'{message_content}\n{line}'
             message_content = message_content.strip()
             # Adventure
-            search_strings = [
-                'found a', #English
-                'encontr', #Spanish, Portuguese
-            ]
-            if (any(search_string in message_content.lower() for search_string in search_strings)
+            if (parsed_message.matches('adventure_adventure', 'content')
                 and (
                     any(f'> {monster.lower()}' in message_content.lower() for monster in strings.MONSTERS_ADVENTURE)
                     or any(f'{monster.lower()}' in message_content.lower() for monster in strings.MONSTERS_ADVENTURE_TOP)
                 )
             ):
                 user = await functions.get_interaction_user(message)
-                search_strings_hardmode = [
-                    '(but stronger)', #English
-                    '(pero más fuerte)', #Spanish
-                    '(só que mais forte)', #Portuguese
-                ]
                 last_adventure_mode = user_command_message = None
                 slash_command = True if user is not None else False
                 if user is None:
-                    search_patterns = [
-                        r"^\*\*(.+?)\*\* found a", #English
-                        r"^\*\*(.+?)\*\* encontr", #Spanish, Portuguese
-                    ]
-                    user_name_match = await functions.get_match_from_patterns(search_patterns, message_content)
+                    user_name_match = await functions.get_match_from_patterns(regex.PATTERNS_ADVENTURE_USER_NAME,
+                                                                              message_content)
                     if user_name_match:
                         user_name = user_name_match.group(1)
                         user_command_message = (
@@ -163,7 +150,7 @@ class AdventureCog(commands.Cog):
                     return
                 if not user_settings.bot_enabled: return
                 user_command = await functions.get_slash_command(user_settings, 'adventure')
-                if any(search_string in message_content.lower() for search_string in search_strings_hardmode):
+                if any(search_string in message_content.lower() for search_string in ADVENTURE_HARDMODE_STRINGS):
                     last_adventure_mode = 'hardmode'
                     if user_settings.slash_mentions_enabled:
                         user_command = f"{user_command} `mode: {last_adventure_mode}`"
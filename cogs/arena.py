@@ -8,36 +8,31 @@ from discord.ext import bridge, commands
 
 from cache import messages
 from database import errors, reminders, users
-from resources import exceptions, functions, regex, settings
+from resources import exceptions, functions, regex, router
+
+
+TRIGGERS = {
+    'arena_cooldown': (
+        'you have started an arena recently', #English
+        'empezaste una arena recientemente', #Spanish
+        'você recentemente iniciou uma arena', #Portuguese
+    ),
+}
 
 
 class ArenaCog(commands.Cog):
     """Cog that contains the arena detection commands"""
     def __init__(self, bot: bridge.AutoShardedBot):
         self.bot = bot
+        router.register_message_handler(self.qualified_name, self.on_message, triggers=TRIGGERS)
 
-    @commands.Cog.listener()
-    async def on_message_edit(self, message_before: discord.Message, message_after: discord.Message) -> None:
-        """Runs when a message is edited in a channel."""
-        if message_after.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-        if message_before.pinned != message_after.pinned: return
-        embed_data_before = await functions.parse_embed(message_before)
-        embed_data_after = await functions.parse_embed(message_after)
-        if (message_before.content == message_after.content and embed_data_before == embed_data_after
-            and message_before.components == message_after.components): return
-        row: discord.Component
-        for row in message_after.components:
-            if isinstance(row, discord.ActionRow):
-                for component in row.children:
-                    if isinstance(component, (discord.Button, discord.SelectMenu)):
-                        if component.disabled:
-                            return
-        await self.on_message(message_after)
+    def cog_unload(self) -> None:
+        """Removes the message handlers of this cog from the router."""
+        router.unregister_message_handler(self.qualified_name)
 
-    @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
-        """Runs when a message is sent in a channel."""
-        if message.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
+        """Runs when EPIC RPG sends or edits a message. Called by the message router."""
+        parsed_message: router.ParsedMessage = router.get_parsed_message(message)
         if not message.embeds: return
         embed: discord.Embed = message.embeds[0]
         message_author = message_title = icon_url = ''
@@ -47,12 +42,7 @@ class ArenaCog(commands.Cog):
         if embed.title is not None: message_title = str(embed.title)
 
         # Arena cooldown
-        search_strings = [
-            'you have started an arena recently', #English
-            'empezaste una arena recientemente', #Spanish
-            'você recentemente iniciou uma arena', #Portuguese
-        ]
-        if any(search_string in message_title.lower() for search_string in search_strings):
+        if parsed_message.matches('arena_cooldown', 'title'):
             user_id = user_name = user_command_message = None
             embed_users = []
             interaction_user = await functions.get_interaction_user(message)
@@ -7,56 +7,44 @@ from discord.ext import bridge, commands
 
 from cache import messages
 from database import errors, users
-from resources import emojis, exceptions, functions, regex, settings
+from resources import emojis, exceptions, functions, regex, router
+
+
+TRIGGERS = {
+    'artifacts_overview': (
+        'you can find parts of the artifacts across', #English
+        'puedes encontrar partes de los artefactos en muchos', #Spanish
+        'você pode encontrar partes dos artefatos em muitos', #Portuguese
+    ),
+}
 
 
 class ArtifactsCog(commands.Cog):
     """Cog that contains the artifacts detection commands"""
     def __init__(self, bot: bridge.AutoShardedBot):
         self.bot = bot
+        router.register_message_handler(self.qualified_name, self.on_message, triggers=TRIGGERS)
 
-    @commands.Cog.listener()
-    async def on_message_edit(self, message_before: discord.Message, message_after: discord.Message) -> None:
-        """Runs when a message is edited in a channel."""
-        if message_after.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-        if message_before.pinned != message_after.pinned: return
-        embed_data_before = await functions.parse_embed(message_before)
-        embed_data_after = await functions.parse_embed(message_after)
-        if (message_before.content == message_after.content and embed_data_before == embed_data_after
-            and message_before.components == message_after.components): return
-        row: discord.Component
-        for row in message_after.components:
-            if isinstance(row, discord.ActionRow):
-                for component in row.children:
-                    if isinstance(component, (discord.Button, discord.SelectMenu)):
-                        if component.disabled:
-                            return
-        await self.on_message(message_after)
+    def cog_unload(self) -> None:
+        """Removes the message handlers of this cog from the router."""
+        router.unregister_message_handler(self.qualified_name)
 
-    @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
-        """Runs when a message is sent in a channel."""
-        if message.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-
+        """Runs when EPIC RPG sends or edits a message. Called by the message router."""
+        parsed_message: router.ParsedMessage = router.get_parsed_message(message)
         if message.embeds:
             embed: discord.Embed = message.embeds[0]
-            embed_author = embed_title = icon_url = embed_description = ''
+            embed_author = embed_title = icon_url = ''
             if embed.author is not None:
                 embed_author = str(embed.author.name)
                 icon_url = embed.author.icon_url
             if embed.title is not None: embed_title = str(embed.title)
-            if embed.description is not None: embed_description = str(embed.description)
             embed_fields = ''
             for field in embed.fields:
                 embed_fields = f'{embed_fields}\n{field.value}'
 
             # Artifacts overview
-            search_strings = [
-                'you can find parts of the artifacts across', #English
-                'puedes encontrar partes de los artefactos en muchos', #Spanish
-                'você pode encontrar partes dos artefatos em muitos', #Portuguese
-            ]
-            if (any(search_string in embed_description.lower() for search_string in search_strings)):
+            if parsed_message.matches('artifacts_overview', 'description'):
                 user_id = user_name = user_command_message = None
                 user = await functions.get_interaction_user(message)
                 if user is None:
@@ -101,12 +89,9 @@ class ArtifactsCog(commands.Cog):
                             pass
                 pocket_watch_active_match = re.search(r'✅ \| <:pocketwatch', embed_fields.lower())
                 if pocket_watch_active_match:
-                    search_patterns = [
-                        r'adds a cooldown reduction of ([0-9\.]+)% and doubles', #English
-                        r'adds a cooldown reduction of ([0-9\.]+)% and doubles', #TODO: Spanish
-                        r'adds a cooldown reduction of ([0-9\.]+)% and doubles', #TODO: Portuguese
-                    ]
-                    pocket_watch_cooldown_match = await functions.get_match_from_patterns(search_patterns, embed_fields)
+                    pocket_watch_cooldown_match = (
+                        await functions.get_match_from_patterns(regex.PATTERNS_ARTIFACTS_POCKET_WATCH, embed_fields)
+                    )
                     pocket_watch_cooldown = float(pocket_watch_cooldown_match.group(1))
                     await user_settings.update(user_pocket_watch_multiplier=(100 - pocket_watch_cooldown) / 100)
                     if user_settings.partner_id is not None:
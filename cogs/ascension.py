@@ -7,37 +7,46 @@ from discord.ext import bridge, commands
 
 from cache import messages
 from database import errors, users
-from resources import emojis, exceptions, functions, regex, settings
+from resources import emojis, exceptions, functions, regex, router
+
+
+TRIGGERS = {
+    'ascension_professions': (
+        "— professions", #All languages
+    ),
+    'ascension_professions_footer': (
+        'level 100', #Not ascended, English
+        'nivel 100', #Not ascended, Spanish
+        'nível 100', #Not ascended, Portuguese
+        'unlocked!', #Ascended, English
+        'desbloqueada!', #Ascended, Spanish, Portuguese
+    ),
+    'ascension_skill_unlocked': (
+        "unlocked the ascended skill", #English
+    ),
+    'ascension_ready': (
+        "— ready", #All languages, ready
+        "— cooldowns", #All languages, cooldowns
+    ),
+    'ascension_ready_lock': (
+        ":lock:", #All languages
+    ),
+}
 
 
 class AscensionCog(commands.Cog):
     """Cog that contains all commands related to the ruby counter"""
     def __init__(self, bot: bridge.AutoShardedBot):
         self.bot = bot
+        router.register_message_handler(self.qualified_name, self.on_message, triggers=TRIGGERS)
 
-    @commands.Cog.listener()
-    async def on_message_edit(self, message_before: discord.Message, message_after: discord.Message) -> None:
-        """Runs when a message is edited in a channel."""
-        if message_after.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-        if message_before.pinned != message_after.pinned: return
-        embed_data_before = await functions.parse_embed(message_before)
-        embed_data_after = await functions.parse_embed(message_after)
-        if (message_before.content == message_after.content and embed_data_before == embed_data_after
-            and message_before.components == message_after.components): return
-        row: discord.Component
-        for row in message_after.components:
-            if isinstance(row, discord.ActionRow):
-                for component in row.children:
-                    if isinstance(component, (discord.Button, discord.SelectMenu)):
-                        if component.disabled:
-                            return
-        await self.on_message(message_after)
+    def cog_unload(self) -> None:
+        """Removes the message handlers of this cog from the router."""
+        router.unregister_message_handler(self.qualified_name)
 
-    @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
-        """Runs when a message is sent in a channel."""
-        if message.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-
+        """Runs when EPIC RPG sends or edits a message. Called by the message router."""
+        parsed_message: router.ParsedMessage = router.get_parsed_message(message)
         if message.embeds:
             embed: discord.Embed = message.embeds[0]
             embed_description = embed_author = embed_footer = embed_field_names = embed_field_values = ''
@@ -52,18 +61,8 @@ class AscensionCog(commands.Cog):
                 icon_url = embed.author.icon_url
 
             # Set ascension from profession overview
-            search_strings = [
-                "— professions", #All languages
-            ]
-            search_strings_footer = [
-                'level 100', #Not ascended, English
-                'nivel 100', #Not ascended, Spanish
-                'nível 100', #Not ascended, Portuguese
-                'unlocked!', #Ascended, English
-                'desbloqueada!', #Ascended, Spanish, Portuguese
-            ]
-            if (any(search_string in embed_author.lower() for search_string in search_strings)
-                and any(search_string in embed_footer.lower() for search_string in search_strings_footer)):
+            if (parsed_message.matches('ascension_professions', 'author')
+                and parsed_message.matches('ascension_professions_footer', 'footer')):
                 user = await functions.get_interaction_user(message)
                 if user is None:
                     user_id_match = re.search(regex.USER_ID_FROM_ICON_URL, icon_url)
@@ -92,10 +91,8 @@ class AscensionCog(commands.Cog):
                     await user_settings.update(ascended=ascended)
                     if user_settings.reactions_enabled: await message.add_reaction(emojis.NAVI)
 
-            search_strings = [
-                "unlocked the ascended skill", #English
-            ]
-            if any(search_string in embed_field_names.lower() for search_string in search_strings):
+            if any(search_string in embed_field_names.lower()
+                   for search_string in TRIGGERS['ascension_skill_unlocked']):
                 user = await functions.get_interaction_user(message)
                 if user is None:
                     user_name_match = re.search(r'\*\*(.+?)\*\*', embed_field_names)
@@ -118,15 +115,9 @@ class AscensionCog(commands.Cog):
                 await user_settings.update(ascended=True)
                 if user_settings.reactions_enabled: await message.add_reaction(emojis.NAVI)
 
-            search_strings = [
-                "— ready", #All languages, ready
-                "— cooldowns", #All languages, cooldowns
-            ]
-            search_strings_field = [
-                ":lock:", #All languages
-            ]
-            if (any(search_string in embed_author.lower() for search_string in search_strings)
-                and any(search_string in embed_field_names.lower() for search_string in search_strings_field)):
+            if (parsed_message.matches('ascension_ready', 'author')
+                and any(search_string in embed_field_names.lower()
+                        for search_string in TRIGGERS['ascension_ready_lock'])):
                 user_id = user_name = user_command_message = None
                 embed_users = []
                 interaction_user = await functions.get_interaction_user(message)
@@ -9,9 +9,136 @@ from discord.ext import bridge, commands
 
 from cache import messages
 from database import errors, guilds, users
-from resources import emojis, exceptions, functions, regex, settings, strings
+from resources import emojis, exceptions, functions, regex, router, settings, strings
 
 
+TRIGGERS = {
+    'auto_flex_lootbox': (
+        "— lootbox", #All languages
+    ),
+    'auto_flex_ascension': (
+        "unlocked the ascended skill", #English
+    ),
+    'auto_flex_pet_catch': (
+        "**dog** is now following", #English, dog
+        "**cat** is now following", #English, cat
+        "**dragon** is now following", #English, dragon
+    ),
+    'auto_flex_pet_adventure': (
+        'pet adventure rewards', #English 1
+        'reward summary', #English 2
+        'recompensas de pet adventure', #Spanish, Portuguese 1
+        'resumen de recompensas', #Spanish 2
+        'resumo de recompensas', #Portuguese 2
+    ),
+    'auto_flex_coinflip': (
+        "where is the coin?", #English
+    ),
+    'auto_flex_time_travel_count': (
+        "— time travel", #All languages
+        "— super time travel", #All languages
+        "— time jump", #All languages
+    ),
+    'auto_flex_time_travel': (
+        "has traveled in time", #English
+        'viajou no tempo', #Spanish
+        'tempo de viagem', #Portuguese
+    ),
+    'auto_flex_xmas_loot_embed': (
+        'godly present', #All languages, godly present
+        'void present', #All languages, void present
+        'epic snowball', #All languages, epic snowball
+    ),
+    'auto_flex_xmas_present_ultraining': (
+        'godly present', #All languages, godly present
+        'void present', #All languages, void present
+    ),
+    'auto_flex_xmas_snowball_fight': (
+        'epic snowball', #All languages
+    ),
+    'auto_flex_card_slots': (
+        "— card slots", #All languages
+    ),
+    'auto_flex_artifact_crafted': (
+        '** successfully crafted!', #English
+    ),
+    'auto_flex_work_loot': (
+        'this may be the luckiest moment of your life', #English, ultimate logs
+        'is this a **dream**????', #English, ultra logs
+        'oooooofff!!', #English, super fish
+        'wwwooooooaaa!!!1', #English, hyper logs
+        '**epic berry**', #English, epic berries
+        '**walking normie fish**', #English, walking normie fish
+    ),
+    'auto_flex_work_watermelon': (
+        'watermelon', #English, watermelon
+    ),
+    'auto_flex_xmas_loot': (
+        'godly present', #All languages, godly present
+        'void present', #All languages, void present
+        'eternal present', #All languages, eternal present
+        'epic snowball', #All languages, void present
+    ),
+    'auto_flex_xmas_chimney': (
+        'stuck in the chimney...', #English
+        'atascó en la chimenea...', #Spanish
+        'atascó en la chimenea...', #TODO: Portuguese
+    ),
+    'auto_flex_forge_cookie': (
+        'bunch of cookies against the godly sword and then leaves it', #English
+    ),
+    'auto_flex_hunt_adventure_loot': (
+        'found a', #English
+        'found the', #English
+        'encontr', #Spanish, Portuguese
+    ),
+    'auto_flex_event_lb': (
+        'your lootbox has evolved', #English
+    ),
+    'auto_flex_event_enchant': (
+        'your sword got an ultra-edgy enchantment', #English sword
+        'your armor got an ultra-edgy enchantment', #English armor
+    ),
+    'auto_flex_event_farm': (
+        'the seed surrendered', #English
+    ),
+    'auto_flex_event_heal': (
+        'killed the mysterious man', #English
+    ),
+    'auto_flex_event_training': (
+        'wings spawned', #English
+    ),
+    'auto_flex_time_capsule': (
+        "a portal was opened", #English
+        "se abrió un portal", #Spanish
+        "um portal foi aberto", #Portuguese
+    ),
+    'auto_flex_eternity_unsealed': (
+        "unsealed **the eternity**", #English
+        "unsealed **the eternity**", #TODO: Spanish
+        "unsealed **the eternity**", #TODO: Portuguese
+    ),
+    'auto_flex_hal_loot': (
+        'sleepy potion', #English potion
+        'suspicious broom', #English broom
+    ),
+    'auto_flex_brew_electronical': (
+        '**electronical potion**, you\'ve received the following boosts', #English
+        '**electronical potion**, has recibido los siguientes boosts', #Spanish
+        '**electronical potion**, recebeu os seguintes boosts', #Portuguese
+    ),
+    'auto_flex_card_drop': (
+        'epic card',
+        'omega card',
+        'godly card',
+        'void card',
+        'eternal card',
+    ),
+    'auto_flex_card_golden': (
+        'goldened these cards!',
+    ),
+}
+
 FLEX_TITLES = {
     'artifacts': strings.FLEX_TITLES_ARTIFACTS,
     'artifacts_bunny_mask': strings.FLEX_TITLES_ARTIFACTS,
@@ -390,6 +517,11 @@ class AutoFlexCog(commands.Cog):
     """Cog that contains the auto flex detection"""
     def __init__(self, bot: bridge.AutoShardedBot):
         self.bot = bot
+        router.register_message_handler(self.qualified_name, self.on_message, triggers=TRIGGERS)
+
+    def cog_unload(self) -> None:
+        """Removes the message handlers of this cog from the router."""
+        router.unregister_message_handler(self.qualified_name)
 
     async def send_auto_flex_message(self, message: discord.Message, guild_settings: guilds.Guild,
                                      user_settings: users.User, user: discord.User, event: str,
@@ -444,35 +576,9 @@ class AutoFlexCog(commands.Cog):
             )
             await user_settings.update(auto_flex_tip_read=True)
 
-    @commands.Cog.listener()
-    async def on_message_edit(self, message_before: discord.Message, message_after: discord.Message) -> None:
-        """Runs when a message is edited in a channel."""
-        if message_before.pinned != message_after.pinned: return
-        allow_disabled_components = False
-        embed_data_before = await functions.parse_embed(message_before)
-        embed_data_after = await functions.parse_embed(message_after)
-        if (message_before.content == message_after.content and embed_data_before == embed_data_after
-            and message_before.components == message_after.components): return
-        """
-        if message_after.embeds:
-            if message_after.embeds[0].author is not None:
-                if 'card hand' in message_after.embeds[0].author.name.lower():
-                    allow_disabled_components = True
-        """
-        if not allow_disabled_components:
-            row: discord.Component
-            for row in message_after.components:
-                if isinstance(row, discord.ActionRow):
-                    for component in row.children:
-                        if isinstance(component, (discord.Button, discord.SelectMenu)):
-                            if component.disabled:
-                                return
-        await self.on_message(message_after)
-
-    @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
-        """Runs when a message is sent in a channel."""
-        if message.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
+        """Runs when EPIC RPG sends or edits a message. Called by the message router."""
+        parsed_message: router.ParsedMessage = router.get_parsed_message(message)
         if message.embeds:
             embed: discord.Embed = message.embeds[0]
             embed_description = embed_title = embed_field0_name = embed_field0_value = embed_autor = icon_url = ''
@@ -492,10 +598,7 @@ class AutoFlexCog(commands.Cog):
                 icon_url = embed.author.icon_url
 
             # Rare loot from lootboxes
-            search_strings = [
-                "— lootbox", #All languages
-            ]
-            if any(search_string in embed_autor.lower() for search_string in search_strings):
+            if parsed_message.matches('auto_flex_lootbox', 'author'):
                 if 'edgy lootbox' in embed_field0_name.lower() and '<:ultralog' in embed_field0_value.lower():
                     event = 'lb_edgy_ultra'
                 elif 'omega lootbox' in embed_field0_name.lower() and '<:ultralog' in embed_field0_value.lower():
@@ -612,10 +715,7 @@ class AutoFlexCog(commands.Cog):
                 await self.send_auto_flex_message(message, guild_settings, user_settings, user, event, description)
 
             # Ascension
-            search_strings = [
-                "unlocked the ascended skill", #English
-            ]
-            if any(search_string in embed_field0_name.lower() for search_string in search_strings):
+            if parsed_message.matches('auto_flex_ascension', 'field0_name'):
                 guild_settings: guilds.Guild = await guilds.get_guild(message.guild.id)
                 if not guild_settings.auto_flex_enabled: return
                 user = await functions.get_interaction_user(message)
@@ -645,20 +745,13 @@ class AutoFlexCog(commands.Cog):
                 await self.send_auto_flex_message(message, guild_settings, user_settings, user, 'pr_ascension', description)
 
             # Pets catch
-            search_strings = [
-                "**dog** is now following", #English, dog
-                "**cat** is now following", #English, cat
-                "**dragon** is now following", #English, dragon
-            ]
-            if (any(search_string in embed_field0_value.lower() for search_string in search_strings)
+            if (parsed_message.matches('auto_flex_pet_catch', 'field0_value')
                 and ('epic**' in embed_field0_value.lower() or 'time traveler**' in embed_field0_value.lower())):
                 guild_settings: guilds.Guild = await guilds.get_guild(message.guild.id)
                 if not guild_settings.auto_flex_enabled: return
                 user = await functions.get_interaction_user(message)
-                search_patterns = [
-                    r'\*\*(\w+?)\*\* is now following \*\*(.+?)\*\*!', #English
-                ]
-                pet_data_match = await functions.get_match_from_patterns(search_patterns, embed_field0_value)
+                pet_data_match = await functions.get_match_from_patterns(regex.PATTERNS_AUTO_FLEX_PET_CATCH,
+                                                                         embed_field0_value)
                 if not pet_data_match:
                     await functions.add_warning_reaction(message)
                     await errors.log_error('Pet type or user name not found in auto flex pets catch message.',
@@ -699,18 +792,11 @@ class AutoFlexCog(commands.Cog):
                 await self.send_auto_flex_message(message, guild_settings, user_settings, user, event, description)
 
             # Pet adventure rewards
-            search_strings = [
-                'pet adventure rewards', #English 1
-                'reward summary', #English 2
-                'recompensas de pet adventure', #Spanish, Portuguese 1
-                'resumen de recompensas', #Spanish 2
-                'resumo de recompensas', #Portuguese 2
-            ]
             search_strings_items = [
                 'omega lootbox',
                 'time capsule',
             ]
-            if (any(search_string in embed_title.lower() for search_string in search_strings)
+            if (parsed_message.matches('auto_flex_pet_adventure', 'title')
                 and (
                     any(search_string in embed_fields.lower() for search_string in search_strings_items)
                     or any(search_string in embed_description.lower() for search_string in search_strings_items)
@@ -759,10 +845,7 @@ class AutoFlexCog(commands.Cog):
                                                   description)
 
             # Coinflip event
-            search_strings = [
-                "where is the coin?", #English
-            ]
-            if any(search_string in embed_description.lower() for search_string in search_strings):
+            if parsed_message.matches('auto_flex_coinflip', 'description'):
                 guild_settings: guilds.Guild = await guilds.get_guild(message.guild.id)
                 if not guild_settings.auto_flex_enabled: return
                 user = await functions.get_interaction_user(message)
@@ -798,12 +881,7 @@ class AutoFlexCog(commands.Cog):
                                                   description)
 
             # Update time travel count from time travel message
-            search_strings = [
-                "— time travel", #All languages
-                "— super time travel", #All languages
-                "— time jump", #All languages
-            ]
-            if any(search_string in embed_autor.lower() for search_string in search_strings):
+            if parsed_message.matches('auto_flex_time_travel_count', 'author'):
                 guild_settings: guilds.Guild = await guilds.get_guild(message.guild.id)
                 if not guild_settings.auto_flex_enabled: return
                 user = await functions.get_interaction_user(message)
@@ -829,11 +907,8 @@ class AutoFlexCog(commands.Cog):
                 except exceptions.FirstTimeUserError:
                     return
                 if not user_settings.bot_enabled or not user_settings.auto_flex_enabled: return
-                search_patterns = [
-                    'this will be your time travel #(.+?)\n', #English
-                    'esta será sua viagem no tempo #(.+?)$', #Spanish, Portuguese
-                ]
-                tt_match = await functions.get_match_from_patterns(search_patterns, embed_description)
+                tt_match = await functions.get_match_from_patterns(regex.PATTERNS_AUTO_FLEX_TIME_TRAVEL,
+                                                                   embed_description)
                 if tt_match:
                     time_travel_count = int(tt_match.group(1)) - 1
                 if not tt_match:
@@ -846,15 +921,8 @@ class AutoFlexCog(commands.Cog):
                         next_tt = True
                     else:
                         next_tt = False
-                    search_patterns = [
-                        r'time travels\*\*: (.+?)\n', #English
-                        r'extra pet slots\*\*: (.+?)\n', #English
-                        r'viajes en el tiempo\*\*: (.+?)\n', #Spanish
-                        r'espacio adicional para mascotas\*\*: (.+?)\n', #Spanish
-                        r'viagem no tempo\*\*: (.+?)\n', #Portuguese
-                        r'espaços extras para pets\*\*: (.+?)\n', #Portuguese
-                    ]
-                    tt_match = await functions.get_match_from_patterns(search_patterns, embed_description)
+                    tt_match = await functions.get_match_from_patterns(regex.PATTERNS_AUTO_FLEX_TIME_TRAVEL_PROFILE,
+                                                                       embed_description)
                     if tt_match:
                         time_travel_count = int(tt_match.group(1))
                         if next_tt: time_travel_count -= 1
@@ -864,12 +932,7 @@ class AutoFlexCog(commands.Cog):
                 await user_settings.update(time_travel_count=time_travel_count, trade_daily_total=trade_daily_total)
 
             # Time travel
-            search_strings = [
-                "has traveled in time", #English
-                'viajou no tempo', #Spanish
-                'tempo de viagem', #Portuguese
-            ]
-            if any(search_string in embed_description.lower() for search_string in search_strings):
+            if parsed_message.matches('auto_flex_time_travel', 'description'):
                 guild_settings: guilds.Guild = await guilds.get_guild(message.guild.id)
                 if not guild_settings.auto_flex_enabled: return
                 user = await functions.get_interaction_user(message)
@@ -975,24 +1038,16 @@ class AutoFlexCog(commands.Cog):
                                                   description)
 
             # Christmas loot, quest and duel embeds
-            search_strings = [
-                'godly present', #All languages, godly present
-                'void present', #All languages, void present
-                'epic snowball', #All languages, epic snowball
-            ]
-            if (any(search_string in embed_field0_value.lower() for search_string in search_strings)):
+            if (parsed_message.matches('auto_flex_xmas_loot_embed', 'field0_value')):
                 guild_settings: guilds.Guild = await guilds.get_guild(message.guild.id)
                 if not guild_settings.auto_flex_enabled: return
-                search_patterns = [
-                    r'\*\*(.+?)\*\* got (.+?) (.+?) (\bgodly\b \bpresent\b|\bvoid\b \bpresent\b|\bepic\b \bsnowball\b)', #English
-                    r'\*\*(.+?)\*\* cons(?:e|i)gui(?:ó|u) (.+?) (.+?) (\bgodly\b \bpresent\b|\bvoid\b \bpresent\b|\bepic\b \bsnowball\b)', #Spanish/Portuguese
-                ]
                 item_events = {
                     'godly present': 'xmas_godly',
                     'void present': 'xmas_void',
                     'epic snowball': 'xmas_snowball',
                 }
-                match = await functions.get_match_from_patterns(search_patterns, embed_field0_value)
+                match = await functions.get_match_from_patterns(regex.PATTERNS_AUTO_FLEX_XMAS_LOOT_EMBED,
+                                                                embed_field0_value)
                 if not match: return
                 user_name = match.group(1)
                 item_amount = match.group(2)
@@ -1035,23 +1090,16 @@ class AutoFlexCog(commands.Cog):
                 await self.send_auto_flex_message(message, guild_settings, user_settings, user, event, description)
 
             # Christmas presents, ultraining embed
-            search_strings = [
-                'godly present', #All languages, godly present
-                'void present', #All languages, void present
-            ]
-            if (any(search_string in embed_field1_value.lower() for search_string in search_strings)):
+            if (parsed_message.matches('auto_flex_xmas_present_ultraining', 'field1_value')):
                 guild_settings: guilds.Guild = await guilds.get_guild(message.guild.id)
                 if not guild_settings.auto_flex_enabled: return
                 user = await functions.get_interaction_user(message)
-                search_patterns = [
-                    r'\*\*(.+?)\*\* got (.+?) (.+?) (\bgodly\b|\bvoid\b) \bpresent\b', #English godly and void present
-                    r'\*\*(.+?)\*\* cons(?:e|i)gui(?:ó|u) (.+?) (.+?) (godly\b|void\b) \bpresent', #Spanish/Portuguese godly and void present
-                ]
                 item_events = {
                     'godly': 'xmas_godly',
                     'void': 'xmas_void',
                 }
-                match = await functions.get_match_from_patterns(search_patterns, embed_field1_value)
+                match = await functions.get_match_from_patterns(regex.PATTERNS_AUTO_FLEX_XMAS_PRESENTS,
+                                                                embed_field1_value)
                 if not match: return
                 user_name = match.group(1)
                 item_amount = match.group(2)
@@ -1094,17 +1142,12 @@ class AutoFlexCog(commands.Cog):
                 await self.send_auto_flex_message(message, guild_settings, user_settings, user, event, description)
 
             # EPIC snowball from snowball fight
-            search_strings = [
-                'epic snowball', #All languages
-            ]
-            if (any(search_string in embed_description.lower() for search_string in search_strings)):
+            if (parsed_message.matches('auto_flex_xmas_snowball_fight', 'description')):
                 guild_settings: guilds.Guild = await guilds.get_guild(message.guild.id)
                 if not guild_settings.auto_flex_enabled: return
                 user = await functions.get_interaction_user(message)
-                search_patterns = [
-                    r' \*\*(.+?)\*\* also got (.+?) (.+?) \*\*EPIC snowball\*\*', #English
-                ]
-                match = await functions.get_match_from_patterns(search_patterns, embed_description)
+                match = await functions.get_match_from_patterns(regex.PATTERNS_AUTO_FLEX_EPIC_SNOWBALL,
+                                                                embed_description)
                 if not match: return
                 user_name = match.group(1)
                 item_amount = match.group(2)
@@ -1134,10 +1177,7 @@ class AutoFlexCog(commands.Cog):
                 await self.send_auto_flex_message(message, guild_settings, user_settings, user, 'xmas_snowball', description)
 
             # Cards from card slots
-            search_strings = [
-                "— card slots", #All languages
-            ]
-            if (any(search_string in embed_autor.lower() for search_string in search_strings)
+            if (parsed_message.matches('auto_flex_card_slots', 'author')
                 and not 'cardroll' in embed_description.lower()):
                 guild_settings: guilds.Guild = await guilds.get_guild(message.guild.id)
                 if not guild_settings.auto_flex_enabled: return
@@ -1180,14 +1220,8 @@ class AutoFlexCog(commands.Cog):
             message_content = message.content
 
             # Craft artifacts
-            search_strings_1 = [
-                '** successfully crafted!', #English
-            ]
-            search_strings_2 = [
-                'see `artifacts`', #English
-            ]
-            if (any(search_string in message_content.lower() for search_string in search_strings_1)
-                and any(search_string in message_content.lower() for search_string in search_strings_2)):
+            if (parsed_message.matches('auto_flex_artifact_crafted', 'content')
+                and 'see `artifacts`' in message_content.lower()):
                 guild_settings: guilds.Guild = await guilds.get_guild(message.guild.id)
                 if not guild_settings.auto_flex_enabled: return
                 user = await functions.get_interaction_user(message)
@@ -1253,37 +1287,18 @@ class AutoFlexCog(commands.Cog):
                                                   description)
 
             # Loot from work commands
-            search_strings = [
-                'this may be the luckiest moment of your life', #English, ultimate logs
-                'is this a **dream**????', #English, ultra logs
-                'oooooofff!!', #English, super fish
-                'wwwooooooaaa!!!1', #English, hyper logs
-                '**epic berry**', #English, epic berries
-                '**walking normie fish**', #English, walking normie fish
-            ]
             search_strings_excluded = [
                 'contribu', #All languages, void contributions
                 'epic bundle', #All languages, halloween shop
                 'epic coins', #All languages, epic shop
             ]
             if len(message_content.split('\n')) > 1:
-                if (any(search_string in message_content.lower() for search_string in search_strings)
+                if (parsed_message.matches('auto_flex_work_loot', 'content')
                     and all(search_string not in message_content.lower() for search_string in search_strings_excluded)
-                    or ('nice!' in message_content.lower() and 'watermelon' in message_content.lower())):
+                    or ('nice!' in message_content.lower() and parsed_message.matches('auto_flex_work_watermelon', 'content'))):
                     guild_settings: guilds.Guild = await guilds.get_guild(message.guild.id)
                     if not guild_settings.auto_flex_enabled: return
                     user = await functions.get_interaction_user(message)
-                    search_patterns = [
-                        r'\?\? \*\*(.+?)\*\* got (.+?) (.+?) (?:__)?\*\*(.+?)(?:\n|__|$)', #English ULTRA log
-                        r'!!1 (.+?)\*\* got (.+?) (.+?) (?:__)?\*\*(.+?)(?:\n|__|$)', #English HYPER log
-                        r' \*\*(.+?)\*\* got (.+?) (.+?) __\*\*(ultimate log)\*\*__', #English ULTIMATE log
-                        r'\*\*(.+?)\*\* also got (.+?) (.+?) \*\*(epic berry)\*\*', #English EPIC berry
-                        r'\*\*(.+?)\*\* got (.+?) (.+?) (?:__)?\*\*(.+?)(?:\n|__|$)', #English SUPER fish, watermelon
-                        r'\*\*(.+?)\*\* also got (.+?) (.+?) __\*\*(walking normie fish)\*\*__', #English walking normie fish
-                        r'\?\? \*\*(.+?)\*\* cons(?:e|i)gui(?:ó|u) (.+?) (.+?) (?:__)?\*\*(.+?)(?:\n|__|$)', #Spanish/Portuguese ULTRA log
-                        r'!!1 (.+?)\*\* cons(?:e|i)gui(?:ó|u) (.+?) (.+?) (?:__)?\*\*(.+?)(?:\n|__|$)', #Spanish/Portuguese HYPER log
-                        r'\*\*(.+?)\*\* cons(?:e|i)gui(?:ó|u) (.+?) (.+?) (?:__)?\*\*(.+?)(?:\n|__|$)', #Spanish/Portuguese ULTIMATE log, SUPER fish, watermelon
-                    ]
                     item_events = {
                         'epic berry': 'work_epicberry',
                         'hyper log': 'work_hyperlog',
@@ -1293,7 +1308,7 @@ class AutoFlexCog(commands.Cog):
                         'walking normie fish': 'work_walkingnormiefish',
                         'watermelon': 'work_watermelon',
                     }
-                    match = await functions.get_match_from_patterns(search_patterns, message_content)
+                    match = await functions.get_match_from_patterns(regex.PATTERNS_AUTO_FLEX_WORK_LOOT, message_content)
                     if not match:
                         await functions.add_warning_reaction(message)
                         await errors.log_error('Couldn\'t find auto flex data in work message.', message)
@@ -1364,29 +1379,17 @@ class AutoFlexCog(commands.Cog):
                     await self.send_auto_flex_message(message, guild_settings, user_settings, user, event, description)
 
             # Christmas loot, non-embed
-            search_strings = [
-                'godly present', #All languages, godly present
-                'void present', #All languages, void present
-                'eternal present', #All languages, eternal present
-                'epic snowball', #All languages, void present
-            ]
-            if (any(search_string in message_content.lower() for search_string in search_strings)):
+            if (parsed_message.matches('auto_flex_xmas_loot', 'content')):
                 guild_settings: guilds.Guild = await guilds.get_guild(message.guild.id)
                 if not guild_settings.auto_flex_enabled: return
                 user = await functions.get_interaction_user(message)
-                search_patterns = [
-                    r'\*\*(.+?)\*\* got (.+?) (.+?) (\bgodly\b \bpresent\b|\bvoid\b \bpresent\b|\beternal\b \bpresent\b|\bepic\b \bsnowball\b)', #English
-                    r'\*\*(.+?)\*\*\ went.+?found (.+?) (.+?) \*\*(\bgodly\b \bpresent\b|\bvoid\b \bpresent\b|\beternal\b \bpresent\b)\*\*', #English godly and void present, chimney
-                    r'\*\*(.+?)\*\* cons(?:e|i)gui(?:ó|u) (.+?) (.+?) (\bgodly\b \bpresent\b|\bvoid\b \bpresent\b|\beternal\b \bpresent\b|\bepic\b \bsnowball\b)', #Spanish/Portuguese
-                    r'\*\*(.+?)\*\* se metió.+encontró (.+?) (.+?) \*\*(\bgodly\b \bpresent\b|\bvoid\b \bpresent\b|\beternal\b \bpresent\b|\bepic\b \bsnowball\b)\*\*', #Spanish/Portuguese, chimney
-                ]
                 item_events = {
                     'godly present': 'xmas_godly',
                     'void present': 'xmas_void',
                     'eternal present': 'xmas_eternal',
                     'epic snowball': 'xmas_snowball',
                 }
-                match = await functions.get_match_from_patterns(search_patterns, message_content)
+                match = await functions.get_match_from_patterns(regex.PATTERNS_AUTO_FLEX_XMAS_LOOT, message_content)
                 if not match: return
                 user_name = match.group(1)
                 item_amount = match.group(2)
@@ -1436,19 +1439,11 @@ class AutoFlexCog(commands.Cog):
                 await self.send_auto_flex_message(message, guild_settings, user_settings, user, event, description)
 
             # Christmas, stuck in chimney
-            search_strings = [
-                'stuck in the chimney...', #English
-                'atascó en la chimenea...', #Spanish
-                'atascó en la chimenea...', #TODO: Portuguese
-            ]
-            if (any(search_string in message_content.lower() for search_string in search_strings)):
+            if (parsed_message.matches('auto_flex_xmas_chimney', 'content')):
                 guild_settings: guilds.Guild = await guilds.get_guild(message.guild.id)
                 if not guild_settings.auto_flex_enabled: return
                 user = await functions.get_interaction_user(message)
-                search_patterns = [
-                    r'\*\*(.+?)\*\*\ went', #English
-                ]
-                match = await functions.get_match_from_patterns(search_patterns, message_content)
+                match = await functions.get_match_from_patterns(regex.PATTERNS_AUTO_FLEX_XMAS_CHIMNEY, message_content)
                 if not match: return
                 user_name = match.group(1)
                 if user is None:
@@ -1473,17 +1468,12 @@ class AutoFlexCog(commands.Cog):
                 await self.send_auto_flex_message(message, guild_settings, user_settings, user, 'xmas_chimney', description)
 
             # Forge godly cookie
-            search_strings = [
-                'bunch of cookies against the godly sword and then leaves it', #English
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('auto_flex_forge_cookie', 'content'):
                 guild_settings: guilds.Guild = await guilds.get_guild(message.guild.id)
                 if not guild_settings.auto_flex_enabled: return
                 user = await functions.get_interaction_user(message)
-                search_patterns = [
-                    r'\*\*(.+?)\*\* press', #English
-                ]
-                user_name_match = await functions.get_match_from_patterns(search_patterns, message_content)
+                user_name_match = await functions.get_match_from_patterns(regex.PATTERNS_AUTO_FLEX_FORGE_COOKIE,
+                                                                          message_content)
                 if not user_name_match:
                     await functions.add_warning_reaction(message)
                     await errors.log_error('Couldn\'t find use name in auto flex godly cookie message.', message)
@@ -1514,11 +1504,6 @@ class AutoFlexCog(commands.Cog):
                                                   description)
 
             # Lootboxes from hunt and adventure
-            search_strings = [
-                'found a', #English
-                'found the', #English
-                'encontr', #Spanish, Portuguese
-            ]
             search_strings_loot = [
                 'omega lootbox',
                 'godly lootbox',
@@ -1533,7 +1518,7 @@ class AutoFlexCog(commands.Cog):
                 'dark energy',
                 'epic berry',
             ]
-            if (any(search_string in message_content.lower() for search_string in search_strings)
+            if (parsed_message.matches('auto_flex_hunt_adventure_loot', 'content')
                 and (
                     any(f'> {monster.lower()}' in message_content.lower() for monster in strings.MONSTERS_HUNT)
                     or any(monster.lower() in message_content.lower() for monster in strings.MONSTERS_HUNT_TOP)
@@ -1564,12 +1549,8 @@ class AutoFlexCog(commands.Cog):
                     together = True
                 partner_name = None
                 if together:
-                    search_patterns = [
-                        r"\*\*(.+?)\*\* and \*\*(.+?)\*\*", #English
-                        r"\*\*(.+?)\*\* y \*\*(.+?)\*\*", #Spanish
-                        r"\*\*(.+?)\*\* e \*\*(.+?)\*\*", #Portuguese
-                    ]
-                    user_name_match = await functions.get_match_from_patterns(search_patterns, message_content)
+                    user_name_match = await functions.get_match_from_patterns(regex.PATTERNS_USER_NAMES_TOGETHER,
+                                                                              message_content)
                     if user_name_match:
                         user_name = user_name_match.group(1)
                         partner_name = user_name_match.group(2)
@@ -1578,11 +1559,8 @@ class AutoFlexCog(commands.Cog):
                         await errors.log_error('User names not found in auto flex hunt together message.', message)
                         return
                 else:
-                    search_patterns_user_name = [
-                        r"\*\*(.+?)\*\* found a", #English
-                        r"\*\*(.+?)\*\* encontr", #Spanish, Portuguese
-                    ]
-                    user_name_match = await functions.get_match_from_patterns(search_patterns_user_name, message_content)
+                    user_name_match = await functions.get_match_from_patterns(regex.PATTERNS_USER_NAME_FOUND,
+                                                                              message_content)
                     if not user_name_match:
                         await functions.add_warning_reaction(message)
                         await errors.log_error('Couldn\'t find user name in auto flex hunt message.', message)
@@ -1933,17 +1911,12 @@ class AutoFlexCog(commands.Cog):
 
 
             # Lootbox event
-            search_strings = [
-                'your lootbox has evolved', #English
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('auto_flex_event_lb', 'content'):
                 guild_settings: guilds.Guild = await guilds.get_guild(message.guild.id)
                 if not guild_settings.auto_flex_enabled: return
                 user = await functions.get_interaction_user(message)
-                search_patterns = [
-                    r'\*\*(.+?)\*\* uses', #English
-                ]
-                user_name_match = await functions.get_match_from_patterns(search_patterns, message_content)
+                user_name_match = await functions.get_match_from_patterns(regex.PATTERNS_AUTO_FLEX_EVENT_LOOTBOX,
+                                                                          message_content)
                 if not user_name_match:
                     await functions.add_warning_reaction(message)
                     await errors.log_error('Couldn\'t find user name in auto flex lootbox event message.', message)
@@ -1973,18 +1946,12 @@ class AutoFlexCog(commands.Cog):
                 await self.send_auto_flex_message(message, guild_settings, user_settings, user, 'event_lb', description)
 
             # Enchant event
-            search_strings = [
-                'your sword got an ultra-edgy enchantment', #English sword
-                'your armor got an ultra-edgy enchantment', #English armor
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('auto_flex_event_enchant', 'content'):
                 guild_settings: guilds.Guild = await guilds.get_guild(message.guild.id)
                 if not guild_settings.auto_flex_enabled: return
                 user = await functions.get_interaction_user(message)
-                search_patterns = [
-                    r'\*\*(.+?)\*\* tries', #English
-                ]
-                user_name_match = await functions.get_match_from_patterns(search_patterns, message_content)
+                user_name_match = await functions.get_match_from_patterns(regex.PATTERNS_AUTO_FLEX_EVENT_ENCHANT,
+                                                                          message_content)
                 if not user_name_match:
                     await functions.add_warning_reaction(message)
                     await errors.log_error('Couldn\'t find user name in auto flex enchant event message.', message)
@@ -2014,17 +1981,12 @@ class AutoFlexCog(commands.Cog):
                                                   description)
 
             # Farm event
-            search_strings = [
-                'the seed surrendered', #English
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('auto_flex_event_farm', 'content'):
                 guild_settings: guilds.Guild = await guilds.get_guild(message.guild.id)
                 if not guild_settings.auto_flex_enabled: return
                 user = await functions.get_interaction_user(message)
-                search_patterns = [
-                    r'\*\*(.+?)\*\* hits', #English
-                ]
-                user_name_match = await functions.get_match_from_patterns(search_patterns, message_content)
+                user_name_match = await functions.get_match_from_patterns(regex.PATTERNS_AUTO_FLEX_EVENT_FARM,
+                                                                          message_content)
                 if not user_name_match:
                     await functions.add_warning_reaction(message)
                     await errors.log_error('Couldn\'t find user name in auto flex farm event message.', message)
@@ -2046,10 +2008,8 @@ class AutoFlexCog(commands.Cog):
                     return
                 if not user_settings.bot_enabled or not user_settings.auto_flex_enabled: return
 
-                search_patterns = [
-                    r'up (\d+?) times', #English
-                ]
-                levels_match = await functions.get_match_from_patterns(search_patterns, message_content)
+                levels_match = await functions.get_match_from_patterns(regex.PATTERNS_AUTO_FLEX_EVENT_FARM_LEVELS,
+                                                                       message_content)
                 levels = int(levels_match.group(1))
                 if levels > 0:
                     description = (
@@ -2068,17 +2028,12 @@ class AutoFlexCog(commands.Cog):
                                                   description)
 
             # Heal event
-            search_strings = [
-                'killed the mysterious man', #English
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('auto_flex_event_heal', 'content'):
                 guild_settings: guilds.Guild = await guilds.get_guild(message.guild.id)
                 if not guild_settings.auto_flex_enabled: return
                 user = await functions.get_interaction_user(message)
-                search_patterns = [
-                    r'\*\*(.+?)\*\* killed', #English
-                ]
-                user_name_match = await functions.get_match_from_patterns(search_patterns, message_content)
+                user_name_match = await functions.get_match_from_patterns(regex.PATTERNS_AUTO_FLEX_EVENT_HEAL,
+                                                                          message_content)
                 if not user_name_match:
                     await functions.add_warning_reaction(message)
                     await errors.log_error('Couldn\'t find user name in auto flex heal event message.', message)
@@ -2108,17 +2063,12 @@ class AutoFlexCog(commands.Cog):
                                                   description)
 
             # Training event
-            search_strings = [
-                'wings spawned', #English
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('auto_flex_event_training', 'content'):
                 guild_settings: guilds.Guild = await guilds.get_guild(message.guild.id)
                 if not guild_settings.auto_flex_enabled: return
                 user = await functions.get_interaction_user(message)
-                search_patterns = [
-                    r"in \*\*(.+?)\*\*'s back", #English
-                ]
-                user_name_match = await functions.get_match_from_patterns(search_patterns, message_content)
+                user_name_match = await functions.get_match_from_patterns(regex.PATTERNS_AUTO_FLEX_EVENT_TRAINING,
+                                                                          message_content)
                 if not user_name_match:
                     await functions.add_warning_reaction(message)
                     await errors.log_error('Couldn\'t find user name in auto flex training event message.', message)
@@ -2139,10 +2089,8 @@ class AutoFlexCog(commands.Cog):
                 except exceptions.FirstTimeUserError:
                     return
                 if not user_settings.bot_enabled or not user_settings.auto_flex_enabled: return
-                search_patterns = [
-                    r'became \*\*(\d+?) ', #English
-                ]
-                amount_match = await functions.get_match_from_patterns(search_patterns, message_content)
+                amount_match = await functions.get_match_from_patterns(regex.PATTERNS_AUTO_FLEX_EVENT_TRAINING_AMOUNT,
+                                                                       message_content)
                 if not amount_match:
                     await functions.add_warning_reaction(message)
                     await errors.log_error('Couldn\'t find dark energy amount in auto flex training event message.', message)
@@ -2157,12 +2105,7 @@ class AutoFlexCog(commands.Cog):
                                                   description)
 
             # Time capsule
-            search_strings = [
-                "a portal was opened", #English
-                "se abrió un portal", #Spanish
-                "um portal foi aberto", #Portuguese
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('auto_flex_time_capsule', 'content'):
                 guild_settings: guilds.Guild = await guilds.get_guild(message.guild.id)
                 if not guild_settings.auto_flex_enabled: return
                 user = await functions.get_interaction_user(message)
@@ -2197,12 +2140,7 @@ class AutoFlexCog(commands.Cog):
                                                   description)
 
             # Time travels from unsealing eternity
-            search_strings = [
-                "unsealed **the eternity**", #English
-                "unsealed **the eternity**", #TODO: Spanish
-                "unsealed **the eternity**", #TODO: Portuguese
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('auto_flex_eternity_unsealed', 'content'):
                 guild_settings: guilds.Guild = await guilds.get_guild(message.guild.id)
                 if not guild_settings.auto_flex_enabled: return
                 user = await functions.get_interaction_user(message)
@@ -2301,25 +2239,18 @@ class AutoFlexCog(commands.Cog):
                                                   description)
 
             # Rare halloween loot
-            search_strings = [
-                'sleepy potion', #English potion
-                'suspicious broom', #English broom
-            ]
             search_strings_scare = [
                 '** scared **', #English potion
                 'got so much scared', #English broom
                 'got so hella scared', #English broom
             ]
-            if (any(search_string in message_content.lower() for search_string in search_strings)
+            if (parsed_message.matches('auto_flex_hal_loot', 'content')
                 and any(search_string in message_content.lower() for search_string in search_strings_scare)):
                 guild_settings: guilds.Guild = await guilds.get_guild(message.guild.id)
                 if not guild_settings.auto_flex_enabled: return
                 user = await functions.get_interaction_user(message)
-                search_patterns = [
-                    r" \*\*(.+?)\*\* scared", #English
-                    r"scared by \*\*(.+?)\*\*", #English
-                ]
-                user_name_match = await functions.get_match_from_patterns(search_patterns, message_content)
+                user_name_match = await functions.get_match_from_patterns(regex.PATTERNS_AUTO_FLEX_HALLOWEEN_LOOT,
+                                                                          message_content)
                 if not user_name_match:
                     await functions.add_warning_reaction(message)
                     await errors.log_error('Couldn\'t find user name in auto flex hal boo message.', message)
@@ -2355,12 +2286,7 @@ class AutoFlexCog(commands.Cog):
                                                   description)
 
             # Brew electronical potion
-            search_strings = [
-                '**electronical potion**, you\'ve received the following boosts', #English
-                '**electronical potion**, has recibido los siguientes boosts', #Spanish
-                '**electronical potion**, recebeu os seguintes boosts', #Portuguese
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('auto_flex_brew_electronical', 'content'):
                 guild_settings: guilds.Guild = await guilds.get_guild(message.guild.id)
                 if not guild_settings.auto_flex_enabled: return
                 user = await functions.get_interaction_user(message)
@@ -2387,14 +2313,7 @@ class AutoFlexCog(commands.Cog):
                                                   description)
 
             # Card drops
-            search_strings = [
-                'epic card',
-                'omega card',
-                'godly card',
-                'void card',
-                'eternal card',
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('auto_flex_card_drop', 'content'):
                 guild_settings: guilds.Guild = await guilds.get_guild(message.guild.id)
                 if not guild_settings.auto_flex_enabled: return
                 user = await functions.get_interaction_user(message)
@@ -2453,10 +2372,7 @@ class AutoFlexCog(commands.Cog):
 
                 
             # Golden cards
-            search_strings = [
-                'goldened these cards!',
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('auto_flex_card_golden', 'content'):
                 guild_settings: guilds.Guild = await guilds.get_guild(message.guild.id)
                 if not guild_settings.auto_flex_enabled: return
                 user = await functions.get_interaction_user(message)
@@ -9,44 +9,103 @@ from discord.ext import bridge, commands
 
 from cache import messages
 from database import errors, reminders, users
-from resources import emojis, exceptions, functions, regex, settings, strings
+from resources import emojis, exceptions, functions, regex, router, strings
+
+
+TRIGGERS = {
+    'boosts_active_boosts': (
+        'these are your active boosts', #English
+        'estos son tus boosts activos', #Spanish
+        'estes são seus boosts ativos', #Portuguese
+    ),
+    'boosts_time_travel': (
+        "— super time travel", #All languages
+        "— time jump", #All languages
+        "— time travel", #All languages
+    ),
+    'boosts_time_travel_confirm': (
+        "are you sure", #English
+        "are you sure", #TODO: Spanish
+        "are you sure", #TODO: Portuguese
+    ),
+    'boosts_party_popper': (
+        'uses a <:partypopper', #English
+        'usa el <:partypopper', #Spanish
+        'uses the <:partypopper', #TODO: Portuguese
+    ),
+    'boosts_alchemy_potions': (
+        '**, you\'ve received the following boosts for', #English
+        '**, you\'ve received the following boosts for', #Spanish
+        '**, you\'ve received the following boosts for', #Portuguese
+    ),
+    'boosts_valentine_boost': (
+        '`valentine boost` successfully bought', #English
+        '`valentine boost` comprado(s)', #Spanish & Portuguese
+    ),
+    'boosts_halloween_boost': (
+        '`halloween boost` successfully bought', #English
+        '`halloween boost` comprado(s)', #Spanish & Portuguese
+    ),
+    'boosts_christmas_boost': (
+        '`christmas boost` successfully bought', #English
+        '`christmas boost` comprado(s)', #Spanish & Portuguese
+    ),
+    'boosts_easter_boost': (
+        '`easter boost` successfully bought', #English
+        '`easter boost` comprado(s)', #Spanish & Portuguese
+    ),
+    'boosts_summer_boost': (
+        '`summer boost` successfully bought', #English
+        '`summer boost` comprado(s)', #Spanish & Portuguese
+    ),
+    'boosts_summer_drink_boost': (
+        'received a `boost`', #English
+        'received a `boost`', #TODO: Spanish
+        'received a `boost`', #TODO: Portuguese
+    ),
+    'boosts_easterng_boost': (
+        'got the **easterng boost', #English
+        'got the **easterng boost', #TODO: Spanish
+        'got the **easterng boost', #TODO: Portuguese
+    ),
+    'boosts_egg_blessing_boost': (
+        'has the egg blessing boost for', #English
+        'has the egg blessing boost for', #TODO: Spanish
+        'has the egg blessing boost for', #TODO: Portuguese
+    ),
+    'boosts_round_card': (
+        '** eats a <:roundcard', #English
+        '** eats a <:roundcard', #TODO: Spanish
+        '** eats a <:roundcard', #TODO: Portuguese
+    ),
+    'boosts_mega_boost': (
+        '** uses a <:megaboost', #English
+        '** uses a <:megaboost', #TODO: Spanish
+        '** uses a <:megaboost', #TODO: Portuguese
+    ),
+}
 
 
 class BoostsCog(commands.Cog):
     """Cog that contains the boost detection commands"""
     def __init__(self, bot: bridge.AutoShardedBot):
         self.bot = bot
+        router.register_message_handler(self.qualified_name, self.on_message, triggers=TRIGGERS)
 
-    @commands.Cog.listener()
-    async def on_message_edit(self, message_before: discord.Message, message_after: discord.Message) -> None:
-        """Runs when a message is edited in a channel."""
-        if message_before.pinned != message_after.pinned: return
-        embed_data_before = await functions.parse_embed(message_before)
-        embed_data_after = await functions.parse_embed(message_after)
-        if (message_before.content == message_after.content and embed_data_before == embed_data_after
-            and message_before.components == message_after.components): return
-        row: discord.Component
-        for row in message_after.components:
-            if isinstance(row, discord.ActionRow):
-                for component in row.children:
-                    if isinstance(component, (discord.Button, discord.SelectMenu)):
-                        if component.disabled:
-                            return
-        await self.on_message(message_after)
+    def cog_unload(self) -> None:
+        """Removes the message handlers of this cog from the router."""
+        router.unregister_message_handler(self.qualified_name)
 
-    @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
-        """Runs when a message is sent in a channel."""
-        if message.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-
+        """Runs when EPIC RPG sends or edits a message. Called by the message router."""
+        parsed_message: router.ParsedMessage = router.get_parsed_message(message)
         if message.embeds:
             embed: discord.Embed = message.embeds[0]
-            embed_author = embed_title = icon_url = embed_description = ''
+            embed_author = embed_title = icon_url = ''
             if embed.author is not None:
                 embed_author = str(embed.author.name)
                 icon_url = embed.author.icon_url
             if embed.title is not None: embed_title = str(embed.title)
-            if embed.description is not None: embed_description = str(embed.description)
             embed_potion_fields = ''
             if embed.fields:
                 embed_potion_fields = embed.fields[0].value
@@ -55,12 +114,7 @@ class BoostsCog(commands.Cog):
                         embed_potion_fields = f'{embed_potion_fields}\n{embed.fields[1].value}'
 
             # Boosts cooldowns
-            search_strings = [
-                'these are your active boosts', #English
-                'estos son tus boosts activos', #Spanish
-                'estes são seus boosts ativos', #Portuguese
-            ]
-            if (any(search_string in embed_description.lower() for search_string in search_strings)):
+            if parsed_message.matches('boosts_active_boosts', 'description'):
                 user_id = user_name = user_command_message = None
                 potion_dragon_breath_active = round_card_active = potion_flask_active = False
                 embed_users = []
@@ -157,18 +211,8 @@ class BoostsCog(commands.Cog):
                     await message.add_reaction(emojis.NAVI)
 
             # Tell user whether time potion is active on time travel
-            search_strings_author = [
-                "— super time travel", #All languages
-                "— time jump", #All languages
-                "— time travel", #All languages
-            ]
-            search_strings_description = [
-                "are you sure", #English
-                "are you sure", #TODO: Spanish
-                "are you sure", #TODO: Portuguese
-            ]
-            if (any(search_string in embed_author.lower() for search_string in search_strings_author)
-                and any(search_string in embed_description.lower() for search_string in search_strings_description)):
+            if (parsed_message.matches('boosts_time_travel', 'author')
+                and parsed_message.matches('boosts_time_travel_confirm', 'description')):
                 user = await functions.get_interaction_user(message)
                 if user is None:
                     user_id_match = re.search(regex.USER_ID_FROM_ICON_URL, icon_url)
@@ -215,12 +259,7 @@ class BoostsCog(commands.Cog):
             message_content = message.content
 
             # Party popper
-            search_strings = [
-                'uses a <:partypopper', #English
-                'usa el <:partypopper', #Spanish
-                'uses the <:partypopper', #TODO: Portuguese
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('boosts_party_popper', 'content'):
                 user = await functions.get_interaction_user(message)
                 user_command_message = None
                 if user is None:
@@ -262,12 +301,7 @@ class BoostsCog(commands.Cog):
                 await functions.add_reminder_reaction(message, reminder, user_settings)
 
             # Alchemy potions
-            search_strings = [
-                '**, you\'ve received the following boosts for', #English
-                '**, you\'ve received the following boosts for', #Spanish
-                '**, you\'ve received the following boosts for', #Portuguese
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('boosts_alchemy_potions', 'content'):
                 user = await functions.get_interaction_user(message)
                 user_command_message = None
                 if user is None:
@@ -322,11 +356,7 @@ class BoostsCog(commands.Cog):
                 await functions.add_reminder_reaction(message, reminder, user_settings)
 
             # Valentine boost
-            search_strings = [
-                '`valentine boost` successfully bought', #English
-                '`valentine boost` comprado(s)', #Spanish & Portuguese
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('boosts_valentine_boost', 'content'):
                 user = await functions.get_interaction_user(message)
                 user_command_message = None
                 if user is None:
@@ -361,11 +391,7 @@ class BoostsCog(commands.Cog):
 
 
             # Halloween boost
-            search_strings = [
-                '`halloween boost` successfully bought', #English
-                '`halloween boost` comprado(s)', #Spanish & Portuguese
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('boosts_halloween_boost', 'content'):
                 user = await functions.get_interaction_user(message)
                 user_command_message = None
                 if user is None:
@@ -400,11 +426,7 @@ class BoostsCog(commands.Cog):
 
 
             # Christmas boost
-            search_strings = [
-                '`christmas boost` successfully bought', #English
-                '`christmas boost` comprado(s)', #Spanish & Portuguese
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('boosts_christmas_boost', 'content'):
                 user = await functions.get_interaction_user(message)
                 user_command_message = None
                 if user is None:
@@ -439,11 +461,7 @@ class BoostsCog(commands.Cog):
 
                 
             # Easter boost
-            search_strings = [
-                '`easter boost` successfully bought', #English
-                '`easter boost` comprado(s)', #Spanish & Portuguese
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('boosts_easter_boost', 'content'):
                 user = await functions.get_interaction_user(message)
                 user_command_message = None
                 if user is None:
@@ -478,11 +496,7 @@ class BoostsCog(commands.Cog):
 
                 
             # Summer boost
-            search_strings = [
-                '`summer boost` successfully bought', #English
-                '`summer boost` comprado(s)', #Spanish & Portuguese
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('boosts_summer_boost', 'content'):
                 user = await functions.get_interaction_user(message)
                 user_command_message = None
                 if user is None:
@@ -517,12 +531,7 @@ class BoostsCog(commands.Cog):
 
 
             # Summer drink boost
-            search_strings = [
-                'received a `boost`', #English
-                'received a `boost`', #TODO: Spanish
-                'received a `boost`', #TODO: Portuguese
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings) and 'drink' in message_content.lower():
+            if parsed_message.matches('boosts_summer_drink_boost', 'content') and 'drink' in message_content.lower():
                 user = await functions.get_interaction_user(message)
                 user_command_message = None
                 if user is None:
@@ -569,12 +578,7 @@ class BoostsCog(commands.Cog):
 
                 
             # EasteRNG boosts
-            search_strings = [
-                'got the **easterng boost', #English
-                'got the **easterng boost', #TODO: Spanish
-                'got the **easterng boost', #TODO: Portuguese
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('boosts_easterng_boost', 'content'):
                 user = await functions.get_interaction_user(message)
                 user_command_message = None
                 if user is None:
@@ -608,12 +612,8 @@ class BoostsCog(commands.Cog):
                         return
                 if user_settings.user_pocket_watch_multiplier < 1: time_left_hours *= 2
                 time_left = timedelta(hours=time_left_hours)
-                search_patterns = [
-                    r'the \*\*(.+?)\*\*!', #English
-                    r'the \*\*(.+?)\*\*!', #TODO: Spanish
-                    r'the \*\*(.+?)\*\*!', #TODO: Portuguese
-                ]
-                boost_name_match = await functions.get_match_from_patterns(search_patterns, message_content.lower())
+                boost_name_match = await functions.get_match_from_patterns(regex.PATTERNS_BOOSTS_EASTERNG_BOOST,
+                                                                           message_content.lower())
                 boost_name = boost_name_match.group(1)
                 reminder_message = (
                         user_settings.alert_boosts.message
@@ -629,21 +629,14 @@ class BoostsCog(commands.Cog):
 
                 
             # Egg blessing boost
-            search_strings = [
-                'has the egg blessing boost for', #English
-                'has the egg blessing boost for', #TODO: Spanish
-                'has the egg blessing boost for', #TODO: Portuguese
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('boosts_egg_blessing_boost', 'content'):
                 user = await functions.get_interaction_user(message)
                 user_command_message = None
                 if user is None:
-                    search_patterns = [
-                       r"blessed \*\*(.+?)\*\*!", #English
-                       r"blessed \*\*(.+?)\*\*!", #TODO: Spanish
-                       r"blessed \*\*(.+?)\*\*!", #TODO: Portuguese
-                    ]
-                    user_name_match = await functions.get_match_from_patterns(search_patterns, message_content.lower())
+                    user_name_match = (
+                        await functions.get_match_from_patterns(regex.PATTERNS_BOOSTS_EGG_BLESSING_USER_NAME,
+                                                                message_content.lower())
+                    )
                     user_command_message = (
                         await messages.find_message(message.channel.id, regex.COMMAND_EGG_GOD,
                                                     user_name=user_name_match.group(1))
@@ -680,12 +673,7 @@ class BoostsCog(commands.Cog):
 
 
             # Round card
-            search_strings = [
-                '** eats a <:roundcard', #English
-                '** eats a <:roundcard', #TODO: Spanish
-                '** eats a <:roundcard', #TODO: Portuguese
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('boosts_round_card', 'content'):
                 user = await functions.get_interaction_user(message)
                 user_command_message = None
                 if user is None:
@@ -744,12 +732,7 @@ class BoostsCog(commands.Cog):
 
                 
             # Mega boost
-            search_strings = [
-                '** uses a <:megaboost', #English
-                '** uses a <:megaboost', #TODO: Spanish
-                '** uses a <:megaboost', #TODO: Portuguese
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('boosts_mega_boost', 'content'):
                 user = await functions.get_interaction_user(message)
                 user_command_message = None
                 if user is None:
@@ -1,10 +1,10 @@
 # cache.py
-"""Collects messages containing rpg and mention commands for the local cache"""
+"""Collects messages containing rpg and mention commands for the local cache and keeps the member name index current"""
 
 import discord
 from discord.ext import bridge, commands
 
-from cache import messages
+from cache import members, messages
 from resources import settings
 
 class CacheCog(commands.Cog):
@@ -37,6 +37,37 @@ class CacheCog(commands.Cog):
             if correct_mention:
                 await messages.store_message(message)
 
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member) -> None:
+        """Runs when a member joins a guild."""
+        await members.update_member(member)
+
+    @commands.Cog.listener()
+    async def on_member_update(self, member_before: discord.Member, member_after: discord.Member) -> None:
+        """Runs when a member is updated."""
+        if member_before.name != member_after.name: await members.update_member(member_after)
+
+    @commands.Cog.listener()
+    async def on_user_update(self, user_before: discord.User, user_after: discord.User) -> None:
+        """Runs when a user changes their name or avatar."""
+        if user_before.name != user_after.name: await members.update_user(user_after)
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member) -> None:
+        """Runs when a member leaves a guild."""
+        members.remove_member(member)
+
+    @commands.Cog.listener()
+    async def on_guild_available(self, guild: discord.Guild) -> None:
+        """Runs when a guild becomes available, e.g. after a reconnect. Member events may have been missed, so the
+        guild is indexed again on the next lookup."""
+        members.remove_guild(guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild) -> None:
+        """Runs when the bot is removed from a guild."""
+        members.remove_guild(guild.id)
+
 # Initialization
 def setup(bot: bridge.AutoShardedBot):
     bot.add_cog(CacheCog(bot))
\ No newline at end of file
@@ -10,17 +10,38 @@ from discord.ext import bridge, commands
 
 from cache import messages
 from database import errors, reminders, users
-from resources import exceptions, functions, regex, settings
+from resources import exceptions, functions, regex, router
+
+TRIGGERS = {
+    'cards_cooldown': (
+        'you have played your cards recently', #English
+        'you have played your cards recently', #TODO: Spanish
+        'you have played your cards recently', #TODO: Portuguese
+    ),
+    'cards_card_hand': (
+        " — card hand", #All languages
+    ),
+    'cards_card_hand_timeout': (
+        '** decided not to play lol', #English
+        '** decided not to play lol', #TODO: Spanish
+        '** decided not to play lol', #TODO: Portuguese
+    ),
+}
+
 
 class CardsCog(commands.Cog):
     """Cog that contains the card detection commands"""
     def __init__(self, bot: bridge.AutoShardedBot):
         self.bot = bot
+        router.register_message_handler(self.qualified_name, self.on_message, on_message_edit=self.on_message_edit,
+                                        triggers=TRIGGERS)
+
+    def cog_unload(self) -> None:
+        """Removes the message handlers of this cog from the router."""
+        router.unregister_message_handler(self.qualified_name)
 
-    @commands.Cog.listener()
     async def on_message_edit(self, message_before: discord.Message, message_after: discord.Message) -> None:
-        """Runs when a message is edited in a channel."""
-        if message_after.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
+        """Runs when EPIC RPG edits a message. Called by the message router."""
         if message_before.pinned != message_after.pinned: return
         embed_data_before = await functions.parse_embed(message_before)
         embed_data_after = await functions.parse_embed(message_after)
@@ -49,11 +70,9 @@ class CardsCog(commands.Cog):
             )
         await self.on_message(message_after)
 
-    @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
-        """Runs when a message is sent in a channel."""
-        if message.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-
+        """Runs when EPIC RPG sends or edits a message. Called by the message router."""
+        parsed_message: router.ParsedMessage = router.get_parsed_message(message)
         if message.embeds:
             embed: discord.Embed = message.embeds[0]
             message_author = message_title = icon_url = message_field0_value = ''
@@ -65,12 +84,7 @@ class CardsCog(commands.Cog):
                 message_field0_value = embed.fields[0].value
 
             # Card hand cooldown
-            search_strings = [
-                'you have played your cards recently', #English
-                'you have played your cards recently', #TODO: Spanish
-                'you have played your cards recently', #TODO: Portuguese
-            ]
-            if any(search_string in message_title.lower() for search_string in search_strings):
+            if parsed_message.matches('cards_cooldown', 'title'):
                 user_id = user_name = user_command_message = None
                 user = await functions.get_interaction_user(message)
                 if user is None:
@@ -118,10 +132,7 @@ class CardsCog(commands.Cog):
                 await functions.add_reminder_reaction(message, reminder, user_settings)
 
             # Card hand
-            search_strings = [
-               " — card hand", #All languages
-            ]
-            if (any(search_string in message_author.lower() for search_string in search_strings)
+            if (parsed_message.matches('cards_card_hand', 'author')
                 and '+' in message_field0_value):
                 user_id = user_name = user_command_message = None
                 user = await functions.get_interaction_user(message)
@@ -164,12 +175,7 @@ class CardsCog(commands.Cog):
             message_content = message.content
 
             # Card hand timeout
-            search_strings = [
-                '** decided not to play lol', #English
-                '** decided not to play lol', #TODO: Spanish
-                '** decided not to play lol', #TODO: Portuguese
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('cards_card_hand_timeout', 'content'):
                 user = await functions.get_interaction_user(message)
                 user_command_message = None
                 if user is None:
@@ -11,52 +11,60 @@ from discord.ext import bridge, commands
 
 from cache import messages
 from database import errors, reminders, users
-from resources import exceptions, functions, settings
+from resources import exceptions, functions, router
+
+
+TRIGGERS = {
+    'celebration_cel_dailyquest': (
+        'come back tomorrow and i will give you another quest!', #English
+        'why? idk, i have too many', #English 2
+    ),
+    'celebration_cel_dailyquest_field': (
+        'daily quest', #English
+    ),
+    'celebration_cel_multiply': (
+        'you feel', #English
+    ),
+    'celebration_cel_multiply_rich': (
+        '% more rich', #English
+    ),
+    'celebration_cel_sacrifice': (
+        'sacrificed', #English
+    ),
+    'celebration_cel_multiply_cooldown': (
+        'you cannot multiply your celebration coins', #English
+    ),
+    'celebration_cel_dailyquest_cooldown': (
+        'you already completed the quest of today!', #English
+    ),
+    'celebration_cel_sacrifice_cooldown': (
+        'you cannot sacrifice your celebration coins', #English
+    ),
+}
 
 
 class CelebrationCog(commands.Cog):
     """Cog that contains the celebration event detection commands"""
     def __init__(self, bot: bridge.AutoShardedBot):
         self.bot = bot
+        router.register_message_handler(self.qualified_name, self.on_message, triggers=TRIGGERS)
+
+    def cog_unload(self) -> None:
+        """Removes the message handlers of this cog from the router."""
+        router.unregister_message_handler(self.qualified_name)
 
-    @commands.Cog.listener()
-    async def on_message_edit(self, message_before: discord.Message, message_after: discord.Message) -> None:
-        """Runs when a message is edited in a channel."""
-        if message_after.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-        if message_before.pinned != message_after.pinned: return
-        embed_data_before = await functions.parse_embed(message_before)
-        embed_data_after = await functions.parse_embed(message_after)
-        if (message_before.content == message_after.content and embed_data_before == embed_data_after
-            and message_before.components == message_after.components): return
-        row: discord.Component
-        for row in message_after.components:
-            if isinstance(row, discord.ActionRow):
-                for component in row.children:
-                    if isinstance(component, (discord.Button, discord.SelectMenu)):
-                        if component.disabled:
-                            return
-        await self.on_message(message_after)
-
-    @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
-        """Runs when a message is sent in a channel."""
-        if message.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-        
+        """Runs when EPIC RPG sends or edits a message. Called by the message router."""
+        parsed_message: router.ParsedMessage = router.get_parsed_message(message)
         if message.embeds:
             embed: discord.Embed = message.embeds[0]
-            embed_description = embed_field0_value = embed_field0_name = ''
-            if embed.description is not None: embed_description = str(embed.description)
+            embed_field0_value = ''
             if embed.fields:
-                embed_field0_name = embed.fields[0].name
                 embed_field0_value = embed.fields[0].value
 
             # Cel dailyquest
-            search_strings = [
-                'come back tomorrow and i will give you another quest!', #English
-                'why? idk, i have too many', #English 2
-            ]
-            if (any(search_string in embed_description.lower() for search_string in search_strings)
-                or 'daily quest' in embed_field0_name.lower()):
+            if (parsed_message.matches('celebration_cel_dailyquest', 'description')
+                or parsed_message.matches('celebration_cel_dailyquest_field', 'field0_name')):
                 user_command = user_command_message = user_name = None
                 user = await functions.get_interaction_user(message)
                 if user is None:
@@ -91,14 +99,8 @@ class CelebrationCog(commands.Cog):
             message_content = message.content
             
             # Cel Multiply
-            search_strings_1 = [
-                'you feel', #English
-            ]
-            search_strings_2 = [
-                '% more rich', #English
-            ]
-            if (any(search_string in message_content.lower() for search_string in search_strings_1)
-                and any(search_string in message_content.lower() for search_string in search_strings_2)):
+            if (parsed_message.matches('celebration_cel_multiply', 'content')
+                and parsed_message.matches('celebration_cel_multiply_rich', 'content')):
                 user_command = user_command_message = None
                 user = await functions.get_interaction_user(message)
                 if user is None:
@@ -132,10 +134,7 @@ class CelebrationCog(commands.Cog):
             message_content = message.content
             
             # Cel sacrifice
-            search_strings = [
-                'sacrificed', #English
-            ]
-            if (any(search_string in message_content.lower() for search_string in search_strings)
+            if (parsed_message.matches('celebration_cel_sacrifice', 'content')
                 and 'celebrationcoin' in message_content.lower()):
                 user_command = user_command_message = None
                 user = await functions.get_interaction_user(message)
@@ -172,10 +171,7 @@ class CelebrationCog(commands.Cog):
                 await functions.add_reminder_reaction(message, reminder, user_settings)
 
             # Cel Multiply cooldown
-            search_strings = [
-                'you cannot multiply your celebration coins', #English
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('celebration_cel_multiply_cooldown', 'content'):
                 user = message.mentions[0]
                 try:
                     user_settings: users.User = await users.get_user(user.id)
@@ -198,10 +194,7 @@ class CelebrationCog(commands.Cog):
                 await functions.add_reminder_reaction(message, reminder, user_settings)
 
             # Cel daily quest cooldown
-            search_strings = [
-                'you already completed the quest of today!', #English
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings) and message.mentions:
+            if parsed_message.matches('celebration_cel_dailyquest_cooldown', 'content') and message.mentions:
                 user = message.mentions[0]
                 try:
                     user_settings: users.User = await users.get_user(user.id)
@@ -223,10 +216,7 @@ class CelebrationCog(commands.Cog):
                 await functions.add_reminder_reaction(message, reminder, user_settings)
 
             # Cel sacrifice cooldown
-            search_strings = [
-                'you cannot sacrifice your celebration coins', #English
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('celebration_cel_sacrifice_cooldown', 'content'):
                 user = message.mentions[0]
                 try:
                     user_settings: users.User = await users.get_user(user.id)
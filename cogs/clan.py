@@ -11,40 +11,49 @@ from datetime import datetime, timedelta
 
 from cache import messages
 from database import clans, errors, cooldowns, reminders, users
-from resources import emojis, exceptions, functions, regex, settings, strings
+from resources import emojis, exceptions, functions, regex, router, settings, strings
+
+
+TRIGGERS = {
+    'clan_cooldown': (
+        'your guild has already raided or been upgraded', #English
+        'tu guild ya hizo un raideo o fue mejorado', #Spanish
+        'sua guild já raidou ou foi atualizada', #Portuguese
+    ),
+    'clan_overview': (
+        'your guild was raided', #English
+        'tu guild fue raideado', #Spanish
+        'sua guild foi raidad', #Portuguese
+    ),
+    'clan_upgrade': (
+        'upgrade', #English
+        'mejora', #Spanish
+        'melhoria', #Portuguese
+    ),
+    'clan_raid': (
+        '** raided **', #English
+        '** raideó **', #Spanish
+        '** raidou **', #Portuguese
+    ),
+}
 
 
 class ClanCog(commands.Cog):
     """Cog that contains the clan detection commands"""
     def __init__(self, bot: bridge.AutoShardedBot):
         self.bot = bot
+        router.register_message_handler(self.qualified_name, self.on_message, triggers=TRIGGERS)
 
-    @commands.Cog.listener()
-    async def on_message_edit(self, message_before: discord.Message, message_after: discord.Message) -> None:
-        """Runs when a message is edited in a channel."""
-        if message_after.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-        if message_before.pinned != message_after.pinned: return
-        embed_data_before = await functions.parse_embed(message_before)
-        embed_data_after = await functions.parse_embed(message_after)
-        if (message_before.content == message_after.content and embed_data_before == embed_data_after
-            and message_before.components == message_after.components): return
-        row: discord.Component
-        for row in message_after.components:
-            if isinstance(row, discord.ActionRow):
-                for component in row.children:
-                    if isinstance(component, (discord.Button, discord.SelectMenu)):
-                        if component.disabled:
-                            return
-        await self.on_message(message_after)
+    def cog_unload(self) -> None:
+        """Removes the message handlers of this cog from the router."""
+        router.unregister_message_handler(self.qualified_name)
 
-    @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
-        """Runs when a message is sent in a channel."""
-        if message.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-
+        """Runs when EPIC RPG sends or edits a message. Called by the message router."""
+        parsed_message: router.ParsedMessage = router.get_parsed_message(message)
         if message.embeds:
             embed: discord.Embed = message.embeds[0]
-            message_author = message_title = icon_url = message_footer = message_field0_name = message_field0_value = ''
+            message_author = message_title = icon_url = message_field0_name = message_field0_value = ''
             message_field1 = message_description = ''
             if embed.author is not None:
                 message_author = str(embed.author.name)
@@ -56,15 +65,9 @@ class ClanCog(commands.Cog):
                 if len(embed.fields) > 1:
                     message_field1 = embed.fields[1].value
             if embed.description is not None: message_description = str(embed.description)
-            if embed.footer is not None: message_footer = str(embed.footer.text)
 
             # Clan cooldown
-            search_strings = [
-                'your guild has already raided or been upgraded', #English
-                'tu guild ya hizo un raideo o fue mejorado', #Spanish
-                'sua guild já raidou ou foi atualizada', #Portuguese
-            ]
-            if any(search_string in message_title.lower() for search_string in search_strings):
+            if parsed_message.matches('clan_cooldown', 'title'):
                 user_id = user_name = user_command_message = None
                 user = await functions.get_interaction_user(message)
                 if user is None:
@@ -142,12 +145,7 @@ class ClanCog(commands.Cog):
                         await functions.add_reminder_reaction(message, reminder, user_settings)
 
             # Clan overview
-            search_strings = [
-                'your guild was raided', #English
-                'tu guild fue raideado', #Spanish
-                'sua guild foi raidad', #Portuguese
-            ]
-            if any(search_string in message_footer.lower() for search_string in search_strings):
+            if parsed_message.matches('clan_overview', 'footer'):
                 user = await functions.get_interaction_user(message)
                 if user is None:
                     user_command_message = (
@@ -180,12 +178,7 @@ class ClanCog(commands.Cog):
                 clan_alert_enabled = getattr(clan, 'alert_enabled', False)
                 if clan_channel_id is None: clan_alert_enabled = False
                 if not user_alert_enabled and not clan_alert_enabled: return
-                search_patterns = [
-                    r"STEALTH\*\*: (.+?)\n", #English
-                    r"SIGILO\*\*: (.+?)\n", #Spanish
-                    r"FURTIVIDADE\*\*: (.+?)\n", #Portuguese
-                ]
-                stealth_match = await functions.get_match_from_patterns(search_patterns, message_field1)
+                stealth_match = await functions.get_match_from_patterns(regex.PATTERNS_CLAN_STEALTH, message_field1)
                 if stealth_match:
                     stealth = stealth_match.group(1)
                     stealth = int(stealth)
@@ -253,12 +246,7 @@ class ClanCog(commands.Cog):
                         await functions.add_reminder_reaction(message, reminder, user_settings)
 
             # Guild upgrade
-            search_strings = [
-                'upgrade', #English
-                'mejora', #Spanish
-                'melhoria', #Portuguese
-            ]
-            if any(search_string == message_field0_name.lower() for search_string in search_strings):
+            if any(search_string == message_field0_name.lower() for search_string in TRIGGERS['clan_upgrade']):
                 user = await functions.get_interaction_user(message)
                 user_command_message = None
                 slash_command = True if user is not None else False
@@ -350,18 +338,15 @@ class ClanCog(commands.Cog):
                 '** RAIDEÓ **', #Spanish
                 '** RAIDOU **', #Portuguese
             ]
-            if (any(search_string in message_description for search_string in search_strings)
+            if (parsed_message.matches('clan_raid', 'description')
+                and any(search_string in message_description for search_string in search_strings)
                 and (('⚔️' in message_description.lower()) or ':crossed_swords:' in message_description.lower())):
                 user_name = user_command_message = None
                 user = await functions.get_interaction_user(message)
                 slash_command = True if user is not None else False
                 if user is None:
-                    search_patterns = [
-                        r"\*\*(.+?)\*\* throws", #English
-                        r"\*\*(.+?)\*\* tiró", #Spanish
-                        r"\*\*(.+?)\*\* jogou", #Portuguese
-                    ]
-                    user_name_match = await functions.get_match_from_patterns(search_patterns, message_field0_value)
+                    user_name_match = await functions.get_match_from_patterns(regex.PATTERNS_CLAN_RAID_USER_NAME,
+                                                                              message_field0_value)
                     if user_name_match:
                         user_name = user_name_match.group(1)
                         user_command_message = (
@@ -395,12 +380,8 @@ class ClanCog(commands.Cog):
                 time_left = timedelta(seconds=actual_cooldown) - time_elapsed
                 if time_left < timedelta(0): return
                 if clan_alert_enabled:
-                    search_patterns = [
-                        r"earned \*\*(.+?)\*\*", #English
-                        r"ganó \*\*(.+?)\*\*", #Spanish
-                        r"ganhou \*\*(.+?)\*\*", #Portuguese
-                    ]
-                    energy_match = await functions.get_match_from_patterns(search_patterns, message_field1)
+                    energy_match = await functions.get_match_from_patterns(regex.PATTERNS_CLAN_RAID_ENERGY,
+                                                                           message_field1)
                     if energy_match:
                         energy = int(energy_match.group(1))
                     else:
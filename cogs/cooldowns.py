@@ -11,39 +11,45 @@ from datetime import timedelta
 from cache import messages
 from database import alts, errors, reminders, users
 from database import cooldowns as cooldowns_db
-from resources import emojis, exceptions, functions, regex, settings, strings
+from resources import emojis, exceptions, functions, regex, router, strings
+
+
+TRIGGERS = {
+    'cooldowns_cooldown': (
+        'check the short version of this command', #English
+        'revisa la versión más corta de este comando', #Spanish
+        'verifique a versão curta deste comando', #Portuguese
+    ),
+    'cooldowns_ready': (
+        'check the long version of this command', #English
+        'revisa la versión más larga de este comando', #Spanish
+        'verifique a versão longa deste comando', #Portuguese
+    ),
+}
+
+READY_WORK_STRINGS = (
+    'mine`**',
+    'pickaxe`**',
+    'drill`**',
+    'dynamite`**',
+)
 
 
 class CooldownsCog(commands.Cog):
     """Cog that contains the cooldowns detection commands"""
     def __init__(self, bot: bridge.AutoShardedBot):
         self.bot = bot
+        router.register_message_handler(self.qualified_name, self.on_message, triggers=TRIGGERS)
 
-    @commands.Cog.listener()
-    async def on_message_edit(self, message_before: discord.Message, message_after: discord.Message) -> None:
-        """Runs when a message is edited in a channel."""
-        if message_after.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-        if message_before.pinned != message_after.pinned: return
-        embed_data_before = await functions.parse_embed(message_before)
-        embed_data_after = await functions.parse_embed(message_after)
-        if (message_before.content == message_after.content and embed_data_before == embed_data_after
-            and message_before.components == message_after.components): return
-        row: discord.Component
-        for row in message_after.components:
-            if isinstance(row, discord.ActionRow):
-                for component in row.children:
-                    if isinstance(component, (discord.Button, discord.SelectMenu)):
-                        if component.disabled:
-                            return
-        await self.on_message(message_after)
+    def cog_unload(self) -> None:
+        """Removes the message handlers of this cog from the router."""
+        router.unregister_message_handler(self.qualified_name)
 
-    @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
-        """Runs when a message is sent in a channel."""
-        if message.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
+        """Runs when EPIC RPG sends or edits a message. Called by the message router."""
         if not message.embeds: return
         embed: discord.Embed = message.embeds[0]
-        message_author = message_footer = message_fields = icon_url = message_description = ''
+        message_author = message_fields = icon_url = message_description = ''
         if embed.description is not None:
             message_description = embed.description
         if embed.author is not None:
@@ -51,15 +57,11 @@ class CooldownsCog(commands.Cog):
             icon_url = embed.author.icon_url
         for field in embed.fields:
             message_fields = f'{message_fields}\n{str(field.value)}'.strip()
-        if embed.footer is not None: message_footer = str(embed.footer.text)
+
+        parsed_message: router.ParsedMessage = router.get_parsed_message(message)
 
         # Cooldown
-        search_strings = [
-            'check the short version of this command', #English
-            'revisa la versión más corta de este comando', #Spanish
-            'verifique a versão curta deste comando', #Portuguese
-        ]
-        if any(search_string in message_footer.lower() for search_string in search_strings):
+        if parsed_message.matches('cooldowns_cooldown', 'footer'):
             user_id = user_name = user_command_message = None
             embed_users = []
             interaction_user = await functions.get_interaction_user(message)
@@ -99,13 +101,9 @@ class CooldownsCog(commands.Cog):
                 return
             if not user_settings.bot_enabled: return
             # Anniversary event reduction update
-            search_patterns = [
-                r'anniversary event cooldown reduction\*\*: (\d+?)%',
-                r'reducción de cooldown del evento de aniversario\*\*: (\d+?)%',
-                r'redução do cooldown do evento de aniversário\*\*: (\d+?)%',
-            ]
-            anniversary_event_match = await functions.get_match_from_patterns(search_patterns,
-                                                                              message_description)
+            anniversary_event_match = await functions.get_match_from_patterns(
+                regex.PATTERNS_COOLDOWNS_ANNIVERSARY_EVENT, message_description
+            )
             if anniversary_event_match:
                 event_reduction = int(anniversary_event_match.group(1))
                 anniversary_activities = [
@@ -299,13 +297,8 @@ class CooldownsCog(commands.Cog):
                 else:
                     ready_commands.append('produce')
             if user_settings.alert_work.enabled:
-                search_patterns = [
-                    r'mine`\*\* \(\*\*(.+?)\*\*',
-                    r'pickaxe`\*\* \(\*\*(.+?)\*\*',
-                    r'drill`\*\* \(\*\*(.+?)\*\*',
-                    r'dynamite`\*\* \(\*\*(.+?)\*\*',
-                ]
-                work_match = await functions.get_match_from_patterns(search_patterns, message_fields.lower())
+                work_match = await functions.get_match_from_patterns(regex.PATTERNS_COOLDOWNS_WORK,
+                                                                     message_fields.lower())
                 if work_match:
                     if user_settings.last_work_command != '':
                         user_command = await functions.get_slash_command(user_settings, user_settings.last_work_command)
@@ -353,12 +346,7 @@ class CooldownsCog(commands.Cog):
             if user_settings.reactions_enabled: await message.add_reaction(emojis.NAVI)
 
         # Ready
-        search_strings = [
-            'check the long version of this command', #English
-            'revisa la versión más larga de este comando', #Spanish
-            'verifique a versão longa deste comando', #Portuguese
-        ]
-        if any(search_string in message_footer.lower() for search_string in search_strings):
+        if parsed_message.matches('cooldowns_ready', 'footer'):
             user_id = user_name = user_command_message = None
             embed_users = []
             interaction_user = await functions.get_interaction_user(message)
@@ -419,13 +407,7 @@ class CooldownsCog(commands.Cog):
             if user_settings.alert_farm.enabled and 'farm`**' in message_fields.lower():
                 ready_commands.append('farm')
             if user_settings.alert_work.enabled:
-                search_strings_work = [
-                    r'mine`**',
-                    r'pickaxe`**',
-                    r'drill`**',
-                    r'dynamite`**',
-                ]
-                if any(search_string in message_fields.lower() for search_string in search_strings_work):
+                if any(search_string in message_fields.lower() for search_string in READY_WORK_STRINGS):
                     ready_commands.append('work')
             for activity in ready_commands:
                 try:
@@ -8,37 +8,58 @@ from discord.ext import bridge, commands
 
 from cache import messages
 from database import errors, reminders, users
-from resources import exceptions, functions, regex, settings, strings
+from resources import exceptions, functions, regex, router, strings
+
+
+TRIGGERS = {
+    'current_area_time_travel': (
+        'has traveled in time', #English
+        'viajou no tempo', #Spanish
+        'tempo de viagem', #Portuguese
+    ),
+    'current_area_hunt_adventure': (
+        'found a', #English
+        'found the', #English TOP
+        'encontr', #Spanish, Portuguese
+    ),
+    'current_area_move': (
+        'has moved to the area #', #English, area change
+        'starts to fly and travels to the next area!', #English, candy cane
+        'se movio al área #', #Spanish, area change
+        'se movio al área #', #TODO: Spanish, candy cane
+        'foi movido para a área #', #TODO: Portuguese, area change
+        'foi movido para a área #', #TODO: Portuguese, candy cane
+    ),
+    'current_area_zombie': (
+        ':zombie', #All languages
+    ),
+    'current_area_ruby_dragon': (
+        'the ruby dragon', #English
+        'el dragón ruby', #Spanish
+        'o dragão ruby', #Portuguese
+    ),
+}
+
+CURRENT_AREA_TOGETHER_STRINGS = (
+    'hunting together', #English
+    'cazando juntos', #Spanish
+    'caçando juntos', #Portuguese
+)
 
 
 class CurrentAreaCog(commands.Cog):
     """Cog that contains all commands related to the ruby counter"""
     def __init__(self, bot: bridge.AutoShardedBot):
         self.bot = bot
+        router.register_message_handler(self.qualified_name, self.on_message, triggers=TRIGGERS)
 
-    @commands.Cog.listener()
-    async def on_message_edit(self, message_before: discord.Message, message_after: discord.Message) -> None:
-        """Runs when a message is edited in a channel."""
-        if message_after.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-        if message_before.pinned != message_after.pinned: return
-        embed_data_before = await functions.parse_embed(message_before)
-        embed_data_after = await functions.parse_embed(message_after)
-        if (message_before.content == message_after.content and embed_data_before == embed_data_after
-            and message_before.components == message_after.components): return
-        row: discord.Component
-        for row in message_after.components:
-            if isinstance(row, discord.ActionRow):
-                for component in row.children:
-                    if isinstance(component, (discord.Button, discord.SelectMenu)):
-                        if component.disabled:
-                            return
-        await self.on_message(message_after)
+    def cog_unload(self) -> None:
+        """Removes the message handlers of this cog from the router."""
+        router.unregister_message_handler(self.qualified_name)
 
-    @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
-        """Runs when a message is sent in a channel."""
-        if message.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-
+        """Runs when EPIC RPG sends or edits a message. Called by the message router."""
+        parsed_message: router.ParsedMessage = router.get_parsed_message(message)
         if message.embeds:
             embed: discord.Embed = message.embeds[0]
             embed_description = embed_field = embed_author = ''
@@ -48,21 +69,12 @@ class CurrentAreaCog(commands.Cog):
                 icon_url = embed.author.icon_url
 
             # Set current area from time traveling
-            search_strings = [
-                'has traveled in time', #English
-                'viajou no tempo', #Spanish
-                'tempo de viagem', #Portuguese
-            ]
-            if any(search_string in embed_description.lower() for search_string in search_strings):
+            if parsed_message.matches('current_area_time_travel', 'description'):
                 user_command_message = None
                 user = await functions.get_interaction_user(message)
                 if user is None:
-                    search_patterns = [
-                        r'\*\*(.+?)\*\* has', #English
-                        r'\*\*(.+?)\*\* viajó', #English
-                        r'\*\*(.+?)\*\* tempo', #Portuguese
-                    ]
-                    user_name_match = await functions.get_match_from_patterns(search_patterns, embed_description)
+                    user_name_match = await functions.get_match_from_patterns(regex.PATTERNS_USER_NAME_TIME_TRAVEL,
+                                                                              embed_description)
                     if user_name_match:
                         user_name = user_name_match.group(1)
                         user_command_message = (
@@ -89,12 +101,7 @@ class CurrentAreaCog(commands.Cog):
         if not message.embeds:
             message_content = message.content
             # Set current area from hunt and adventure mobs
-            search_strings = [
-                'found a', #English
-                'found the', #English TOP
-                'encontr', #Spanish, Portuguese
-            ]
-            if (any(search_string in message_content.lower() for search_string in search_strings)
+            if (parsed_message.matches('current_area_hunt_adventure', 'content')
                 and (
                     any(f'> {monster.lower()}' in message_content.lower() for monster in strings.MONSTERS_HUNT)
                     or any(monster.lower() in message_content.lower() for monster in strings.MONSTERS_HUNT_TOP)
@@ -108,31 +115,21 @@ class CurrentAreaCog(commands.Cog):
             ):
                 user = await functions.get_interaction_user(message)
                 together = False
-                search_strings_together = [
-                    'hunting together', #English
-                    'cazando juntos', #Spanish
-                    'caçando juntos', #Portuguese
-                ]
-                if any(search_string in message_content.lower() for search_string in search_strings_together):
+                if any(search_string in message_content.lower() for search_string in CURRENT_AREA_TOGETHER_STRINGS):
                     together = True
                 if together:
-                    search_patterns = [
-                        r"\*\*(.+?)\*\* and \*\*", #English
-                        r"\*\*(.+?)\*\* y \*\*", #Spanish
-                        r"\*\*(.+?)\*\* e \*\*", #Portuguese
-                    ]
-                    user_name_match = await functions.get_match_from_patterns(search_patterns, message_content)
+                    user_name_match = (
+                        await functions.get_match_from_patterns(regex.PATTERNS_CURRENT_AREA_USER_NAME_TOGETHER,
+                                                                message_content)
+                    )
                     if not user_name_match:
                         await functions.add_warning_reaction(message)
                         await errors.log_error('User name not found in current area hunt together message.', message)
                         return
                     user_name = user_name_match.group(1)
                 else:
-                    search_patterns_user_name = [
-                        r"\*\*(.+?)\*\* found a", #English
-                        r"\*\*(.+?)\*\* encontr", #Spanish, Portuguese
-                    ]
-                    user_name_match = await functions.get_match_from_patterns(search_patterns_user_name, message_content)
+                    user_name_match = await functions.get_match_from_patterns(regex.PATTERNS_USER_NAME_FOUND,
+                                                                              message_content)
                     if not user_name_match:
                         await functions.add_warning_reaction(message)
                         await errors.log_error('Couldn\'t find user name in current area hunt/adventure message.', message)
@@ -153,16 +150,8 @@ class CurrentAreaCog(commands.Cog):
                 except exceptions.FirstTimeUserError:
                     return
                 if not user_settings.bot_enabled: return
-                search_patterns_mob_name = [
-                    r"found and killed (.+?) \*\*(.+?)\*\*(?: \(but| \(way|\n)", #English
-                    r"found (the) \*\*(.+?)\*\*(?:, | \(but| \(way|\n)", #English
-                    r"found an? (.+?) \*\*(.+?)\*\*", #English
-                    r"encontró un (.+?) \*\*(.+?)\*\*(?:, | \(pero| \(mucho|\n)", #Spanish
-                    r"encontró y mató (.+?) \*\*(.+?)\*\*(?:, | \(pero| \(mucho|\n)", #Spanish
-                    r"encontrou e matou (.+?) \*\*(.+?)\*\*(?:, | \(só| \(muito|\n)", #Portuguese
-                    r"encontrou um (.+?) \*\*(.+?)\*\*, mas", #Portuguese
-                ]
-                mob_name_match = await functions.get_match_from_patterns(search_patterns_mob_name, message_content)
+                mob_name_match = await functions.get_match_from_patterns(regex.PATTERNS_CURRENT_AREA_MOB_NAME,
+                                                                         message_content)
                 if not mob_name_match:
                     await functions.add_warning_reaction(message)
                     await errors.log_error('Couldn\'t find mob name in current area hunt/adventure message.', message)
@@ -174,15 +163,7 @@ class CurrentAreaCog(commands.Cog):
                     await functions.update_area(user_settings, new_area)
 
             # Set current area from move command
-            search_strings = [
-                'has moved to the area #', #English, area change
-                'starts to fly and travels to the next area!', #English, candy cane
-                'se movio al área #', #Spanish, area change
-                'se movio al área #', #TODO: Spanish, candy cane
-                'foi movido para a área #', #TODO: Portuguese, area change
-                'foi movido para a área #', #TODO: Portuguese, candy cane
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('current_area_move', 'content'):
                 user_name = None
                 user = await functions.get_interaction_user(message)
                 if user is None:
@@ -219,7 +200,7 @@ class CurrentAreaCog(commands.Cog):
                 await functions.update_area(user_settings, new_area)
 
             # Set current area from hunt event
-            if ':zombie' in message_content.lower() and '#2' in message_content.lower():
+            if parsed_message.matches('current_area_zombie', 'content') and '#2' in message_content.lower():
                 user = await functions.get_interaction_user(message)
                 if user is None:
                     user_name = user_command_message = None
@@ -243,12 +224,7 @@ class CurrentAreaCog(commands.Cog):
                 if user_settings.current_area != 2: await user_settings.update(current_area=2)
 
             # Clear current area from ruby dragon event and warn user
-            dragon_names = [
-                'the ruby dragon', #English
-                'el dragón ruby', #Spanish
-                'o dragão ruby', #Portuguese
-            ]
-            if ':mag:' in message_content.lower() and any(name in message_content.lower() for name in dragon_names):
+            if ':mag:' in message_content.lower() and parsed_message.matches('current_area_ruby_dragon', 'content'):
                 user = await functions.get_interaction_user(message)
                 if user is None:
                     user_name = user_command_message = None
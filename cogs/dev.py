@@ -17,7 +17,7 @@ from discord.ext import bridge, commands
 from discord.ext.bridge import BridgeOption
 from humanfriendly import format_timespan
 
-from database import cooldowns, users
+from database import cooldowns, executor, users
 from database import settings as settings_db
 from resources import emojis, exceptions, functions, logs, settings, views
 
@@ -302,8 +302,8 @@ class DevCog(commands.Cog):
             start_time = utils.utcnow()
             interaction = await ctx.respond('Starting backup...')
             backup_db_file = os.path.join(settings.BOT_DIR, 'database/navi_db_backup.db')
-            navi_backup_db = sqlite3.connect(backup_db_file)
-            settings.NAVI_DB.backup(navi_backup_db)
+            navi_backup_db = sqlite3.connect(backup_db_file, check_same_thread=False)
+            await executor.run(settings.NAVI_DB.backup, navi_backup_db)
             navi_backup_db.close()
             time_taken = utils.utcnow() - start_time
             await interaction.edit(f'Backup finished after {format_timespan(time_taken)}')
@@ -430,9 +430,10 @@ class DevCog(commands.Cog):
         else:
             await interaction.edit(content='Shutdown aborted.', view=None)
 
-    @dev_group.command(name='cache', description='Shows messagecache size', guild_ids=settings.DEV_GUILDS)
+    @dev_group.command(name='cache', description='Shows cache, database and event loop stats',
+                       guild_ids=settings.DEV_GUILDS)
     async def dev_cache(self, ctx: bridge.BridgeContext):
-        """Shows message cache size"""
+        """Shows cache, database and event loop stats"""
         if ctx.author.id not in settings.DEV_IDS:
             if ctx.is_app: await ctx.respond(MSG_NOT_DEV, ephemeral=True)
             return
@@ -443,12 +444,34 @@ class DevCog(commands.Cog):
         for channel_messages in messages._MESSAGE_CACHE.values():
             message_count += len(channel_messages)
             cache_size += sys.getsizeof(channel_messages)
-            for message in channel_messages:
-                cache_size += sys.getsizeof(message)
+            for cached_message in channel_messages:
+                cache_size += sys.getsizeof(cached_message) + sys.getsizeof(cached_message.message)
+        from cogs.tasks import loop_lag
+        executor_stats: executor.ExecutorStats = executor.get_executor_stats()
+        query_time_average = (
+            executor_stats.query_time_total / executor_stats.query_count if executor_stats.query_count > 0 else 0
+        )
+        user_cache_stats: users.UserCacheStats = users.get_user_cache_stats()
+        user_cache_requests = user_cache_stats.hits + user_cache_stats.misses
+        user_cache_hit_rate = user_cache_stats.hits / user_cache_requests * 100 if user_cache_requests > 0 else 0
         await ctx.respond(
+            f'**Message cache**\n'
             f'Cache size: {cache_size / 1024:,.2f} KB\n'
             f'Channel count: {channel_count:,}\n'
-            f'Message count: {message_count:,}\n'
+            f'Message count: {message_count:,}\n\n'
+            f'**User cache**\n'
+            f'Cached users: {user_cache_stats.size:,} / {settings.USER_CACHE_MAX_SIZE:,}\n'
+            f'Hits: {user_cache_stats.hits:,}\n'
+            f'Misses: {user_cache_stats.misses:,}\n'
+            f'Hit rate: {user_cache_hit_rate:,.2f}%\n\n'
+            f'**Database**\n'
+            f'Queries: {executor_stats.query_count:,}\n'
+            f'Read connections: {executor_stats.read_connections:,} / {settings.DB_READ_CONNECTIONS:,}\n'
+            f'Average query time: {query_time_average * 1000:,.2f} ms\n'
+            f'Slowest query: {executor_stats.query_time_max * 1000:,.2f} ms\n\n'
+            f'**Event loop lag**\n'
+            f'Last: {loop_lag["last"] * 1000:,.2f} ms\n'
+            f'Max: {loop_lag["max"] * 1000:,.2f} ms\n'
         )
 
     @dev_group.command(name='server-list', aliases=('servers',), description='List all servers the bot is in',
@@ -482,33 +505,10 @@ class DevCog(commands.Cog):
             if ctx.is_app: await ctx.respond(MSG_NOT_DEV, ephemeral=True)
             return
         await ctx.defer()
-        from datetime import datetime
-        import asyncio
         from humanfriendly import format_timespan
         from database import tracking
         start_time = utils.utcnow()
-        log_entry_count = 0
-        try:
-            old_log_entries = await tracking.get_old_log_entries(28)
-        except exceptions.NoDataFoundError:
-            await ctx.respond('Nothing to do.')
-            return
-        entries = {}
-        for log_entry in old_log_entries:
-            date_time = log_entry.date_time.replace(hour=23, minute=59, second=59, microsecond=999999)
-            key = (log_entry.user_id, log_entry.guild_id, log_entry.command, date_time)
-            amount = entries.get(key, 0)
-            entries[key] = amount + 1
-            log_entry_count += 1
-        for key, amount in entries.items():
-            user_id, guild_id, command, date_time = key
-            await tracking.insert_log_summary(user_id, guild_id, command, date_time, amount)
-            date_time_min = date_time.replace(hour=0, minute=0, second=0, microsecond=0)
-            date_time_max = date_time.replace(hour=23, minute=59, second=59, microsecond=999999)
-            await tracking.delete_log_entries(user_id, guild_id, command, date_time_min, date_time_max)
-            await asyncio.sleep(0.01)
-        cur = settings.NAVI_DB.cursor()
-        cur.execute('VACUUM')
+        log_entry_count = await tracking.consolidate_log_entries(28)
         end_time = utils.utcnow()
         time_passed = end_time - start_time
         logs.logger.info(f'Consolidated {log_entry_count:,} log entries in {format_timespan(time_passed)} manually.')
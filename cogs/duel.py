@@ -8,55 +8,50 @@ from discord.ext import bridge, commands
 
 from cache import messages
 from database import errors, reminders, users
-from resources import exceptions, functions, regex, settings
+from resources import exceptions, functions, regex, router, settings
+
+
+TRIGGERS = {
+    'duel_cooldown': (
+        'you have been in a duel recently', #English
+        'estuviste en un duelo recientemente', #Spanish
+        'você estava em um duelo recentemente', #Portuguese
+    ),
+    'duel_duel': (
+        "— duel", #All languages
+    ),
+    'duel_duel_result': (
+        "** won!", #English
+        "** ganó!", #Spanish
+        "** ganhou!", #Portugiesisch
+    ),
+}
 
 
 class DuelCog(commands.Cog):
     """Cog that contains the duel detection commands"""
     def __init__(self, bot: bridge.AutoShardedBot):
         self.bot = bot
+        router.register_message_handler(self.qualified_name, self.on_message, triggers=TRIGGERS)
 
-    @commands.Cog.listener()
-    async def on_message_edit(self, message_before: discord.Message, message_after: discord.Message) -> None:
-        """Runs when a message is edited in a channel."""
-        if message_after.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-        if message_before.pinned != message_after.pinned: return
-        embed_data_before = await functions.parse_embed(message_before)
-        embed_data_after = await functions.parse_embed(message_after)
-        if (message_before.content == message_after.content and embed_data_before == embed_data_after
-            and message_before.components == message_after.components): return
-        row: discord.Component
-        for row in message_after.components:
-            if isinstance(row, discord.ActionRow):
-                for component in row.children:
-                    if isinstance(component, (discord.Button, discord.SelectMenu)):
-                        if component.disabled:
-                            return
-        await self.on_message(message_after)
+    def cog_unload(self) -> None:
+        """Removes the message handlers of this cog from the router."""
+        router.unregister_message_handler(self.qualified_name)
 
-    @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
-        """Runs when a message is sent in a channel."""
-        if message.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-
+        """Runs when EPIC RPG sends or edits a message. Called by the message router."""
+        parsed_message: router.ParsedMessage = router.get_parsed_message(message)
         if message.embeds:
             embed: discord.Embed = message.embeds[0]
-            message_author = message_title = icon_url = message_description = message_field0_name = ''
+            message_author = message_title = icon_url = message_description = ''
             if embed.author is not None:
                 message_author = str(embed.author.name)
                 icon_url = embed.author.icon_url
             if embed.title is not None: message_title = str(embed.title)
             if embed.description is not None: message_description = embed.description
-            if embed.fields:
-                message_field0_name = embed.fields[0].name
 
             # Duel cooldown
-            search_strings = [
-                'you have been in a duel recently', #English
-                'estuviste en un duelo recientemente', #Spanish
-                'você estava em um duelo recentemente', #Portuguese
-            ]
-            if any(search_string in message_title.lower() for search_string in search_strings):
+            if parsed_message.matches('duel_cooldown', 'title'):
                 user_id = user_name = user_command_message = None
                 embed_users = []
                 interaction_user = await functions.get_interaction_user(message)
@@ -104,16 +99,8 @@ class DuelCog(commands.Cog):
                 await functions.add_reminder_reaction(message, reminder, user_settings)
 
             # Duel
-            search_strings_author = [
-                 "— duel", #All languages
-            ]
-            search_strings_field = [
-                 "** won!", #English
-                 "** ganó!", #Spanish
-                 "** ganhou!", #Portugiesisch
-            ]
-            if (any(search_string in message_author.lower() for search_string in search_strings_author)
-                and any(search_string in message_field0_name.lower() for search_string in search_strings_field)):
+            if (parsed_message.matches('duel_duel', 'author')
+                and parsed_message.matches('duel_duel_result', 'field0_name')):
                 user_id = user_name = user_command_message = duel_user = None
                 created_reminder = False
                 time_left = None
@@ -9,56 +9,82 @@ from discord.ext import bridge, commands
 
 from cache import messages
 from database import errors, reminders, users
-from resources import emojis, exceptions, functions, regex, settings
+from resources import emojis, exceptions, functions, regex, router
+
+
+TRIGGERS = {
+    'dungeon_miniboss_cooldown': (
+        'been in a fight with a boss recently', #English
+        'en una pelea con un boss recientemente', #Spanish
+        'em uma briga com um boss recentemente', #Portuguese
+    ),
+    'dungeon_miniboss_dungeon': (
+        " — dungeon", # All languages
+    ),
+    'dungeon_miniboss_dungeon_won': (
+        'eternality', # Eternal dungeon, all languages
+        'unlocked commands:', # Dungeons 1-9, 11-14, English
+        'comandos desbloqueados:', # Dungeons 1-9, 11-14, Spanish & Portuguese
+        'unlocked the next area', # Dungeons 11-15, English
+        'unlocked the next area', # TODO: Dungeons 11-15, Spanish
+        'unlocked the next area', # TODO: Dungeons 11-15, Portuguese
+        'both have unlocked area 11', # Dungeon 10, English
+        'both have unlocked area 11', # TODO: Dungeon 10, Spanish
+        'both have unlocked area 11', # TODO: Dungeon 10, Portuguese
+        'players are still in the same area', # Dungeons 16-20, English
+        'players are still in the same area', # TODO: Dungeons 16-20, Spanish
+        'players are still in the same area', # TODO: Dungeons 16-20, Portuguese
+    ),
+    'dungeon_miniboss_dungeon_lost': (
+        'rip', # Eternal dungeon fail, English
+    ),
+    'dungeon_miniboss_dungeon_lost_eternal': (
+        'eternal dragon', # Eternal dungeon fail, all languages
+    ),
+    'dungeon_miniboss_dungeon_reset': (
+        'dungeon reset` successfully bought', #English
+        'dungeon reset` comprado(s)', #Spanish, Portuguese
+    ),
+}
+
+SOLO_DUNGEON_FOOTER_STRINGS = (
+    'eternality', # Eternal dungeon, all languages
+    'unlocked the next area', # Dungeons 11-15, English
+    'unlocked the next area', # TODO: Dungeons 11-15, Spanish
+    'unlocked the next area', # TODO: Dungeons 11-15, Portuguese
+)
+
+SOLO_DUNGEON_FIELD0_VALUE_STRINGS = (
+    'eternal dragon', # Eternal dungeon fail, all languages
+)
 
 
 class DungeonMinibossCog(commands.Cog):
     """Cog that contains the dungeon/miniboss detection commands"""
     def __init__(self, bot: bridge.AutoShardedBot):
         self.bot = bot
+        router.register_message_handler(self.qualified_name, self.on_message, triggers=TRIGGERS)
 
-    @commands.Cog.listener()
-    async def on_message_edit(self, message_before: discord.Message, message_after: discord.Message) -> None:
-        """Runs when a message is edited in a channel."""
-        if message_after.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-        if message_before.pinned != message_after.pinned: return
-        embed_data_before = await functions.parse_embed(message_before)
-        embed_data_after = await functions.parse_embed(message_after)
-        if (message_before.content == message_after.content and embed_data_before == embed_data_after
-            and message_before.components == message_after.components): return
-        row: discord.Component
-        for row in message_after.components:
-            if isinstance(row, discord.ActionRow):
-                for component in row.children:
-                    if isinstance(component, (discord.Button, discord.SelectMenu)):
-                        if component.disabled:
-                            return
-        await self.on_message(message_after)
+    def cog_unload(self) -> None:
+        """Removes the message handlers of this cog from the router."""
+        router.unregister_message_handler(self.qualified_name)
 
-    @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
-        """Runs when a message is sent in a channel."""
-        if message.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-
+        """Runs when EPIC RPG sends or edits a message. Called by the message router."""
+        parsed_message: router.ParsedMessage = router.get_parsed_message(message)
         if message.embeds:
             embed: discord.Embed = message.embeds[0]
-            message_author = message_title = icon_url = message_footer = embed_field0_name = embed_field0_value = ''
+            message_author = message_title = icon_url = message_footer = embed_field0_value = ''
             if embed.author is not None:
                 message_author = str(embed.author.name)
                 icon_url = str(embed.author.icon_url)
             if embed.title is not None: message_title = str(embed.title)
             if embed.footer is not None: message_footer = embed.footer.text
             if embed.fields:
-                embed_field0_name = embed.fields[0].name
                 embed_field0_value = embed.fields[0].value
 
             # Dungeon / Miniboss cooldown
-            search_strings = [
-                'been in a fight with a boss recently', #English
-                'en una pelea con un boss recientemente', #Spanish
-                'em uma briga com um boss recentemente', #Portuguese
-            ]
-            if any(search_string in message_title.lower() for search_string in search_strings):
+            if parsed_message.matches('dungeon_miniboss_cooldown', 'title'):
                 user_id = user_name = user_command_message = None
                 embed_users = []
                 interaction_user = await functions.get_interaction_user(message)
@@ -108,55 +134,22 @@ class DungeonMinibossCog(commands.Cog):
                 await functions.add_reminder_reaction(message, reminder, user_settings)
 
             # Dungeons
-            search_strings_author = [
-               " — dungeon", # All languages
-            ]
-            search_strings_footer = [
-                'eternality', # Eternal dungeon, all languages
-                'unlocked commands:', # Dungeons 1-9, 11-14, English
-                'comandos desbloqueados:', # Dungeons 1-9, 11-14, Spanish & Portuguese
-                'unlocked the next area', # Dungeons 11-15, English
-                'unlocked the next area', # TODO: Dungeons 11-15, Spanish
-                'unlocked the next area', # TODO: Dungeons 11-15, Portuguese
-                'both have unlocked area 11', # Dungeon 10, English
-                'both have unlocked area 11', # TODO: Dungeon 10, Spanish
-                'both have unlocked area 11', # TODO: Dungeon 10, Portuguese
-                'players are still in the same area', # Dungeons 16-20, English
-                'players are still in the same area', # TODO: Dungeons 16-20, Spanish
-                'players are still in the same area', # TODO: Dungeons 16-20, Portuguese
-            ]
-            search_strings_field0_name = [
-                'rip', # Eternal dungeon fail, English
-            ]
-            search_strings_field0_value = [
-                'eternal dragon', # Eternal dungeon fail, all languages
-            ]
-
             if (
-                (any(search_string in message_author.lower() for search_string in search_strings_author) and
-                any(search_string in message_footer.lower() for search_string in search_strings_footer))
+                (parsed_message.matches('dungeon_miniboss_dungeon', 'author') and
+                parsed_message.matches('dungeon_miniboss_dungeon_won', 'footer'))
                 or
-                (any(search_string in embed_field0_name.lower() for search_string in search_strings_field0_name) and
-                any(search_string in embed_field0_value.lower() for search_string in search_strings_field0_value))
+                (parsed_message.matches('dungeon_miniboss_dungeon_lost', 'field0_name') and
+                parsed_message.matches('dungeon_miniboss_dungeon_lost_eternal', 'field0_value'))
                 ):
                 user_id = user_name = user_command_message = None
                 solo_dungeon = False
                 dungeon_users = []
                 user = await functions.get_interaction_user(message)
                 slash_command = True if user is not None else False
-                search_strings_solo_dungeons_footer = [
-                    'eternality', # Eternal dungeon, all languages
-                    'unlocked the next area', # Dungeons 11-15, English
-                    'unlocked the next area', # TODO: Dungeons 11-15, Spanish
-                    'unlocked the next area', # TODO: Dungeons 11-15, Portuguese
-                ]
-                search_strings_solo_dungeons_field0_value = [
-                    'eternal dragon', # Eternal dungeon fail, all languages
-                ]
                 if (
-                    any(search_string in message_footer.lower() for search_string in search_strings_solo_dungeons_footer)
+                    any(search_string in message_footer.lower() for search_string in SOLO_DUNGEON_FOOTER_STRINGS)
                     or
-                    any(search_string in embed_field0_value.lower() for search_string in search_strings_solo_dungeons_field0_value)
+                    any(search_string in embed_field0_value.lower() for search_string in SOLO_DUNGEON_FIELD0_VALUE_STRINGS)
                     ):
                     solo_dungeon = True
                 if user is None:
@@ -221,14 +214,8 @@ class DungeonMinibossCog(commands.Cog):
 
 
         if not message.embeds:
-            message_content = message.content
-
             # Dungeon reset from returning shop
-            search_strings = [
-                'dungeon reset` successfully bought', #English
-                'dungeon reset` comprado(s)', #Spanish, Portuguese
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('dungeon_miniboss_dungeon_reset', 'content'):
                 user_name = user_command_message = None
                 user = await functions.get_interaction_user(message)
                 if user is None:
@@ -9,37 +9,56 @@ from discord.ext import bridge, commands
 
 from cache import messages
 from database import errors, reminders, users
-from resources import exceptions, functions, regex, settings
+from resources import exceptions, functions, regex, router
+
+
+TRIGGERS = {
+    'epic_items_cooldown': (
+        'you have used an epic item already', #English
+        'ya usaste un item épico', #Spanish
+        'você já usou um item épico', #Portuguese
+    ),
+    'epic_items_seed': (
+        'planting the', #English
+        'colocando la', #Spanish
+        'plantando a', #Portuguese
+    ),
+    'epic_items_bait': (
+        'placing the', #English
+        'colocando el', #Spanish
+        'colocando a', #Portuguese
+    ),
+    'epic_items_trumpet': (
+        'summoning the', #English
+        'invocando una', #Spanish
+        'convocando a', #Portuguese
+    ),
+    'epic_items_toothbrush': (
+        'casts a magic spell', #English
+        'casts a magic spell', #Spanish
+        'casts a magic spell', #Portuguese
+    ),
+    'epic_items_arena_token': (
+        'arena cooldown got reset!', #English
+        'cooldown de arena reiniciado!', #Spanish
+        'o cooldown do arena foi reiniciado!', #Portuguese
+    ),
+}
 
 
 class EpicItemsCog(commands.Cog):
     """Cog that contains the epic item detection commands"""
     def __init__(self, bot: bridge.AutoShardedBot):
         self.bot = bot
+        router.register_message_handler(self.qualified_name, self.on_message, triggers=TRIGGERS)
 
-    @commands.Cog.listener()
-    async def on_message_edit(self, message_before: discord.Message, message_after: discord.Message) -> None:
-        """Runs when a message is edited in a channel."""
-        if message_after.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-        if message_before.pinned != message_after.pinned: return
-        embed_data_before = await functions.parse_embed(message_before)
-        embed_data_after = await functions.parse_embed(message_after)
-        if (message_before.content == message_after.content and embed_data_before == embed_data_after
-            and message_before.components == message_after.components): return
-        row: discord.Component
-        for row in message_after.components:
-            if isinstance(row, discord.ActionRow):
-                for component in row.children:
-                    if isinstance(component, (discord.Button, discord.SelectMenu)):
-                        if component.disabled:
-                            return
-        await self.on_message(message_after)
+    def cog_unload(self) -> None:
+        """Removes the message handlers of this cog from the router."""
+        router.unregister_message_handler(self.qualified_name)
 
-    @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
-        """Runs when a message is sent in a channel."""
-        if message.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-
+        """Runs when EPIC RPG sends or edits a message. Called by the message router."""
+        parsed_message: router.ParsedMessage = router.get_parsed_message(message)
         if message.embeds:
             embed: discord.Embed = message.embeds[0]
             message_author = message_title = icon_url = ''
@@ -49,12 +68,7 @@ class EpicItemsCog(commands.Cog):
             if embed.title is not None: message_title = str(embed.title)
 
             # EPIC item cooldown
-            search_strings = [
-                'you have used an epic item already', #English
-                'ya usaste un item épico', #Spanish
-                'você já usou um item épico', #Portuguese
-            ]
-            if any(search_string in message_title.lower() for search_string in search_strings):
+            if parsed_message.matches('epic_items_cooldown', 'title'):
                 user_id = user_name = user_command_message = None
                 user = await functions.get_interaction_user(message)
                 if user is None:
@@ -106,33 +120,13 @@ class EpicItemsCog(commands.Cog):
         if not message.embeds:
             message_content = message.content
             # EPIC seed, ULTRA bait, coin trumpet, legendary toothbrush
-            search_strings_seed = [
-                'planting the', #English
-                'colocando la', #Spanish
-                'plantando a', #Portuguese
-            ]
-            search_strings_bait = [
-                'placing the', #English
-                'colocando el', #Spanish
-                'colocando a', #Portuguese
-            ]
-            search_strings_trumpet = [
-                'summoning the', #English
-                'invocando una', #Spanish
-                'convocando a', #Portuguese
-            ]
-            search_strings_toothbrush = [
-                'casts a magic spell', #English
-                'casts a magic spell', #Spanish
-                'casts a magic spell', #Portuguese
-            ]
-            if ((any(search_string in message_content.lower() for search_string in search_strings_seed)
+            if ((parsed_message.matches('epic_items_seed', 'content')
                 and 'epic seed' in message_content.lower())
-                or (any(search_string in message_content.lower() for search_string in search_strings_bait)
+                or (parsed_message.matches('epic_items_bait', 'content')
                 and 'ultra bait' in message_content.lower())
-                or (any(search_string in message_content.lower() for search_string in search_strings_trumpet)
+                or (parsed_message.matches('epic_items_trumpet', 'content')
                 and 'coin trumpet' in message_content.lower())
-                or (any(search_string in message_content.lower() for search_string in search_strings_toothbrush)
+                or (parsed_message.matches('epic_items_toothbrush', 'content')
                 and 'legendary toothbrush' in message_content.lower())
             ):
                 user = await functions.get_interaction_user(message)
@@ -163,19 +157,12 @@ class EpicItemsCog(commands.Cog):
                 await functions.add_reminder_reaction(message, reminder, user_settings)
 
             # Arena token
-            search_strings = [
-                'arena cooldown got reset!', #English
-                'cooldown de arena reiniciado!', #Spanish
-                'o cooldown do arena foi reiniciado!', #Portuguese
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('epic_items_arena_token', 'content'):
                 user = await functions.get_interaction_user(message)
                 user_command_message = None
                 if user is None:
-                    search_patterns = [
-                        r"^\*\*(.+?)\*\*,", #All languages
-                    ]
-                    user_name_match = await functions.get_match_from_patterns(search_patterns, message_content)
+                    user_name_match = await functions.get_match_from_patterns(regex.PATTERNS_EPIC_ITEMS_USER_NAME,
+                                                                              message_content)
                     if user_name_match:
                         user_name = user_name_match.group(1)
                         user_command_message = (
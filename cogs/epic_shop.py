@@ -11,37 +11,32 @@ from datetime import timedelta
 
 from cache import messages
 from database import errors, reminders, users
-from resources import emojis, exceptions, functions, regex, settings
+from resources import emojis, exceptions, functions, regex, router
+
+
+TRIGGERS = {
+    'epic_shop_shop': (
+        " — epic shop", #All languages
+    ),
+    'epic_shop_maxed_purchase': (
+        'maxed the purchases', #All languages
+    ),
+}
 
 
 class EpicShopCog(commands.Cog):
     """Cog that contains the epic shop detection commands"""
     def __init__(self, bot: bridge.AutoShardedBot):
         self.bot = bot
+        router.register_message_handler(self.qualified_name, self.on_message, triggers=TRIGGERS)
 
-    @commands.Cog.listener()
-    async def on_message_edit(self, message_before: discord.Message, message_after: discord.Message) -> None:
-        """Runs when a message is edited in a channel."""
-        if message_after.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-        if message_before.pinned != message_after.pinned: return
-        embed_data_before = await functions.parse_embed(message_before)
-        embed_data_after = await functions.parse_embed(message_after)
-        if (message_before.content == message_after.content and embed_data_before == embed_data_after
-            and message_before.components == message_after.components): return
-        row: discord.Component
-        for row in message_after.components:
-            if isinstance(row, discord.ActionRow):
-                for component in row.children:
-                    if isinstance(component, (discord.Button, discord.SelectMenu)):
-                        if component.disabled:
-                            return
-        await self.on_message(message_after)
+    def cog_unload(self) -> None:
+        """Removes the message handlers of this cog from the router."""
+        router.unregister_message_handler(self.qualified_name)
 
-    @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
-        """Runs when a message is sent in a channel."""
-        if message.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-        
+        """Runs when EPIC RPG sends or edits a message. Called by the message router."""
+        parsed_message: router.ParsedMessage = router.get_parsed_message(message)
         if message.embeds:
             embed: discord.Embed = message.embeds[0]
             message_author = message_footer = message_fields = icon_url = message_description = ''
@@ -55,10 +50,7 @@ class EpicShopCog(commands.Cog):
             if embed.footer is not None: message_footer = str(embed.footer.text)
             
             # Epic shop
-            search_strings = [
-                " — epic shop", #All languages
-            ]
-            if (any(search_string in message_author.lower() for search_string in search_strings)
+            if (parsed_message.matches('epic_shop_shop', 'author')
                 and 'special deal' in message_fields.lower()):
                 user_id = user_name = user_command_message = None
                 user = await functions.get_interaction_user(message)
@@ -130,13 +122,8 @@ class EpicShopCog(commands.Cog):
                     await functions.add_reminder_reaction(message, reminder, user_settings)
 
         if not message.embeds:
-            message_content = message.content
-            
             # Maxed purchase message, only works without slash
-            search_strings = [
-                'maxed the purchases', #All languages
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('epic_shop_maxed_purchase', 'content'):
                 interaction = await functions.get_interaction(message)
                 if interaction is not None: return
                 user_command_message = None
@@ -9,36 +9,31 @@ from discord.ext import bridge, commands
 
 from cache import messages
 from database import errors, reminders, users
-from resources import emojis, exceptions, functions, regex, settings, strings
+from resources import emojis, exceptions, functions, regex, router, strings
+
+
+TRIGGERS = {
+    'eternity_unseal': (
+        "unsealed **the eternity**", #English
+        "unsealed **the eternity**", #TODO: Spanish
+        "unsealed **the eternity**", #TODO: Portuguese
+    ),
+}
 
 
 class EternityCog(commands.Cog):
     """Cog that contains the eternity detection commands"""
     def __init__(self, bot: bridge.AutoShardedBot):
         self.bot = bot
+        router.register_message_handler(self.qualified_name, self.on_message, triggers=TRIGGERS)
 
-    @commands.Cog.listener()
-    async def on_message_edit(self, message_before: discord.Message, message_after: discord.Message) -> None:
-        """Runs when a message is edited in a channel."""
-        if message_before.pinned != message_after.pinned: return
-        embed_data_before = await functions.parse_embed(message_before)
-        embed_data_after = await functions.parse_embed(message_after)
-        if (message_before.content == message_after.content and embed_data_before == embed_data_after
-            and message_before.components == message_after.components): return
-        row: discord.Component
-        for row in message_after.components:
-            if isinstance(row, discord.ActionRow):
-                for component in row.children:
-                    if isinstance(component, (discord.Button, discord.SelectMenu)):
-                        if component.disabled:
-                            return
-        await self.on_message(message_after)
+    def cog_unload(self) -> None:
+        """Removes the message handlers of this cog from the router."""
+        router.unregister_message_handler(self.qualified_name)
 
-    @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
-        """Runs when a message is sent in a channel."""
-        if message.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-
+        """Runs when EPIC RPG sends or edits a message. Called by the message router."""
+        parsed_message: router.ParsedMessage = router.get_parsed_message(message)
         if message.embeds:
             return
 
@@ -46,12 +41,7 @@ class EternityCog(commands.Cog):
             message_content = message.content
 
             # Unseal eternity
-            search_strings = [
-                "unsealed **the eternity**", #English
-                "unsealed **the eternity**", #TODO: Spanish
-                "unsealed **the eternity**", #TODO: Portuguese
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('eternity_unseal', 'content'):
                 user = await functions.get_interaction_user(message)
                 user_command_message = None
                 if user is None:
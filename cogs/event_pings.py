@@ -4,43 +4,50 @@ import discord
 from discord.ext import bridge, commands
 
 from database import guilds
-from resources import functions, settings
+from resources import functions, router
+
+
+TRIGGERS = {
+    'event_pings_event': (
+        'arena cookies', #Arena, English & Spanish
+        'cookies de arena', #Arena, Portuguese
+        'collect some coins', #Coin rain, English
+        'recolectar algunos coins', #Coin rain, Spanish
+        'coletar algumos coins', #Coin rain, Portuguese
+        'collect some fish', #Megalodon, English
+        'recolectar algunos normie fish', #Megalodon, Spanish
+        'coletar alguns normie fish', #Megalodon, Portuguese
+        'collect some wooden logs', #Epic tree, English
+        'recolectar algunos wooden logs', #Epic tree, Spanish
+        'coletar alguns wooden logs', #Epic tree, Portuguese
+        'join the summoning', #Lootbox summoning, English
+        'unirte a la invocación', #Lootbox summoning, Spanish
+        'participar da convocação', #Lootbox summoning, Portuguese
+        'time to fight', #Legendary boss
+        'epicrpgsword', #Miniboss
+        'get that pickaxe', #Rare hunt monster
+    ),
+}
 
 
 class EventPingsCog(commands.Cog):
     """Cog that contains the event ping detection commands"""
     def __init__(self, bot: bridge.AutoShardedBot):
         self.bot = bot
+        router.register_message_handler(self.qualified_name, self.on_message, triggers=TRIGGERS)
 
-    @commands.Cog.listener()
-    async def on_message_edit(self, message_before: discord.Message, message_after: discord.Message) -> None:
-        """Runs when a message is edited in a channel."""
-        if message_after.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-        if message_before.pinned != message_after.pinned: return
-        embed_data_before = await functions.parse_embed(message_before)
-        embed_data_after = await functions.parse_embed(message_after)
-        if (message_before.content == message_after.content and embed_data_before == embed_data_after
-            and message_before.components == message_after.components): return
-        row: discord.Component
-        for row in message_after.components:
-            if isinstance(row, discord.ActionRow):
-                for component in row.children:
-                    if isinstance(component, (discord.Button, discord.SelectMenu)):
-                        if component.disabled:
-                            return
-        await self.on_message(message_after)
+    def cog_unload(self) -> None:
+        """Removes the message handlers of this cog from the router."""
+        router.unregister_message_handler(self.qualified_name)
 
-    @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
-        """Runs when a message is sent in a channel."""
-        if message.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-
+        """Runs when EPIC RPG sends or edits a message. Called by the message router."""
+        parsed_message: router.ParsedMessage = router.get_parsed_message(message)
         if message.embeds:
             embed: discord.Embed = message.embeds[0]
-            field_0_name = field_0_value = ''
+            field_0_name = ''
             if embed.fields:
                 field_0_name = embed.fields[0].name
-                field_0_value = embed.fields[0].value
 
             search_strings_name = {
                 'type `join`': 'arena', #Arena, English
@@ -71,27 +78,8 @@ class EventPingsCog(commands.Cog):
                 'sapphire killer robot': 'rare_hunt_monster', #Rare hunt monster, mob 5
                 
             }
-            search_strings_value = (
-                'arena cookies', #Arena, English & Spanish
-                'cookies de arena', #Arena, Portuguese
-                'collect some coins', #Coin rain, English
-                'recolectar algunos coins', #Coin rain, Spanish
-                'coletar algumos coins', #Coin rain, Portuguese
-                'collect some fish', #Megalodon, English
-                'recolectar algunos normie fish', #Megalodon, Spanish
-                'coletar alguns normie fish', #Megalodon, Portuguese
-                'collect some wooden logs', #Epic tree, English
-                'recolectar algunos wooden logs', #Epic tree, Spanish
-                'coletar alguns wooden logs', #Epic tree, Portuguese
-                'join the summoning', #Lootbox summoning, English
-                'unirte a la invocación', #Lootbox summoning, Spanish
-                'participar da convocação', #Lootbox summoning, Portuguese
-                'time to fight', #Legendary boss
-                'epicrpgsword', #Miniboss
-                'get that pickaxe', #Rare hunt monster
-            )
             if (any(search_string in field_0_name.lower() for search_string in search_strings_name.keys())
-                and any(search_string in field_0_value.lower() for search_string in search_strings_value)):
+                and parsed_message.matches('event_pings_event', 'field0_value')):
                 for string, event_name in search_strings_name.items():
                     if string in field_0_name.lower():
                         event = event_name
@@ -10,37 +10,53 @@ from discord.ext import bridge, commands
 
 from cache import messages
 from database import errors, reminders, tracking, users
-from resources import emojis, exceptions, functions, regex, settings
+from resources import emojis, exceptions, functions, regex, router
+
+
+TRIGGERS = {
+    'farm_cooldown': (
+        'you have farmed already', #English
+        'ya cultivaste recientemente', #Spanish
+        'você plantou recentemente', #Portuguese
+    ),
+    'farm_farm': (
+        'seed in the ground...', #English
+        'en el suelo...', #Spanish
+        'no solo...', #Portuguese
+    ),
+    'farm_event_non_slash': (
+        'hits the floor with the', #English
+        'is about to plant another seed', #English
+    ),
+    'farm_event_slash': (
+        '<:seed', #All languages
+        ':crossed_swords:', #All languages
+        '⚔️', #All languages
+        ':sweat_drops:', #All languages
+        '💦', #All languages
+    ),
+}
+
+FARM_MESSAGE_STRINGS = (
+    'also got', #English
+    'también consiguió', #Spanish
+    'também conseguiu', #Portuguese
+)
 
 
 class FarmCog(commands.Cog):
     """Cog that contains the farm detection commands"""
     def __init__(self, bot: bridge.AutoShardedBot):
         self.bot = bot
+        router.register_message_handler(self.qualified_name, self.on_message, triggers=TRIGGERS)
 
-    @commands.Cog.listener()
-    async def on_message_edit(self, message_before: discord.Message, message_after: discord.Message) -> None:
-        """Runs when a message is edited in a channel."""
-        if message_after.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-        if message_before.pinned != message_after.pinned: return
-        embed_data_before = await functions.parse_embed(message_before)
-        embed_data_after = await functions.parse_embed(message_after)
-        if (message_before.content == message_after.content and embed_data_before == embed_data_after
-            and message_before.components == message_after.components): return
-        row: discord.Component
-        for row in message_after.components:
-            if isinstance(row, discord.ActionRow):
-                for component in row.children:
-                    if isinstance(component, (discord.Button, discord.SelectMenu)):
-                        if component.disabled:
-                            return
-        await self.on_message(message_after)
+    def cog_unload(self) -> None:
+        """Removes the message handlers of this cog from the router."""
+        router.unregister_message_handler(self.qualified_name)
 
-    @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
-        """Runs when a message is sent in a channel."""
-        if message.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-
+        """Runs when EPIC RPG sends or edits a message. Called by the message router."""
+        parsed_message: router.ParsedMessage = router.get_parsed_message(message)
         if message.embeds:
             embed: discord.Embed = message.embeds[0]
             message_author = message_title = icon_url = ''
@@ -50,12 +66,7 @@ class FarmCog(commands.Cog):
             if embed.title is not None: message_title = str(embed.title)
 
             # Farm cooldown
-            search_strings = [
-                'you have farmed already', #English
-                'ya cultivaste recientemente', #Spanish
-                'você plantou recentemente', #Portuguese
-            ]
-            if any(search_string in message_title.lower() for search_string in search_strings):
+            if parsed_message.matches('farm_cooldown', 'title'):
                 user_id = user_name = user_command = user_command_message = None
                 user = await functions.get_interaction_user(message)
                 slash_command = True if user is not None else False
@@ -123,20 +134,13 @@ class FarmCog(commands.Cog):
                     message_content = f'{message_content}\n{line}'
             message_content = message_content.strip()
             # Farm
-            search_strings = [
-               'seed in the ground...', #English
-               'en el suelo...', #Spanish
-               'no solo...', #Portuguese
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if any(search_string in message_content.lower() for search_string in TRIGGERS['farm_farm']):
                 user_name = last_farm_seed = user_command_message = None
                 user = await functions.get_interaction_user(message)
                 slash_command = True if user is not None else False
                 if user is None:
-                    search_patterns = [
-                        r"^\*\*(.+?)\*\* plant", #English, Spanish, Portuguese
-                    ]
-                    user_name_match = await functions.get_match_from_patterns(search_patterns, message_content)
+                    user_name_match = await functions.get_match_from_patterns(regex.PATTERNS_FARM_USER_NAME,
+                                                                              message_content)
                     if user_name_match:
                         user_name = user_name_match.group(1)
                         user_command_message = (
@@ -171,22 +175,13 @@ class FarmCog(commands.Cog):
                 if all(search_string not in message_content.lower() for search_string in search_strings_excluded):
                     crop_match = re.search(r'^([0-9,]+) <.+> (.+?) ', message_content.lower(), re.MULTILINE)
                     if crop_match is None:
-                        search_patterns = [
-                            r'give you ([0-9,]+) <.+> (.+?), ', #English, TOP
-                            r'regalarte ([0-9,]+) <.+> (.+?), ', #Spanish, TOP
-                            r'give you ([0-9,]+) <.+> (.+?), ', #TODO: Portuguese, TOP
-                        ]
-                        crop_match = await functions.get_match_from_patterns(search_patterns, message_content)
+                        crop_match = await functions.get_match_from_patterns(regex.PATTERNS_FARM_CROP, message_content)
                     crop_type = crop_match.group(2)
                     crop_count = getattr(user_settings.inventory, crop_type.lower())
                     crop_count += int(crop_match.group(1).replace(',',''))
                     updated_settings[f'inventory_{crop_type}'] = crop_count
-                    search_patterns = [
-                        r'also got (\d+?) \*\*(?:.+?) (.+?) ', #English
-                        r'también consiguió (\d+?) \*\*(?:.+?) (.+?) ', #Spanish
-                        r'também conseguiu(\d+?) \*\*(?:.+?) (.+?) ', #Portuguese
-                    ]
-                    seed_returned_match = await functions.get_match_from_patterns(search_patterns, message_content)
+                    seed_returned_match = await functions.get_match_from_patterns(regex.PATTERNS_FARM_SEED_RETURNED,
+                                                                                  message_content)
                     if seed_returned_match:
                         seed_returned_count = int(seed_returned_match.group(1))
                         seed_returned_type = seed_returned_match.group(2).lower()
@@ -221,12 +216,7 @@ class FarmCog(commands.Cog):
                 )
                 asyncio.ensure_future(functions.call_ready_command(self.bot, message, user, user_settings, 'farm'))
                 await functions.add_reminder_reaction(message, reminder, user_settings)
-                search_strings = [
-                    'also got', #English
-                    'también consiguió', #Spanish
-                    'também conseguiu', #Portuguese
-                ]
-                if any(search_string in message_content.lower() for search_string in search_strings):
+                if any(search_string in message_content.lower() for search_string in FARM_MESSAGE_STRINGS):
                     if 'potato seed**' in message_content.lower():
                         if user_settings.reactions_enabled: await message.add_reaction(emojis.SEED_POTATO)
                     elif 'carrot seed**' in message_content.lower():
@@ -235,8 +225,7 @@ class FarmCog(commands.Cog):
                         if user_settings.reactions_enabled: await message.add_reaction(emojis.SEED_BREAD)
 
             # Farm event non-slash (always English)
-            if ('hits the floor with the' in message_content.lower()
-                or 'is about to plant another seed' in message_content.lower()):
+            if any(search_string in message_content.lower() for search_string in TRIGGERS['farm_event_non_slash']):
                 interaction = await functions.get_interaction(message)
                 if interaction is None:
                     user_name = user_command = user_command_message = None
@@ -281,9 +270,10 @@ class FarmCog(commands.Cog):
                     await functions.add_reminder_reaction(message, reminder, user_settings)
 
             # Farm event slash (all languages)
-            if  (('<:seed' in message_content.lower() and '!!' in message_content.lower())
-                 or ':crossed_swords:' in message_content.lower() or '⚔️' in message_content.lower()
-                 or ':sweat_drops:' in message_content.lower() or '💦' in message_content.lower()):
+            if (parsed_message.matches('farm_event_slash', 'content')
+                and (('<:seed' in message_content.lower() and '!!' in message_content.lower())
+                     or ':crossed_swords:' in message_content.lower() or '⚔️' in message_content.lower()
+                     or ':sweat_drops:' in message_content.lower() or '💦' in message_content.lower())):
                 user_name = user_command = None
                 interaction = await functions.get_interaction(message)
                 if interaction is not None:
@@ -9,31 +9,57 @@ from discord.ext import bridge, commands
 
 from cache import messages
 from database import errors, users
-from resources import emojis, exceptions, functions, regex, settings
+from resources import emojis, exceptions, functions, regex, router
+
+
+TRIGGERS = {
+    'fun_mysterious_man': (
+        'died fighting the **mysterious man**', #English
+    ),
+    'fun_jail': (
+        'is now in the jail', #English
+    ),
+    'fun_enchant_exploded': (
+        'again, it **exploded**', #English
+    ),
+    'fun_farm_seed_lost': (
+        'took the seed from the ground and decided to try planting it again later', #English
+    ),
+    'fun_not_clever': (
+        'fighting them wasn\'t very clever', #English
+    ),
+    'fun_lootbox_lost': (
+        'you just lost your lootbox', #English
+        'você perdeu a lootbox', #Portuguese
+    ),
+    'fun_christmas_slime': (
+        'christmas slime', #English
+    ),
+    'fun_coolness': (
+        '<:coolness', #All languages
+    ),
+    'fun_lost_pet': (
+        'got bored and left', #English
+        'se aburrió y se fue', #Spanish
+        'ficou entediado e foi embora', #Portuguese
+    ),
+    'fun_lootbox_opened': (
+        'lootbox opened', #English
+        'lootbox abierta', #Spanish
+        'lootbox aberto', #Portuguese
+    ),
+}
 
 
 class FunCog(commands.Cog):
     """Cog with events and help and about commands"""
     def __init__(self, bot: bridge.AutoShardedBot):
         self.bot = bot
+        router.register_message_handler(self.qualified_name, self.on_message, triggers=TRIGGERS)
 
-    @commands.Cog.listener()
-    async def on_message_edit(self, message_before: discord.Message, message_after: discord.Message) -> None:
-        """Runs when a message is edited in a channel."""
-        if message_after.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-        if message_before.pinned != message_after.pinned: return
-        embed_data_before = await functions.parse_embed(message_before)
-        embed_data_after = await functions.parse_embed(message_after)
-        if (message_before.content == message_after.content and embed_data_before == embed_data_after
-            and message_before.components == message_after.components): return
-        row: discord.Component
-        for row in message_after.components:
-            if isinstance(row, discord.ActionRow):
-                for component in row.children:
-                    if isinstance(component, (discord.Button, discord.SelectMenu)):
-                        if component.disabled:
-                            return
-        await self.on_message(message_after)
+    def cog_unload(self) -> None:
+        """Removes the message handlers of this cog from the router."""
+        router.unregister_message_handler(self.qualified_name)
 
     @commands.command(aliases=('listen',))
     @commands.bot_has_permissions(send_messages=True, embed_links=True, read_message_history=True)
@@ -69,8 +95,8 @@ class FunCog(commands.Cog):
             return
         await ctx.reply('I said no appeal.')
 
-    @commands.Cog.listener()
-    async def on_message(self, message: discord.Message) -> None:
+    @commands.Cog.listener('on_message')
+    async def on_user_message(self, message: discord.Message) -> None:
         """Runs when a message is sent in a channel."""
 
         if not message.embeds and not message.author.bot:
@@ -115,9 +141,12 @@ class FunCog(commands.Cog):
             if message_content.lower() == 'navi big':
                 await message.reply('https://media.tenor.com/-_XHSdRBjJwAAAAd/legend-of-zelda-minish-cap.gif')
 
-        if not message.embeds and message.author.id in [settings.EPIC_RPG_ID, settings.TESTY_ID]:
+    async def on_message(self, message: discord.Message) -> None:
+        """Runs when EPIC RPG sends or edits a message. Called by the message router."""
+        parsed_message: router.ParsedMessage = router.get_parsed_message(message)
+        if not message.embeds:
             message_content = message.content
-            if 'died fighting the **mysterious man**' in message_content.lower():
+            if parsed_message.matches('fun_mysterious_man', 'content'):
                 user_command_message = user_name = None
                 user = await functions.get_interaction_user(message)
                 if user is None:
@@ -140,7 +169,7 @@ class FunCog(commands.Cog):
                 if not user_settings.bot_enabled or not user_settings.reactions_enabled: return
                 await message.add_reaction(emojis.PEPE_LAUGH)
 
-            if 'is now in the jail' in message_content.lower():
+            if parsed_message.matches('fun_jail', 'content'):
                 user = await functions.get_interaction_user(message)
                 if user is None:
                     user_name = None
@@ -164,7 +193,7 @@ class FunCog(commands.Cog):
                 if not user_settings.bot_enabled or not user_settings.reactions_enabled: return
                 await message.add_reaction(emojis.PEEPO_JAIL)
 
-            if 'again, it **exploded**' in message_content.lower():
+            if parsed_message.matches('fun_enchant_exploded', 'content'):
                 user = await functions.get_interaction_user(message)
                 user_name = user_command_message = None
                 if user is None:
@@ -187,7 +216,7 @@ class FunCog(commands.Cog):
                 if not user_settings.bot_enabled or not user_settings.reactions_enabled: return
                 await message.add_reaction(emojis.PEPE_LAUGH)
 
-            if 'took the seed from the ground and decided to try planting it again later' in message_content.lower():
+            if parsed_message.matches('fun_farm_seed_lost', 'content'):
                 user = await functions.get_interaction_user(message)
                 user_name = user_command_message = None
                 if user is None:
@@ -210,7 +239,7 @@ class FunCog(commands.Cog):
                 if not user_settings.bot_enabled or not user_settings.reactions_enabled: return
                 await message.add_reaction(emojis.PEPE_LAUGH)
 
-            if 'fighting them wasn\'t very clever' in message_content.lower():
+            if parsed_message.matches('fun_not_clever', 'content'):
                 user = await functions.get_interaction_user(message)
                 user_name = user_command_message = None
                 if user is None:
@@ -233,18 +262,12 @@ class FunCog(commands.Cog):
                 if not user_settings.bot_enabled or not user_settings.reactions_enabled: return
                 await message.add_reaction(emojis.PEPE_LAUGH)
 
-            search_strings = [
-                'you just lost your lootbox', #English
-                'você perdeu a lootbox', #Portuguese
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('fun_lootbox_lost', 'content'):
                 user = await functions.get_interaction_user(message)
                 user_name = user_command_message = None
                 if user is None:
-                    search_patterns = [
-                        r"\*\*(.+?)\*\* uses? ", #English, Portuguese
-                    ]
-                    user_name_match = await functions.get_match_from_patterns(search_patterns, message_content)
+                    user_name_match = await functions.get_match_from_patterns(regex.PATTERNS_FUN_USER_NAME_LOOTBOX,
+                                                                              message_content)
                     if user_name_match:
                         user_name = user_name_match.group(1)
                         user_command_message = (
@@ -263,7 +286,7 @@ class FunCog(commands.Cog):
                 if not user_settings.bot_enabled or not user_settings.reactions_enabled: return
                 await message.add_reaction(emojis.PEPE_LAUGH)
 
-            if 'christmas slime' in message_content.lower() and 'got 100' in message_content.lower():
+            if parsed_message.matches('fun_christmas_slime', 'content') and 'got 100' in message_content.lower():
                 user = await functions.get_interaction_user(message)
                 user_name = user_command_message = None
                 if user is None:
@@ -286,18 +309,12 @@ class FunCog(commands.Cog):
                 if not user_settings.bot_enabled or not user_settings.reactions_enabled: return
                 await message.add_reaction(emojis.PEEPO_XMAS_YAY)
 
-            search_strings = [
-                '<:coolness', #All languages
-            ]
-            if (any(search_string in message_content.lower() for search_string in search_strings)
+            if (parsed_message.matches('fun_coolness', 'content')
                 and not 'coolrency' in message_content.lower()):
                 user = await functions.get_interaction_user(message)
                 if user is None:
-                    search_patterns = [
-                        r"\*\*(.+?)\*\* (also )?earned [0-9,]+ <:coolness", #English
-                        r"\*\*(.+?)\*\* found", #English 2
-                    ]
-                    user_name_match = await functions.get_match_from_patterns(search_patterns, message_content)
+                    user_name_match = await functions.get_match_from_patterns(regex.PATTERNS_FUN_USER_NAME_COOLNESS,
+                                                                              message_content)
                     if user_name_match:
                         user_name = user_name_match.group(1)
                         user_command_message = (
@@ -317,19 +334,14 @@ class FunCog(commands.Cog):
                 if not user_settings.bot_enabled or not user_settings.reactions_enabled: return
                 await message.add_reaction(emojis.PANDA_COOL)
 
-        if message.embeds and message.author.id in [settings.EPIC_RPG_ID, settings.TESTY_ID]:
+        if message.embeds:
             embed: discord.Embed = message.embeds[0]
 
             if embed.fields:
                 field = embed.fields[0]
 
                 # Lost pet reaction
-                search_strings = [
-                    'got bored and left', #English
-                    'se aburrió y se fue', #Spanish
-                    'ficou entediado e foi embora', #Portuguese
-                ]
-                if (any(search_string in field.value.lower() for search_string in search_strings)
+                if (parsed_message.matches('fun_lost_pet', 'field0_value')
                     and not 'bunny' in field.value.lower()):
                     user = await functions.get_interaction_user(message)
                     if user is None:
@@ -350,12 +362,7 @@ class FunCog(commands.Cog):
 
                 # Shitty lootbox reaction
                 shitty_lootbox_found = False
-                search_strings = [
-                    'lootbox opened', #English
-                    'lootbox abierta', #Spanish
-                    'lootbox aberto', #Portuguese
-                ]
-                if any(search_string in field.name.lower() for search_string in search_strings):
+                if parsed_message.matches('fun_lootbox_opened', 'field0_name'):
                     if '+1' in field.value.lower() and field.value.lower().count('<:') == 1:
                         if 'wooden log' in field.value.lower() or 'normie fish' in field.value.lower():
                             shitty_lootbox_found = True
@@ -9,35 +9,41 @@ from discord.ext import bridge, commands
 
 from cache import messages
 from database import errors, reminders, users
-from resources import exceptions, functions, regex, settings
+from resources import exceptions, functions, regex, router
+
+
+TRIGGERS = {
+    'halloween_boo_cooldown': (
+        'you have scared someone recently', #English
+        'ya asustaste recientemente', #Spanish
+        'você se assustou recentemente', #Portuguese
+    ),
+    'halloween_scroll_boss': (
+        "**the pumpkin bat** is attacking", #English
+    ),
+    'halloween_boo': (
+        '** scared **', #English
+        '** asustó a **', #Spanish
+        '** assustou a **', #Portuguese
+        '** failed to scare **', #English, failed
+        '** got so much scared by **', #English, failed
+    ),
+}
 
 
 class HalloweenCog(commands.Cog):
     """Cog that contains the halloween detection"""
     def __init__(self, bot: bridge.AutoShardedBot):
         self.bot = bot
+        router.register_message_handler(self.qualified_name, self.on_message, triggers=TRIGGERS)
 
-    @commands.Cog.listener()
-    async def on_message_edit(self, message_before: discord.Message, message_after: discord.Message) -> None:
-        """Runs when a message is edited in a channel."""
-        if message_before.pinned != message_after.pinned: return
-        embed_data_before = await functions.parse_embed(message_before)
-        embed_data_after = await functions.parse_embed(message_after)
-        if (message_before.content == message_after.content and embed_data_before == embed_data_after
-            and message_before.components == message_after.components): return
-        row: discord.Component
-        for row in message_after.components:
-            if isinstance(row, discord.ActionRow):
-                for component in row.children:
-                    if isinstance(component, (discord.Button, discord.SelectMenu)):
-                        if component.disabled:
-                            return
-        await self.on_message(message_after)
+    def cog_unload(self) -> None:
+        """Removes the message handlers of this cog from the router."""
+        router.unregister_message_handler(self.qualified_name)
 
-    @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
-        """Runs when a message is sent in a channel."""
-        if message.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
+        """Runs when EPIC RPG sends or edits a message. Called by the message router."""
+        parsed_message: router.ParsedMessage = router.get_parsed_message(message)
         if message.embeds:
             embed: discord.Embed = message.embeds[0]
             embed_description = embed_title = embed_field0_name = embed_field0_value = embed_autor = icon_url = ''
@@ -51,12 +57,7 @@ class HalloweenCog(commands.Cog):
                 icon_url = embed.author.icon_url
 
             # Hal boo cooldown
-            search_strings = [
-                'you have scared someone recently', #English
-                'ya asustaste recientemente', #Spanish
-                'você se assustou recentemente', #Portuguese
-            ]
-            if any(search_string in embed_title.lower() for search_string in search_strings):
+            if parsed_message.matches('halloween_boo_cooldown', 'title'):
                 user_id = user_name = user_command = user_command_message = None
                 user = await functions.get_interaction_user(message)
                 if user is None:
@@ -103,20 +104,15 @@ class HalloweenCog(commands.Cog):
                 await functions.add_reminder_reaction(message, reminder, user_settings)
 
             # Scroll boss helper
-            search_strings = [
-                "**the pumpkin bat** is attacking", #English
-            ]
-            if any(search_string in embed_field0_value.lower() for search_string in search_strings):
+            if parsed_message.matches('halloween_scroll_boss', 'field0_value'):
                 user_command_message = None
                 user = await functions.get_interaction_user(message)
                 if user is None:
-                    search_patterns = [
-                        r'\*\*(.+?)\*\* hits \*\*(.+?)\*\*',
-                        r'\*\*(.+?)\*\* has summoned \*\*(.+?)\*\*',
-                    ]
-                    user_name_match = await functions.get_match_from_patterns(search_patterns, embed_description)
+                    user_name_match = await functions.get_match_from_patterns(regex.PATTERNS_HALLOWEEN_SCROLL_BOSS,
+                                                                              embed_description)
                     if not user_name_match:
-                        user_name_match = await functions.get_match_from_patterns(search_patterns, embed_field0_value)
+                        user_name_match = await functions.get_match_from_patterns(regex.PATTERNS_HALLOWEEN_SCROLL_BOSS,
+                                                                                  embed_field0_value)
                     if user_name_match:
                         user_name = user_name_match.group(1)
                         if user_name.lower() == 'the pumpkin bat': user_name = user_name_match.group(2)
@@ -135,10 +131,8 @@ class HalloweenCog(commands.Cog):
                     except exceptions.FirstTimeUserError:
                         return
                     if not user_settings.bot_enabled or not user_settings.halloween_helper_enabled: return
-                search_patterns = [
-                    r'(?:attacking you) (?:from )?(?:the )?(\w.+)!', #English
-                ]
-                attack_match = await functions.get_match_from_patterns(search_patterns, embed_field0_value)
+                attack_match = await functions.get_match_from_patterns(regex.PATTERNS_HALLOWEEN_ATTACK,
+                                                                       embed_field0_value)
                 if not attack_match:
                     await functions.add_warning_reaction(message)
                     await errors.log_error('No attack found in scroll boss helper', message)
@@ -166,23 +160,12 @@ class HalloweenCog(commands.Cog):
         if not message.embeds:
             message_content = message.content
             # Boo
-            search_strings = [
-                '** scared **', #English
-                '** asustó a **', #Spanish
-                '** assustou a **', #Portuguese
-                '** failed to scare **', #English, failed
-                '** got so much scared by **', #English, failed
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('halloween_boo', 'content'):
                 user = await functions.get_interaction_user(message)
                 user_command_message = None
                 if user is None:
-                    search_patterns = [
-                        r" \*\*(.+?)\*\* scared", #English
-                        r" \*\*(.+?)\*\* failed", #English
-                        r" scared by \*\*(.+?)\*\*", #English
-                    ]
-                    user_name_match = await functions.get_match_from_patterns(search_patterns, message_content)
+                    user_name_match = await functions.get_match_from_patterns(regex.PATTERNS_HALLOWEEN_USER_NAME,
+                                                                              message_content)
                     if user_name_match:
                         user_name = user_name_match.group(1)
                         user_command_message = (
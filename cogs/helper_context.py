@@ -7,52 +7,90 @@ from discord.ext import bridge, commands
 
 from cache import messages
 from database import errors, users
-from resources import exceptions, functions, regex, settings, strings
+from resources import exceptions, functions, regex, router, strings
+
+
+TRIGGERS = {
+    'helper_context_pets_fusion': (
+        'you have got a new pet', #English
+        'conseguiste una nueva mascota', #Spanish
+        'você tem um novo pet', #Portuguese
+    ),
+    'helper_context_caught_new_pet': (
+        '** is now following **', #English
+        '** ahora sigue a **', #Spanish
+        '** agora segue **', #Portuguese
+    ),
+    'helper_context_pets_claim': (
+        'pet adventure rewards', #English 1
+        'reward summary', #English 2
+        'recompensas de pet adventure', #Spanish, Portuguese 1
+        'resumen de recompensas', #Spanish 2
+        'resumo de recompensas', #Portuguese 2
+    ),
+    'helper_context_vote_embed': (
+        'next vote rewards', #English
+        'recompensas del siguiente voto', #Spanish
+        'recompensas do próximo voto', #Portuguese
+    ),
+    'helper_context_pets_adventure': (
+        'your pet has started an adventure and will be back', #English 1 pet
+        'pets have started an adventure!', #English multiple pets
+        'tu mascota empezó una aventura y volverá', #Spanish 1 pet
+        'tus mascotas han comenzado una aventura!', #Spanish multiple pets
+        'seu pet começou uma aventura e voltará', #Portuguese 1 pet
+        'seus pets começaram uma aventura!', #Portuguese multiple pets
+    ),
+    'helper_context_quest': (
+        'got a **new quest**!', #English accepted
+        'consiguió una **nueva misión**', #Spanish accepted
+        'conseguiu uma **nova missão**', #Portuguese accepted
+    ),
+    'helper_context_jail': (
+        'is now in the jail', #English
+        'is now in the jail', #TODO: Spanish
+        'is now in the jail', #TODO: Portuguese
+    ),
+    'helper_context_ruby_dragon': (
+        ':mag:', #Ruby dragon event, all languages
+        '🔍', #Ruby dragon event, all languages
+    ),
+    'helper_context_zombie': (
+        ':zombie', #All languages
+    ),
+}
+
+HELPER_CONTEXT_TT_STRINGS = (
+    'the following pets are back instantly', #English
+    'voidog pet made all pets travel', #English VOIDog
+    'las siguientes mascotas están de vuelta instantaneamente', #Spanish
+    'mascota voidog hizo que todas tus mascotas', #Spanish VOIDog
+    'os seguintes pets voltaram instantaneamente', #Portuguese
+    'voidog fez todos os bichinhos', #Portuguese VOIDog
+)
 
 
 class HelperContextCog(commands.Cog):
     """Cog that contains the training helper detection"""
     def __init__(self, bot: bridge.AutoShardedBot):
         self.bot = bot
+        router.register_message_handler(self.qualified_name, self.on_message, triggers=TRIGGERS)
 
-    @commands.Cog.listener()
-    async def on_message_edit(self, message_before: discord.Message, message_after: discord.Message) -> None:
-        """Runs when a message is edited in a channel."""
-        if message_after.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-        if message_before.pinned != message_after.pinned: return
-        embed_data_before = await functions.parse_embed(message_before)
-        embed_data_after = await functions.parse_embed(message_after)
-        if (message_before.content == message_after.content and embed_data_before == embed_data_after
-            and message_before.components == message_after.components): return
-        row: discord.Component
-        for row in message_after.components:
-            if isinstance(row, discord.ActionRow):
-                for component in row.children:
-                    if isinstance(component, (discord.Button, discord.SelectMenu)):
-                        if component.disabled:
-                            return
-        await self.on_message(message_after)
+    def cog_unload(self) -> None:
+        """Removes the message handlers of this cog from the router."""
+        router.unregister_message_handler(self.qualified_name)
 
-    @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
-        """Runs when a message is sent in a channel."""
-        if message.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
+        """Runs when EPIC RPG sends or edits a message. Called by the message router."""
+        parsed_message: router.ParsedMessage = router.get_parsed_message(message)
         if message.embeds:
             embed: discord.Embed = message.embeds[0]
-            embed_description = embed_title = embed_field0_name = embed_field0_value = ''
-            if embed.description is not None: embed_description = embed.description
-            if embed.title is not None: embed_title = embed.title
+            embed_field0_value = ''
             if embed.fields:
-                embed_field0_name = embed.fields[0].name
                 embed_field0_value = embed.fields[0].value
 
             # Pets fusion
-            search_strings = [
-                'you have got a new pet', #English
-                'conseguiste una nueva mascota', #Spanish
-                'você tem um novo pet', #Portuguese
-            ]
-            if any(search_string in embed_description.lower() for search_string in search_strings):
+            if parsed_message.matches('helper_context_pets_fusion', 'description'):
                 user = await functions.get_interaction_user(message)
                 if user is None: return
                 try:
@@ -67,12 +105,7 @@ class HelperContextCog(commands.Cog):
                 await message.reply(answer)
 
             # Caught new pet
-            search_strings = [
-                '** is now following **', #English
-                '** ahora sigue a **', #Spanish
-                '** agora segue **', #Portuguese
-            ]
-            if any(search_string in embed_field0_value.lower() for search_string in search_strings):
+            if parsed_message.matches('helper_context_caught_new_pet', 'field0_value'):
                 user = await functions.get_interaction_user(message)
                 if user is None: return
                 try:
@@ -86,14 +119,7 @@ class HelperContextCog(commands.Cog):
                 await message.reply(answer)
 
             # Pets claim
-            search_strings = [
-                'pet adventure rewards', #English 1
-                'reward summary', #English 2
-                'recompensas de pet adventure', #Spanish, Portuguese 1
-                'resumen de recompensas', #Spanish 2
-                'resumo de recompensas', #Portuguese 2
-            ]
-            if any(search_string in embed_title.lower() for search_string in search_strings):
+            if parsed_message.matches('helper_context_pets_claim', 'title'):
                 user = await functions.get_interaction_user(message)
                 if user is None: return
                 try:
@@ -108,12 +134,7 @@ class HelperContextCog(commands.Cog):
                 await message.reply(answer)
 
             # Vote embed
-            search_strings = [
-                'next vote rewards', #English
-                'recompensas del siguiente voto', #Spanish
-                'recompensas do próximo voto', #Portuguese
-            ]
-            if (any(search_string in embed_field0_name.lower() for search_string in search_strings)
+            if (parsed_message.matches('helper_context_vote_embed', 'field0_name')
                 and not 'cooldown:' in embed_field0_value.lower()):
                 user = await functions.get_interaction_user(message)
                 if user is None: return
@@ -135,15 +156,7 @@ class HelperContextCog(commands.Cog):
             message_content = message.content
 
             # Pets adventure
-            search_strings = [
-                'your pet has started an adventure and will be back', #English 1 pet
-                'pets have started an adventure!', #English multiple pets
-                'tu mascota empezó una aventura y volverá', #Spanish 1 pet
-                'tus mascotas han comenzado una aventura!', #Spanish multiple pets
-                'seu pet começou uma aventura e voltará', #Portuguese 1 pet
-                'seus pets começaram uma aventura!', #Portuguese multiple pets
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('helper_context_pets_adventure', 'content'):
                 user = await functions.get_interaction_user(message)
                 if user is None: return
                 try:
@@ -151,15 +164,7 @@ class HelperContextCog(commands.Cog):
                 except exceptions.FirstTimeUserError:
                     return
                 if not user_settings.bot_enabled or not user_settings.context_helper_enabled: return
-                search_strings_tt = [
-                    'the following pets are back instantly', #English
-                    'voidog pet made all pets travel', #English VOIDog
-                    'las siguientes mascotas están de vuelta instantaneamente', #Spanish
-                    'mascota voidog hizo que todas tus mascotas', #Spanish VOIDog
-                    'os seguintes pets voltaram instantaneamente', #Portuguese
-                    'voidog fez todos os bichinhos', #Portuguese VOIDog
-                ]
-                if not any(search_string in message_content.lower() for search_string in search_strings_tt):
+                if not any(search_string in message_content.lower() for search_string in HELPER_CONTEXT_TT_STRINGS):
                     answer = (
                         f"➜ {strings.SLASH_COMMANDS['pets adventure']}\n"
                         f"➜ {strings.SLASH_COMMANDS['pets list']}\n"
@@ -168,12 +173,7 @@ class HelperContextCog(commands.Cog):
                     await message.reply(answer)
 
             # Quest - Only works with slash
-            search_strings = [
-                'got a **new quest**!', #English accepted
-                'consiguió una **nueva misión**', #Spanish accepted
-                'conseguiu uma **nova missão**', #Portuguese accepted
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('helper_context_quest', 'content'):
                 user = await functions.get_interaction_user(message)
                 if user is None: return
                 if message.reference.cached_message is not None:
@@ -244,12 +244,7 @@ class HelperContextCog(commands.Cog):
                     return
                 await message.reply(answer)
 
-            search_strings = [
-                'is now in the jail', #English
-                'is now in the jail', #TODO: Spanish
-                'is now in the jail', #TODO: Portuguese
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('helper_context_jail', 'content'):
                 user = await functions.get_interaction_user(message)
                 if user is None: return
                 try:
@@ -259,7 +254,7 @@ class HelperContextCog(commands.Cog):
                 if not user_settings.bot_enabled or not user_settings.context_helper_enabled: return
                 await message.reply(f"➜ {strings.SLASH_COMMANDS['jail']}")
 
-            if  ':zombie' in message_content.lower() and '#2' in message_content.lower():
+            if parsed_message.matches('helper_context_zombie', 'content') and '#2' in message_content.lower():
                 user_name = user_command_message = None
                 user = await functions.get_interaction_user(message)
                 if user is None:
@@ -291,11 +286,7 @@ class HelperContextCog(commands.Cog):
                 else:
                     await message.channel.send(f'**{user_global_name}**, {warning}')
 
-            search_strings = [
-                ':mag:', #Ruby dragon event, all languages
-                '🔍', #Ruby dragon event, all languages
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('helper_context_ruby_dragon', 'content'):
                 user_name = user_command_message = None
                 user = await functions.get_interaction_user(message)
                 if user is None:
@@ -7,51 +7,49 @@ from discord.ext import bridge, commands
 
 from cache import messages
 from database import errors, users
-from resources import emojis, exceptions, functions, regex, settings
+from resources import emojis, exceptions, functions, regex, router
+
+
+TRIGGERS = {
+    'helper_farm_inventory': (
+        "— inventory", #All languages
+    ),
+    'helper_farm_pets_claim': (
+        'pet adventure rewards', #English 1
+        'reward summary', #English 2
+        'recompensas de pet adventure', #Spanish, Portuguese 1
+        'resumen de recompensas', #Spanish 2
+        'resumo de recompensas', #Portuguese 2
+    ),
+    'helper_farm_special_seed': (
+        '`special seed`', #All languages
+    ),
+}
 
 
 class HelperFarmCog(commands.Cog):
     """Cog that contains all commands related to the ruby counter"""
     def __init__(self, bot: bridge.AutoShardedBot):
         self.bot = bot
+        router.register_message_handler(self.qualified_name, self.on_message, triggers=TRIGGERS)
 
-    @commands.Cog.listener()
-    async def on_message_edit(self, message_before: discord.Message, message_after: discord.Message) -> None:
-        """Runs when a message is edited in a channel."""
-        if message_after.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-        if message_before.pinned != message_after.pinned: return
-        embed_data_before = await functions.parse_embed(message_before)
-        embed_data_after = await functions.parse_embed(message_after)
-        if (message_before.content == message_after.content and embed_data_before == embed_data_after
-            and message_before.components == message_after.components): return
-        row: discord.Component
-        for row in message_after.components:
-            if isinstance(row, discord.ActionRow):
-                for component in row.children:
-                    if isinstance(component, (discord.Button, discord.SelectMenu)):
-                        if component.disabled:
-                            return
-        await self.on_message(message_after)
+    def cog_unload(self) -> None:
+        """Removes the message handlers of this cog from the router."""
+        router.unregister_message_handler(self.qualified_name)
 
-    @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
-        """Runs when a message is sent in a channel."""
-        if message.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-
+        """Runs when EPIC RPG sends or edits a message. Called by the message router."""
+        parsed_message: router.ParsedMessage = router.get_parsed_message(message)
         if message.embeds:
             embed: discord.Embed = message.embeds[0]
-            message_description = message_author = message_title = ''
-            if embed.title is not None: message_title = embed.title
+            message_description = message_author = ''
             if embed.description is not None: message_description = str(embed.description)
             if embed.author is not None:
                 message_author = str(embed.author.name)
                 icon_url = embed.author.icon_url
 
             # Seeds and crops from inventory
-            search_strings = [
-                "— inventory", #All languages
-            ]
-            if any(search_string in message_author.lower() for search_string in search_strings):
+            if parsed_message.matches('helper_farm_inventory', 'author'):
                 if icon_url is None: return
                 user_id = user_name = user_command_message = None
                 embed_users = []
@@ -106,14 +104,7 @@ class HelperFarmCog(commands.Cog):
                     await message.add_reaction(emojis.NAVI)
 
             # Pets claim
-            search_strings = [
-                'pet adventure rewards', #English 1
-                'reward summary', #English 2
-                'recompensas de pet adventure', #Spanish, Portuguese 1
-                'resumen de recompensas', #Spanish 2
-                'resumo de recompensas', #Portuguese 2
-            ]
-            if any(search_string in message_title.lower() for search_string in search_strings):
+            if parsed_message.matches('helper_farm_pets_claim', 'title'):
                 user_id = user_name = user_command_message = None
                 user = await functions.get_interaction_user(message)
                 if user is None:
@@ -172,16 +163,14 @@ class HelperFarmCog(commands.Cog):
             message_content = message.content
 
             # Special seed from guild shop
-            if '`special seed`' in message_content.lower() and 'guild rings' in message_content.lower():
+            if (parsed_message.matches('helper_farm_special_seed', 'content')
+                and 'guild rings' in message_content.lower()):
                 message_content = message_content.split('\n')[1]
                 user_name = user_command_message = None
                 user = await functions.get_interaction_user(message)
                 if user is None:
-                    search_patterns = [
-                        r"\*\*(.+?)\*\* got (\d+) (?:.+?) \*\*(.+?) seed", #English
-                        r"\*\*(.+?)\*\* cons[ie]gui[óu] (\d+) (?:.+?) \*\*(.+?) seed", #Spanish & Portuguese
-                    ]
-                    data_match = await functions.get_match_from_patterns(search_patterns, message_content)
+                    data_match = await functions.get_match_from_patterns(regex.PATTERNS_HELPER_FARM_SPECIAL_SEED,
+                                                                         message_content)
                     if data_match:
                         user_name = data_match.group(1)
                         user_command_message = (
@@ -7,50 +7,50 @@ from discord.ext import bridge, commands
 
 from cache import messages
 from database import errors, reminders, users
-from resources import emojis, functions, exceptions, regex, settings, strings
+from resources import emojis, exceptions, functions, regex, router, strings
+
+
+TRIGGERS = {
+    'helper_heal_hunt_together': (
+        'are hunting together', #English
+        'cazando juntos', #Spanish
+        'caçando juntos', #Portuguese
+    ),
+    'helper_heal_hunt_adventure': (
+        '** found a', #English
+        '** encontr', #Spanish, Portuguese
+    ),
+    'helper_heal_omega_sword': (
+        '`omega sword` successfully forged', #English
+        '`omega sword` exitosamente forjado', #Spanish
+        '`omega sword` forjado com sucesso', #Portuguese
+    ),
+    'helper_heal_dragon_breath_potion': (
+        '**dragon breath potion**, you\'ve received the following boosts', #English
+        '**dragon breath potion**, has recibido los siguientes boosts', #Spanish
+        '**dragon breath potion**, recebeu os seguintes boosts', #Portuguese
+    ),
+}
 
 
 class HelperHealCog(commands.Cog):
     """Cog that contains the heal warning detection"""
     def __init__(self, bot: bridge.AutoShardedBot):
         self.bot = bot
+        router.register_message_handler(self.qualified_name, self.on_message, triggers=TRIGGERS)
 
-    @commands.Cog.listener()
-    async def on_message_edit(self, message_before: discord.Message, message_after: discord.Message) -> None:
-        """Runs when a message is edited in a channel."""
-        if message_after.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-        if message_before.pinned != message_after.pinned: return
-        embed_data_before = await functions.parse_embed(message_before)
-        embed_data_after = await functions.parse_embed(message_after)
-        if (message_before.content == message_after.content and embed_data_before == embed_data_after
-            and message_before.components == message_after.components): return
-        row: discord.Component
-        for row in message_after.components:
-            if isinstance(row, discord.ActionRow):
-                for component in row.children:
-                    if isinstance(component, (discord.Button, discord.SelectMenu)):
-                        if component.disabled:
-                            return
-        await self.on_message(message_after)
+    def cog_unload(self) -> None:
+        """Removes the message handlers of this cog from the router."""
+        router.unregister_message_handler(self.qualified_name)
 
-    @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
-        """Runs when a message is sent in a channel."""
-        if message.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
+        """Runs when EPIC RPG sends or edits a message. Called by the message router."""
+        parsed_message: router.ParsedMessage = router.get_parsed_message(message)
         if message.embeds: return
         message_content = message.content
 
         # Hunt together
-        search_strings_hunt_together = [
-            'are hunting together', #English
-            'cazando juntos', #Spanish
-            'caçando juntos', #Portuguese
-        ]
-        search_strings_hunt_adv = [
-            '** found a', #English
-            '** encontr', #Spanish, Portuguese
-        ]
-        if any(search_string in message_content.lower() for search_string in search_strings_hunt_together):
+        if parsed_message.matches('helper_heal_hunt_together', 'content'):
             event_mobs = [
                 'christmas slime',
                 'bunny slime',
@@ -61,12 +61,8 @@ class HelperHealCog(commands.Cog):
             user_name = user_command_message = None
             interaction = await functions.get_interaction(message)
             user = await functions.get_interaction_user(message)
-            search_patterns = [
-                r"\*\*(.+?)\*\* and \*\*(.+?)\*\*", #English
-                r"\*\*(.+?)\*\* y \*\*(.+?)\*\*", #Spanish
-                r"\*\*(.+?)\*\* e \*\*(.+?)\*\*", #Portuguese
-            ]
-            user_name_match = await functions.get_match_from_patterns(search_patterns, message_content)
+            user_name_match = await functions.get_match_from_patterns(regex.PATTERNS_USER_NAMES_TOGETHER,
+                                                                      message_content)
             if user_name_match:
                 user_name, partner_name = user_name_match.groups()
             if user is None:
@@ -140,7 +136,7 @@ class HelperHealCog(commands.Cog):
                     await message.channel.send(f'**{user_global_name}**, {warning}')
 
         # Hunt solo and adventure
-        elif any(search_string in message_content.lower() for search_string in search_strings_hunt_adv):
+        elif parsed_message.matches('helper_heal_hunt_adventure', 'content'):
             event_mobs = [
                 'horslime',
                 'bat slime',
@@ -183,12 +179,8 @@ class HelperHealCog(commands.Cog):
             except exceptions.NoDataFoundError:
                 pass
             user_global_name = user.global_name if user.global_name is not None else user.name
-            search_patterns = [
-                r'lost (.+?) hp, remaining hp is (.+?)/', #English
-                r'(?:perdió|perdiste) (.+?) hp, la hp restante es (.+?)/', #Spanish
-                r'perdeu (.+?) hp, restam (.+?)/', #Spanish
-            ]
-            health_match = await functions.get_match_from_patterns(search_patterns, message_content.lower())
+            health_match = await functions.get_match_from_patterns(regex.PATTERNS_HELPER_HEAL_HEALTH,
+                                                                   message_content.lower())
             if not health_match:
                 search_strings = [
                     f'{user_name}** lost but', #English 1
@@ -223,12 +215,7 @@ class HelperHealCog(commands.Cog):
                     await message.channel.send(f'**{user_global_name}**, {warning}')
 
         # Heal after crafting omega sword
-        search_strings = [
-            '`omega sword` successfully forged', #English
-            '`omega sword` exitosamente forjado', #Spanish
-            '`omega sword` forjado com sucesso', #Portuguese
-        ]
-        if any(search_string in message_content.lower() for search_string in search_strings):
+        if parsed_message.matches('helper_heal_omega_sword', 'content'):
             user = await functions.get_interaction_user(message)
             if user is None:
                 user_command_message = (
@@ -261,12 +248,7 @@ class HelperHealCog(commands.Cog):
                 await message.channel.send(f'**{user_global_name}**, {warning}')
 
         # Heal after brewing dragon breath potion
-        search_strings = [
-            '**dragon breath potion**, you\'ve received the following boosts', #English
-            '**dragon breath potion**, has recibido los siguientes boosts', #Spanish
-            '**dragon breath potion**, recebeu os seguintes boosts', #Portuguese
-        ]
-        if any(search_string in message_content.lower() for search_string in search_strings):
+        if parsed_message.matches('helper_heal_dragon_breath_potion', 'content'):
             user = await functions.get_interaction_user(message)
             if user is None:
                 user_command_message = (
@@ -7,18 +7,34 @@ from discord.ext import bridge, commands
 
 from cache import messages
 from database import errors, users
-from resources import emojis, exceptions, functions, settings, regex
+from resources import emojis, exceptions, functions, regex, router
+
+
+TRIGGERS = {
+    'helper_pets_catch': (
+        'suddenly', #English
+        'de repente', #Spanish, Portuguese
+    ),
+    'helper_pets_catch_happiness': (
+        'happiness', #English
+        'felicidad', #Spanish, Portuguese
+    ),
+}
 
 
 class HelperPetsCog(commands.Cog):
     """Cog that contains the pets detection commands"""
     def __init__(self, bot: bridge.AutoShardedBot):
         self.bot = bot
+        router.register_message_handler(self.qualified_name, self.on_message, edits=False, triggers=TRIGGERS)
+
+    def cog_unload(self) -> None:
+        """Removes the message handlers of this cog from the router."""
+        router.unregister_message_handler(self.qualified_name)
 
-    @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
-        """Runs when a message is sent in a channel."""
-        if message.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
+        """Runs when EPIC RPG sends or edits a message. Called by the message router."""
+        parsed_message: router.ParsedMessage = router.get_parsed_message(message)
         if message.embeds:
             embed: discord.Embed = message.embeds[0]
             message_field_name = message_field_value = message_author = icon_url = ''
@@ -31,16 +47,8 @@ class HelperPetsCog(commands.Cog):
                 icon_url = str(embed.author.icon_url)
 
             # Pet catch
-            search_strings_name = [
-                'suddenly', #English
-                'de repente', #Spanish, Portuguese
-            ]
-            search_strings_value = [
-                'happiness', #English
-                'felicidad', #Spanish, Portuguese
-            ]
-            if (any(search_string in message_field_name.lower() for search_string in search_strings_name)
-                and any(search_string in message_field_value.lower() for search_string in search_strings_value)):
+            if (parsed_message.matches('helper_pets_catch', 'field0_name')
+                and parsed_message.matches('helper_pets_catch_happiness', 'field0_value')):
                 bunny_event = True if 'bunny' in message_author else False
                     
                 async def design_pet_catch_field(feeds: int, pats: int, user_settings: users.User) -> str:
@@ -85,12 +93,8 @@ class HelperPetsCog(commands.Cog):
                         user_id = int(user_id_match.group(1))
                         user = message.guild.get_member(user_id)
                     if user is None:
-                        search_patterns = [
-                            r"APPROACHING \*\*(.+?)\*\*", #English
-                            r"ACERCANDO A \*\*(.+?)\*\*", #Spanish
-                            r"APROXIMANDO DE \*\*(.+?)\*\*", #Portuguese
-                        ]
-                        user_name_match = await functions.get_match_from_patterns(search_patterns, message_field_name)
+                        user_name_match = await functions.get_match_from_patterns(regex.PATTERNS_HELPER_PETS_USER_NAME,
+                                                                                  message_field_name)
                         if not user_name_match:
                             user_name_match = re.search(regex.USERNAME_FROM_EMBED_AUTHOR, message_author)
                         if user_name_match:
@@ -119,16 +123,7 @@ class HelperPetsCog(commands.Cog):
                 except exceptions.FirstTimeUserError:
                     return
                 if not user_settings.bot_enabled or not user_settings.pet_helper_enabled: return
-                search_patterns_happiness = [
-                    r'happiness\**: (.+?)\n', #English
-                    r'felicidade?\**: (.+?)\n', #Spanish, Portuguese
-                ]
-                search_patterns_hunger = [
-                    r'hunger\**: (.+?)$', #English
-                    r'hambre\**: (.+?)$', #Spanish
-                    r'fome\**: (.+?)$', #Portuguese
-                ]
-                happiness_match = await functions.get_match_from_patterns(search_patterns_happiness,
+                happiness_match = await functions.get_match_from_patterns(regex.PATTERNS_HELPER_PETS_HAPPINESS,
                                                                             message_field_value.lower())
                 if happiness_match:
                     happiness = int(happiness_match.group(1))
@@ -136,7 +131,7 @@ class HelperPetsCog(commands.Cog):
                     await functions.add_warning_reaction(message)
                     await errors.log_error('Happiness not found in pet catch message for pet helper.', message)
                     return
-                hunger_match = await functions.get_match_from_patterns(search_patterns_hunger,
+                hunger_match = await functions.get_match_from_patterns(regex.PATTERNS_HELPER_PETS_HUNGER,
                                                                         message_field_value.lower())
                 if hunger_match:
                     hunger = int(hunger_match.group(1))
@@ -7,53 +7,82 @@ from discord.ext import bridge, commands
 
 from cache import messages
 from database import errors, users
-from resources import emojis, exceptions, functions, regex, settings, strings, views
+from resources import emojis, exceptions, functions, regex, router, strings, views
+
+
+TRIGGERS = {
+    'helper_ruby_trades': (
+        'our trade is done then', #English
+        'nuestro intercambio está hecho entonces', #Spanish
+        'nossa troca é feita então', #Portuguese
+    ),
+    'helper_ruby_lootboxes': (
+        "— lootbox", #All languages
+    ),
+    'helper_ruby_inventory': (
+        "— inventory", #All languages
+    ),
+    'helper_ruby_training': (
+        '** is training in the mine!', #English
+        '** está entrenando en la mina!', #Spanish
+        '** está treinando na mina!', #Portuguese
+    ),
+    'helper_ruby_selling': (
+        '`ruby` successfully sold', #English
+        '`ruby` vendido(s)', #Spanish, Portuguese
+    ),
+    'helper_ruby_work': (
+        '** got ', #English
+        '** consiguió ', #Spanish
+        '** conseguiu ', #Portuguese 1
+        '** recebeu ', #Portuguese 2
+    ),
+    'helper_ruby_ruby_sword': (
+        '`ruby sword` successfully crafted', #English
+        '`ruby sword` crafteado(s)', #Spanish
+        '`ruby sword` craftado(s)', #Portuguese
+    ),
+    'helper_ruby_ruby_armor': (
+        '`ruby armor` successfully crafted', #English
+        '`ruby armor` crafteado(s)', #Spanish
+        '`ruby armor` craftado(s)', #Portuguese
+    ),
+    'helper_ruby_coin_sword': (
+        '`coin sword` successfully crafted', #English
+        '`coin sword` crafteado(s)', #Spanish
+        '`coin sword` craftado(s)', #Portuguese
+    ),
+    'helper_ruby_ultra_edgy_armor': (
+        '`ultra-edgy armor` successfully forged', #English
+        '`ultra-edgy armor` exitosamente forjado', #Spanish
+        '`ultra-edgy armor` forjado com sucesso', #Portuguese
+    ),
+}
 
 
 class HelperRubyCog(commands.Cog):
     """Cog that contains all commands related to the ruby counter"""
     def __init__(self, bot: bridge.AutoShardedBot):
         self.bot = bot
+        router.register_message_handler(self.qualified_name, self.on_message, triggers=TRIGGERS)
 
-    @commands.Cog.listener()
-    async def on_message_edit(self, message_before: discord.Message, message_after: discord.Message) -> None:
-        """Runs when a message is edited in a channel."""
-        if message_after.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-        if message_before.pinned != message_after.pinned: return
-        embed_data_before = await functions.parse_embed(message_before)
-        embed_data_after = await functions.parse_embed(message_after)
-        if (message_before.content == message_after.content and embed_data_before == embed_data_after
-            and message_before.components == message_after.components): return
-        row: discord.Component
-        for row in message_after.components:
-            if isinstance(row, discord.ActionRow):
-                for component in row.children:
-                    if isinstance(component, (discord.Button, discord.SelectMenu)):
-                        if component.disabled:
-                            return
-        await self.on_message(message_after)
+    def cog_unload(self) -> None:
+        """Removes the message handlers of this cog from the router."""
+        router.unregister_message_handler(self.qualified_name)
 
-    @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
-        """Runs when a message is sent in a channel."""
-        if message.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-
+        """Runs when EPIC RPG sends or edits a message. Called by the message router."""
+        parsed_message: router.ParsedMessage = router.get_parsed_message(message)
         if message.embeds:
             embed: discord.Embed = message.embeds[0]
-            message_description = message_field = message_author = ''
-            if embed.description is not None: message_description = str(embed.description)
+            message_field = message_author = ''
             if embed.fields: message_field = str(embed.fields[0].value)
             if embed.author is not None:
                 message_author = str(embed.author.name)
                 icon_url = embed.author.icon_url
 
             # Rubies from trades E and F
-            search_strings = [
-                'our trade is done then', #English
-                'nuestro intercambio está hecho entonces', #Spanish
-                'nossa troca é feita então', #Portuguese
-            ]
-            if (any(search_string in message_description.lower() for search_string in search_strings)
+            if (parsed_message.matches('helper_ruby_trades', 'description')
                 and '<:ruby' in message_field.lower()):
                 user_name = user_command_message = None
                 user = await functions.get_interaction_user(message)
@@ -97,10 +126,7 @@ class HelperRubyCog(commands.Cog):
                     await message.add_reaction(emojis.NAVI)
 
             # Rubies from lootboxes
-            search_strings = [
-                "— lootbox", #All languages
-            ]
-            if (any(search_string in message_author.lower() for search_string in search_strings)
+            if (parsed_message.matches('helper_ruby_lootboxes', 'author')
                 and '<:ruby' in message_field.lower()):
                 user_id = user_name = user_command_message = None
                 user = await functions.get_interaction_user(message)
@@ -143,10 +169,7 @@ class HelperRubyCog(commands.Cog):
                     await message.add_reaction(emojis.NAVI)
 
             # Rubies from inventory
-            search_strings = [
-                "— inventory", #All languages
-            ]
-            if any(search_string in message_author.lower() for search_string in search_strings):
+            if parsed_message.matches('helper_ruby_inventory', 'author'):
                 if icon_url is None: return
                 user_id = user_name = user_command_message = None
                 embed_users = []
@@ -201,12 +224,8 @@ class HelperRubyCog(commands.Cog):
                     message_content = f'{message_content}\n{line}'
             message_content = message_content.strip()
             # Ruby training helper
-            search_strings = [
-                '** is training in the mine!', #English
-                '** está entrenando en la mina!', #Spanish
-                '** está treinando na mina!', #Portuguese
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if any(search_string in message_content.lower()
+                   for search_string in TRIGGERS['helper_ruby_training']):
                 user_name = user_command_message = None
                 user = await functions.get_interaction_user(message)
                 if user is None:
@@ -227,12 +246,8 @@ class HelperRubyCog(commands.Cog):
                 except exceptions.FirstTimeUserError:
                     return
                 if not user_settings.bot_enabled or not user_settings.ruby_counter_enabled: return
-                search_patterns = [
-                    r'more than (.+?) <:ruby', #English
-                    r'más de (.+?) <:ruby', #Spanish
-                    r'mais de (.+?) <:ruby', #Portuguese
-                ]
-                ruby_count_match = await functions.get_match_from_patterns(search_patterns, message_content)
+                ruby_count_match = await functions.get_match_from_patterns(regex.PATTERNS_HELPER_RUBY_TRADE_RUBY_COUNT,
+                                                                           message_content)
                 if ruby_count_match:
                     ruby_count = int(ruby_count_match.group(1).replace(',',''))
                 else:
@@ -274,11 +289,8 @@ class HelperRubyCog(commands.Cog):
                 await message.channel.send(content=answer, view=view)
 
             # Rubies from selling
-            search_strings = [
-                '`ruby` successfully sold', #English
-                '`ruby` vendido(s)', #Spanish, Portuguese
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if any(search_string in message_content.lower()
+                   for search_string in TRIGGERS['helper_ruby_selling']):
                 user_command_message = None
                 user = await functions.get_interaction_user(message)
                 if user is None:
@@ -309,22 +321,14 @@ class HelperRubyCog(commands.Cog):
                     await message.add_reaction(emojis.NAVI)
 
             # Rubies from work commands
-            search_strings = [
-                '** got ', #English
-                '** consiguió ', #Spanish
-                '** conseguiu ', #Portuguese 1
-                '** recebeu ', #Portuguese 2
-            ]
-            if (any(search_string in message_content.lower() for search_string in search_strings)
+            if (any(search_string in message_content.lower()
+                    for search_string in TRIGGERS['helper_ruby_work'])
                 and '<:ruby' in message_content.lower()):
                 user_name = user_command_message = None
                 user = await functions.get_interaction_user(message)
                 if user is None:
-                    search_patterns = [
-                        r'\*\*(.+?)\*\* got', #English
-                        r'\*\*(.+?)\*\* cons(?:e|i)gui(?:ó|u)', #Spanish, Portuguese
-                    ]
-                    user_name_match = await functions.get_match_from_patterns(search_patterns, message_content) #case
+                    user_name_match = await functions.get_match_from_patterns(regex.PATTERNS_HELPER_RUBY_WORK_USER_NAME,
+                                                                              message_content) #case
                     if user_name_match:
                         user_name = user_name_match.group(1)
                         user_command_message = (
@@ -341,14 +345,8 @@ class HelperRubyCog(commands.Cog):
                 except exceptions.FirstTimeUserError:
                     return
                 if not user_settings.bot_enabled or not user_settings.ruby_counter_enabled: return
-                search_patterns = [
-                    r'\*\* got (.+?) <:ruby', #English mine commands
-                    r' had (.+?) <:ruby', #English proc pickup commands
-                    r'\*\* cons(?:e|i)gui(?:ó|u) (.+?) <:ruby', #Spanish, Portuguese mine commands
-                    r'llevaba dentro (.+?) <:ruby', #Spanish proc pickup commands
-                    r'deles tinha (.+?) <:ruby', #Portuguese proc pickup commands
-                ]
-                ruby_count_match = await functions.get_match_from_patterns(search_patterns, message_content.lower())
+                ruby_count_match = await functions.get_match_from_patterns(regex.PATTERNS_HELPER_RUBY_WORK_RUBY_COUNT,
+                                                                           message_content.lower())
                 if ruby_count_match:
                     ruby_count = int(ruby_count_match.group(1).replace(',',''))
                 else:
@@ -360,12 +358,8 @@ class HelperRubyCog(commands.Cog):
                 await user_settings.update(inventory_ruby=ruby_count)
 
             # Rubies from crafting ruby sword
-            search_strings = [
-                '`ruby sword` successfully crafted', #English
-                '`ruby sword` crafteado(s)', #Spanish
-                '`ruby sword` craftado(s)', #Portuguese
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if any(search_string in message_content.lower()
+                   for search_string in TRIGGERS['helper_ruby_ruby_sword']):
                 user = await functions.get_interaction_user(message)
                 if user is None:
                     user_command_message = (
@@ -388,12 +382,8 @@ class HelperRubyCog(commands.Cog):
                     await message.add_reaction(emojis.NAVI)
 
             # Rubies from crafting ruby armor
-            search_strings = [
-                '`ruby armor` successfully crafted', #English
-                '`ruby armor` crafteado(s)', #Spanish
-                '`ruby armor` craftado(s)', #Portuguese
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if any(search_string in message_content.lower()
+                   for search_string in TRIGGERS['helper_ruby_ruby_armor']):
                 user = await functions.get_interaction_user(message)
                 if user is None:
                     user_command_message = (
@@ -416,12 +406,8 @@ class HelperRubyCog(commands.Cog):
                     await message.add_reaction(emojis.NAVI)
 
             # Rubies from crafting coin sword
-            search_strings = [
-                '`coin sword` successfully crafted', #English
-                '`coin sword` crafteado(s)', #Spanish
-                '`coin sword` craftado(s)', #Portuguese
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if any(search_string in message_content.lower()
+                   for search_string in TRIGGERS['helper_ruby_coin_sword']):
                 user = await functions.get_interaction_user(message)
                 if user is None:
                     user_command_message = (
@@ -444,12 +430,8 @@ class HelperRubyCog(commands.Cog):
                     await message.add_reaction(emojis.NAVI)
 
             # Rubies from crafting ultra-edgy armor
-            search_strings = [
-                '`ultra-edgy armor` successfully forged', #English
-                '`ultra-edgy armor` exitosamente forjado', #Spanish
-                '`ultra-edgy armor` forjado com sucesso', #Portuguese
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if any(search_string in message_content.lower()
+                   for search_string in TRIGGERS['helper_ruby_ultra_edgy_armor']):
                 user = await functions.get_interaction_user(message)
                 if user is None:
                     user_command_message = (
@@ -9,56 +9,55 @@ from discord.ext import bridge, commands
 from cache import messages
 from database import errors, users
 from database import settings as settings_db
-from resources import emojis, exceptions, functions, settings, regex, views
+from resources import emojis, exceptions, functions, regex, router, views
 
 
+TRIGGERS = {
+    'helper_training_void_areas': (
+        'help us unseal the next areas!', #English
+        'ayudanos a abrir las siguientes áreas!', #Spanish
+        'ajude-nos a abrir as seguintes áreas!', #Portuguese
+    ),
+    'helper_training_training': (
+        '** is training in the', #English
+        '** está entrenando', #Spanish
+        '** está treinando', #Portuguese
+    ),
+}
+
+VOID_AREA_UNSEALED_STRINGS = (
+    'unsealed', #English
+    'abierto', #Spanish
+    'aberto', #Portuguese, UNCONFIRMED
+)
+
+TRAINING_VOID_STRINGS = (
+    'training in the void', #English
+    'vacío', #Spanish, UNCONFIRMED
+    'vazio', #Portuguese, UNCONFIRMED
+)
+
 
 class HelperTrainingCog(commands.Cog):
     """Cog that contains the training helper detection"""
     def __init__(self, bot: bridge.AutoShardedBot):
         self.bot = bot
+        router.register_message_handler(self.qualified_name, self.on_message, triggers=TRIGGERS)
 
-    @commands.Cog.listener()
-    async def on_message_edit(self, message_before: discord.Message, message_after: discord.Message) -> None:
-        """Runs when a message is edited in a channel."""
-        if message_after.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-        if message_before.pinned != message_after.pinned: return
-        embed_data_before = await functions.parse_embed(message_before)
-        embed_data_after = await functions.parse_embed(message_after)
-        if (message_before.content == message_after.content and embed_data_before == embed_data_after
-            and message_before.components == message_after.components): return
-        row: discord.Component
-        for row in message_after.components:
-            if isinstance(row, discord.ActionRow):
-                for component in row.children:
-                    if isinstance(component, (discord.Button, discord.SelectMenu)):
-                        if component.disabled:
-                            return
-        await self.on_message(message_after)
+    def cog_unload(self) -> None:
+        """Removes the message handlers of this cog from the router."""
+        router.unregister_message_handler(self.qualified_name)
 
-    @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
-        """Runs when a message is sent in a channel."""
-        if message.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
+        """Runs when EPIC RPG sends or edits a message. Called by the message router."""
+        parsed_message: router.ParsedMessage = router.get_parsed_message(message)
         if message.embeds:
             embed: discord.Embed = message.embeds[0]
-            message_description = ''
-            if embed.description is not None: message_description = embed.description
             # Void area unseal times
-            search_strings = [
-                'help us unseal the next areas!', #English
-                'ayudanos a abrir las siguientes áreas!', #Spanish
-                'ajude-nos a abrir as seguintes áreas!', #Portuguese
-            ]
-            if any(search_string in message_description.lower() for search_string in search_strings):
+            if parsed_message.matches('helper_training_void_areas', 'description'):
                 updated_settings = False
                 for field in embed.fields:
-                    search_strings = [
-                        'unsealed', #English
-                        'abierto', #Spanish
-                        'aberto', #Portuguese, UNCONFIRMED
-                    ]
-                    if any(search_string in field.value.lower() for search_string in search_strings):
+                    if any(search_string in field.value.lower() for search_string in VOID_AREA_UNSEALED_STRINGS):
                         seal_timestring_match = re.search(r"__: (.+?)$", field.value)
                         if seal_timestring_match:
                             area_no = int(field.name[-2:])
@@ -80,17 +79,12 @@ class HelperTrainingCog(commands.Cog):
         if not message.embeds:
             message_content = message.content
             # Training helper
-            search_strings_included = [
-                '** is training in the', #English
-                '** está entrenando', #Spanish
-                '** está treinando', #Portuguese
-            ]
             search_strings_not_included = [
                 'in the mine!', #English
                 'en la mina!', #Spanish
                 'na mina!', #Portuguese
             ]
-            if (any(search_string in message_content.lower() for search_string in search_strings_included)
+            if (parsed_message.matches('helper_training_training', 'content')
                 and all(search_string not in message_content.lower() for search_string in search_strings_not_included)):
                 user_name = user_command_message = None
                 user = await functions.get_interaction_user(message)
@@ -112,12 +106,7 @@ class HelperTrainingCog(commands.Cog):
                 except exceptions.FirstTimeUserError:
                     return
                 if not user_settings.bot_enabled or not user_settings.training_helper_enabled: return
-                search_strings_void = [
-                    'training in the void', #English
-                    'vacío', #Spanish, UNCONFIRMED
-                    'vazio', #Portuguese, UNCONFIRMED
-                ]
-                if any(search_string in message_content.lower() for search_string in search_strings_void):
+                if any(search_string in message_content.lower() for search_string in TRAINING_VOID_STRINGS):
                     if user_settings.training_helper_button_mode:
                         answer, buttons = await functions.get_void_training_answer_buttons(message, user_settings)
                         if buttons:
@@ -9,35 +9,39 @@ from discord.ext import bridge, commands
 
 from cache import messages
 from database import errors, reminders, users
-from resources import emojis, exceptions, functions, logs, regex, settings
+from resources import emojis, exceptions, functions, logs, regex, router
+
+
+TRIGGERS = {
+    'horse_cooldown': (
+        'you have used this command recently', #English
+        'usaste este comando recientemente', #Spanish
+        'você usou este comando recentementesh', #Portuguese
+    ),
+    'horse_breeding': (
+        " — horse breeding", # All languages
+    ),
+    'horse_omega_horse_token': (
+        'horse cooldown got reset', #English
+        'cooldown de horse reiniciado', #Spanish
+        'cooldown do horse foi reiniciado', #Portuguese
+    ),
+}
 
 
 class HorseCog(commands.Cog):
     """Cog that contains the horse detection commands"""
     def __init__(self, bot: bridge.AutoShardedBot):
         self.bot = bot
+        router.register_message_handler(self.qualified_name, self.on_message, triggers=TRIGGERS)
 
-    @commands.Cog.listener()
-    async def on_message_edit(self, message_before: discord.Message, message_after: discord.Message) -> None:
-        """Runs when a message is edited in a channel."""
-        if message_before.pinned != message_after.pinned: return
-        embed_data_before = await functions.parse_embed(message_before)
-        embed_data_after = await functions.parse_embed(message_after)
-        if (message_before.content == message_after.content and embed_data_before == embed_data_after
-            and message_before.components == message_after.components): return
-        row: discord.Component
-        for row in message_after.components:
-            if isinstance(row, discord.ActionRow):
-                for component in row.children:
-                    if isinstance(component, (discord.Button, discord.SelectMenu)):
-                        if component.disabled:
-                            return
-        await self.on_message(message_after)
+    def cog_unload(self) -> None:
+        """Removes the message handlers of this cog from the router."""
+        router.unregister_message_handler(self.qualified_name)
 
-    @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
-        """Runs when a message is sent in a channel."""
-        if message.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
+        """Runs when EPIC RPG sends or edits a message. Called by the message router."""
+        parsed_message: router.ParsedMessage = router.get_parsed_message(message)
         if message.embeds:
             embed: discord.Embed = message.embeds[0]
             message_author = message_title = icon_url = ''
@@ -47,12 +51,7 @@ class HorseCog(commands.Cog):
             if embed.title is not None: message_title = str(embed.title)
 
             # Horse cooldown
-            search_strings = [
-                'you have used this command recently', #English
-                'usaste este comando recientemente', #Spanish
-                'você usou este comando recentementesh', #Portuguese
-            ]
-            if any(search_string in message_title.lower() for search_string in search_strings):
+            if parsed_message.matches('horse_cooldown', 'title'):
                 user_id = user_name = user_command_message = None
                 embed_users = []
                 interaction_user = await functions.get_interaction_user(message)
@@ -105,15 +104,12 @@ class HorseCog(commands.Cog):
                 await functions.add_reminder_reaction(message, reminder, user_settings)
 
             # Horse breeding
-            search_strings_author = [
-               " — horse breeding", # All languages
-            ]
             search_strings_title = [
                 f'breeding request accepted!', # English
                 f'petición de horse breeding aceptada!', # Spanish
                 f'pedido de horse breeding aceito!', # Portuguese
             ]
-            if (any(search_string in message_author.lower() for search_string in search_strings_author) and
+            if (parsed_message.matches('horse_breeding', 'author') and
                 any(search_string in message_title.lower() for search_string in search_strings_title)):
                 user_id = user_name = user_command_message = None
                 breeding_users = []
@@ -171,12 +167,7 @@ class HorseCog(commands.Cog):
             message_content = message.content
             
             # Omega horse token
-            search_strings = [
-                'horse cooldown got reset', #English
-                'cooldown de horse reiniciado', #Spanish
-                'cooldown do horse foi reiniciado', #Portuguese
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('horse_omega_horse_token', 'content'):
                 user_id = None
                 user = await functions.get_interaction_user(message)
                 if user is None:
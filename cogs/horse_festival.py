@@ -11,18 +11,91 @@ from discord.ext import bridge, commands
 
 from cache import messages
 from database import errors, reminders, users
-from resources import emojis, exceptions, functions, regex, settings, strings
+from resources import emojis, exceptions, functions, regex, router, strings
+
+
+TRIGGERS = {
+    'horse_festival_lightspeed': (
+        'rides at the speed of light', #English
+        'viaja a la velocidad de la luz', #Spanish
+        'viaja na velocidade', #Portuguese
+    ),
+    'horse_festival_megarace': (
+        'you have not reached the end of this stage', #English
+        'aún no has llegado al final de esta etapa', #Spanish
+        'você ainda não chegou ao fim desta etapa', #Portuguese
+    ),
+    'horse_festival_minirace': (
+        'you are now in the list of pending players for a tournament', #English
+        'ahora estás en la lista de jugadores pendientes de un torneo', #Spanish
+        'você está agora na lista de jogadores pendentes para um torneio', #Portuguese
+    ),
+    'horse_festival_minirace_start': (
+        'started riding!', #English
+        'started riding!', #TODO: Spanish
+        'started riding!', #TODO: Portuguese
+    ),
+    'horse_festival_megarace_stage': (
+        'total time', #English
+        'tiempo total', #Spanish
+        'tempo total', #Portuguese
+    ),
+    'horse_festival_megarace_overview': (
+        'you can join megarace every week', #English
+        'puedes entrar a la megacarrera cada semana', #Spanish
+        'você pode entrar na mega corrida toda semana', #Portuguese
+    ),
+    'horse_festival_megarace_not_started': (
+        'megarace not started', #English 2
+        'la megacarrera no comenzó', #Spanish 2
+        'a megacorrida não começou', #Portuguese 2
+    ),
+    'horse_festival_megarace_boost_done': (
+        'passes through the boost', #English
+        'pasa por el boost', #Spanish
+        'passa pelo boost', #Spanish, UNCONFIRMED
+    ),
+    'horse_festival_megarace_boost': (
+        'megaraceboost',
+    ),
+    'horse_festival_megarace_boost_missed': (
+        'did not pass through the boost',
+    ),
+    'horse_festival_megarace_helper': (
+        '— megarace', #All languages
+    ),
+}
+
+HORSE_FESTIVAL_COMPLETED_STRINGS = (
+    'megarace completed', #English
+    'megacarrera completada', #Spanish
+    'megacorrida completa', #Portuguese
+)
+
+HORSE_FESTIVAL_INCREASED_STRINGS = (
+    'stage time increased', #English
+)
+
+HORSE_FESTIVAL_REDUCED_STRINGS = (
+    'stage time reduced', #English
+    'tiempo de etapa reducido', #Spanish
+    'tempo da etapa reduzido', #Portuguese
+)
 
 
 class HorseFestivalCog(commands.Cog):
     """Cog that contains the horse festival detection commands"""
     def __init__(self, bot: bridge.AutoShardedBot):
         self.bot = bot
+        router.register_message_handler(self.qualified_name, self.on_message, on_message_edit=self.on_message_edit,
+                                        triggers=TRIGGERS)
+
+    def cog_unload(self) -> None:
+        """Removes the message handlers of this cog from the router."""
+        router.unregister_message_handler(self.qualified_name)
 
-    @commands.Cog.listener()
     async def on_message_edit(self, message_before: discord.Message, message_after: discord.Message) -> None:
-        """Runs when a message is edited in a channel."""
-        if message_after.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
+        """Runs when EPIC RPG edits a message. Called by the message router."""
         if message_after.embeds:
             embed: discord.Embed = message_after.embeds[0]
             message_author = ''
@@ -89,28 +162,19 @@ class HorseFestivalCog(commands.Cog):
         await self.on_message(message_after)
 
 
-    @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
-        """Runs when a message is sent in a channel."""
-
+        """Runs when EPIC RPG sends or edits a message. Called by the message router."""
+        parsed_message: router.ParsedMessage = router.get_parsed_message(message)
         if not message.embeds:
             message_content = message.content
 
             # Lightspeed
-            search_strings = [
-                'rides at the speed of light', #English
-                'viaja a la velocidad de la luz', #Spanish
-                'viaja na velocidade', #Portuguese
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('horse_festival_lightspeed', 'content'):
                 user_name = user = user_command_message = None
                 user = await functions.get_interaction_user(message)
                 if user is None:
-                    search_patterns = [
-                        r'\*\*(.+?)\*\* rides', #English
-                        r'\*\*(.+?)\*\* viaja', #Spanish, Portuguese
-                    ]
-                    user_name_match = await functions.get_match_from_patterns(search_patterns, message_content)
+                    user_name_match = await functions.get_match_from_patterns(regex.PATTERNS_HORSE_FESTIVAL_USER_NAME,
+                                                                              message_content)
                     if user_name_match:
                         user_name = user_name_match.group(1)
                         user_command_message = (
@@ -142,12 +206,7 @@ class HorseFestivalCog(commands.Cog):
                     await message.add_reaction(emojis.KIRBY_RUN)
 
             # Megarace
-            search_strings = [
-                'you have not reached the end of this stage', #English
-                'aún no has llegado al final de esta etapa', #Spanish
-                'você ainda não chegou ao fim desta etapa', #Portuguese
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('horse_festival_megarace', 'content'):
                 user_id = user_name = None
                 user = await functions.get_interaction_user(message)
                 if user is None:
@@ -163,12 +222,8 @@ class HorseFestivalCog(commands.Cog):
                     return
                 if not user_settings.bot_enabled or not user_settings.alert_megarace.enabled: return
                 user_command = await functions.get_slash_command(user_settings, 'megarace')
-                search_patterns = [
-                    r'be there in \*\*(.+?)\*\*', #English
-                    r'allí en \*\*(.+?)\*\*', #Spanish
-                    r'lá em \*\*(.+?)\*\*', #Portuguese
-                ]
-                timestring_match = await functions.get_match_from_patterns(search_patterns, message_content.lower())
+                timestring_match = await functions.get_match_from_patterns(regex.PATTERNS_HORSE_FESTIVAL_MEGARACE,
+                                                                           message_content.lower())
                 time_left = await functions.calculate_time_left_from_timestring(message, timestring_match.group(1))
                 if time_left < timedelta(0): return
                 reminder_message = user_settings.alert_megarace.message.replace('{command}', user_command)
@@ -179,12 +234,7 @@ class HorseFestivalCog(commands.Cog):
                 await functions.add_reminder_reaction(message, reminder, user_settings)
 
             
-            search_strings = [
-                'you are now in the list of pending players for a tournament', #English
-                'ahora estás en la lista de jugadores pendientes de un torneo', #Spanish
-                'você está agora na lista de jogadores pendentes para um torneio', #Portuguese
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('horse_festival_minirace', 'content'):
                 user_id = user_name = None
                 user = await functions.get_interaction_user(message)
                 if user is None:
@@ -214,12 +264,7 @@ class HorseFestivalCog(commands.Cog):
                                                          message.channel.id, reminder_message)
                 )
 
-            search_strings = [
-                'started riding!', #English
-                'started riding!', #TODO: Spanish
-                'started riding!', #TODO: Portuguese
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('horse_festival_minirace_start', 'content'):
                 user_id = user_name = None
                 user = await functions.get_interaction_user(message)
                 if user is None:
@@ -257,9 +302,7 @@ class HorseFestivalCog(commands.Cog):
 
         if message.embeds:
             embed: discord.Embed = message.embeds[0]
-            message_field0_name = message_field1_name = message_field0_value = message_field1_value = message_author = ''
-            message_description = ''
-            if embed.description is not None: message_description = str(embed.description)
+            message_field0_name = message_field0_value = message_field1_value = message_author = ''
             if embed.author is not None:
                 message_author = str(embed.author.name)
                 icon_url = embed.author.icon_url
@@ -267,15 +310,9 @@ class HorseFestivalCog(commands.Cog):
                 message_field0_name = embed.fields[0].name
                 message_field0_value = embed.fields[0].value
             if len(embed.fields) > 1:
-                message_field1_name = embed.fields[1].name
                 message_field1_value = embed.fields[1].value
 
-            search_strings = [
-                'total time', #English
-                'tiempo total', #Spanish
-                'tempo total', #Portuguese
-            ]
-            if (any(search_string in message_field1_name.lower() for search_string in search_strings)
+            if (parsed_message.matches('horse_festival_megarace_stage', 'field1_name')
                 and 'megarace' in message_author.lower()):
                 user_id = user_name = None
                 user = await functions.get_interaction_user(message)
@@ -306,10 +343,8 @@ class HorseFestivalCog(commands.Cog):
                     return
                 if not user_settings.bot_enabled or not user_settings.alert_megarace.enabled: return
                 user_command = await functions.get_slash_command(user_settings, 'megarace')
-                search_patterns = [
-                    r' \*\*(.+?)\*\* ', #English, Spanish, Portuguese
-                ]
-                timestring_match = await functions.get_match_from_patterns(search_patterns, message_field1_value.lower())
+                timestring_match = await functions.get_match_from_patterns(regex.PATTERNS_HORSE_FESTIVAL_MEGARACE_STAGE,
+                                                                           message_field1_value.lower())
                 if not timestring_match:
                     await functions.add_warning_reaction(message)
                     await errors.log_error('Timestring not found in megarace message.', message)
@@ -322,23 +357,8 @@ class HorseFestivalCog(commands.Cog):
                 )
                 await functions.add_reminder_reaction(message, reminder, user_settings)
 
-            search_strings = [
-                'you can join megarace every week', #English
-                'puedes entrar a la megacarrera cada semana', #Spanish
-                'você pode entrar na mega corrida toda semana', #Portuguese
-            ]
-            search_strings_not_started = [
-                'megarace not started', #English 2
-                'la megacarrera no comenzó', #Spanish 2
-                'a megacorrida não começou', #Portuguese 2
-            ]
-            search_strings_completed = [
-                'megarace completed', #English
-                'megacarrera completada', #Spanish
-                'megacorrida completa', #Portuguese
-            ]
-            if (any(search_string in message_description.lower() for search_string in search_strings)
-                and not any(search_string in message_field0_value.lower() for search_string in search_strings_not_started)):
+            if (parsed_message.matches('horse_festival_megarace_overview', 'description')
+                and not parsed_message.matches('horse_festival_megarace_not_started', 'field0_value')):
                 user_id = user_name = None
                 user = await functions.get_interaction_user(message)
                 if user is None:
@@ -356,17 +376,16 @@ class HorseFestivalCog(commands.Cog):
                     return
                 if not user_settings.bot_enabled or not user_settings.alert_megarace.enabled: return
                 user_command = await functions.get_slash_command(user_settings, 'megarace')
-                if any(search_string in message_field0_value.lower() for search_string in search_strings_completed):
+                if any(search_string in message_field0_value.lower() for search_string in HORSE_FESTIVAL_COMPLETED_STRINGS):
                     current_time = utils.utcnow()
                     next_monday = current_time.date() + timedelta(days=(0 - current_time.weekday() - 1) % 7 + 1)
                     next_monday_dt = datetime(year=next_monday.year, month=next_monday.month, day=next_monday.day, hour=0, minute=5, second=0, microsecond=0, tzinfo=timezone.utc)
                     time_left = next_monday_dt - utils.utcnow() + timedelta(seconds=random.randint(0, 600))
                 else:
-                    search_patterns = [
-                        r'time remaining\*\*: (.+?)\n', #English
-                        r'ti?empo restante\*\*: (.+?)\n', #Spanish, Portuguese
-                    ]
-                    timestring_match = await functions.get_match_from_patterns(search_patterns, message_field0_value.lower())
+                    timestring_match = (
+                        await functions.get_match_from_patterns(regex.PATTERNS_HORSE_FESTIVAL_MEGARACE_OVERVIEW,
+                                                                message_field0_value.lower())
+                    )
                     timestring = timestring_match.group(1)
                     if timestring in ('0d 0h 0m 0s', '0h 0m 0s'): return
                     time_left = await functions.calculate_time_left_from_timestring(message, timestring)
@@ -377,12 +396,7 @@ class HorseFestivalCog(commands.Cog):
                 )
                 await functions.add_reminder_reaction(message, reminder, user_settings)
 
-            search_strings = [
-                'passes through the boost', #English
-                'pasa por el boost', #Spanish
-                'passa pelo boost', #Spanish, UNCONFIRMED
-            ]
-            if any(search_string in message_field0_name.lower() for search_string in search_strings):
+            if parsed_message.matches('horse_festival_megarace_boost_done', 'field0_name'):
                 user_id = user_name = None
                 user = await functions.get_interaction_user(message)
                 if user is None:
@@ -404,12 +418,10 @@ class HorseFestivalCog(commands.Cog):
                 except exceptions.FirstTimeUserError:
                     return
                 if not user_settings.bot_enabled or not user_settings.alert_megarace.enabled: return
-                search_patterns = [
-                    r'(?:increased|reduced)__: \*\*(.+?)\*\*', #English
-                    r'(?:incrementado|aumentado|reducido)__: \*\*(.+?)\*\*', #Spanish, increased one UNCONFIRMED
-                    r'(?:incrementado|aumentado|reduzido)__: \*\*(.+?)\*\*', #TODO: Portuguese
-                ]
-                timestring_match = await functions.get_match_from_patterns(search_patterns, message_field0_value.lower())
+                timestring_match = (
+                    await functions.get_match_from_patterns(regex.PATTERNS_HORSE_FESTIVAL_MEGARACE_BOOST_DONE,
+                                                            message_field0_value.lower())
+                )
                 if not timestring_match:
                     await functions.add_warning_reaction(message)
                     await errors.log_error('Timestring not found in megarace boost done message.', message)
@@ -419,25 +431,14 @@ class HorseFestivalCog(commands.Cog):
                     reminder: reminders.Reminder = await reminders.get_user_reminder(user.id, 'megarace')
                 except exceptions.NoDataFoundError:
                     return
-                search_strings_increased = [
-                    'stage time increased', #English
-                ]
-                search_strings_reduced = [
-                    'stage time reduced', #English
-                    'tiempo de etapa reducido', #Spanish
-                    'tempo da etapa reduzido', #Portuguese
-                ]
-                if any(search_string in message_field0_value.lower() for search_string in search_strings_increased):
+                if any(search_string in message_field0_value.lower() for search_string in HORSE_FESTIVAL_INCREASED_STRINGS):
                     new_end_time = reminder.end_time + time_left
-                elif any(search_string in message_field0_value.lower() for search_string in search_strings_reduced):
+                elif any(search_string in message_field0_value.lower() for search_string in HORSE_FESTIVAL_REDUCED_STRINGS):
                     new_end_time = reminder.end_time - time_left
                 await reminder.update(end_time=new_end_time)
                 await functions.add_reminder_reaction(message, reminder, user_settings)
 
-            search_strings = [
-                'megaraceboost',
-            ]
-            if any(search_string in message_field0_name.lower() for search_string in search_strings):
+            if parsed_message.matches('horse_festival_megarace_boost', 'field0_name'):
                 user_id = user_name = None
                 user = await functions.get_interaction_user(message)
                 if user is None:
@@ -464,10 +465,7 @@ class HorseFestivalCog(commands.Cog):
                 answer = f'{answer} {user.mention}' if user_settings.ping_after_message else f'{user.mention} {answer}'
                 await message.channel.send(answer)
 
-            search_strings = [
-                'did not pass through the boost',
-            ]
-            if any(search_string in message_field0_name.lower() for search_string in search_strings):
+            if parsed_message.matches('horse_festival_megarace_boost_missed', 'field0_name'):
                 user_id = user_name = None
                 user = await functions.get_interaction_user(message)
                 if user is None:
@@ -493,7 +491,7 @@ class HorseFestivalCog(commands.Cog):
                 await message.add_reaction(emojis.PEPE_LAUGH)
 
             # Megarace helper
-            if '— megarace' in message_author.lower():
+            if parsed_message.matches('horse_festival_megarace_helper', 'author'):
                 user_name = user_id = None
                 user = await functions.get_interaction_user(message)
                 if user is None:
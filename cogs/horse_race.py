@@ -8,50 +8,41 @@ from discord.ext import bridge, commands
 
 from cache import messages
 from database import errors, reminders, users
-from resources import exceptions, functions, regex, settings
+from resources import exceptions, functions, regex, router
+
+
+TRIGGERS = {
+    'horse_race_next_race': (
+        'the next race is in', #English
+        'la siguiente carrera es en', #Spanish
+        'próxima corrida é em', #Portuguese
+    ),
+}
+
+HORSE_RACE_REGISTERED_STRINGS = (
+    'you are registered already', #English
+    'ya estás en registro', #Spanish
+    'você já está em registro', #Portuguese
+)
 
 
 class HorseRaceCog(commands.Cog):
     """Cog that contains the horse race detection"""
     def __init__(self, bot: bridge.AutoShardedBot):
         self.bot = bot
+        router.register_message_handler(self.qualified_name, self.on_message, triggers=TRIGGERS)
 
-    @commands.Cog.listener()
-    async def on_message_edit(self, message_before: discord.Message, message_after: discord.Message) -> None:
-        """Runs when a message is edited in a channel."""
-        if message_after.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-        if message_before.pinned != message_after.pinned: return
-        embed_data_before = await functions.parse_embed(message_before)
-        embed_data_after = await functions.parse_embed(message_after)
-        if (message_before.content == message_after.content and embed_data_before == embed_data_after
-            and message_before.components == message_after.components): return
-        row: discord.Component
-        for row in message_after.components:
-            if isinstance(row, discord.ActionRow):
-                for component in row.children:
-                    if isinstance(component, (discord.Button, discord.SelectMenu)):
-                        if component.disabled:
-                            return
-        await self.on_message(message_after)
+    def cog_unload(self) -> None:
+        """Removes the message handlers of this cog from the router."""
+        router.unregister_message_handler(self.qualified_name)
 
-    @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
-        """Runs when a message is sent in a channel."""
-        if message.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
+        """Runs when EPIC RPG sends or edits a message. Called by the message router."""
+        parsed_message: router.ParsedMessage = router.get_parsed_message(message)
         if message.embeds: return
         message_content = message.content
-        search_strings = [
-            'the next race is in', #English
-            'la siguiente carrera es en', #Spanish
-            'próxima corrida é em', #Portuguese
-        ]
-        if any(search_string in message_content.lower() for search_string in search_strings):
-            search_strings_registered = [
-                'you are registered already', #English
-                'ya estás en registro', #Spanish
-                'você já está em registro', #Portuguese
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings_registered):
+        if parsed_message.matches('horse_race_next_race', 'content'):
+            if any(search_string in message_content.lower() for search_string in HORSE_RACE_REGISTERED_STRINGS):
                 already_registered = True
             else:
                 already_registered = False
@@ -78,12 +69,8 @@ class HorseRaceCog(commands.Cog):
             except exceptions.FirstTimeUserError:
                 return
             if not user_settings.bot_enabled or not user_settings.alert_horse_race.enabled: return
-            search_patterns = [
-                r'next race is in \*\*(.+?)\*\*', #English
-                r'la siguiente carrera es en \*\*(.+?)\*\*', #Spanish
-                r'próxima corrida é em \*\*(.+?)\*\*', #Portuguese
-            ]
-            timestring_match = await functions.get_match_from_patterns(search_patterns, message_content.lower())
+            timestring_match = await functions.get_match_from_patterns(regex.PATTERNS_HORSE_RACE_NEXT_RACE,
+                                                                       message_content.lower())
             if not timestring_match:
                     await functions.add_warning_reaction(message)
                     await errors.log_error('Timestring not found in horse race message.', message)
@@ -12,37 +12,84 @@ from discord.ext import bridge, commands
 
 from cache import messages
 from database import cooldowns, errors, reminders, tracking, users
-from resources import emojis, exceptions, functions, regex, settings, strings
+from resources import emojis, exceptions, functions, regex, router, settings, strings
+
+
+TRIGGERS = {
+    'hunt_cooldown': (
+        'you have already looked around', #English
+        'ya has mirado a tu alrededor', #Spanish
+        'você já olhou ao seu redor', #Portuguese
+    ),
+    'hunt_rare_monster': ( #All languages
+        'golden wolf',
+        'ruby zombie',
+        'diamond unicorn',
+        'emerald mermaid',
+        'sapphire killer robot',
+    ),
+    'hunt_hunt': (
+        'found a', #English
+        'found the', #English
+        'encontr', #Spanish, Portuguese
+    ),
+    'hunt_event': ( #Always English
+        'pretends to be a zombie',
+        'fights the horde',
+        'thankfully, the horde did not notice',
+    ),
+    'hunt_event_slash_zombie': ( #All languages
+        ':zombie',
+    ),
+    'hunt_event_slash': ( #All languages
+        ':crossed_swords:',
+        '⚔️',
+        ':sweat_drops:',
+        '💦',
+    ),
+}
+
+HUNT_HARDMODE_STRINGS = (
+    '(but stronger)', #English
+    '(pero más fuerte)', #Spanish
+    '(só que mais forte)', #Portuguese
+)
+
+HUNT_TOGETHER_STRINGS = (
+    'hunting together', #English
+    'cazando juntos', #Spanish
+    'caçando juntos', #Portuguese
+)
+
+HUNT_ALONE_STRINGS = (
+    '(but way stronger!!!)', #English
+    '(mucho más fuerte!!!)', #Spanish
+    '(muito mais forte!!!)', #Portuguese
+)
+
+HUNT_EVENT_MOBS = (
+    'horslime',
+    'christmas slime',
+    'bunny slime',
+    'pink wolf',
+    'party slime',
+    'summer slime',
+)
 
 
 class HuntCog(commands.Cog):
     """Cog that contains the hunt detection commands"""
     def __init__(self, bot: bridge.AutoShardedBot):
         self.bot = bot
+        router.register_message_handler(self.qualified_name, self.on_message, triggers=TRIGGERS)
 
-    @commands.Cog.listener()
-    async def on_message_edit(self, message_before: discord.Message, message_after: discord.Message) -> None:
-        """Runs when a message is edited in a channel."""
-        if message_after.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-        if message_before.pinned != message_after.pinned: return
-        embed_data_before = await functions.parse_embed(message_before)
-        embed_data_after = await functions.parse_embed(message_after)
-        if (message_before.content == message_after.content and embed_data_before == embed_data_after
-            and message_before.components == message_after.components): return
-        row: discord.Component
-        for row in message_after.components:
-            if isinstance(row, discord.ActionRow):
-                for component in row.children:
-                    if isinstance(component, (discord.Button, discord.SelectMenu)):
-                        if component.disabled:
-                            return
-        await self.on_message(message_after)
+    def cog_unload(self) -> None:
+        """Removes the message handlers of this cog from the router."""
+        router.unregister_message_handler(self.qualified_name)
 
-    @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
-        """Runs when a message is sent in a channel."""
-        if message.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-
+        """Runs when EPIC RPG sends or edits a message. Called by the message router."""
+        parsed_message: router.ParsedMessage = router.get_parsed_message(message)
         if message.embeds:
             embed: discord.Embed = message.embeds[0]
             message_author = message_title = icon_url = message_description = ''
@@ -53,12 +100,7 @@ class HuntCog(commands.Cog):
             if embed.description is not None: message_description = str(embed.description)
 
             # Hunt cooldown
-            search_strings: list[str] = [
-                'you have already looked around', #English
-                'ya has mirado a tu alrededor', #Spanish
-                'você já olhou ao seu redor', #Portuguese
-            ]
-            if any(search_string in message_title.lower() for search_string in search_strings):
+            if parsed_message.matches('hunt_cooldown', 'title'):
                 user_id = user_name = user_command = last_hunt_mode = user_command_message = None
                 hardmode = together = alone = old = False
                 embed_users = []
@@ -155,14 +197,7 @@ class HuntCog(commands.Cog):
 
 
             # Rare hunt monster event reset (all languages)
-            search_strings = [
-                'golden wolf',
-                'ruby zombie',
-                'diamond unicorn',
-                'emerald mermaid',
-                'sapphire killer robot',
-            ]
-            if  (any(search_string in message_description.lower() for search_string in search_strings)
+            if  (parsed_message.matches('hunt_rare_monster', 'description')
                  and (':coffin:' in message_description.lower() or '⚰️' in message_description.lower())):
                 event_players = embed.fields[0].value.split('\n')[0]
                 players_found = re.findall(r'\s(.+?)(?:,|$)', event_players)
@@ -181,13 +216,9 @@ class HuntCog(commands.Cog):
                 if not re.match(r'\bcard\b', message.content):
                     message_content = f'{message_content}\n{line}'
             message_content = message_content.strip()
+            if not message_content: return
             # Hunt
-            search_strings = [
-                'found a', #English
-                'found the', #English
-                'encontr', #Spanish, Portuguese
-            ]
-            if (any(search_string in message_content.lower() for search_string in search_strings)
+            if (parsed_message.matches('hunt_hunt', 'content')
                 and (
                     any(f'> {monster.lower()}' in message_content.lower() for monster in strings.MONSTERS_HUNT)
                     or any(monster.lower() in message_content.lower() for monster in strings.MONSTERS_HUNT_TOP)
@@ -200,50 +231,20 @@ class HuntCog(commands.Cog):
                 partner_christmas_area = False
                 user = await functions.get_interaction_user(message)
                 slash_command = False if user is None else True
-                search_strings_hardmode = [
-                    '(but stronger)', #English
-                    '(pero más fuerte)', #Spanish
-                    '(só que mais forte)', #Portuguese
-                ]
-                search_strings_together = [
-                    'hunting together', #English
-                    'cazando juntos', #Spanish
-                    'caçando juntos', #Portuguese
-                ]
-                search_strings_alone = [
-                    '(but way stronger!!!)', #English
-                    '(mucho más fuerte!!!)', #Spanish
-                    '(muito mais forte!!!)', #Portuguese
-                ]
-                if any(search_string in message_content.lower() for search_string in search_strings_hardmode):
+                if any(search_string in message_content.lower() for search_string in HUNT_HARDMODE_STRINGS):
                     hardmode = True
-                if any(search_string in message_content.lower() for search_string in search_strings_together):
+                if any(search_string in message_content.lower() for search_string in HUNT_TOGETHER_STRINGS):
                     together = True
-                if any(search_string in message_content.lower() for search_string in search_strings_alone):
+                if any(search_string in message_content.lower() for search_string in HUNT_ALONE_STRINGS):
                     alone = True
                 old = True if '__**' not in message_content.lower() else False
-                search_strings_event_mobs = [
-                    'horslime',
-                    'christmas slime',
-                    'bunny slime',
-                    'pink wolf',
-                    'party slime',
-                    'summer slime',
-                ]
-                if any(search_string in message_content.lower() for search_string in search_strings_event_mobs):
-                    search_strings_together = [
-                        'both players', #English
-                    ]
-                    if any(search_string in message_content.lower() for search_string in search_strings_together):
+                if any(search_string in message_content.lower() for search_string in HUNT_EVENT_MOBS):
+                    if 'both players' in message_content.lower(): #English
                         together = True
                     event_mob = True
                 if together:
-                    search_patterns = [
-                        r"\*\*(.+?)\*\* and \*\*(.+?)\*\*", #English
-                        r"\*\*(.+?)\*\* y \*\*(.+?)\*\*", #Spanish
-                        r"\*\*(.+?)\*\* e \*\*(.+?)\*\*", #Portuguese
-                    ]
-                    user_name_match = await functions.get_match_from_patterns(search_patterns, message_content)
+                    user_name_match = await functions.get_match_from_patterns(regex.PATTERNS_USER_NAMES_TOGETHER,
+                                                                              message_content)
                     if user_name_match:
                         user_name = user_name_match.group(1)
                         partner_name = user_name_match.group(2)
@@ -262,11 +263,8 @@ class HuntCog(commands.Cog):
                             await errors.log_error('User names not found in hunt together message.', message)
                             return
                 else:
-                    search_patterns = [
-                        r"\*\*(.+?)\*\* found a", #English
-                        r"\*\*(.+?)\*\* encontr", #Spanish, Portuguese
-                    ]
-                    user_name_match = await functions.get_match_from_patterns(search_patterns, message_content)
+                    user_name_match = await functions.get_match_from_patterns(regex.PATTERNS_USER_NAME_FOUND,
+                                                                              message_content)
                     if user_name_match:
                         user_name = user_name_match.group(1)
                         if user_name.lower() == 'both players': # Needs to be updated when an event hits that uses this
@@ -530,12 +528,7 @@ class HuntCog(commands.Cog):
                         await message.add_reaction(emojis.PANDA_EWW)
 
             # Hunt event non-slash (always English)
-            search_strings = [
-                'pretends to be a zombie',
-                'fights the horde',
-                'thankfully, the horde did not notice',
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('hunt_event', 'content'):
                 interaction = await functions.get_interaction_user(message)
                 if interaction is None:
                     user_name = user_command = last_hunt_mode = user_command_message = None
@@ -607,9 +600,8 @@ class HuntCog(commands.Cog):
                     await functions.add_reminder_reaction(message, reminder, user_settings)
 
             # Hunt event slash (all languages)
-            if  ((':zombie' in message_content.lower() and '#2' in message_content.lower())
-                    or ':crossed_swords:' in message_content.lower() or '⚔️' in message_content.lower()
-                    or ':sweat_drops:' in message_content.lower() or '💦' in message_content.lower()):
+            if  ((parsed_message.matches('hunt_event_slash_zombie', 'content') and '#2' in message_content.lower())
+                    or parsed_message.matches('hunt_event_slash', 'content')):
                 user_name = user_command = None
                 interaction = await functions.get_interaction(message)
                 if interaction is not None:
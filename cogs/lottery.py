@@ -11,54 +11,55 @@ from discord.ext import bridge, commands
 
 from cache import messages
 from database import errors, reminders, users
-from resources import exceptions, functions, regex, settings
+from resources import exceptions, functions, regex, router
+
+
+TRIGGERS = {
+    'lottery_event': (
+        'join with `lottery', #English 1
+        'join with `/lottery', #English 2
+        'participa con `/lottery', #Spanis
+        'participe com `/lottery', #Portuguese
+    ),
+    'lottery_inventory': (
+        "— inventory", #All languages
+    ),
+    'lottery_buy': (
+        'lottery ticket` successfully bought', #English
+        'lottery ticket successfully bought', #English
+        'lottery ticket` comprado', #Spanish, Portuguese
+    ),
+    'lottery_ticket_limit': (
+        'you cannot buy more than 200 tickets per lottery', #English
+        'no puedes comprar más de 200 tickets por lotería', #Spanish
+        'você não pode comprar mais de 200 bilhetes por loteria', #Portuguese
+    ),
+}
 
 
 class LotteryCog(commands.Cog):
     """Cog that contains the lottery detection commands"""
     def __init__(self, bot: bridge.AutoShardedBot):
         self.bot = bot
+        router.register_message_handler(self.qualified_name, self.on_message, triggers=TRIGGERS)
 
-    @commands.Cog.listener()
-    async def on_message_edit(self, message_before: discord.Message, message_after: discord.Message) -> None:
-        """Runs when a message is edited in a channel."""
-        if message_after.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-        if message_before.pinned != message_after.pinned: return
-        embed_data_before = await functions.parse_embed(message_before)
-        embed_data_after = await functions.parse_embed(message_after)
-        if (message_before.content == message_after.content and embed_data_before == embed_data_after
-            and message_before.components == message_after.components): return
-        row: discord.Component
-        for row in message_after.components:
-            if isinstance(row, discord.ActionRow):
-                for component in row.children:
-                    if isinstance(component, (discord.Button, discord.SelectMenu)):
-                        if component.disabled:
-                            return
-        await self.on_message(message_after)
+    def cog_unload(self) -> None:
+        """Removes the message handlers of this cog from the router."""
+        router.unregister_message_handler(self.qualified_name)
 
-    @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
-        """Runs when a message is sent in a channel."""
-        if message.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-
+        """Runs when EPIC RPG sends or edits a message. Called by the message router."""
+        parsed_message: router.ParsedMessage = router.get_parsed_message(message)
         if message.embeds:
             embed: discord.Embed = message.embeds[0]
-            message_description = message_field = message_author = icon_url = ''
-            if embed.description is not None: message_description = embed.description
+            message_field = message_author = icon_url = ''
             if embed.fields: message_field = embed.fields[0].value
             if embed.author is not None:
                 message_author = str(embed.author.name)
                 icon_url = embed.author.icon_url
 
             # Lottery event check
-            search_strings = [
-                'join with `lottery', #English 1
-                'join with `/lottery', #English 2
-                'participa con `/lottery', #Spanis
-                'participe com `/lottery', #Portuguese
-            ]
-            if any(search_string in message_description.lower() for search_string in search_strings):
+            if parsed_message.matches('lottery_event', 'description'):
                 user = await functions.get_interaction_user(message)
                 user_command_message = None
                 if user is None:
@@ -85,12 +86,8 @@ class LotteryCog(commands.Cog):
                     user_command = f"{user_command} `amount: [1-200]`"
                 else:
                     user_command = f"{user_command} `buy [1-200]`".replace('` `', ' ')
-                search_patterns = [
-                    r'next draw\*\*: (.+?)$', #English
-                    r'siguiente ronda\*\*: (.+?)$', #Spanish
-                    r'próximo sorteio\*\*: (.+?)$', #Portuguese
-                ]
-                timestring_match = await functions.get_match_from_patterns(search_patterns, message_field.lower())
+                timestring_match = await functions.get_match_from_patterns(regex.PATTERNS_LOTTERY_NEXT_DRAW,
+                                                                           message_field.lower())
                 if not timestring_match:
                     await functions.add_warning_reaction(message)
                     await errors.log_error('Timestring not found in lottery event message.', message)
@@ -106,10 +103,7 @@ class LotteryCog(commands.Cog):
                 )
                 await functions.add_reminder_reaction(message, reminder, user_settings)
 
-            search_strings = [
-                "— inventory", #All languages
-            ]
-            if any(search_string in message_author.lower() for search_string in search_strings):
+            if parsed_message.matches('lottery_inventory', 'author'):
                 if icon_url is None: return
                 field_values = ''
                 for field in embed.fields:
@@ -178,12 +172,7 @@ class LotteryCog(commands.Cog):
         if not message.embeds:
             message_content = message.content
             # Buy lottery ticket
-            search_strings = [
-                'lottery ticket` successfully bought', #English
-                'lottery ticket successfully bought', #English
-                'lottery ticket` comprado', #Spanish, Portuguese
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('lottery_buy', 'content'):
                 user = await functions.get_interaction_user(message)
                 user_command_message = None
                 if user is None:
@@ -209,12 +198,8 @@ class LotteryCog(commands.Cog):
                     user_command = f"{user_command} `amount: [1-200]`"
                 else:
                     user_command = f"{user_command} `buy [1-200]`".replace('` `', ' ')
-                search_patterns = [
-                    r'the winner in \*\*(.+?)\*\*', #English
-                    r'el ganador en \*\*(.+?)\*\*', #Spanish
-                    r'o vencedor em \*\*(.+?)\*\*', #Portuguese
-                ]
-                timestring_match = await functions.get_match_from_patterns(search_patterns, message_content.lower())
+                timestring_match = await functions.get_match_from_patterns(regex.PATTERNS_LOTTERY_BUY,
+                                                                           message_content.lower())
                 if not timestring_match:
                     await functions.add_warning_reaction(message)
                     await errors.log_error('Timestring not found in buy lottery ticket message.', message)
@@ -231,12 +216,7 @@ class LotteryCog(commands.Cog):
                 asyncio.ensure_future(functions.call_ready_command(self.bot, message, user, user_settings, 'lottery'))
                 await functions.add_reminder_reaction(message, reminder, user_settings)
 
-            search_strings = [
-                'you cannot buy more than 200 tickets per lottery', #English
-                'no puedes comprar más de 200 tickets por lotería', #Spanish
-                'você não pode comprar mais de 200 bilhetes por loteria', #Portuguese
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('lottery_ticket_limit', 'content'):
                 user = await functions.get_interaction_user(message)
                 user_command_message = None
                 if user is None: user = message.mentions[0]
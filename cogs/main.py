@@ -8,7 +8,7 @@ from discord import slash_command
 from discord.ext import bridge, commands
 
 from content import main
-from database import errors, guilds
+from database import clans, errors, guilds
 from resources import exceptions, functions, logs, settings, strings
 
 if TYPE_CHECKING:
@@ -220,6 +220,11 @@ class MainCog(commands.Cog):
         startup_info: str = f'{self.bot.user.name} has connected to Discord!'
         print(startup_info)
         logs.logger.info(startup_info)
+        cached_guild_count: int = await guilds.load_guild_cache(guild.id for guild in self.bot.guilds)
+        logs.logger.info(f'Loaded the settings of {cached_guild_count:,} guilds into the guild cache.')
+        cached_clan_count: int = await clans.load_clan_cache()
+        logs.logger.info(f'Loaded {cached_clan_count:,} clans into the clan cache.')
+
     @commands.Cog.listener()
     async def on_guild_join(self, guild: discord.Guild) -> None:
         """Fires when bot joins a guild. Sends a welcome message to the system channel."""
@@ -234,6 +239,11 @@ class MainCog(commands.Cog):
         except:
             return
 
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild) -> None:
+        """Fires when bot leaves a guild. Removes the guild from the guild cache."""
+        guilds.invalidate_guild_cache(guild.id)
+
 
 # Initialization
 def setup(bot: bridge.AutoShardedBot):
@@ -9,45 +9,35 @@ from discord import utils
 from discord.ext import bridge, commands
 
 from database import reminders, users
-from resources import exceptions, functions, settings
+from resources import exceptions, functions, router
+
+
+TRIGGERS = {
+    'maintenance_maintenance': (
+        'the bot is under maintenance!', #English
+        'the bot is under maintenance!', #TODO: Spanish
+        'the bot is under maintenance!', #TODO: Portuguese
+    ),
+}
 
 
 class MaintenanceCog(commands.Cog):
     """Cog that contains the celebration event detection commands"""
     def __init__(self, bot: bridge.AutoShardedBot):
         self.bot = bot
+        router.register_message_handler(self.qualified_name, self.on_message, triggers=TRIGGERS)
 
-    @commands.Cog.listener()
-    async def on_message_edit(self, message_before: discord.Message, message_after: discord.Message) -> None:
-        """Runs when a message is edited in a channel."""
-        if message_after.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-        if message_before.pinned != message_after.pinned: return
-        embed_data_before: dict[str, str] = await functions.parse_embed(message_before)
-        embed_data_after: dict[str, str] = await functions.parse_embed(message_after)
-        if (message_before.content == message_after.content and embed_data_before == embed_data_after
-            and message_before.components == message_after.components): return
-        row: discord.Component
-        for row in message_after.components:
-            if isinstance(row, discord.ActionRow):
-                for component in row.children:
-                    if isinstance(component, (discord.Button, discord.SelectMenu)):
-                        if component.disabled:
-                            return
-        await self.on_message(message_after)
+    def cog_unload(self) -> None:
+        """Removes the message handlers of this cog from the router."""
+        router.unregister_message_handler(self.qualified_name)
 
-    @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
-        """Runs when a message is sent in a channel."""
-        if message.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
+        """Runs when EPIC RPG sends or edits a message. Called by the message router."""
+        parsed_message: router.ParsedMessage = router.get_parsed_message(message)
         if not message.embeds:
  
             # Cel Multiply cooldown
-            search_strings: tuple[str, ...] = (
-                'the bot is under maintenance!', #English
-                'the bot is under maintenance!', #TODO: Spanish
-                'the bot is under maintenance!', #TODO: Portuguese
-            )
-            if any(search_string in message.content.lower() for search_string in search_strings):
+            if parsed_message.matches('maintenance_maintenance', 'content'):
                 if not message.mentions: return
                 user: discord.User | discord.Member = message.mentions[0]
                 try:
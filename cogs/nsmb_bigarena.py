@@ -9,57 +9,63 @@ from discord.ext import bridge, commands
 
 from cache import messages
 from database import errors, reminders, users
-from resources import exceptions, functions, regex, settings
+from resources import exceptions, functions, regex, router
+
+
+TRIGGERS = {
+    'nsmb_bigarena_event': (
+        '**minin\'tboss** event', #English minin'tboss
+        '**big arena** event', #English big arena
+        'evento **minin\'tboss**', #Spanish, Portuguese minin't boss
+        'evento de **big arena**', #Spanish, Portuguese big arena
+    ),
+    'nsmb_bigarena_registered': (
+        'successfully registered for the next **big arena** event!', #English 1
+        'successfully registered for the next **minin\'tboss** event!', #English 2
+        'you are already registered!', #English 3
+        'se registró exitosamente para el evento de **big arena**!', #Spanish 1
+        'se registró exitosamente para el evento de **minin\'tboss**!', #Spanish 2
+        'ya estás en registro!', #Spanish 3
+        'inscreveu com sucesso no evento de **minin\'tboss**!', #Portuguese 1
+        'inscreveu com sucesso no evento **big arena**!', #Portuguese 2
+        'você já está em registro!', #Portuguese 3
+    ),
+}
+
+NSMB_BIGARENA_REGISTERED_STRINGS = (
+    'you are already registered!', #English
+    'ya estás en registro!', #Spanish
+    'você já está em registro!', #Portuguese
+)
 
 
 class NotSoMiniBossBigArenaCog(commands.Cog):
     """Cog that contains the not so mini boss and big arena detection commands"""
     def __init__(self, bot: bridge.AutoShardedBot):
         self.bot = bot
+        router.register_message_handler(self.qualified_name, self.on_message, triggers=TRIGGERS)
 
-    @commands.Cog.listener()
-    async def on_message_edit(self, message_before: discord.Message, message_after: discord.Message) -> None:
-        """Runs when a message is edited in a channel."""
-        if message_after.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-        if message_before.pinned != message_after.pinned: return
-        embed_data_before = await functions.parse_embed(message_before)
-        embed_data_after = await functions.parse_embed(message_after)
-        if (message_before.content == message_after.content and embed_data_before == embed_data_after
-            and message_before.components == message_after.components): return
-        row: discord.Component
-        for row in message_after.components:
-            if isinstance(row, discord.ActionRow):
-                for component in row.children:
-                    if isinstance(component, (discord.Button, discord.SelectMenu)):
-                        if component.disabled:
-                            return
-        await self.on_message(message_after)
+    def cog_unload(self) -> None:
+        """Removes the message handlers of this cog from the router."""
+        router.unregister_message_handler(self.qualified_name)
 
-    @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
-        """Runs when a message is sent in a channel."""
-        if message.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
+        """Runs when EPIC RPG sends or edits a message. Called by the message router."""
+        parsed_message: router.ParsedMessage = router.get_parsed_message(message)
         if message.embeds:
             embed: discord.Embed = message.embeds[0]
-            message_title = message_field0_value = message_field1_name = ''
-            if embed.title is not None: message_title = embed.title
+            message_field0_value = message_field1_name = ''
             if embed.fields:
                 message_field0_value = embed.fields[0].value
                 if len(embed.fields) > 1:
                     message_field1_value = embed.fields[1].value
 
-            search_strings = [
-                '**minin\'tboss** event', #English minin'tboss
-                '**big arena** event', #English big arena
-                'evento **minin\'tboss**', #Spanish, Portuguese minin't boss
-                'evento de **big arena**', #Spanish, Portuguese big arena
-            ]
             search_strings_excluded = [
                 'not registered', #English
                 'sin registro', #Spanish
                 'sem registro', #Portuguese
             ]
-            if (any(search_string in message_title.lower() for search_string in search_strings)
+            if (parsed_message.matches('nsmb_bigarena_event', 'title')
                 and all(search_string not in message_field1_value.lower() for search_string in search_strings_excluded)):
                 user = await functions.get_interaction_user(message)
                 user_command_message = None
@@ -92,12 +98,8 @@ class NotSoMiniBossBigArenaCog(commands.Cog):
                 if event == 'minintboss':
                     if not user_settings.alert_not_so_mini_boss.enabled: return
                     reminder_message = user_settings.alert_not_so_mini_boss.message.replace('{event}', event.replace('-',' '))
-                search_patterns = [
-                        r'in \*\*(.+?)\*\*', #English
-                        r'en \*\*(.+?)\*\*', #Spanish
-                        r'em \*\*(.+?)\*\*', #Portuguese
-                    ]
-                timestring_match = await functions.get_match_from_patterns(search_patterns, message_field0_value.lower())
+                timestring_match = await functions.get_match_from_patterns(regex.PATTERNS_NSMB_BIGARENA_EVENT,
+                                                                           message_field0_value.lower())
                 if not timestring_match:
                     await functions.add_warning_reaction(message)
                     await errors.log_error('Timestring not found in big arena / minintboss embed.', message)
@@ -114,24 +116,8 @@ class NotSoMiniBossBigArenaCog(commands.Cog):
 
         if not message.embeds:
             message_content = message.content
-            search_strings = [
-                'successfully registered for the next **big arena** event!', #English 1
-                'successfully registered for the next **minin\'tboss** event!', #English 2
-                'you are already registered!', #English 3
-                'se registró exitosamente para el evento de **big arena**!', #Spanish 1
-                'se registró exitosamente para el evento de **minin\'tboss**!', #Spanish 2
-                'ya estás en registro!', #Spanish 3
-                'inscreveu com sucesso no evento de **minin\'tboss**!', #Portuguese 1
-                'inscreveu com sucesso no evento **big arena**!', #Portuguese 2
-                'você já está em registro!', #Portuguese 3
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
-                search_strings_registered = [
-                   'you are already registered!', #English
-                    'ya estás en registro!', #Spanish
-                    'você já está em registro!', #Portuguese
-                ]
-                if any(search_string in message_content.lower() for search_string in search_strings_registered):
+            if parsed_message.matches('nsmb_bigarena_registered', 'content'):
+                if any(search_string in message_content.lower() for search_string in NSMB_BIGARENA_REGISTERED_STRINGS):
                     already_registered = True
                 else:
                     already_registered = False
@@ -186,12 +172,8 @@ class NotSoMiniBossBigArenaCog(commands.Cog):
                     if not user_settings.alert_not_so_mini_boss.enabled: return
                     user_command = await functions.get_slash_command(user_settings, event)
                     reminder_message = user_settings.alert_not_so_mini_boss.message.replace('{event}', event.replace('-',' '))
-                search_patterns = [
-                        r'next event is in \*\*(.+?)\*\*', #English
-                        r'siguiente evento es en \*\*(.+?)\*\*', #Spanish
-                        r'próximo evento (?:será|é) em \*\*(.+?)\*\*', #Portuguese
-                    ]
-                timestring_match = await functions.get_match_from_patterns(search_patterns, message_content.lower())
+                timestring_match = await functions.get_match_from_patterns(regex.PATTERNS_NSMB_BIGARENA_REGISTERED,
+                                                                           message_content.lower())
                 if not timestring_match:
                     await functions.add_warning_reaction(message)
                     await errors.log_error('Timestring not found in big arena / minintboss message.', message)
@@ -10,49 +10,76 @@ from discord.ext import bridge, commands
 
 from cache import messages
 from database import errors, reminders, users
-from resources import emojis, exceptions, functions, logs, regex, settings, strings
+from resources import emojis, exceptions, functions, logs, regex, router, strings
+
+
+TRIGGERS = {
+    'pets_adventure_started': (
+        'your pet has started an adventure and will be back', #English 1 pet
+        'pets have started an adventure!', #English multiple pets
+        'tu mascota empezó una aventura y volverá', #Spanish 1 pet
+        'tus mascotas han comenzado una aventura!', #Spanish multiple pets
+        'seu pet começou uma aventura e voltará', #Portuguese 1 pet
+        'seus pets começaram uma aventura!', #Portuguese multiple pets
+    ),
+    'pets_adventure_cancelled': (
+        'pet adventure(s) cancelled', #English
+        'mascota(s) cancelada(s)', #Spanish
+        'pets cancelada(s)', #Portuguese
+    ),
+    'pets_no_rewards': (
+        'there are no pet adventure rewards to claim', #English
+        'no hay recompensas de pet adventure para reclamar', #Spanish
+        'não há recompensas de pet adventure para coletar', #Portuguese
+    ),
+    'pets_adventure_instant': (
+        'it came back instantly!!', #English
+        'volvio al instante!!', #Spanish
+        'voltou instantaneamente!!', #Portuguese
+    ),
+    'pets_pet_list': (
+        'pets can collect items and coins, more information', #English
+        'las mascotas puedes recoger items y coins, más información', #Spanish
+        'pets podem coletar itens e coins, mais informações', #Portuguese
+    ),
+    'pets_claim': (
+        'pet adventure rewards', #English 1
+        'reward summary', #English 2
+        'recompensas de pet adventure', #Spanish, Portuguese 1
+        'resumen de recompensas', #Spanish 2
+        'resumo de recompensas', #Portuguese 2
+    ),
+    'pets_summary': (
+        'this is a summary of your pets', #English
+        'este es un sumario de tus mascotas', #Spanish
+        'este é um resumo dos seus pets', #Portuguese
+    ),
+}
+
+PETS_BACK_INSTANTLY_STRINGS = (
+    'the following pets are back instantly', #English
+    'las siguientes mascotas están de vuelta instantaneamente', #Spanish
+    'os seguintes pets voltaram instantaneamente', #Portuguese
+)
 
 
 class PetsCog(commands.Cog):
     """Cog that contains the pets detection commands"""
     def __init__(self, bot: bridge.AutoShardedBot):
         self.bot = bot
+        router.register_message_handler(self.qualified_name, self.on_message, triggers=TRIGGERS)
 
-    @commands.Cog.listener()
-    async def on_message_edit(self, message_before: discord.Message, message_after: discord.Message) -> None:
-        """Runs when a message is edited in a channel."""
-        if message_after.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-        if message_before.pinned != message_after.pinned: return
-        embed_data_before = await functions.parse_embed(message_before)
-        embed_data_after = await functions.parse_embed(message_after)
-        if (message_before.content == message_after.content and embed_data_before == embed_data_after
-            and message_before.components == message_after.components): return
-        row: discord.Component
-        for row in message_after.components:
-            if isinstance(row, discord.ActionRow):
-                for component in row.children:
-                    if isinstance(component, (discord.Button, discord.SelectMenu)):
-                        if component.disabled:
-                            return
-        await self.on_message(message_after)
+    def cog_unload(self) -> None:
+        """Removes the message handlers of this cog from the router."""
+        router.unregister_message_handler(self.qualified_name)
 
-    @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
-        """Runs when a message is sent in a channel."""
-        if message.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-
+        """Runs when EPIC RPG sends or edits a message. Called by the message router."""
+        parsed_message: router.ParsedMessage = router.get_parsed_message(message)
         if not message.embeds:
             message_content = message.content
             # Single pet adventure
-            search_strings = [
-                'your pet has started an adventure and will be back', #English 1 pet
-                'pets have started an adventure!', #English multiple pets
-                'tu mascota empezó una aventura y volverá', #Spanish 1 pet
-                'tus mascotas han comenzado una aventura!', #Spanish multiple pets
-                'seu pet começou uma aventura e voltará', #Portuguese 1 pet
-                'seus pets começaram uma aventura!', #Portuguese multiple pets
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('pets_adventure_started', 'content'):
                 user = await functions.get_interaction_user(message)
                 user_command_message = None
                 if user is None:
@@ -83,12 +110,7 @@ class PetsCog(commands.Cog):
                     ) # Message split up like this because I'm unsure if I want to always send the first part
                     await user_settings.update(pet_tip_read=True)
                     await message.reply(pet_message)
-                search_strings = [
-                    'the following pets are back instantly', #English
-                    'las siguientes mascotas están de vuelta instantaneamente', #Spanish
-                    'os seguintes pets voltaram instantaneamente', #Portuguese
-                ]
-                if any(search_string in message_content.lower() for search_string in search_strings):
+                if any(search_string in message_content.lower() for search_string in PETS_BACK_INSTANTLY_STRINGS):
                     if user_settings.reactions_enabled: await message.add_reaction(emojis.SKILL_TIME_TRAVELER)
                     await message.reply(f"➜ {strings.SLASH_COMMANDS['pets claim']}")
                 if 'voidog' in message.content.lower():
@@ -97,12 +119,7 @@ class PetsCog(commands.Cog):
                         await message.add_reaction(emojis.SKILL_TIME_TRAVELER)
                         await message.add_reaction(emojis.PET_VOIDOG)
 
-            search_strings = [
-                'pet adventure(s) cancelled', #English
-                'mascota(s) cancelada(s)', #Spanish
-                'pets cancelada(s)', #Portuguese
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('pets_adventure_cancelled', 'content'):
                 user = await functions.get_interaction_user(message)
                 user_command_message = None
                 if user is not None:
@@ -153,12 +170,7 @@ class PetsCog(commands.Cog):
                 if user_settings.reactions_enabled: await message.add_reaction(emojis.NAVI)
 
             # Pets claim when no pets are on adventures
-            search_strings = [
-                'there are no pet adventure rewards to claim', #English
-                'no hay recompensas de pet adventure para reclamar', #Spanish
-                'não há recompensas de pet adventure para coletar', #Portuguese
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('pets_no_rewards', 'content'):
                 user = await functions.get_interaction_user(message)
                 user_command_message = None
                 if user is None:
@@ -176,12 +188,7 @@ class PetsCog(commands.Cog):
                 if user_settings.ready_pets_claim_active:
                     await user_settings.update(ready_pets_claim_active=False)
 
-            search_strings = [
-                'it came back instantly!!', #English
-                'volvio al instante!!', #Spanish
-                'voltou instantaneamente!!', #Portuguese
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('pets_adventure_instant', 'content'):
                 user = await functions.get_interaction_user(message)
                 if user is None:
                     user_command_message = (
@@ -202,23 +209,17 @@ class PetsCog(commands.Cog):
 
         if message.embeds:
             embed: discord.Embed = message.embeds[0]
-            message_author = message_description = icon_url = message_title = ''
+            message_author = message_description = icon_url = ''
             if embed.author is not None:
                 message_author = str(embed.author.name)
                 icon_url = embed.author.icon_url
             if embed.description is not None: message_description = str(embed.description)
-            if embed.title is not None: message_title = embed.title
             if len(embed.fields) > 1:
                 message_field_1_name = embed.fields[1].name
                 message_field_1_value = embed.fields[1].value
 
             # Pet list
-            search_strings = [
-                'pets can collect items and coins, more information', #English
-                'las mascotas puedes recoger items y coins, más información', #Spanish
-                'pets podem coletar itens e coins, mais informações', #Portuguese
-            ]
-            if any(search_string in message_description.lower() for search_string in search_strings):
+            if parsed_message.matches('pets_pet_list', 'description'):
                 pet_names_emojis = {
                     'cat': emojis.PET_CAT,
                     'voidog': emojis.PET_VOIDOG, # Needs to be before "dog"!
@@ -270,6 +271,8 @@ class PetsCog(commands.Cog):
                     summary_reminder_max = await reminders.get_user_reminder(user_id=user.id, activity='pets-MAX')
                 except exceptions.NoDataFoundError:
                     summary_reminder_max = None
+                pet_reminders = []
+                pets_list_timed_out = False
                 for field in embed.fields:
                     pet_id_match = re.search(r'`ID: (.+?)`', field.name)
                     pet_emoji = ''
@@ -307,7 +310,9 @@ class PetsCog(commands.Cog):
                     time_elapsed = current_time - bot_answer_time
                     time_left -= time_elapsed
                     end_time = current_time + time_left
-                    if time_left < timedelta(0): return # This can happen because the timeout edits pets list one last time
+                    if time_left < timedelta(0): # This can happen because the timeout edits pets list one last time
+                        pets_list_timed_out = True
+                        break
                     if summary_reminder_min is not None:
                         if end_time - timedelta(seconds=2) <= summary_reminder_min.end_time <= end_time + timedelta(seconds=2):
                             await summary_reminder_min.delete()
@@ -318,16 +323,13 @@ class PetsCog(commands.Cog):
                             summary_reminder_max = None
                     reminder_created = True
                     reminder_message = user_settings.alert_pets.message.replace('{id}', pet_id).replace('{emoji}',pet_emoji)
-                    reminder: reminders.Reminder = (
-                        await reminders.insert_user_reminder(user.id, f'pets-{pet_id}', time_left,
-                                                             message.channel.id, reminder_message)
-                    )
+                    pet_reminders.append((f'pets-{pet_id}', time_left, reminder_message))
+                if pet_reminders:
+                    await reminders.insert_user_reminders_bulk(user.id, message.channel.id, pet_reminders)
+                if pets_list_timed_out: return
                 if reminder_created and user_settings.reactions_enabled: await message.add_reaction(emojis.NAVI)
-                search_patterns = [
-                    r'adventure__\*\*: (\d+?)/\d+\n', #English
-                    r'aventura__\*\*: (\d+?)/\d+\n', #Spanish & Portuguese
-                ]
-                pet_adv_amount_match = await functions.get_match_from_patterns(search_patterns, message_description)
+                pet_adv_amount_match = await functions.get_match_from_patterns(regex.PATTERNS_PETS_ADVENTURE_AMOUNT,
+                                                                               message_description)
                 if not pet_adv_amount_match:
                     await functions.add_warning_reaction(message)
                     await errors.log_error('Amount of pets in adventure in pet list message not found.', message)
@@ -337,14 +339,7 @@ class PetsCog(commands.Cog):
 
 
             # Pets claim
-            search_strings = [
-                'pet adventure rewards', #English 1
-                'reward summary', #English 2
-                'recompensas de pet adventure', #Spanish, Portuguese 1
-                'resumen de recompensas', #Spanish 2
-                'resumo de recompensas', #Portuguese 2
-            ]
-            if any(search_string in message_title.lower() for search_string in search_strings):
+            if parsed_message.matches('pets_claim', 'title'):
                 user_id = user_name = user_command_message = None
                 user = await functions.get_interaction_user(message)
                 if user is None:
@@ -373,12 +368,7 @@ class PetsCog(commands.Cog):
                     await user_settings.update(ready_pets_claim_active=False)
 
             # Pets summary
-            search_strings = [
-                'this is a summary of your pets', #English
-                'este es un sumario de tus mascotas', #Spanish
-                'este é um resumo dos seus pets', #Portuguese
-            ]
-            if any(search_string in message_description.lower() for search_string in search_strings):
+            if parsed_message.matches('pets_summary', 'description'):
                 user_id = user_name = user_command_message = None
                 user = await functions.get_interaction_user(message)
                 if user is None:
@@ -403,18 +393,10 @@ class PetsCog(commands.Cog):
                 except exceptions.FirstTimeUserError:
                     return
                 if not user_settings.bot_enabled or not user_settings.alert_pets.enabled: return
-                search_patterns_min = [
-                    r'min time left\*\*: (.+?)\n', #English
-                    r'tiempo mínimo restante\*\*: (.+?)\n', #Spanish
-                    r'tempo restante\*\*: (.+?)\n', #Portuguese
-                ]
-                search_patterns_max = [
-                    r'max time left\*\*: (.+?)$', #English
-                    r'tiempo máximo restante\*\*: (.+?)$', #Spanish
-                    r'tempo máximo restante\*\*: (.+?)$', #Portuguese
-                ]
-                timestring_min_match = await functions.get_match_from_patterns(search_patterns_min, message_field_1_value)
-                timestring_max_match = await functions.get_match_from_patterns(search_patterns_max, message_field_1_value)
+                timestring_min_match = await functions.get_match_from_patterns(regex.PATTERNS_PETS_TIME_LEFT_MIN,
+                                                                               message_field_1_value)
+                timestring_max_match = await functions.get_match_from_patterns(regex.PATTERNS_PETS_TIME_LEFT_MAX,
+                                                                               message_field_1_value)
                 if not timestring_min_match or not timestring_max_match:
                     await functions.add_warning_reaction(message)
                     await errors.log_error('Timestring for min or max pet not found in pet summary message.', message)
@@ -425,11 +407,15 @@ class PetsCog(commands.Cog):
                 }
                 if timestrings['min'] != '--' or timestrings['max'] != '--':
                     current_time = utils.utcnow()
+                    summary_reminders = []
+                    summary_timed_out = False
                     for timestring_type, timestring in timestrings.items():
                         if timestring_type == '--': continue
                         time_left = await functions.calculate_time_left_from_timestring(message, timestring)
                         end_time = current_time + time_left
-                        if time_left < timedelta(0): return
+                        if time_left < timedelta(0):
+                            summary_timed_out = True
+                            break
                         reminder_exists = False
                         try:
                             pet_reminders = (
@@ -442,22 +428,20 @@ class PetsCog(commands.Cog):
                             if reminder.activity == f'pets-{timestring_type}': continue
                             if end_time - timedelta(seconds=2) <= reminder.end_time <= end_time + timedelta(seconds=2):
                                 reminder_exists = True
+                        for _, summary_time_left, _ in summary_reminders:
+                            if abs(summary_time_left - time_left) <= timedelta(seconds=2): reminder_exists = True
                         if not reminder_exists:
                             reminder_message = (
                                 user_settings.alert_pets.message.replace('{id}', timestring_type.upper()).replace('{emoji}','').strip()
                             )
-                            reminder: reminders.Reminder = (
-                                await reminders.insert_user_reminder(user.id, f'pets-{timestring_type.upper()}',
-                                                                     time_left, message.channel.id, reminder_message)
-                            )
+                            summary_reminders.append((f'pets-{timestring_type.upper()}', time_left, reminder_message))
                         if user_settings.reactions_enabled: await message.add_reaction(emojis.NAVI)
+                    if summary_reminders:
+                        await reminders.insert_user_reminders_bulk(user.id, message.channel.id, summary_reminders)
+                    if summary_timed_out: return
                 if user_settings.ready_pets_claim_active and not user_settings.ready_pets_claim_after_every_pet:
-                    search_patterns = [
-                        r'claim\*\*: (\d+?)/(\d+?)\n', #English
-                        r'reclamar\*\*: (\d+?)/(\d+?)\n', #Spanish
-                        r'coletar\*\*: (\d+?)/(\d+?)\n', #Portuguese
-                    ]
-                    pet_claim_amount_match = await functions.get_match_from_patterns(search_patterns, message_field_1_value)
+                    pet_claim_amount_match = await functions.get_match_from_patterns(regex.PATTERNS_PETS_CLAIM_AMOUNT,
+                                                                                     message_field_1_value)
                     if not pet_claim_amount_match:
                         await functions.add_warning_reaction(message)
                         await errors.log_error('Amount of claimable pets in pet summary not found.', message)
@@ -11,44 +11,39 @@ from discord.ext import bridge, commands
 
 from cache import messages
 from database import errors, reminders, users
-from resources import exceptions, functions, regex, settings
+from resources import exceptions, functions, regex, router
+
+
+TRIGGERS = {
+    'pets_tournament_sent': (
+        'pet successfully sent to the pet tournament!', #English
+        'mascota exitosamente enviada al torneo de mascotas!', #Spanish
+        'pet enviado com sucesso para o torneio de pets!', #Portuguese
+    ),
+    'pets_tournament_pet_list': (
+        'pets can collect items and coins, more information', #English
+        'las mascotas puedes recoger items y coins, más información', #Spanish
+        'pets podem coletar itens e coins, mais informações', #Portuguese
+    ),
+}
 
 
 class PetsTournamentCog(commands.Cog):
     """Cog that contains the horse race detection"""
     def __init__(self, bot: bridge.AutoShardedBot):
         self.bot = bot
+        router.register_message_handler(self.qualified_name, self.on_message, triggers=TRIGGERS)
 
-    @commands.Cog.listener()
-    async def on_message_edit(self, message_before: discord.Message, message_after: discord.Message) -> None:
-        """Runs when a message is edited in a channel."""
-        if message_after.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-        if message_before.pinned != message_after.pinned: return
-        embed_data_before = await functions.parse_embed(message_before)
-        embed_data_after = await functions.parse_embed(message_after)
-        if (message_before.content == message_after.content and embed_data_before == embed_data_after
-            and message_before.components == message_after.components): return
-        row: discord.Component
-        for row in message_after.components:
-            if isinstance(row, discord.ActionRow):
-                for component in row.children:
-                    if isinstance(component, (discord.Button, discord.SelectMenu)):
-                        if component.disabled:
-                            return
-        await self.on_message(message_after)
+    def cog_unload(self) -> None:
+        """Removes the message handlers of this cog from the router."""
+        router.unregister_message_handler(self.qualified_name)
 
-    @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
-        """Runs when a message is sent in a channel."""
-        if message.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
+        """Runs when EPIC RPG sends or edits a message. Called by the message router."""
+        parsed_message: router.ParsedMessage = router.get_parsed_message(message)
         if not message.embeds:
             message_content = message.content
-            search_strings = [
-                'pet successfully sent to the pet tournament!', #English
-                'mascota exitosamente enviada al torneo de mascotas!', #Spanish
-                'pet enviado com sucesso para o torneio de pets!', #Portuguese
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('pets_tournament_sent', 'content'):
                 user = await functions.get_interaction_user(message)
                 user_command_message = None
                 if user is None:
@@ -65,12 +60,10 @@ class PetsTournamentCog(commands.Cog):
                 except exceptions.FirstTimeUserError:
                     return
                 if not user_settings.bot_enabled or not user_settings.alert_pet_tournament.enabled: return
-                search_patterns = [
-                    r'next pet tournament is in \*\*(.+?)\*\*', #English
-                    r'el siguiente torneo es el \*\*(.+?)\*\*', #Spanish
-                    r'o próximo torneio é em \*\*(.+?)\*\*', #Portuguese
-                ]
-                timestring_match = await functions.get_match_from_patterns(search_patterns, message_content.lower())
+                timestring_match = (
+                    await functions.get_match_from_patterns(regex.PATTERNS_PETS_TOURNAMENT_NEXT_TOURNAMENT,
+                                                            message_content.lower())
+                )
                 if not timestring_match:
                     await functions.add_warning_reaction(message)
                     await errors.log_error('Timestring not found in pet tournament message.', message)
@@ -89,26 +82,16 @@ class PetsTournamentCog(commands.Cog):
 
         if message.embeds:
             embed: discord.Embed = message.embeds[0]
-            embed_description = embed_footer = embed_author = ''
-            if embed.description is not None: embed_description = str(embed.description)
+            embed_footer = embed_author = ''
             if embed.author is not None:
                 embed_author = str(embed.author.name)
                 icon_url = embed.author.icon_url
             if embed.footer is not None: embed_footer = str(embed.footer.text)
 
             # Pet list
-            search_strings = [
-                'pets can collect items and coins, more information', #English
-                'las mascotas puedes recoger items y coins, más información', #Spanish
-                'pets podem coletar itens e coins, mais informações', #Portuguese
-            ]
-            if any(search_string in embed_description.lower() for search_string in search_strings):
-                search_patterns = [
-                    r'pet id "(.+?)" is registered', #English
-                    r'la mascota "(.+?)" está registrada', #Spanish
-                    r'de pet "(.+?)" está registrado', #Portuguese
-                ]
-                pet_tournament_match = await functions.get_match_from_patterns(search_patterns, embed_footer.lower())
+            if parsed_message.matches('pets_tournament_pet_list', 'description'):
+                pet_tournament_match = await functions.get_match_from_patterns(regex.PATTERNS_PETS_TOURNAMENT_PET_ID,
+                                                                               embed_footer.lower())
                 if not pet_tournament_match: return
                 user_id = user_name = user_command_message = None
                 user = await functions.get_interaction_user(message)
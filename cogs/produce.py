@@ -9,37 +9,36 @@ from discord.ext import bridge, commands
 
 from cache import messages
 from database import errors, reminders, users
-from resources import exceptions, functions, regex, settings
+from resources import exceptions, functions, regex, router
+
+
+TRIGGERS = {
+    'produce_cooldown': (
+        'produced a module recently', #English
+        'produced a module recently', #Spanish, missing because no slash command
+        'produced a module recently', #Portuguese, missing because no slash command
+    ),
+    'produce_produce': (
+        'is producing a module!', #English
+        'is producing a module!', #Spanish, missing because no slash command
+        'is producing a module!', #Portuguese, missing because no slash command
+    ),
+}
 
 
 class ProduceCog(commands.Cog):
     """Cog that contains the produce detection commands"""
     def __init__(self, bot: bridge.AutoShardedBot):
         self.bot = bot
+        router.register_message_handler(self.qualified_name, self.on_message, triggers=TRIGGERS)
 
-    @commands.Cog.listener()
-    async def on_message_edit(self, message_before: discord.Message, message_after: discord.Message) -> None:
-        """Runs when a message is edited in a channel."""
-        if message_after.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-        if message_before.pinned != message_after.pinned: return
-        embed_data_before = await functions.parse_embed(message_before)
-        embed_data_after = await functions.parse_embed(message_after)
-        if (message_before.content == message_after.content and embed_data_before == embed_data_after
-            and message_before.components == message_after.components): return
-        row: discord.Component
-        for row in message_after.components:
-            if isinstance(row, discord.ActionRow):
-                for component in row.children:
-                    if isinstance(component, (discord.Button, discord.SelectMenu)):
-                        if component.disabled:
-                            return
-        await self.on_message(message_after)
+    def cog_unload(self) -> None:
+        """Removes the message handlers of this cog from the router."""
+        router.unregister_message_handler(self.qualified_name)
 
-    @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
-        """Runs when a message is sent in a channel."""
-        if message.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-
+        """Runs when EPIC RPG sends or edits a message. Called by the message router."""
+        parsed_message: router.ParsedMessage = router.get_parsed_message(message)
         if message.embeds:
             embed: discord.Embed = message.embeds[0]
             message_author = message_title = icon_url = ''
@@ -49,12 +48,7 @@ class ProduceCog(commands.Cog):
             if embed.title is not None: message_title = str(embed.title)
 
             # Produce cooldown
-            search_strings: list[str] = [
-                'produced a module recently', #English
-                'produced a module recently', #Spanish, missing because no slash command
-                'produced a module recently', #Portuguese, missing because no slash command
-            ]
-            if any(search_string in message_title.lower() for search_string in search_strings):
+            if parsed_message.matches('produce_cooldown', 'title'):
                 user_id = user_name = user_command = user_command_message = None
                 user = await functions.get_interaction_user(message)
                 slash_command: bool = True if user is not None else False
@@ -109,21 +103,12 @@ class ProduceCog(commands.Cog):
 
         if not message.embeds:
             # Produce
-            search_strings = [
-                'is producing a module!', #English
-                'is producing a module!', #Spanish, missing because no slash command
-                'is producing a module!', #Portuguese, missing because no slash command
-            ]
-            if any(search_string in message.content.lower() for search_string in search_strings):
+            if parsed_message.matches('produce_produce', 'content'):
                 user = await functions.get_interaction_user(message)
                 user_command_message = None
                 if user is None:
-                    search_patterns = [
-                        r"^\*\*(.+?)\*\* is producing", #English
-                        r"^\*\*(.+?)\*\* is producing", #Spanish, missing because no slash command
-                        r"^\*\*(.+?)\*\* is producing", #Portuguese, missing because no slash command
-                    ]
-                    user_name_match = await functions.get_match_from_patterns(search_patterns, message.content)
+                    user_name_match = await functions.get_match_from_patterns(regex.PATTERNS_PRODUCE_USER_NAME,
+                                                                              message.content)
                     if user_name_match:
                         user_name = user_name_match.group(1)
                         user_command_message = (
@@ -9,36 +9,33 @@ from discord.ext import bridge, commands
 
 from cache import messages
 from database import errors, reminders, users
-from resources import exceptions, functions, regex, settings
+from resources import exceptions, functions, regex, router
+
+
+TRIGGERS = {
+    'profile_profile': (
+        "— profile", #All languages
+        "— progress", #All languages
+    ),
+    'profile_eternal_profile': (
+        "— eternal", #All languages
+    ),
+}
 
 
 class ProfileCog(commands.Cog):
     """Cog that contains the adventure detection commands"""
     def __init__(self, bot: bridge.AutoShardedBot):
         self.bot = bot
+        router.register_message_handler(self.qualified_name, self.on_message, triggers=TRIGGERS)
 
-    @commands.Cog.listener()
-    async def on_message_edit(self, message_before: discord.Message, message_after: discord.Message) -> None:
-        """Runs when a message is edited in a channel."""
-        if message_before.pinned != message_after.pinned: return
-        embed_data_before = await functions.parse_embed(message_before)
-        embed_data_after = await functions.parse_embed(message_after)
-        if (message_before.content == message_after.content and embed_data_before == embed_data_after
-            and message_before.components == message_after.components): return
-        row: discord.Component
-        for row in message_after.components:
-            if isinstance(row, discord.ActionRow):
-                for component in row.children:
-                    if isinstance(component, (discord.Button, discord.SelectMenu)):
-                        if component.disabled:
-                            return
-        await self.on_message(message_after)
-
-    @commands.Cog.listener()
-    async def on_message(self, message: discord.Message) -> None:
-        """Runs when a message is sent in a channel."""
-        if message.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
+    def cog_unload(self) -> None:
+        """Removes the message handlers of this cog from the router."""
+        router.unregister_message_handler(self.qualified_name)
 
+    async def on_message(self, message: discord.Message) -> None:
+        """Runs when EPIC RPG sends or edits a message. Called by the message router."""
+        parsed_message: router.ParsedMessage = router.get_parsed_message(message)
         if message.embeds:
             embed: discord.Embed = message.embeds[0]
             embed_author = embed_field0_value = embed_footer = icon_url = embed_field_values = ''
@@ -53,11 +50,7 @@ class ProfileCog(commands.Cog):
                 embed_footer = embed.footer.text
 
             # Update settings from profile
-            search_strings = [
-                "— profile", #All languages
-                "— progress", #All languages
-            ]
-            if (any(search_string in embed_author.lower() for search_string in search_strings)
+            if (parsed_message.matches('profile_profile', 'author')
                 and not 'epic npc' in embed_author.lower()):
                 embed_users = []
                 interaction_user = await functions.get_interaction_user(message)
@@ -95,12 +88,8 @@ class ProfileCog(commands.Cog):
                 if len(embed_field0_value.split('\n')) < 4:
                     time_travel_count = 0
                 else:
-                    search_patterns = [
-                        r'time travels\*\*: (.+?)(?:$|\n)', #English
-                        r'el tiempo\*\*: (.+?)(?:$|\n)', #Spanish
-                        r'no tempo\*\*: (.+?)(?:$|\n)', #Portuguese
-                    ]
-                    tt_match = await functions.get_match_from_patterns(search_patterns, embed_field0_value)
+                    tt_match = await functions.get_match_from_patterns(regex.PATTERNS_PROFILE_TIME_TRAVELS,
+                                                                       embed_field0_value)
                     if not tt_match:
                         await functions.add_warning_reaction(message)
                         await errors.log_error('Time travel count not found in profile or progress message.', message)
@@ -138,10 +127,7 @@ class ProfileCog(commands.Cog):
 
 
             # Update settings from eternal profile
-            search_strings = [
-                "— eternal", #All languages
-            ]
-            if (any(search_string in embed_author.lower() for search_string in search_strings)
+            if (parsed_message.matches('profile_eternal_profile', 'author')
                 and not 'enchant' in embed_author.lower()):
                 embed_users = []
                 interaction_user = await functions.get_interaction_user(message)
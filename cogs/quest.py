@@ -11,18 +11,76 @@ from discord.ext import bridge, commands
 
 from cache import messages
 from database import cooldowns, clans, errors, reminders, users
-from resources import emojis, exceptions, functions, regex, settings
+from resources import emojis, exceptions, functions, regex, router, settings
+
+
+TRIGGERS = {
+    'quest_guild_quest_check': (
+        'are you looking for a quest', #English
+        'buscando una misión', #Spanish
+        'procurando uma missão', #Portuguese
+    ),
+    'quest_cooldown': (
+        'you have already claimed a quest', #English
+        'ya reclamaste una misión', #Spanish
+        'você já reivindicou uma missão', #Portuguese
+    ),
+    'quest_void_areas': (
+        'i don\'t think i can give you any quest here', #English
+        'misión aquí', #Spanish
+        'missão aqui', #Portuguese, UNCONFIRMED
+    ),
+    'quest_epic_quest': (
+        '__wave #1__', #English
+        '__oleada #1__', #Spanish
+        '__onda #1__', #Portuguese
+    ),
+    'quest_guild_quest_active': (
+        'if you don\'t want this quest anymore', #English
+        'si ya no quieres esta misión', #Spanish
+        'se você não quiser mais esta missão', #Portuguese
+    ),
+    'quest_quest': (
+        'got a **new quest**!', #English accepted
+        'you did not accept the quest', #English declined
+        'consiguió una **nueva misión**', #Spanish accepted
+        'no aceptaste la misión', #Spanish declined
+        'conseguiu uma **nova missão**', #Portuguese accepted
+        'você não aceitou a missão', #Portuguese declined
+    ),
+    'quest_guild_quest_aborted': (
+        'you don\'t have a quest anymore', #English
+        'ya no tienes una misión', #Spanish
+        'você não tem mais uma missão', #Portuguese
+    ),
+}
+
+QUEST_MINIBOSS_STRINGS = (
+    'summon and kill a miniboss', #English
+    'invoca y mata un miniboss', #Spanish
+    'invocar e matar um miniboss', #Portuguese
+)
+
+QUEST_GUILD_RAID_STRINGS = (
+    'do a guild raid', #English
+    'has un guild raid', #Spanish
+    'faça uma guild raid', #Portuguese
+)
 
 
 class QuestCog(commands.Cog):
     """Cog that contains the quest detection commands"""
     def __init__(self, bot: bridge.AutoShardedBot):
         self.bot = bot
+        router.register_message_handler(self.qualified_name, self.on_message, on_message_edit=self.on_message_edit,
+                                        triggers=TRIGGERS)
+
+    def cog_unload(self) -> None:
+        """Removes the message handlers of this cog from the router."""
+        router.unregister_message_handler(self.qualified_name)
 
-    @commands.Cog.listener()
     async def on_message_edit(self, message_before: discord.Message, message_after: discord.Message) -> None:
-        """Runs when a message is edited in a channel."""
-        if message_after.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
+        """Runs when EPIC RPG edits a message. Called by the message router."""
         if message_before.pinned != message_after.pinned: return
         embed_data_before = await functions.parse_embed(message_before)
         embed_data_after = await functions.parse_embed(message_after)
@@ -38,14 +96,12 @@ class QuestCog(commands.Cog):
                             return
         await self.on_message(message_after)
 
-    @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
-        """Runs when a message is sent in a channel."""
-        if message.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-
+        """Runs when EPIC RPG sends or edits a message. Called by the message router."""
+        parsed_message: router.ParsedMessage = router.get_parsed_message(message)
         if message.embeds:
             embed: discord.Embed = message.embeds[0]
-            message_author = message_title = message_description = icon_url = field_value = ''
+            message_author = message_title = icon_url = field_value = ''
             if embed.author is not None:
                 message_author = str(embed.author.name)
                 icon_url = embed.author.icon_url
@@ -53,15 +109,9 @@ class QuestCog(commands.Cog):
                 field_name = embed.fields[0].name
                 field_value = embed.fields[0].value
             if embed.title is not None: message_title = str(embed.title)
-            if embed.description is not None: message_description = embed.description
 
             # Guild quest check
-            search_strings_quest = [
-                'are you looking for a quest', #English
-                'buscando una misión', #Spanish
-                'procurando uma missão', #Portuguese
-            ]
-            if any(search_string in message_description.lower() for search_string in search_strings_quest):
+            if parsed_message.matches('quest_guild_quest_check', 'description'):
                 user_id = user_name = user_command_message = None
                 user = await functions.get_interaction_user(message)
                 if user is None:
@@ -88,12 +138,7 @@ class QuestCog(commands.Cog):
                     return
                 if not user_settings.bot_enabled: return
                 user_global_name = user.global_name if user.global_name is not None else user.name
-                search_strings_miniboss = [
-                    'summon and kill a miniboss', #English
-                    'invoca y mata un miniboss', #Spanish
-                    'invocar e matar um miniboss', #Portuguese
-                ]
-                if any(search_string in field_value.lower() for search_string in search_strings_miniboss): 
+                if any(search_string in field_value.lower() for search_string in QUEST_MINIBOSS_STRINGS): 
                     if user_settings.alert_dungeon_miniboss.enabled:
                         try:
                             miniboss_reminder = await reminders.get_user_reminder(user.id, 'dungeon-miniboss')
@@ -117,12 +162,7 @@ class QuestCog(commands.Cog):
                                 answer = f'{user.mention} {answer}'
                         await message.channel.send(answer)
                     
-                search_strings_guild_raid = [
-                    'do a guild raid', #English
-                    'has un guild raid', #Spanish
-                    'faça uma guild raid', #Portuguese
-                ]
-                if any(search_string in field_value.lower() for search_string in search_strings_guild_raid): 
+                if any(search_string in field_value.lower() for search_string in QUEST_GUILD_RAID_STRINGS): 
                     clan: clans.Clan | None
                     try:
                         clan = await clans.get_clan_by_user_id(user_settings.user_id)
@@ -194,12 +234,7 @@ class QuestCog(commands.Cog):
                         await message.channel.send(answer)
 
             # Quest cooldown
-            search_strings = [
-                'you have already claimed a quest', #English
-                'ya reclamaste una misión', #Spanish
-                'você já reivindicou uma missão', #Portuguese
-            ]
-            if any(search_string in message_title.lower() for search_string in search_strings):
+            if parsed_message.matches('quest_cooldown', 'title'):
                 user_id = user_name = user_command = user_command_message = None
                 user = await functions.get_interaction_user(message)
                 slash_command = True if user is not None else False
@@ -260,12 +295,7 @@ class QuestCog(commands.Cog):
                 await functions.add_reminder_reaction(message, reminder, user_settings)
 
             # Quest in void areas and TOP
-            search_strings = [
-                'i don\'t think i can give you any quest here', #English
-                'misión aquí', #Spanish
-                'missão aqui', #Portuguese, UNCONFIRMED
-            ]
-            if any(search_string in message_description.lower() for search_string in search_strings):
+            if parsed_message.matches('quest_void_areas', 'description'):
                 user = await functions.get_interaction_user(message)
                 user_command_message = None
                 if user is None:
@@ -304,12 +334,7 @@ class QuestCog(commands.Cog):
                 await functions.add_reminder_reaction(message, reminder, user_settings)
 
             # Epic Quest
-            search_strings = [
-                '__wave #1__', #English
-                '__oleada #1__', #Spanish
-                '__onda #1__', #Portuguese
-            ]
-            if any(search_string in message_description.lower() for search_string in search_strings):
+            if parsed_message.matches('quest_epic_quest', 'description'):
                 user_id = user_name = user_command_message = None
                 user = await functions.get_interaction_user(message)
                 slash_command = True if user is not None else False
@@ -364,12 +389,7 @@ class QuestCog(commands.Cog):
                 await functions.add_reminder_reaction(message, reminder, user_settings)
 
             # Guild quest in progress
-            search_strings = [
-                'if you don\'t want this quest anymore', #English
-                'si ya no quieres esta misión', #Spanish
-                'se você não quiser mais esta missão', #Portuguese
-            ]
-            if (any(search_string in message_description.lower() for search_string in search_strings)
+            if (parsed_message.matches('quest_guild_quest_active', 'description')
                 and 'guild' in field_name.lower()):
                 user = await functions.get_interaction_user(message)
                 user_command_message = None
@@ -458,15 +478,7 @@ class QuestCog(commands.Cog):
         if not message.embeds:
             message_content = message.content
             # Quest
-            search_strings = [
-                'got a **new quest**!', #English accepted
-                'you did not accept the quest', #English declined
-                'consiguió una **nueva misión**', #Spanish accepted
-                'no aceptaste la misión', #Spanish declined
-                'conseguiu uma **nova missão**', #Portuguese accepted
-                'você não aceitou a missão', #Portuguese declined
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('quest_quest', 'content'):
                 user_name = user_command_message = None
                 user = await functions.get_interaction_user(message)
                 slash_command = True if user is not None else False
@@ -551,12 +563,7 @@ class QuestCog(commands.Cog):
                 await functions.add_reminder_reaction(message, reminder, user_settings)
 
             # Aborted guild quest
-            search_strings = [
-                'you don\'t have a quest anymore', #English
-                'ya no tienes una misión', #Spanish
-                'você não tem mais uma missão', #Portuguese
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings) and message.mentions:
+            if parsed_message.matches('quest_guild_quest_aborted', 'content') and message.mentions:
                 user = message.mentions[0]
                 try:
                     user_settings: users.User = await users.get_user(user.id)
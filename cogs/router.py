@@ -0,0 +1,82 @@
+# router.py
+"""Dispatches all messages of EPIC RPG to the message handlers registered in resources.router"""
+
+import asyncio
+
+import discord
+from discord.ext import bridge, commands
+
+from resources import functions, router, settings
+
+
+class RouterCog(commands.Cog):
+    """Cog that contains the message router"""
+    def __init__(self, bot: bridge.AutoShardedBot):
+        self.bot = bot
+
+    async def run_handler(self, handler: router.MessageHandler | router.EditHandler, *args: discord.Message) -> None:
+        """Runs a message handler and reports errors the same way discord does for listeners."""
+        try:
+            await handler(*args)
+        except Exception:
+            await self.bot.on_error('on_message', args[-1])
+
+    async def run_handlers(self, coroutines: list) -> None:
+        """Runs all handler coroutines. Only creates tasks if more than one handler needs to run."""
+        if not coroutines: return
+        if len(coroutines) == 1:
+            await coroutines[0]
+        else:
+            await asyncio.gather(*coroutines)
+
+    async def dispatch(self, message: discord.Message, edit: bool = False) -> None:
+        """Parses the message and runs all handlers whose triggers appear in it."""
+        parsed_message: router.ParsedMessage = router.parse_message(message)
+        router.add_parsed_message(parsed_message)
+        try:
+            await self.run_handlers(
+                [self.run_handler(handler.on_message, message) for handler in router.get_message_handlers(parsed_message)
+                 if not edit or (handler.edits and handler.on_message_edit is None)]
+            )
+        finally:
+            router.remove_parsed_message(parsed_message)
+
+    async def is_relevant_edit(self, message_before: discord.Message, message_after: discord.Message) -> bool:
+        """Checks if an edit changed anything that handlers need to look at again.
+        Edits that only pin the message or disable its components are ignored."""
+        if message_before.pinned != message_after.pinned: return False
+        embed_data_before = await functions.parse_embed(message_before)
+        embed_data_after = await functions.parse_embed(message_after)
+        if (message_before.content == message_after.content and embed_data_before == embed_data_after
+            and message_before.components == message_after.components): return False
+        row: discord.Component
+        for row in message_after.components:
+            if isinstance(row, discord.ActionRow):
+                for component in row.children:
+                    if isinstance(component, (discord.Button, discord.SelectMenu)):
+                        if component.disabled:
+                            return False
+        return True
+
+    @commands.Cog.listener()
+    async def on_message_edit(self, message_before: discord.Message, message_after: discord.Message) -> None:
+        """Runs when a message is edited in a channel."""
+        if message_after.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
+        coroutines: list = [
+            self.run_handler(handler.on_message_edit, message_before, message_after)
+            for handler in router.get_edit_handlers()
+        ]
+        if await self.is_relevant_edit(message_before, message_after):
+            coroutines.append(self.dispatch(message_after, edit=True))
+        await self.run_handlers(coroutines)
+
+    @commands.Cog.listener()
+    async def on_message(self, message: discord.Message) -> None:
+        """Runs when a message is sent in a channel."""
+        if message.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
+        await self.dispatch(message)
+
+
+# Initialization
+def setup(bot: bridge.AutoShardedBot):
+    bot.add_cog(RouterCog(bot))
@@ -9,13 +9,18 @@ import re
 
 from database import clans, errors, reminders, users
 from content import settings as settings_cmd
-from resources import emojis, exceptions, functions, settings, strings
+from resources import emojis, exceptions, functions, regex, router, settings, strings
 
 
 class SettingsCog(commands.Cog):
     """Cog with user settings commands"""
     def __init__(self, bot: bridge.AutoShardedBot):
         self.bot = bot
+        router.register_message_handler(self.qualified_name, on_message_edit=self.on_message_edit)
+
+    def cog_unload(self) -> None:
+        """Removes the message handlers of this cog from the router."""
+        router.unregister_message_handler(self.qualified_name)
 
     # Bridge commands
     @bridge.bridge_command(name='on', description='Turn on Navi', aliases=('register', 'activate', 'start'))
@@ -199,107 +204,98 @@ class SettingsCog(commands.Cog):
 
 
     # Events
-    @commands.Cog.listener()
     async def on_message_edit(self, message_before: discord.Message, message_after: discord.Message) -> None:
-        """Fires when a message is edited"""
-        if message_before.author.id in [settings.EPIC_RPG_ID, settings.TESTY_ID]:
-            search_strings = [
-                'loading the epic guild member list...', #English
-                'cargando la lista épica de miembros...', #Spanish
-                'carregando lista de membros épica...', #Portuguese
-            ]
-            if any(search_string in message_before.content.lower() for search_string in search_strings):
-                message_clan_name = str(message_after.embeds[0].fields[0].name)
-                message_clan_members = str(message_after.embeds[0].fields[0].value)
-                message_clan_leader = str(message_after.embeds[0].footer.text)
-                search_patterns = [
-                    r'^\*\*(.+?)\*\* members', #English
-                    r'^Mi?embros de \*\*(.+?)\*\*', #Spanish, Portuguese
-                ]
-                clan_name_match = await functions.get_match_from_patterns(search_patterns, message_clan_name)
-                if clan_name_match:
-                    clan_name = clan_name_match.group(1)
+        """Fires when EPIC RPG edits a message. Called by the message router."""
+        search_strings = [
+            'loading the epic guild member list...', #English
+            'cargando la lista épica de miembros...', #Spanish
+            'carregando lista de membros épica...', #Portuguese
+        ]
+        if any(search_string in message_before.content.lower() for search_string in search_strings):
+            message_clan_name = str(message_after.embeds[0].fields[0].name)
+            message_clan_members = str(message_after.embeds[0].fields[0].value)
+            message_clan_leader = str(message_after.embeds[0].footer.text)
+            clan_name_match = await functions.get_match_from_patterns(regex.PATTERNS_SETTINGS_CLAN_NAME,
+                                                                      message_clan_name)
+            if clan_name_match:
+                clan_name = clan_name_match.group(1)
+            else:
+                await functions.add_warning_reaction(message_after)
+                await errors.log_error(f'Clan name not found in guild list message: {message_clan_name}', message_after)
+                return
+            clan_leaders = []
+            for line in message_clan_leader.split('\n'):
+                clan_leader_match = await functions.get_match_from_patterns(regex.PATTERNS_SETTINGS_CLAN_LEADER, line)
+                if clan_leader_match:
+                    clan_leader = clan_leader_match.group(1)
                 else:
                     await functions.add_warning_reaction(message_after)
-                    await errors.log_error(f'Clan name not found in guild list message: {message_clan_name}', message_after)
+                    await errors.log_error(f'Clan owner not found in guild list footer line: {line}', message_after)
                     return
-                search_patterns = [
-                    r'owner: (.+?)$', #English
-                    r'líder: (.+?)$', #Spanish, Portuguese
-                ]
-                clan_leaders = []
-                for line in message_clan_leader.split('\n'):
-                    clan_leader_match = await functions.get_match_from_patterns(search_patterns, line)
-                    if clan_leader_match:
-                        clan_leader = clan_leader_match.group(1)
-                    else:
+                if clan_leader.isnumeric():
+                    clan_leaders.append(int(clan_leader))
+                else:
+                    user_name_match = re.search(r'^(.+?)(?:#(\d+?))?$', clan_leader)
+                    if not user_name_match:
                         await functions.add_warning_reaction(message_after)
-                        await errors.log_error(f'Clan owner not found in guild list footer line: {line}', message_after)
+                        await errors.log_error(f'Couldn\'t find user ID or name for guild list leader "{clan_leader}".',
+                                                message_after)
                         return
-                    if clan_leader.isnumeric():
-                        clan_leaders.append(int(clan_leader))
+                    username = user_name_match.group(1)
+                    discriminator = user_name_match.group(2)
+                    if discriminator is not None:
+                        clan_leader = discord.utils.get(message_before.guild.members,
+                                                        name=username, discriminator=discriminator)
                     else:
-                        user_name_match = re.search(r'^(.+?)(?:#(\d+?))?$', clan_leader)
-                        if not user_name_match:
-                            await functions.add_warning_reaction(message_after)
-                            await errors.log_error(f'Couldn\'t find user ID or name for guild list leader "{clan_leader}".',
-                                                    message_after)
-                            return
-                        username = user_name_match.group(1)
-                        discriminator = user_name_match.group(2)
-                        if discriminator is not None:
-                            clan_leader = discord.utils.get(message_before.guild.members,
-                                                            name=username, discriminator=discriminator)
-                        else:
-                            clan_leader = discord.utils.get(message_before.guild.members,
-                                                            name=username)
-                        clan_leaders.append(clan_leader.id)
-                clan_members = message_clan_members.split('\n')
-                clan_member_ids = []
-                for member in clan_members:
-                    user_id_match = re.search(r'^ID: \*\*(\d+?)\*\*$', member)
-                    if user_id_match:
-                        member_id = int(user_id_match.group(1))
+                        clan_leader = discord.utils.get(message_before.guild.members,
+                                                        name=username)
+                    clan_leaders.append(clan_leader.id)
+            clan_members = message_clan_members.split('\n')
+            clan_member_ids = []
+            for member in clan_members:
+                user_id_match = re.search(r'^ID: \*\*(\d+?)\*\*$', member)
+                if user_id_match:
+                    member_id = int(user_id_match.group(1))
+                else:
+                    user_name_match = re.search(r'^\*\*(.+?)(?:#(\d+?))?\*\*$', member)
+                    if not user_name_match:
+                        await functions.add_warning_reaction(message_after)
+                        await errors.log_error(f'Couldn\'t find user ID or name for guild list member "{member}".',
+                                               message_after)
+                        return
+                    username = user_name_match.group(1)
+                    discriminator = user_name_match.group(2)
+                    if discriminator is not None:
+                        member = discord.utils.get(message_before.guild.members,
+                                                name=username, discriminator=discriminator)
                     else:
-                        user_name_match = re.search(r'^\*\*(.+?)(?:#(\d+?))?\*\*$', member)
-                        if not user_name_match:
-                            await functions.add_warning_reaction(message_after)
-                            await errors.log_error(f'Couldn\'t find user ID or name for guild list member "{member}".',
-                                                   message_after)
-                            return
-                        username = user_name_match.group(1)
-                        discriminator = user_name_match.group(2)
-                        if discriminator is not None:
-                            member = discord.utils.get(message_before.guild.members,
-                                                    name=username, discriminator=discriminator)
-                        else:
-                            member = discord.utils.get(message_before.guild.members,
-                                                    name=username)
-                        member_id = member.id
-                    clan_member_ids.append(member_id)
-                try:
-                    clan: clans.Clan = await clans.get_clan_by_user_id(clan_leaders[0])
-                    if clan.clan_name != clan_name:
+                        member = discord.utils.get(message_before.guild.members,
+                                                name=username)
+                    member_id = member.id
+                clan_member_ids.append(member_id)
+            try:
+                clan: clans.Clan = await clans.get_clan_by_user_id(clan_leaders[0])
+                if clan.clan_name != clan_name:
+                    try:
+                        existing_clan: clans.Clan = await clans.get_clan_by_clan_name(clan_name)
+                    except exceptions.NoDataFoundError:
                         try:
-                            existing_clan: clans.Clan = await clans.get_clan_by_clan_name(clan_name)
+                            reminder: reminders.Reminder = await reminders.get_clan_reminder(clan.clan_name)
+                            await reminder.update(clan_name=clan_name)
                         except exceptions.NoDataFoundError:
-                            try:
-                                reminder: reminders.Reminder = await reminders.get_clan_reminder(clan.clan_name)
-                                await reminder.update(clan_name=clan_name)
-                            except exceptions.NoDataFoundError:
-                                pass
-                            await clan.update(clan_name=clan_name)
-                except exceptions.NoDataFoundError:
-                    pass
-                try:
-                    clan: clans.Clan = await clans.get_clan_by_clan_name(clan_name)
-                    await clan.update(leader_ids=clan_leaders, member_ids=clan_member_ids)
-                except exceptions.NoDataFoundError:
-                    clan: clans.Clan = await clans.insert_clan(clan_name, clan_leaders, clan_member_ids)
-                if not clan.record_exists:
-                    if settings.DEBUG_MODE: await message_after.channel.send(strings.MSG_ERROR)
-                    return
-                await message_after.add_reaction(emojis.NAVI)
+                            pass
+                        await clan.update(clan_name=clan_name)
+            except exceptions.NoDataFoundError:
+                pass
+            try:
+                clan: clans.Clan = await clans.get_clan_by_clan_name(clan_name)
+                await clan.update(leader_ids=clan_leaders, member_ids=clan_member_ids)
+            except exceptions.NoDataFoundError:
+                clan: clans.Clan = await clans.insert_clan(clan_name, clan_leaders, clan_member_ids)
+            if not clan.record_exists:
+                if settings.DEBUG_MODE: await message_after.channel.send(strings.MSG_ERROR)
+                return
+            await message_after.add_reaction(emojis.NAVI)
 
 
 # Initialization
@@ -9,55 +9,44 @@ from discord.ext import bridge, commands
 
 from cache import messages
 from database import errors, reminders, users
-from resources import emojis, exceptions, functions, regex, settings, strings
+from resources import emojis, exceptions, functions, regex, router, strings
 
 if TYPE_CHECKING:
     import re
 
 
+TRIGGERS = {
+    'sleepy_potion_sleepy_potion': (
+        'has slept for a day', #English
+        'ha dormido durante un día', #Spanish
+        'dormiu por um dia', #Portuguese
+    ),
+}
+
+
 class SleepyPotionCog(commands.Cog):
     """Cog that contains the sleepy potion detection commands"""
     def __init__(self, bot: bridge.AutoShardedBot):
         self.bot = bot
+        router.register_message_handler(self.qualified_name, self.on_message, triggers=TRIGGERS)
 
-    @commands.Cog.listener()
-    async def on_message_edit(self, message_before: discord.Message, message_after: discord.Message) -> None:
-        """Runs when a message is edited in a channel."""
-        if message_before.pinned != message_after.pinned: return
-        embed_data_before: dict[str, str] = await functions.parse_embed(message_before)
-        embed_data_after: dict[str, str] = await functions.parse_embed(message_after)
-        if (message_before.content == message_after.content and embed_data_before == embed_data_after
-            and message_before.components == message_after.components): return
-        row: discord.Component
-        for row in message_after.components:
-            if isinstance(row, discord.ActionRow):
-                for component in row.children:
-                    if isinstance(component, (discord.Button, discord.SelectMenu)):
-                        if component.disabled:
-                            return
-        await self.on_message(message_after)
+    def cog_unload(self) -> None:
+        """Removes the message handlers of this cog from the router."""
+        router.unregister_message_handler(self.qualified_name)
 
-    @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
-        """Runs when a message is sent in a channel."""
-        if message.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
+        """Runs when EPIC RPG sends or edits a message. Called by the message router."""
+        parsed_message: router.ParsedMessage = router.get_parsed_message(message)
         if message.embeds: return
         # Sleepy Potion
-        search_strings: list[str] = [
-            'has slept for a day', #English
-            'ha dormido durante un día', #Spanish
-            'dormiu por um dia', #Portuguese
-        ]
-        if any(search_string in message.content.lower() for search_string in search_strings):
+        if parsed_message.matches('sleepy_potion_sleepy_potion', 'content'):
             user_name: str | None = None
             user_command_message: discord.Message | None = None
             user: discord.User | discord.Member | None = await functions.get_interaction_user(message)
             if user is None:
-                search_patterns: list[str] = [
-                    r'^\*\*(.+?)\*\* drinks', #English
-                    r'^\*\*(.+?)\*\* bebe', #Spanish, Portuguese
-                ]
-                user_name_match: re.Match[str] | None = await functions.get_match_from_patterns(search_patterns, message.content)
+                user_name_match: re.Match[str] | None = (
+                    await functions.get_match_from_patterns(regex.PATTERNS_SLEEPY_POTION_USER_NAME, message.content)
+                )
                 if user_name_match:
                     user_name = user_name_match.group(1)
                     user_command_message = (
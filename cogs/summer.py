@@ -11,52 +11,64 @@ from discord.ext import bridge, commands
 
 from cache import messages
 from database import errors, reminders, users
-from resources import exceptions, functions, regex, settings
+from resources import exceptions, functions, regex, router
+
+
+TRIGGERS = {
+    'summer_surf_cooldown': (
+        'you have surfed recently', #English
+        'you have surfed recently', #TODO: Spanish
+        'you have surfed recently', #TODO: Portuguese
+    ),
+    'summer_color_tournament': (
+        'complete a surf course to improve your team score', #English
+        'complete a surf course to improve your team score', #TODO: Spanish
+        'complete a surf course to improve your team score', #TODO: Portuguese
+    ),
+    'summer_surf_helper': (
+        "try not to slip off the surfboard", #English
+        "try not to slip off the surfboard", #TODO: Spanish
+        "try not to slip off the surfboard", #TODO: Portuguese
+    ),
+    'summer_surf': (
+        'completed the surf course', #English, success
+        'slipped off the surfboard', #English, fail
+        'completed the surf course', #TODO: Spanish, success
+        'slipped off the surfboard', #TODO: Spanish, fail
+        'completed the surf course', #TODO: Portuguese, success
+        'slipped off the surfboard', #TODO: Portuguese, fail
+    ),
+    'summer_color_tournament_drinks': (
+        'team perk** until the end of this week!', #English
+        'team perk** until the end of this week!', #TODO: Spanish
+        'team perk** until the end of this week!', #TODO: Portuguese
+    ),
+}
 
 
 class SummerCog(commands.Cog):
     """Cog that contains the summer event detection commands"""
     def __init__(self, bot: bridge.AutoShardedBot):
         self.bot = bot
+        router.register_message_handler(self.qualified_name, self.on_message, triggers=TRIGGERS)
 
-    @commands.Cog.listener()
-    async def on_message_edit(self, message_before: discord.Message, message_after: discord.Message) -> None:
-        """Runs when a message is edited in a channel."""
-        if message_after.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-        if message_before.pinned != message_after.pinned: return
-        embed_data_before = await functions.parse_embed(message_before)
-        embed_data_after = await functions.parse_embed(message_after)
-        if (message_before.content == message_after.content and embed_data_before == embed_data_after
-            and message_before.components == message_after.components): return
-        row: discord.Component
-        for row in message_after.components:
-            if isinstance(row, discord.ActionRow):
-                for component in row.children:
-                    if isinstance(component, (discord.Button, discord.SelectMenu)):
-                        if component.disabled:
-                            return
-        await self.on_message(message_after)
+    def cog_unload(self) -> None:
+        """Removes the message handlers of this cog from the router."""
+        router.unregister_message_handler(self.qualified_name)
 
-    @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
-        """Runs when a message is sent in a channel."""
-        if message.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
+        """Runs when EPIC RPG sends or edits a message. Called by the message router."""
+        parsed_message: router.ParsedMessage = router.get_parsed_message(message)
         if message.embeds:
             embed: discord.Embed = message.embeds[0]
-            embed_author = message_title = message_description = icon_url = ''
+            embed_author = message_title = icon_url = ''
             if embed.author is not None:
                 embed_author = str(embed.author.name)
                 icon_url = embed.author.icon_url
             if embed.title is not None: message_title = str(embed.title)
-            if embed.description is not None: message_description = str(embed.description)
             
             # Surf cooldown
-            search_strings = [
-                'you have surfed recently', #English
-                'you have surfed recently', #TODO: Spanish
-                'you have surfed recently', #TODO: Portuguese
-            ]
-            if any(search_string in message_title.lower() for search_string in search_strings):
+            if parsed_message.matches('summer_surf_cooldown', 'title'):
                 user_id = user_name = user_command_message = None
                 user = await functions.get_interaction_user(message)
                 if user is None:
@@ -101,12 +113,7 @@ class SummerCog(commands.Cog):
                 await functions.add_reminder_reaction(message, reminder, user_settings)
 
             # Color tournament
-            search_strings = [
-                'complete a surf course to improve your team score', #English
-                'complete a surf course to improve your team score', #TODO: Spanish
-                'complete a surf course to improve your team score', #TODO: Portuguese
-            ]
-            if any(search_string in message_description.lower() for search_string in search_strings):
+            if parsed_message.matches('summer_color_tournament', 'description'):
                 user_id = user_name = user_command_message = None
                 user = await functions.get_interaction_user(message)
                 if user is None:
@@ -142,12 +149,7 @@ class SummerCog(commands.Cog):
                 await functions.add_reminder_reaction(message, reminder, user_settings)      
 
             # Surf helper
-            search_strings = [
-                "try not to slip off the surfboard", #English
-                "try not to slip off the surfboard", #TODO: Spanish
-                "try not to slip off the surfboard", #TODO: Portuguese
-            ]
-            if any(search_string in message_description.lower() for search_string in search_strings):
+            if parsed_message.matches('summer_surf_helper', 'description'):
                 user_command_message = None
                 user = await functions.get_interaction_user(message)
                 if user is None:
@@ -224,15 +226,7 @@ class SummerCog(commands.Cog):
             message_content = message.content
 
             # Surf
-            search_strings = [
-                'completed the surf course', #English, success
-                'slipped off the surfboard', #English, fail
-                'completed the surf course', #TODO: Spanish, success
-                'slipped off the surfboard', #TODO: Spanish, fail
-                'completed the surf course', #TODO: Portuguese, success
-                'slipped off the surfboard', #TODO: Portuguese, fail
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('summer_surf', 'content'):
                 user_id = user_name = None
                 user = await functions.get_interaction_user(message)
                 if user is None:
@@ -269,12 +263,7 @@ class SummerCog(commands.Cog):
                 await functions.add_reminder_reaction(message, reminder, user_settings)
 
             # Joining color tournament from using drinks
-            search_strings = [
-                'team perk** until the end of this week!', #English
-                'team perk** until the end of this week!', #TODO: Spanish
-                'team perk** until the end of this week!', #TODO: Portuguese
-            ]
-            if (any(search_string in message_content.lower() for search_string in search_strings)
+            if (parsed_message.matches('summer_color_tournament_drinks', 'content')
                 and datetime.today().weekday() < 5):
                 user_id = user_name = None
                 user = await functions.get_interaction_user(message)
@@ -5,7 +5,7 @@ import asyncio
 from datetime import datetime, timedelta
 from humanfriendly import format_timespan
 import re
-import sqlite3
+from time import perf_counter
 
 import discord
 from discord import utils
@@ -17,12 +17,14 @@ from resources import emojis, exceptions, functions, logs, settings, strings
 
 
 running_tasks = {}
+loop_lag = {'last': 0.0, 'max': 0.0} # Event loop lag in seconds, measured by TasksCog.measure_loop_lag
 
 
 class TasksCog(commands.Cog):
     """Cog with tasks"""
     def __init__(self, bot: bridge.AutoShardedBot):
         self.bot = bot
+        reminders.register_task_handlers(self.create_tasks, self.delete_task)
 
     # Task management
     async def background_task(self, reminders_list: list[reminders.Reminder]) -> None:
@@ -212,12 +214,38 @@ class TasksCog(commands.Cog):
         running_tasks[reminders_list[0].task_name] = task
 
     async def delete_task(self, task_name: str) -> None:
-        """Stops and deletes a running task if it exists"""
+        """Stops and deletes a running task if it exists. A task never cancels itself."""
         if task_name in running_tasks:
-            running_tasks[task_name].cancel()
-            running_tasks.pop(task_name, None)
+            task = running_tasks.pop(task_name)
+            if task is not asyncio.current_task(): task.cancel()
         return
 
+    async def create_tasks(self, reminders_list: list[reminders.Reminder]) -> None:
+        """Creates tasks for due reminders. Called by the reminder scheduler.
+        Reminders that fire at the same second for the same user in the same channel are combined into one task.
+        """
+        user_reminders = {}
+        reminder: reminders.Reminder
+        for reminder in reminders_list:
+            if reminder.reminder_type == 'user':
+                reminder_user_channel = f'{reminder.user_id}-{reminder.channel_id}-{reminder.end_time.replace(microsecond=0)}'
+                if reminder_user_channel in user_reminders:
+                    user_reminders[reminder_user_channel].append(reminder)
+                else:
+                    user_reminders[reminder_user_channel] = [reminder,]
+            else:
+                await self.create_task([reminder,])
+        for user_reminders_list in user_reminders.values():
+            user_reminders_list.sort(key=lambda reminder: reminder.activity)
+            pet_reminders = []
+            other_reminders = []
+            for reminder in user_reminders_list:
+                if reminder.activity.startswith('pets'):
+                    pet_reminders.append(reminder)
+                else:
+                    other_reminders.append(reminder)
+            await self.create_task(other_reminders + pet_reminders)
+
     @commands.command(name='task-start')
     @commands.bot_has_permissions(send_messages=True, embed_links=True)
     async def task_start(self, ctx: commands.Context, *args: str) -> None:
@@ -228,10 +256,6 @@ class TasksCog(commands.Cog):
             reminders.schedule_reminders.start()
         except Exception as error:
             errors.append(f'Task "schedule_reminders": {error}')
-        try:
-            self.schedule_tasks.start()
-        except Exception as error:
-            errors.append(f'Task "schedule_tasks": {error}')
         try:
             self.delete_old_reminders.start()
         except Exception as error:
@@ -244,18 +268,26 @@ class TasksCog(commands.Cog):
             self.consolidate_tracking_log.start()
         except Exception as error:
             errors.append(f'Task "consolidate_tracking_log": {error}')
+        try:
+            tracking.log_to_leaderboard.start()
+        except Exception as error:
+            errors.append(f'Task "log_to_leaderboard": {error}')
         try:
             self.delete_old_messages_from_cache.start()
         except Exception as error:
             errors.append(f'Task "delete_olde_messages_from_cache": {error}')
         try:
-            self.reset_trade_daily_done.start()
+            self.reset_user_columns.start()
         except Exception as error:
-            errors.append(f'Task "trade_daily_done": {error}')
+            errors.append(f'Task "reset_user_columns": {error}')
         try:
             self.disable_event_reduction.start()
         except Exception as error:
             errors.append(f'Task "disable_event_reduction": {error}')
+        try:
+            self.measure_loop_lag.start()
+        except Exception as error:
+            errors.append(f'Task "measure_loop_lag": {error}')
         errors_list = ''
         if errors:
             errors_list = '```'
@@ -272,10 +304,6 @@ class TasksCog(commands.Cog):
             reminders.schedule_reminders.start()
         except RuntimeError:
             pass
-        try:
-            self.schedule_tasks.start()
-        except RuntimeError:
-            pass
         try:
             self.delete_old_reminders.start()
         except RuntimeError:
@@ -288,12 +316,16 @@ class TasksCog(commands.Cog):
             self.consolidate_tracking_log.start()
         except RuntimeError:
             pass
+        try:
+            tracking.log_to_leaderboard.start()
+        except RuntimeError:
+            pass
         try:
             self.delete_old_messages_from_cache.start()
         except RuntimeError:
             pass 
         try:
-            self.reset_trade_daily_done.start()
+            self.reset_user_columns.start()
         except RuntimeError:
             pass
         try:
@@ -304,40 +336,12 @@ class TasksCog(commands.Cog):
             self.delete_empty_clans.start()
         except RuntimeError:
             pass
+        try:
+            self.measure_loop_lag.start()
+        except RuntimeError:
+            pass
 
     # Tasks
-    @tasks.loop(seconds=0.5)
-    async def schedule_tasks(self):
-        """Task that creates or deletes tasks from scheduled reminders.
-        Reminders that fire at the same second for the same user in the same channel are combined into one task.
-        """
-        user_reminders = {}
-        reminder: reminders.Reminder
-        for reminder in reminders.scheduled_for_tasks.copy().values():
-            reminders.scheduled_for_tasks.pop(reminder.task_name, None)
-            if reminder.reminder_type == 'user':
-                reminder_user_channel = f'{reminder.user_id}-{reminder.channel_id}-{reminder.end_time.replace(microsecond=0)}'
-                if reminder_user_channel in user_reminders:
-                    user_reminders[reminder_user_channel].append(reminder)
-                else:
-                    user_reminders[reminder_user_channel] = [reminder,]
-            else:
-                await self.create_task([reminder,])
-        for reminder in reminders.scheduled_for_deletion.copy().values():
-            reminders.scheduled_for_deletion.pop(reminder.task_name, None)
-            await self.delete_task(reminder.task_name)
-        if user_reminders:
-            for reminders_list in user_reminders.values():
-                reminders_list.sort(key=lambda reminder: reminder.activity)
-                pet_reminders = []
-                other_reminders = []
-                for reminder in reminders_list:
-                    if reminder.activity.startswith('pets'):
-                        pet_reminders.append(reminder)
-                    else:
-                        other_reminders.append(reminder)
-                await self.create_task(other_reminders + pet_reminders)
-
     @tasks.loop(minutes=2.0)
     async def delete_old_reminders(self) -> None:
         """Task that deletes all old reminders"""
@@ -440,48 +444,19 @@ class TasksCog(commands.Cog):
         """Task that consolidates tracking log entries older than 28 days into summaries"""
         start_time = utils.utcnow()
         if start_time.hour == 0 and start_time.minute == 15:
-            log_entry_count = 0
-            try:
-                old_log_entries = await tracking.get_old_log_entries(28)
-            except exceptions.NoDataFoundError:
-                logs.logger.info('Didn\'t find any log entries to consolidate.')
-                return
-            entries = {}
-            for log_entry in old_log_entries:
-                date_time = log_entry.date_time.replace(hour=23, minute=59, second=59, microsecond=999999)
-                key = (log_entry.user_id, log_entry.guild_id, log_entry.command, date_time)
-                amount = entries.get(key, 0)
-                entries[key] = amount + 1
-                log_entry_count += 1
-            for key, amount in entries.items():
-                user_id, guild_id, command, date_time = key
-                summary_log_entry = await tracking.insert_log_summary(user_id, guild_id, command, date_time, amount)
-                date_time_min = date_time.replace(hour=0, minute=0, second=0, microsecond=0)
-                date_time_max = date_time.replace(hour=23, minute=59, second=59, microsecond=999999)
-                await tracking.delete_log_entries(user_id, guild_id, command, date_time_min, date_time_max)
-                await asyncio.sleep(0.01)
-            cur = settings.NAVI_DB.cursor()
-            date_time = utils.utcnow() - timedelta(days=366)
-            date_time = date_time.replace(hour=0, minute=0, second=0)
-            sql = 'DELETE FROM tracking_log WHERE date_time<?'
-            try:
-                cur.execute(sql, (date_time,))
-                cur.execute('VACUUM')
-            except sqlite3.Error as error:
-                logs.logger.error(f'Error while consolidating: {error}')
-                raise
+            log_entry_count = await tracking.consolidate_log_entries(28)
             end_time = utils.utcnow()
             time_passed = end_time - start_time
             logs.logger.info(f'Consolidated {log_entry_count:,} log entries in {format_timespan(time_passed)}.')
-            
+
     @tasks.loop(seconds=60)
-    async def reset_trade_daily_done(self) -> None:
-        """Task that resets the daily trade amounts to 0"""
+    async def reset_user_columns(self) -> None:
+        """Task that resets the user columns in users.SCHEDULED_COLUMN_RESETS (e.g. the daily trade amounts)"""
         current_time = utils.utcnow()
-        if current_time.hour == 0 and current_time.minute == 0:
-            all_user_settings = await users.get_all_users()
-            for user_settings in all_user_settings:
-                if user_settings.trade_daily_done != 0: await user_settings.update(trade_daily_done=0)
+        for column_reset in users.SCHEDULED_COLUMN_RESETS:
+            if current_time.hour == column_reset.hour and current_time.minute == column_reset.minute:
+                user_count = await users.reset_user_columns(**column_reset.values)
+                logs.logger.info(f'Reset {", ".join(column_reset.values.keys())} of {user_count:,} users.')
 
     @tasks.loop(seconds=60)
     async def delete_old_messages_from_cache(self) -> None:
@@ -503,6 +478,16 @@ class TasksCog(commands.Cog):
             for cooldown in all_cooldowns:
                 await cooldown.update(event_reduction_slash=0, event_reduction_mention=0)
 
+    @tasks.loop(seconds=1)
+    async def measure_loop_lag(self) -> None:
+        """Task that measures how much later than requested the event loop wakes up from a sleep"""
+        sleep_time = 0.1
+        start_time = perf_counter()
+        await asyncio.sleep(sleep_time)
+        lag = max(perf_counter() - start_time - sleep_time, 0)
+        loop_lag['last'] = lag
+        if lag > loop_lag['max']: loop_lag['max'] = lag
+
 # Initialization
 def setup(bot: bridge.AutoShardedBot):
     bot.add_cog(TasksCog(bot))
\ No newline at end of file
@@ -12,13 +12,37 @@ from discord.ext import bridge, commands
 from cache import messages
 from content import tracking as tracking_cmd
 from database import errors, reminders, users, tracking
-from resources import emojis, functions, exceptions, regex, settings
+from resources import emojis, functions, exceptions, regex, router
+
+
+TRIGGERS = {
+    'tracking_epic_guard': (
+        'we have to check you are actually playing', #English
+        'tenemos que revisar que realmente estés jugando', #Spanish
+        'temos que verificar se você está realmente jogando', #Portuguese
+    ),
+    'tracking_lost_time_travel': (
+        'was severely affected by the effects of this area and lost', #English
+        'was severely affected by the effects of this area and lost', #TODO: Spanish
+        'was severely affected by the effects of this area and lost', #TODO: Portuguese
+    ),
+    'tracking_time_travel': (
+        'has traveled in time', #English
+        'viajou no tempo', #Spanish
+        'tempo de viagem', #Portuguese
+    ),
+}
 
 
 class TrackingCog(commands.Cog):
     """Cog with command tracking commands"""
     def __init__(self, bot: bridge.AutoShardedBot):
         self.bot = bot
+        router.register_message_handler(self.qualified_name, self.on_message, triggers=TRIGGERS)
+
+    def cog_unload(self) -> None:
+        """Removes the message handlers of this cog from the router."""
+        router.unregister_message_handler(self.qualified_name)
 
     # Slash commands
     @slash_command()
@@ -72,156 +96,118 @@ class TrackingCog(commands.Cog):
         await tracking_cmd.command_stats(self.bot, ctx, timestring, user)
 
     # Events
-    @commands.Cog.listener()
-    async def on_message_edit(self, message_before: discord.Message, message_after: discord.Message) -> None:
-        """Runs when a message is edited in a channel."""
-        if message_after.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-        if message_before.pinned != message_after.pinned: return
-        embed_data_before = await functions.parse_embed(message_before)
-        embed_data_after = await functions.parse_embed(message_after)
-        if (message_before.content == message_after.content and embed_data_before == embed_data_after
-            and message_before.components == message_after.components): return
-        row: discord.Component
-        for row in message_after.components:
-            if isinstance(row, discord.ActionRow):
-                for component in row.children:
-                    if isinstance(component, (discord.Button, discord.SelectMenu)):
-                        if component.disabled:
-                            return
-        await self.on_message(message_after)
-
-    @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
-        """Fires when a message is sent"""
-        if message.author.id in [settings.EPIC_RPG_ID, settings.TESTY_ID]:
-            if not message.embeds:
-                message_content = message.content
+        """Runs when EPIC RPG sends or edits a message. Called by the message router."""
+        parsed_message: router.ParsedMessage = router.get_parsed_message(message)
+        if not message.embeds:
+            message_content = message.content
 
-                # Epic Guard
-                search_strings = [
-                    'we have to check you are actually playing', #English
-                    'tenemos que revisar que realmente estés jugando', #Spanish
-                    'temos que verificar se você está realmente jogando', #Portuguese
-                ]
-                if any(search_string in message_content.lower() for search_string in search_strings):
-                    user = await functions.get_interaction_user(message)
-                    if user is None:
-                        if message.mentions:
-                            user = message.mentions[0]
-                        else:
-                            return
-                    try:
-                        user_settings: users.User = await users.get_user(user.id)
-                    except exceptions.FirstTimeUserError:
-                        return
-                    if user_settings.tracking_enabled and user_settings.bot_enabled:
-                        await tracking.insert_log_entry(user.id, message.guild.id, 'epic guard',
-                                                        utils.utcnow())
-                        
-                # Losing time travel in area 20
-                search_strings = [
-                    'was severely affected by the effects of this area and lost', #English
-                    'was severely affected by the effects of this area and lost', #TODO: Spanish
-                    'was severely affected by the effects of this area and lost', #TODO: Portuguese
-                ]
-                if any(search_string in message_content.lower() for search_string in search_strings):
-                    user = await functions.get_interaction_user(message)
-                    if user is None:
-                        user_name_match = re.search(regex.NAME_FROM_MESSAGE_START, message_content)
-                        if user_name_match:
-                            user_name = user_name_match.group(1)
-                        else:
-                            await functions.add_warning_reaction(message)
-                            await errors.log_error('Couldn\'t find a user for a20 lost time travel message.', message)
-                            return
-                        user_command_message = (
-                            await messages.find_message(message.channel.id, user_name=user_name)
-                        )
-                        if user_command_message is None:
-                            await functions.add_warning_reaction(message)
-                            await errors.log_error('Couldn\'t find a command for a20 lost time travel message.',
-                                                message)
-                            return
-                        user = user_command_message.author
-                    try:
-                        user_settings: users.User = await users.get_user(user.id)
-                    except exceptions.FirstTimeUserError:
+            # Epic Guard
+            if parsed_message.matches('tracking_epic_guard', 'content'):
+                user = await functions.get_interaction_user(message)
+                if user is None:
+                    if message.mentions:
+                        user = message.mentions[0]
+                    else:
                         return
-                    if not user_settings.bot_enabled: return
-                    lost_tt_count_match = re.search(r' (\d+) <:', message_content)
-                    if lost_tt_count_match:
-                        lost_tt_count = int(lost_tt_count_match.group(1))
+                try:
+                    user_settings: users.User = await users.get_user(user.id)
+                except exceptions.FirstTimeUserError:
+                    return
+                if user_settings.tracking_enabled and user_settings.bot_enabled:
+                    await tracking.insert_log_entry(user.id, message.guild.id, 'epic guard',
+                                                    utils.utcnow())
+                    
+            # Losing time travel in area 20
+            if parsed_message.matches('tracking_lost_time_travel', 'content'):
+                user = await functions.get_interaction_user(message)
+                if user is None:
+                    user_name_match = re.search(regex.NAME_FROM_MESSAGE_START, message_content)
+                    if user_name_match:
+                        user_name = user_name_match.group(1)
                     else:
                         await functions.add_warning_reaction(message)
-                        await errors.log_error('Couldn\'t find a  lost tt count in a20 lost time travel message.', message)
+                        await errors.log_error('Couldn\'t find a user for a20 lost time travel message.', message)
                         return
-                    time_travel_count_new = user_settings.time_travel_count - lost_tt_count
-                    trade_daily_total = floor(100 * (time_travel_count_new + 1) ** 1.35)
-                    await user_settings.update(time_travel_count=time_travel_count_new, trade_daily_total=trade_daily_total)
-                        
-
-            if message.embeds:
-                # Last time travel
+                    user_command_message = (
+                        await messages.find_message(message.channel.id, user_name=user_name)
+                    )
+                    if user_command_message is None:
+                        await functions.add_warning_reaction(message)
+                        await errors.log_error('Couldn\'t find a command for a20 lost time travel message.',
+                                            message)
+                        return
+                    user = user_command_message.author
                 try:
-                    embed_description = str(message.embeds[0].description)
-                except:
+                    user_settings: users.User = await users.get_user(user.id)
+                except exceptions.FirstTimeUserError:
+                    return
+                if not user_settings.bot_enabled: return
+                lost_tt_count_match = re.search(r' (\d+) <:', message_content)
+                if lost_tt_count_match:
+                    lost_tt_count = int(lost_tt_count_match.group(1))
+                else:
+                    await functions.add_warning_reaction(message)
+                    await errors.log_error('Couldn\'t find a  lost tt count in a20 lost time travel message.', message)
                     return
-                search_strings = [
-                    'has traveled in time', #English
-                    'viajou no tempo', #Spanish
-                    'tempo de viagem', #Portuguese
-                ]
-                if any(search_string in embed_description.lower() for search_string in search_strings):
-                    user_command_message = None
-                    user = await functions.get_interaction_user(message)
-                    if user is None:
-                        search_patterns = [
-                            r'\*\*(.+?)\*\* has', #English
-                            r'\*\*(.+?)\*\* viajó', #English
-                            r'\*\*(.+?)\*\* tempo', #Portuguese
-                        ]
-                        user_name_match = await functions.get_match_from_patterns(search_patterns, embed_description)
-                        if user_name_match:
-                            user_name = user_name_match.group(1)
-                            user_command_message = (
-                                await messages.find_message(message.channel.id, regex.COMMAND_TIME_TRAVEL,
-                                                            user_name=user_name)
-                            )
-                        if not user_name_match or user_command_message is None:
-                            await errors.log_error('User name not found in time travel message.', message)
-                            return
-                        user = user_command_message.author
-                    try:
-                        user_settings: users.User = await users.get_user(user.id)
-                    except exceptions.FirstTimeUserError:
+                time_travel_count_new = user_settings.time_travel_count - lost_tt_count
+                trade_daily_total = floor(100 * (time_travel_count_new + 1) ** 1.35)
+                await user_settings.update(time_travel_count=time_travel_count_new, trade_daily_total=trade_daily_total)
+                    
+
+        if message.embeds:
+            # Last time travel
+            try:
+                embed_description = str(message.embeds[0].description)
+            except:
+                return
+            if parsed_message.matches('tracking_time_travel', 'description'):
+                user_command_message = None
+                user = await functions.get_interaction_user(message)
+                if user is None:
+                    user_name_match = await functions.get_match_from_patterns(regex.PATTERNS_USER_NAME_TIME_TRAVEL,
+                                                                              embed_description)
+                    if user_name_match:
+                        user_name = user_name_match.group(1)
+                        user_command_message = (
+                            await messages.find_message(message.channel.id, regex.COMMAND_TIME_TRAVEL,
+                                                        user_name=user_name)
+                        )
+                    if not user_name_match or user_command_message is None:
+                        await errors.log_error('User name not found in time travel message.', message)
                         return
-                    if not user_settings.bot_enabled: return
-                    tt_time = message.created_at
-                    updated_settings = {
-                        'last_tt': tt_time,
-                        'inventory_bread': 0,
-                        'inventory_carrot': 0,
-                        'inventory_potato': 0,
-                        'inventory_seed_bread': 0,
-                        'inventory_seed_potato': 0,
-                        'inventory_seed_carrot': 0,
-                        'inventory_ruby': 0,
-                    }
-                    await user_settings.update(**updated_settings)
-                    try:
-                        reminder: reminders.Reminder = await reminders.get_user_reminder(user.id, 'lottery')
-                        await reminder.delete()
-                    except exceptions.NoDataFoundError:
-                        pass
-                    try:
-                        user_command = await functions.get_slash_command(user_settings, 'farm')
-                        reminder_message = user_settings.alert_farm.message.replace('{command}', user_command)
-                        reminder: reminders.Reminder = await reminders.get_user_reminder(user.id, 'farm')
-                        await reminder.update(message=reminder_message)
-                    except exceptions.NoDataFoundError:
-                        pass
-                    if user_settings.last_tt == tt_time and user_settings.bot_enabled and user_settings.reactions_enabled:
-                        await message.add_reaction(emojis.NAVI)
+                    user = user_command_message.author
+                try:
+                    user_settings: users.User = await users.get_user(user.id)
+                except exceptions.FirstTimeUserError:
+                    return
+                if not user_settings.bot_enabled: return
+                tt_time = message.created_at
+                updated_settings = {
+                    'last_tt': tt_time,
+                    'inventory_bread': 0,
+                    'inventory_carrot': 0,
+                    'inventory_potato': 0,
+                    'inventory_seed_bread': 0,
+                    'inventory_seed_potato': 0,
+                    'inventory_seed_carrot': 0,
+                    'inventory_ruby': 0,
+                }
+                await user_settings.update(**updated_settings)
+                try:
+                    reminder: reminders.Reminder = await reminders.get_user_reminder(user.id, 'lottery')
+                    await reminder.delete()
+                except exceptions.NoDataFoundError:
+                    pass
+                try:
+                    user_command = await functions.get_slash_command(user_settings, 'farm')
+                    reminder_message = user_settings.alert_farm.message.replace('{command}', user_command)
+                    reminder: reminders.Reminder = await reminders.get_user_reminder(user.id, 'farm')
+                    await reminder.update(message=reminder_message)
+                except exceptions.NoDataFoundError:
+                    pass
+                if user_settings.last_tt == tt_time and user_settings.bot_enabled and user_settings.reactions_enabled:
+                    await message.add_reaction(emojis.NAVI)
 
 
 # Initialization
@@ -7,37 +7,36 @@ from discord.ext import bridge, commands
 
 from cache import messages
 from database import errors, users
-from resources import emojis, exceptions, functions, regex, settings, strings, views
+from resources import emojis, exceptions, functions, regex, router, strings, views
+
+
+TRIGGERS = {
+    'trade_trade': (
+        'our trade is done then', #English
+        'nuestro intercambio está hecho entonces', #Spanish
+        'nossa troca é feita então', #Portuguese
+    ),
+    'trade_daily_trades': (
+        'are you looking to trade your items?', #English
+        'estás buscando intercambiar tus items?', #Spanish
+        'pretende trocar os seus itens?', #Portuguese
+    ),
+}
 
 
 class TradeCog(commands.Cog):
     """Cog that contains all commands related to trading with the exception of the ruby helper"""
     def __init__(self, bot: bridge.AutoShardedBot):
         self.bot = bot
+        router.register_message_handler(self.qualified_name, self.on_message, triggers=TRIGGERS)
 
-    @commands.Cog.listener()
-    async def on_message_edit(self, message_before: discord.Message, message_after: discord.Message) -> None:
-        """Runs when a message is edited in a channel."""
-        if message_after.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-        if message_before.pinned != message_after.pinned: return
-        embed_data_before = await functions.parse_embed(message_before)
-        embed_data_after = await functions.parse_embed(message_after)
-        if (message_before.content == message_after.content and embed_data_before == embed_data_after
-            and message_before.components == message_after.components): return
-        row: discord.Component
-        for row in message_after.components:
-            if isinstance(row, discord.ActionRow):
-                for component in row.children:
-                    if isinstance(component, (discord.Button, discord.SelectMenu)):
-                        if component.disabled:
-                            return
-        await self.on_message(message_after)
+    def cog_unload(self) -> None:
+        """Removes the message handlers of this cog from the router."""
+        router.unregister_message_handler(self.qualified_name)
 
-    @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
-        """Runs when a message is sent in a channel."""
-        if message.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-
+        """Runs when EPIC RPG sends or edits a message. Called by the message router."""
+        parsed_message: router.ParsedMessage = router.get_parsed_message(message)
         if message.embeds:
             embed: discord.Embed = message.embeds[0]
             message_description = message_field = message_author = ''
@@ -48,12 +47,7 @@ class TradeCog(commands.Cog):
                 icon_url = embed.author.icon_url
 
             # Tracks daily trades done
-            search_strings = [
-                'our trade is done then', #English
-                'nuestro intercambio está hecho entonces', #Spanish
-                'nossa troca é feita então', #Portuguese
-            ]
-            if any(search_string in message_description.lower() for search_string in search_strings):
+            if parsed_message.matches('trade_trade', 'description'):
                 user_name = user_command_message = None
                 trade_from, trade_to = message_field.split('\n')[:2]
                 user_name_match = re.search(r"\*\*(.+?)\*\*:", trade_from)
@@ -103,12 +97,7 @@ class TradeCog(commands.Cog):
                 if user_settings.reactions_enabled: await message.add_reaction(emojis.NAVI)
 
             # Updates daily trades total and done from trade list
-            search_strings = [
-                'are you looking to trade your items?', #English
-                'estás buscando intercambiar tus items?', #Spanish
-                'pretende trocar os seus itens?', #Portuguese
-            ]
-            if any(search_string in message_description.lower() for search_string in search_strings):
+            if parsed_message.matches('trade_daily_trades', 'description'):
                 user_name = user_command_message = None
                 user = await functions.get_interaction_user(message)
                 if user is None:
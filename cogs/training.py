@@ -10,37 +10,60 @@ from discord.ext import bridge, commands
 
 from cache import messages
 from database import errors, reminders, tracking, users
-from resources import emojis, exceptions, functions, regex, settings, strings
+from resources import emojis, exceptions, functions, regex, router, strings
+
+
+TRIGGERS = {
+    'training_cooldown': (
+        'you have trained already', #English
+        'ya entrenaste', #Spanish
+        'você já treinou', #Portuguese
+    ),
+    'training_ultraining': (
+        '**: well done, **', #English
+        '**: bien hecho, **', #Spanish
+        '**: muito bem, **', #Portuguese
+        '**: damn, that was fast!', #English, eternal tier 7
+        '**: damn, that was fast!', #TODO: Spanish, eternal tier 7
+        '**: damn, that was fast!', #TODO: Portuguese, eternal tier 7
+    ),
+    'training_training': (
+        'well done, **', #English success
+        'better luck next time, **', #English fail
+        'bien hecho, **', #Spanish success
+        'próxima vez, **', #Spanish, Portuguese fail
+        'muito bem, **', #Portuguese success
+    ),
+    'training_void_event': (
+        'attempts to fly', #English butterfly
+        'runs the area command', #English keyboard
+        'it seems like a mysterious player saved', #English cry
+    ),
+    'training_reset': (
+        'training reset` successfully bought', #English
+        'training reset` comprado(s)', #Spanish, Portuguese
+    ),
+}
+
+ULTRAINING_FAIL_STRINGS = (
+    'better luck next time', #English
+    'próxima vez', #Spanish, Portuguese
+)
 
 
 class TrainingCog(commands.Cog):
 
     def __init__(self, bot: bridge.AutoShardedBot):
         self.bot = bot
+        router.register_message_handler(self.qualified_name, self.on_message, triggers=TRIGGERS)
 
-    @commands.Cog.listener()
-    async def on_message_edit(self, message_before: discord.Message, message_after: discord.Message) -> None:
-        """Runs when a message is edited in a channel."""
-        if message_after.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-        if message_before.pinned != message_after.pinned: return
-        embed_data_before = await functions.parse_embed(message_before)
-        embed_data_after = await functions.parse_embed(message_after)
-        if (message_before.content == message_after.content and embed_data_before == embed_data_after
-            and message_before.components == message_after.components): return
-        row: discord.Component
-        for row in message_after.components:
-            if isinstance(row, discord.ActionRow):
-                for component in row.children:
-                    if isinstance(component, (discord.Button, discord.SelectMenu)):
-                        if component.disabled:
-                            return
-        await self.on_message(message_after)
+    def cog_unload(self) -> None:
+        """Removes the message handlers of this cog from the router."""
+        router.unregister_message_handler(self.qualified_name)
 
-    @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
-        """Runs when a message is sent in a channel."""
-        if message.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-
+        """Runs when EPIC RPG sends or edits a message. Called by the message router."""
+        parsed_message: router.ParsedMessage = router.get_parsed_message(message)
         if message.embeds:
             embed: discord.Embed = message.embeds[0]
             message_author = message_title = message_description = message_field1_value = icon_url = message_field0_value = ''
@@ -55,12 +78,7 @@ class TrainingCog(commands.Cog):
                     message_field1_value = embed.fields[1].value
 
             # Training cooldown
-            search_strings = [
-                'you have trained already', #English
-                'ya entrenaste', #Spanish
-                'você já treinou', #Portuguese
-            ]
-            if any(search_string in message_title.lower() for search_string in search_strings):
+            if parsed_message.matches('training_cooldown', 'title'):
                 user_id = user_name = user_command_message = None
                 user = await functions.get_interaction_user(message)
                 slash_command = True if user is not None else False
@@ -120,15 +138,8 @@ class TrainingCog(commands.Cog):
                 )
                 await functions.add_reminder_reaction(message, reminder, user_settings)
 
-            search_strings = [
-                '**: well done, **', #English
-                '**: bien hecho, **', #Spanish
-                '**: muito bem, **', #Portuguese
-                '**: damn, that was fast!', #English, eternal tier 7
-                '**: damn, that was fast!', #TODO: Spanish, eternal tier 7
-                '**: damn, that was fast!', #TODO: Portuguese, eternal tier 7
-            ]
-            if (any(search_string in message_description.lower() for search_string in search_strings)
+            # Ultraining
+            if (parsed_message.matches('training_ultraining', 'description')
                 and any(search_string.lower() in message_description.lower() for search_string in strings.EPIC_NPC_NAMES)
                 and not 'celebrationcoin' in message_field0_value.lower()):
                 user_name = user_command_message = None
@@ -170,24 +181,13 @@ class TrainingCog(commands.Cog):
                 )
                 asyncio.ensure_future(functions.call_ready_command(self.bot, message, user, user_settings, 'training'))
                 await functions.add_reminder_reaction(message, reminder, user_settings)
-                search_strings = [
-                    'better luck next time', #English
-                    'próxima vez', #Spanish, Portuguese
-                ]
-                if any(search_string in message_field1_value.lower() for search_string in search_strings):
+                if any(search_string in message_field1_value.lower() for search_string in ULTRAINING_FAIL_STRINGS):
                     if user_settings.reactions_enabled: await message.add_reaction(emojis.PEEPO_NOOB)
 
         if not message.embeds:
             message_content = message.content
             # Training
-            search_strings = [
-                'well done, **', #English success
-                'better luck next time, **', #English fail
-                'bien hecho, **', #Spanish success
-                'próxima vez, **', #Spanish, Portuguese fail
-                'muito bem, **', #Portuguese success
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('training_training', 'content'):
                 user_name = user_command_message = None
                 user = await functions.get_interaction_user(message)
                 slash_command = True if user is not None else False
@@ -225,12 +225,7 @@ class TrainingCog(commands.Cog):
                 await functions.add_reminder_reaction(message, reminder, user_settings)
 
             # Training VOID event
-            search_strings = [
-                'attempts to fly', #English butterfly
-                'runs the area command', #English keyboard
-                'it seems like a mysterious player saved', #English cry
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('training_void_event', 'content'):
                 user_name = user_command_message = None
                 user = await functions.get_interaction_user(message)
                 slash_command = True if user is not None else False
@@ -266,11 +261,7 @@ class TrainingCog(commands.Cog):
                 if user_settings.reactions_enabled: await message.add_reaction(emojis.NAVI)
 
             # Training reset from ultraining shop
-            search_strings = [
-                'training reset` successfully bought', #English
-                'training reset` comprado(s)', #Spanish, Portuguese
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if parsed_message.matches('training_reset', 'content'):
                 user_name = user_command_message = None
                 user = await functions.get_interaction_user(message)
                 slash_command = True if user is not None else False
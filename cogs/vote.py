@@ -8,51 +8,36 @@ from discord.ext import bridge, commands
 
 from cache import messages
 from database import errors, reminders, users
-from resources import emojis, exceptions, functions, logs, regex, settings
+from resources import emojis, exceptions, functions, logs, regex, router
+
+
+TRIGGERS = {
+    'vote_cooldown': (
+        'next vote rewards', #English
+        'recompensas del siguiente voto', #Spanish
+        'recompensas do próximo voto', #Portuguese
+    ),
+}
 
 
 class VoteCog(commands.Cog):
     """Cog that contains the dungeon/miniboss detection commands"""
     def __init__(self, bot: bridge.AutoShardedBot):
         self.bot = bot
+        router.register_message_handler(self.qualified_name, self.on_message, triggers=TRIGGERS)
 
-    @commands.Cog.listener()
-    async def on_message_edit(self, message_before: discord.Message, message_after: discord.Message) -> None:
-        """Runs when a message is edited in a channel."""
-        if message_after.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-        if message_before.pinned != message_after.pinned: return
-        embed_data_before = await functions.parse_embed(message_before)
-        embed_data_after = await functions.parse_embed(message_after)
-        if (message_before.content == message_after.content and embed_data_before == embed_data_after
-            and message_before.components == message_after.components): return
-        row: discord.Component
-        for row in message_after.components:
-            if isinstance(row, discord.ActionRow):
-                for component in row.children:
-                    if isinstance(component, (discord.Button, discord.SelectMenu)):
-                        if component.disabled:
-                            return
-        await self.on_message(message_after)
+    def cog_unload(self) -> None:
+        """Removes the message handlers of this cog from the router."""
+        router.unregister_message_handler(self.qualified_name)
 
-    @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
-        """Runs when a message is sent in a channel."""
-        if message.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-
+        """Runs when EPIC RPG sends or edits a message. Called by the message router."""
         if message.embeds:
             if message.embeds[0].fields:
                 field = message.embeds[0].fields[0]
 
                 # Vote cooldown
-                search_strings = [
-                    'next vote rewards', #English
-                    'recompensas del siguiente voto', #Spanish
-                    'recompensas do próximo voto', #Portuguese
-                ]
-                if any(search_string in field.name.lower() for search_string in search_strings):
-                    search_patterns = [
-                        r'cooldown: \*\*(.+?)\*\*', #All languages
-                    ]
+                if any(search_string in field.name.lower() for search_string in TRIGGERS['vote_cooldown']):
                     user = await functions.get_interaction_user(message)
                     if user is None:
                         user_command_message = (
@@ -68,7 +53,8 @@ class VoteCog(commands.Cog):
                     except exceptions.FirstTimeUserError:
                         return
                     if not user_settings.bot_enabled or not user_settings.alert_vote.enabled: return
-                    timestring_match = await functions.get_match_from_patterns(search_patterns, field.value.lower())
+                    timestring_match = await functions.get_match_from_patterns(regex.PATTERNS_VOTE_COOLDOWN,
+                                                                               field.value.lower())
                     if not timestring_match:
                         try:
                             reminder: reminders.Reminder = await reminders.get_user_reminder(user.id, 'vote')
@@ -9,37 +9,34 @@ from discord.ext import bridge, commands
 
 from cache import messages
 from database import errors, reminders, users
-from resources import exceptions, functions, regex, settings
+from resources import exceptions, functions, regex, router
+
+
+TRIGGERS = {
+    'weekly_cooldown': (
+        'you have claimed your weekly rewards already', #English
+        'ya reclamaste tu recompenza semanal', #Spanish
+        'você já reivindicou sua recompensa semanal', #Portuguese
+    ),
+    'weekly_weekly': (
+        " — weekly", #All languages
+    ),
+}
 
 
 class WeeklyCog(commands.Cog):
     """Cog that contains the weekly detection commands"""
     def __init__(self, bot: bridge.AutoShardedBot):
         self.bot = bot
+        router.register_message_handler(self.qualified_name, self.on_message, triggers=TRIGGERS)
 
-    @commands.Cog.listener()
-    async def on_message_edit(self, message_before: discord.Message, message_after: discord.Message) -> None:
-        """Runs when a message is edited in a channel."""
-        if message_after.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-        if message_before.pinned != message_after.pinned: return
-        embed_data_before = await functions.parse_embed(message_before)
-        embed_data_after = await functions.parse_embed(message_after)
-        if (message_before.content == message_after.content and embed_data_before == embed_data_after
-            and message_before.components == message_after.components): return
-        row: discord.Component
-        for row in message_after.components:
-            if isinstance(row, discord.ActionRow):
-                for component in row.children:
-                    if isinstance(component, (discord.Button, discord.SelectMenu)):
-                        if component.disabled:
-                            return
-        await self.on_message(message_after)
+    def cog_unload(self) -> None:
+        """Removes the message handlers of this cog from the router."""
+        router.unregister_message_handler(self.qualified_name)
 
-    @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
-        """Runs when a message is sent in a channel."""
-        if message.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-
+        """Runs when EPIC RPG sends or edits a message. Called by the message router."""
+        parsed_message: router.ParsedMessage = router.get_parsed_message(message)
         if message.embeds:
             embed: discord.Embed = message.embeds[0]
             message_author = message_title = icon_url = ''
@@ -49,12 +46,7 @@ class WeeklyCog(commands.Cog):
             if embed.title is not None: message_title = str(embed.title)
 
             # Weekly cooldown
-            search_strings = [
-                'you have claimed your weekly rewards already', #English
-                'ya reclamaste tu recompenza semanal', #Spanish
-                'você já reivindicou sua recompensa semanal', #Portuguese
-            ]
-            if any(search_string in message_title.lower() for search_string in search_strings):
+            if parsed_message.matches('weekly_cooldown', 'title'):
                 user_id = user_name = user_command_message = None
                 user = await functions.get_interaction_user(message)
                 if user is None:
@@ -102,10 +94,7 @@ class WeeklyCog(commands.Cog):
                 await functions.add_reminder_reaction(message, reminder, user_settings)
 
             # Weekly
-            search_strings = [
-               " — weekly", #All languages
-            ]
-            if any(search_string in message_author.lower() for search_string in search_strings):
+            if parsed_message.matches('weekly_weekly', 'author'):
                 user_id = user_name = None
                 user = await functions.get_interaction_user(message)
                 slash_command = True if user is not None else False
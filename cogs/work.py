@@ -10,37 +10,95 @@ from discord.ext import bridge, commands
 
 from cache import messages
 from database import errors, reminders, tracking, users
-from resources import emojis, exceptions, functions, regex, settings, strings
+from resources import emojis, exceptions, functions, regex, router, strings
+
+
+TRIGGERS = {
+    'work_cooldown': (
+        'you have already got some resources', #English
+        'ya conseguiste algunos recursos', #Spanish
+        'você já tem alguns recursos', #Portuguese
+    ),
+    'work_work': (
+        '** got ', #English
+        '** consiguió ', #Spanish
+        '** conseguiu ', #Portuguese
+    ),
+    'work_event_non_slash': (
+        'it seems like the dragon just had 1 point of life',
+        'the dragon did not move an inch',
+        'you slept well and the items respawned',
+        '**epic npc** came here to gave you',
+    ),
+    'work_event_slash': (
+        ':x:',
+        ':crossed_swords:',
+        '⚔️',
+        ':zzz:',
+        '💤',
+        ':sweat_drops:',
+        '💦',
+    ),
+}
+
+WORK_ITEMS_STRINGS = (
+    'wooden log',
+    'epic log',
+    'super log',
+    '**mega** log',
+    '**hyper** log',
+    'ultimate log',
+    'ultra log',
+    'normie fish',
+    'golden fish',
+    'epic fish',
+    'super fish',
+    'apple',
+    'banana',
+    'watermelon',
+    'ruby',
+    'coins',
+    'nothing',
+)
+
+WORK_CHOP_PROC_STRINGS = (
+    'quite a large leaf', #English
+    'una bastante grande', #Spanish
+    'uma folha bem grande', #Portuguese
+)
+
+WORK_MINE_PROC_STRINGS = (
+    'mined with too much force', #English
+    'minó con demasiada fuerza', #Spanish
+    'minerado com muita força', #Portugese
+)
+
+WORK_FISH_PROC_STRINGS = (
+    'for some reason, one of the fish was carrying', #English
+    'por alguna razón, uno de los peces llevaba', #Spanish
+    'por algum motivo, um dos peixes estava carregando', #Portuguese
+)
+
+WORK_PICKUP_PROC_STRINGS = (
+    'rubies in it', #English
+    'uno de ellos llevaba', #Spanish
+    'um deles tinha', #Portuguese
+)
 
 
 class WorkCog(commands.Cog):
     """Cog that contains the work detection commands"""
     def __init__(self, bot: bridge.AutoShardedBot):
         self.bot = bot
+        router.register_message_handler(self.qualified_name, self.on_message, triggers=TRIGGERS)
 
-    @commands.Cog.listener()
-    async def on_message_edit(self, message_before: discord.Message, message_after: discord.Message) -> None:
-        """Runs when a message is edited in a channel."""
-        if message_after.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-        if message_before.pinned != message_after.pinned: return
-        embed_data_before = await functions.parse_embed(message_before)
-        embed_data_after = await functions.parse_embed(message_after)
-        if (message_before.content == message_after.content and embed_data_before == embed_data_after
-            and message_before.components == message_after.components): return
-        row: discord.Component
-        for row in message_after.components:
-            if isinstance(row, discord.ActionRow):
-                for component in row.children:
-                    if isinstance(component, (discord.Button, discord.SelectMenu)):
-                        if component.disabled:
-                            return
-        await self.on_message(message_after)
+    def cog_unload(self) -> None:
+        """Removes the message handlers of this cog from the router."""
+        router.unregister_message_handler(self.qualified_name)
 
-    @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
-        """Runs when a message is sent in a channel."""
-        if message.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-
+        """Runs when EPIC RPG sends or edits a message. Called by the message router."""
+        parsed_message: router.ParsedMessage = router.get_parsed_message(message)
         if message.embeds:
             embed: discord.Embed = message.embeds[0]
             message_author = message_title = icon_url = ''
@@ -50,12 +108,7 @@ class WorkCog(commands.Cog):
             if embed.title is not None: message_title = str(embed.title)
 
             # Work cooldown
-            search_strings = [
-                'you have already got some resources', #English
-                'ya conseguiste algunos recursos', #Spanish
-                'você já tem alguns recursos', #Portuguese
-            ]
-            if any(search_string in message_title.lower() for search_string in search_strings):
+            if parsed_message.matches('work_cooldown', 'title'):
                 user_id = user_name = user_command = user_command_message = None
                 user = await functions.get_interaction_user(message)
                 slash_command = True if user is not None else False
@@ -181,58 +234,15 @@ class WorkCog(commands.Cog):
                 '`boost`', #All languages, boost from party popper
                 'lootbox', #All languages, Lootboxes
             ]
-            search_strings = [
-                '** got ', #English
-                '** consiguió ', #Spanish
-                '** conseguiu ', #Portuguese
-            ]
-            search_strings_work_items = [
-                'wooden log',
-                'epic log',
-                'super log',
-                '**mega** log',
-                '**hyper** log',
-                'ultimate log',
-                'ultra log',
-                'normie fish',
-                'golden fish',
-                'epic fish',
-                'super fish',
-                'apple',
-                'banana',
-                'watermelon',
-                'ruby',
-                'coins',
-                'nothing',
-            ]
-            if (any(search_string in message_content.lower() for search_string in search_strings)
+            if (any(search_string in message_content.lower() for search_string in TRIGGERS['work_work'])
                 and all(search_string not in message_content.lower() for search_string in excluded_strings)
-                and any(search_string in message_content.lower() for search_string in search_strings_work_items)):
+                and any(search_string in message_content.lower() for search_string in WORK_ITEMS_STRINGS)):
                 user_name = user_command = last_work_command = user_command_message = None
                 user = await functions.get_interaction_user(message)
                 slash_command = True if user is not None else False
                 if user is None:
-                    search_patterns = [
-                        r'[!1] \*\*(.+?)\*\* got', #English 1
-                        r'\?\?\?\?\? \*\*(.+?)\*\* got', #English 2
-                        r'WOOAAAA!! (.+?)\*\* got', #English 3
-                        r'WwWOoOOoOAAa!!!1 (.+?)\*\* got', #English 4
-                        r'\.\.\. \*\*(.+?)\*\* got', #English 5
-                        r'\*\*(.+?)\*\* got', #English 6
-                        r'[!1] \*\*(.+?)\*\* consiguió', #Spanish 1, UNCONFIRMED
-                        r'\?\?\?\?\? \*\*(.+?)\*\* consiguió', #Spanish 2, UNCONFIRMED
-                        r'WOOAAAA!! (.+?)\*\* consiguió', #Spanish 3, UNCONFIRMED
-                        r'WwWOoOOoOAAa!!!1 (.+?)\*\* consiguió', #Spanish 4, UNCONFIRMED
-                        r'\.\.\. \*\*(.+?)\*\* consiguió', #Spanish 5, UNCONFIRMED
-                        r'\*\*(.+?)\*\* consiguió', #Spanish 6
-                        r'[!1] \*\*(.+?)\*\* (?:recebeu|conseguiu)', #Portuguese 1, UNCONFIRMED
-                        r'\?\?\?\?\? \*\*(.+?)\*\* (?:recebeu|conseguiu)', #Portuguese 2, UNCONFIRMED
-                        r'WOOAAAA!! (.+?)\*\* (?:recebeu|conseguiu)', #Portuguese 3, UNCONFIRMED
-                        r'WwWOoOOoOAAa!!!1 (.+?)\*\* (?:recebeu|conseguiu)', #Portuguese 4, UNCONFIRMED
-                        r'\.\.\. \*\*(.+?)\*\* (?:recebeu|conseguiu)', #Portuguese 5, UNCONFIRMED
-                        r'\*\*(.+?)\*\* (?:recebeu|conseguiu)', #Portuguese 6
-                    ]
-                    user_name_match = await functions.get_match_from_patterns(search_patterns, message_content)
+                    user_name_match = await functions.get_match_from_patterns(regex.PATTERNS_WORK_USER_NAME,
+                                                                              message_content)
                     if user_name_match:
                         user_name = user_name_match.group(1)
                     else:
@@ -284,33 +294,13 @@ class WorkCog(commands.Cog):
                 asyncio.ensure_future(functions.call_ready_command(self.bot, message, user, user_settings, 'work'))
                 await functions.add_reminder_reaction(message, reminder, user_settings)
                 if user_settings.reactions_enabled:
-                    search_strings_chop_proc = [
-                        'quite a large leaf', #English
-                        'una bastante grande', #Spanish
-                        'uma folha bem grande', #Portuguese
-                    ]
-                    search_strings_mine_proc = [
-                        'mined with too much force', #English
-                        'minó con demasiada fuerza', #Spanish
-                        'minerado com muita força', #Portugese
-                    ]
-                    search_strings_fish_proc = [
-                        'for some reason, one of the fish was carrying', #English
-                        'por alguna razón, uno de los peces llevaba', #Spanish
-                        'por algum motivo, um dos peixes estava carregando', #Portuguese
-                    ]
-                    search_strings_pickup_proc = [
-                        'rubies in it', #English
-                        'uno de ellos llevaba', #Spanish
-                        'um deles tinha', #Portuguese
-                    ]
-                    if any(search_string in message_content.lower() for search_string in search_strings_chop_proc):
+                    if any(search_string in message_content.lower() for search_string in WORK_CHOP_PROC_STRINGS):
                         await message.add_reaction(emojis.PEPE_WOAH_THERE)
-                    if any(search_string in message_content.lower() for search_string in search_strings_mine_proc):
+                    if any(search_string in message_content.lower() for search_string in WORK_MINE_PROC_STRINGS):
                         await message.add_reaction(emojis.PANDA_SWEATY)
-                    if any(search_string in message_content.lower() for search_string in search_strings_fish_proc):
+                    if any(search_string in message_content.lower() for search_string in WORK_FISH_PROC_STRINGS):
                         await message.add_reaction(emojis.FISHPOGGERS)
-                    if any(search_string in message_content.lower() for search_string in search_strings_pickup_proc):
+                    if any(search_string in message_content.lower() for search_string in WORK_PICKUP_PROC_STRINGS):
                         await message.add_reaction(emojis.PEEPO_WOW)
                     if 'mega log' in message_content.lower() or '**mega** log' in message_content.lower():
                         await message.add_reaction(emojis.FIRE)
@@ -328,13 +318,7 @@ class WorkCog(commands.Cog):
                         await message.add_reaction(emojis.PANDA_COOL)
 
             # Work event non-slash (always English)
-            search_strings = [
-                'it seems like the dragon just had 1 point of life',
-                'the dragon did not move an inch',
-                'you slept well and the items respawned',
-                '**epic npc** came here to gave you',
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if any(search_string in message_content.lower() for search_string in TRIGGERS['work_event_non_slash']):
                 interaction = await functions.get_interaction(message)
                 slash_command = True if interaction is not None else False
                 if interaction is None:
@@ -380,16 +364,7 @@ class WorkCog(commands.Cog):
                     await functions.add_reminder_reaction(message, reminder, user_settings)
 
             # Work event slash (all languages)
-            search_strings = [
-                ':x:',
-                ':crossed_swords:',
-                '⚔️',
-                ':zzz:',
-                '💤',
-                ':sweat_drops:',
-                '💦',
-            ]
-            if  any(search_string in message_content.lower() for search_string in search_strings):
+            if  any(search_string in message_content.lower() for search_string in TRIGGERS['work_event_slash']):
                 user_name = user_command = None
                 interaction = await functions.get_interaction(message)
                 if interaction is not None:
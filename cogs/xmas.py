@@ -11,7 +11,7 @@ from discord.ext import bridge, commands
 
 from cache import messages
 from database import errors, reminders, users
-from resources import emojis, exceptions, functions, regex, settings, strings
+from resources import emojis, exceptions, functions, regex, router, strings
 
 
 CHRISTMAS_AREA_ENABLED = (
@@ -37,53 +37,96 @@ ACTIVITIES_AFFECTED_BY_A0 = (
     'work',
 )
 
+TRIGGERS = {
+    'xmas_chimney_cooldown': (
+        'you have went through a chimney recently', #English
+        'has pasado por una chimenea recientemente', #Spanish
+        'você passou por uma chaminé recentemente', #Portuguese
+    ),
+    'xmas_advent_calendar': (
+        '— advent calendar', #All languages
+    ),
+    'xmas_eternal_presents_open': (
+        'you can open up to 10 presents', #English
+        'você pode abrir até 10 presentes', #Spanish & Portuguese
+    ),
+    'xmas_eternal_presents_inventory': (
+        "— inventory", #All languages
+    ),
+    'xmas_chimney': (
+        'went through a chimney', #English
+        'se metió por una chimenea', #Spanish
+        'passou por uma chaminé', #Portuguese
+    ),
+    'xmas_area_mode_on': (
+        'has teleported to the **christmas area**', #English
+        'se ha teletransportado al **área de navidad**', #Spanish
+        'se teletransportou para a **zona de natal**', #Portuguese
+    ),
+    'xmas_area_mode_off': (
+        'has moved to the area #', #English, area change
+        'starts to fly and travels to the next area!', #English, candy cane
+        'se movio al área #', #Spanish, area change
+        'se movio al área #', #TODO: Spanish, candy cane
+        'foi movido para a área #', #Portuguese, area change
+        'foi movido para a área #', #TODO: Portuguese, candy cane
+    ),
+    'xmas_area_mode_toggle': (
+        'found a', #English
+        'found the', #English
+        'encontr', #Spanish, Portuguese
+        'hunting together', #English
+        'cazando juntos', #Spanish
+        'caçando juntos', #Portuguese
+    ),
+    'xmas_cookies_and_milk': (
+        '`cookies and milk` successfully crafted!', #English
+        '`cookies and milk` crafteado con éxito!', #Spanish
+        '`cookies and milk` craftado com sucesso!', #Portuguese
+    ),
+    'xmas_eternal_present_cooldown': (
+        'you cannot open eternal presents', #English
+        'you cannot open eternal presents', #TODO: Spanish
+        'you cannot open eternal presents', #TODO: Portuguese
+    ),
+}
+
+XMAS_STUCK_STRINGS = (
+    'now stuck in the chimney', #English
+    'atascó en la chimenea', #Spanish
+    'now stuck in the chimney', #TODO: Portuguese
+)
+
+XMAS_TOGETHER_STRINGS = (
+    'hunting together', #English
+    'cazando juntos', #Spanish
+    'caçando juntos', #Portuguese
+)
+
+
 class ChristmasCog(commands.Cog):
     """Cog that contains the horse festival detection commands"""
     def __init__(self, bot: bridge.AutoShardedBot):
         self.bot = bot
+        router.register_message_handler(self.qualified_name, self.on_message, triggers=TRIGGERS)
 
-    @commands.Cog.listener()
-    async def on_message_edit(self, message_before: discord.Message, message_after: discord.Message) -> None:
-        """Runs when a message is edited in a channel."""
-        if message_after.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-        if message_before.pinned != message_after.pinned: return
-        embed_data_before = await functions.parse_embed(message_before)
-        embed_data_after = await functions.parse_embed(message_after)
-        if (message_before.content == message_after.content and embed_data_before == embed_data_after
-            and message_before.components == message_after.components): return
-        row: discord.Component
-        for row in message_after.components:
-            if isinstance(row, discord.ActionRow):
-                for component in row.children:
-                    if isinstance(component, (discord.Button, discord.SelectMenu)):
-                        if component.disabled:
-                            return
-        await self.on_message(message_after)
-
+    def cog_unload(self) -> None:
+        """Removes the message handlers of this cog from the router."""
+        router.unregister_message_handler(self.qualified_name)
 
-    @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
-        """Runs when a message is sent in a channel."""
-        if message.author.id not in [settings.EPIC_RPG_ID, settings.TESTY_ID]: return
-
+        """Runs when EPIC RPG sends or edits a message. Called by the message router."""
+        parsed_message: router.ParsedMessage = router.get_parsed_message(message)
         if message.embeds:
             embed: discord.Embed = message.embeds[0]
-            message_author = message_title = message_footer = ''
+            message_author = message_title = ''
             if embed.author is not None:
                 message_author = str(embed.author.name)
                 icon_url = embed.author.icon_url
             if embed.title is not None: message_title = str(embed.title)
-            if embed.footer is not None:
-                if embed.footer.text is not None:
-                    message_footer = embed.footer.text
 
             # Chimney cooldown
-            search_strings = [
-                'you have went through a chimney recently', #English
-                'has pasado por una chimenea recientemente', #Spanish
-                'você passou por uma chaminé recentemente', #Portuguese
-            ]
-            if any(search_string in message_title.lower() for search_string in search_strings):
+            if parsed_message.matches('xmas_chimney_cooldown', 'title'):
                 user_id = user_name = user_command = user_command_message = None
                 user = await functions.get_interaction_user(message)
                 if user is None:
@@ -131,10 +174,7 @@ class ChristmasCog(commands.Cog):
                 await functions.add_reminder_reaction(message, reminder, user_settings)
 
             # Advent calendar
-            search_strings = [
-                '— advent calendar', #All languages
-            ]
-            if any(search_string in message_author.lower() for search_string in search_strings):
+            if parsed_message.matches('xmas_advent_calendar', 'author'):
                 current_time = utils.utcnow()
                 stephans_day = datetime(year=current_time.year, month=12, day=26, hour=0, minute=0, second=0, tzinfo=current_time.tzinfo)
                 if current_time >= stephans_day: return
@@ -181,11 +221,7 @@ class ChristmasCog(commands.Cog):
 
 
             # Opening eternal presents
-            search_strings = [
-                'you can open up to 10 presents', #English
-                'você pode abrir até 10 presentes', #Spanish & Portuguese
-            ]
-            if any(search_string in message_footer.lower() for search_string in search_strings):
+            if parsed_message.matches('xmas_eternal_presents_open', 'footer'):
                 user_id = user_name = None
                 user = await functions.get_interaction_user(message)
                 if user is not None: return
@@ -209,10 +245,7 @@ class ChristmasCog(commands.Cog):
 
 
             # ETERNAL presents from inventory
-            search_strings = [
-                "— inventory", #All languages
-            ]
-            if any(search_string in message_author.lower() for search_string in search_strings):
+            if parsed_message.matches('xmas_eternal_presents_inventory', 'author'):
                 if icon_url is None: return
                 user_id = user_name = user_command_message = None
                 embed_users = []
@@ -259,12 +292,7 @@ class ChristmasCog(commands.Cog):
             message_content = message.content
 
             # Chimney
-            search_strings = [
-                'went through a chimney', #English
-                'se metió por una chimenea', #Spanish
-                'passou por uma chaminé', #Portuguese
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if any(search_string in message_content.lower() for search_string in TRIGGERS['xmas_chimney']):
                 user_id = user_name = None
                 user = await functions.get_interaction_user(message)
                 if user is None:
@@ -299,12 +327,7 @@ class ChristmasCog(commands.Cog):
                 )
                 asyncio.ensure_future(functions.call_ready_command(self.bot, message, user, user_settings, 'chimney'))
                 await functions.add_reminder_reaction(message, reminder, user_settings)
-                search_strings_stuck = [
-                    'now stuck in the chimney', #English
-                    'atascó en la chimenea', #Spanish
-                    'now stuck in the chimney', #TODO: Portuguese
-                ]
-                if any(search_string in message_content.lower() for search_string in search_strings_stuck):
+                if any(search_string in message_content.lower() for search_string in XMAS_STUCK_STRINGS):
                     reminder: reminders.Reminder = (
                         await reminders.insert_user_reminder(user.id, 'unstuck', timedelta(minutes=5),
                                                              message.channel.id,
@@ -312,12 +335,7 @@ class ChristmasCog(commands.Cog):
                     )
 
             # Turn on christmas area mode, gingerbread
-            search_strings = [
-                'has teleported to the **christmas area**', #English
-                'se ha teletransportado al **área de navidad**', #Spanish
-                'se teletransportou para a **zona de natal**', #Portuguese
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if any(search_string in message_content.lower() for search_string in TRIGGERS['xmas_area_mode_on']):
                 user_id = user_name = None
                 user = await functions.get_interaction_user(message)
                 if user is None:
@@ -351,15 +369,7 @@ class ChristmasCog(commands.Cog):
                 if user_settings.current_area != 0: await user_settings.update(current_area=0)
 
             # Turn off christmas area mode when changing area or using a candy cane
-            search_strings = [
-                'has moved to the area #', #English, area change
-                'starts to fly and travels to the next area!', #English, candy cane
-                'se movio al área #', #Spanish, area change
-                'se movio al área #', #TODO: Spanish, candy cane
-                'foi movido para a área #', #Portuguese, area change
-                'foi movido para a área #', #TODO: Portuguese, candy cane
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if any(search_string in message_content.lower() for search_string in TRIGGERS['xmas_area_mode_off']):
                 user_id = user_name = None
                 user = await functions.get_interaction_user(message)
                 if user is None:
@@ -394,15 +404,7 @@ class ChristmasCog(commands.Cog):
                     )
 
             # Toggle christmas area mode, hunt and adventure
-            search_strings = [
-                'found a', #English
-                'found the', #English
-                'encontr', #Spanish, Portuguese
-                'hunting together', #English
-                'cazando juntos', #Spanish
-                'caçando juntos', #Portuguese
-            ]
-            if (any(search_string in message_content.lower() for search_string in search_strings)
+            if (any(search_string in message_content.lower() for search_string in TRIGGERS['xmas_area_mode_toggle'])
                 and (
                     any(f'> {monster.lower()}' in message_content.lower() for monster in strings.MONSTERS_HUNT)
                     or any(monster.lower() in message_content.lower() for monster in strings.MONSTERS_HUNT_TOP)
@@ -420,20 +422,11 @@ class ChristmasCog(commands.Cog):
                 user_id = user_name = partner_name = None
                 together = False
                 user = await functions.get_interaction_user(message)
-                search_strings_together = [
-                    'hunting together', #English
-                    'cazando juntos', #Spanish
-                    'caçando juntos', #Portuguese
-                ]
-                if any(search_string in message_content.lower() for search_string in search_strings_together):
+                if any(search_string in message_content.lower() for search_string in XMAS_TOGETHER_STRINGS):
                     together = True
                 if together:
-                    search_patterns = [
-                        r"\*\*(.+?)\*\* and \*\*(.+?)\*\*", #English
-                        r"\*\*(.+?)\*\* y \*\*(.+?)\*\*", #Spanish
-                        r"\*\*(.+?)\*\* e \*\*(.+?)\*\*", #Portuguese
-                    ]
-                    user_name_match = await functions.get_match_from_patterns(search_patterns, message_content)
+                    user_name_match = await functions.get_match_from_patterns(regex.PATTERNS_USER_NAMES_TOGETHER,
+                                                                              message_content)
                     if user_name_match:
                         user_name = user_name_match.group(1)
                         partner_name = user_name_match.group(2)
@@ -442,11 +435,8 @@ class ChristmasCog(commands.Cog):
                         await errors.log_error('User names not found in xmas hunt together message.', message)
                         return
                 else:
-                    search_patterns = [
-                        r"\*\*(.+?)\*\* found a", #English
-                        r"\*\*(.+?)\*\* encontr", #Spanish, Portuguese
-                    ]
-                    user_name_match = await functions.get_match_from_patterns(search_patterns, message_content)
+                    user_name_match = await functions.get_match_from_patterns(regex.PATTERNS_USER_NAME_FOUND,
+                                                                              message_content)
                     if user_name_match:
                         user_name = user_name_match.group(1)
                     else:
@@ -500,12 +490,7 @@ class ChristmasCog(commands.Cog):
                     )
 
             # Cookies and milk
-            search_strings = [
-                '`cookies and milk` successfully crafted!', #English
-                '`cookies and milk` crafteado con éxito!', #Spanish
-                '`cookies and milk` craftado com sucesso!', #Portuguese
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if any(search_string in message_content.lower() for search_string in TRIGGERS['xmas_cookies_and_milk']):
                 user_id = user_name = None
                 user = await functions.get_interaction_user(message)
                 if user is None:
@@ -522,12 +507,8 @@ class ChristmasCog(commands.Cog):
                 except exceptions.FirstTimeUserError:
                     return
                 if not user_settings.bot_enabled: return
-                search_patterns = [
-                    r'reset: (.+?)$', #English
-                    r'cooldown\(s\): (.+?)$', #Spanish
-                    r'resetados: (.+?)$', #Portuguese
-                ]
-                activites_match = await functions.get_match_from_patterns(search_patterns, message_content)
+                activites_match = await functions.get_match_from_patterns(regex.PATTERNS_XMAS_ACTIVITIES,
+                                                                          message_content)
                 if not activites_match:
                     await functions.add_warning_reaction(message)
                     await errors.log_error('Couldn\'t read reset activites from xmas cookies and milk message.', message)
@@ -548,12 +529,8 @@ class ChristmasCog(commands.Cog):
 
 
             # Eternal present cooldown
-            search_strings = [
-                'you cannot open eternal presents', #English
-                'you cannot open eternal presents', #TODO: Spanish
-                'you cannot open eternal presents', #TODO: Portuguese
-            ]
-            if any(search_string in message_content.lower() for search_string in search_strings):
+            if any(search_string in message_content.lower()
+                   for search_string in TRIGGERS['xmas_eternal_present_cooldown']):
                 user = message.mentions[0]
                 try:
                     user_settings: users.User = await users.get_user(user.id)
@@ -1,8 +1,10 @@
 # reminders_lists.py
 """Contains reminder list commands"""
 
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Optional, Union
+from operator import attrgetter
+from typing import Any, Callable, NamedTuple, Optional, Union
 
 import discord
 from discord import utils
@@ -107,21 +109,160 @@ async def command_ready(
                 await settings_cmd.command_settings_ready(bot, ctx)
 
 
+# -- Ready command cache ---
+# The command strings of the ready activities only depend on the user settings below. They are rendered once per user
+# and activity and rendered again after one of these settings changed.
+READY_COMMAND_USER_SETTINGS: tuple[str, ...] = (
+    'farm_helper_mode',
+    'inventory.carrot',
+    'inventory.potato',
+    'inventory.seed_bread',
+    'inventory.seed_carrot',
+    'inventory.seed_potato',
+    'last_adventure_mode',
+    'last_farm_seed',
+    'last_hunt_mode',
+    'last_lootbox',
+    'last_quest_command',
+    'last_training_command',
+    'last_work_command',
+    'partner_name',
+    'ready_pets_claim_active',
+    'slash_mentions_enabled',
+)
+
+
+class CachedReadyCommands(NamedTuple):
+    """Object that contains the rendered ready commands of a user and the settings they were rendered with"""
+    commands: dict[str, str] # Activity -> command
+    user_settings: tuple[Any, ...]
+
+
+_READY_COMMAND_CACHE: OrderedDict[int, CachedReadyCommands] = OrderedDict()
+_get_ready_command_user_settings: Callable[[users.User], tuple[Any, ...]] = attrgetter(*READY_COMMAND_USER_SETTINGS)
+
+
+def get_cached_ready_commands(user_settings: users.User) -> dict[str, str]:
+    """Returns the cached ready commands of a user (activity -> command). The dict is emptied if one of the user settings
+    the commands depend on changed since they were rendered. Use get_ready_command() to read from it.
+    """
+    ready_command_user_settings: tuple[Any, ...] = _get_ready_command_user_settings(user_settings)
+    cached_commands: CachedReadyCommands | None = _READY_COMMAND_CACHE.get(user_settings.user_id, None)
+    if cached_commands is None or cached_commands.user_settings != ready_command_user_settings:
+        cached_commands = CachedReadyCommands(commands={}, user_settings=ready_command_user_settings)
+        _READY_COMMAND_CACHE[user_settings.user_id] = cached_commands
+        while len(_READY_COMMAND_CACHE) > settings.USER_CACHE_MAX_SIZE:
+            _READY_COMMAND_CACHE.popitem(last=False)
+    _READY_COMMAND_CACHE.move_to_end(user_settings.user_id)
+
+    return cached_commands.commands
+
+
+async def get_ready_command(user_settings: users.User, activity: str,
+                            cached_commands: Optional[dict[str, str]] = None) -> str:
+    """Returns the command string of a ready activity from the ready command cache and renders it if necessary.
+    Doesn't support "guild", that command depends on the clan.
+
+    Arguments
+    ---------
+    user_settings: User object
+    activity: str
+    cached_commands: Dict returned by get_cached_ready_commands(). Pass it if you need several commands of the same
+    user, so the user settings are only checked once.
+    """
+    if cached_commands is None: cached_commands = get_cached_ready_commands(user_settings)
+    command: str | None = cached_commands.get(activity, None)
+    if command is None:
+        command = cached_commands[activity] = await _render_ready_command(user_settings, activity)
+
+    return command
+
+
+async def _render_ready_command(user_settings: users.User, activity: str) -> str:
+    """Renders the command string of a ready activity. Doesn't support "guild", that command depends on the clan."""
+    if activity == 'dungeon-miniboss':
+        command_dungeon = await functions.get_slash_command(user_settings, 'dungeon', False)
+        command_miniboss = await functions.get_slash_command(user_settings, 'miniboss', False)
+        command = (
+            f"{command_dungeon} or {command_miniboss}"
+        )
+    elif activity == 'epic':
+        command_use = await functions.get_slash_command(user_settings, 'use', False)
+        command_options = 'item: <EPIC item>' if user_settings.slash_mentions_enabled else '<EPIC item>'
+        command = f"{command_use} `{command_options}`"
+    elif activity == 'party-popper':
+        command_use = await functions.get_slash_command(user_settings, 'use', False)
+        command_options = 'item: party popper' if user_settings.slash_mentions_enabled else 'party popper'
+        command = f"{command_use} `{command_options}`"
+    elif activity == 'quest':
+        command = await functions.get_slash_command(user_settings, user_settings.last_quest_command, False)
+        if command is None: command = await functions.get_slash_command(user_settings, 'quest', False)
+    elif activity == 'training':
+        command = await functions.get_slash_command(user_settings, user_settings.last_training_command, False)
+        if command is None: command = await functions.get_slash_command(user_settings, 'training', False)
+    elif activity == 'work':
+        command = await functions.get_slash_command(user_settings, user_settings.last_work_command, False)
+        if command is None: command = '`work command`'
+    elif activity == 'pets':
+        if user_settings.ready_pets_claim_active:
+            command = await functions.get_slash_command(user_settings, 'pets claim', False)
+        else:
+            command = await functions.get_slash_command(user_settings, 'pets adventure', False)
+    elif activity == 'custom':
+        command = '`custom reminder`'
+    elif activity == 'unstuck':
+        command = '`chimney unstuck lol`'
+    elif activity == 'maintenance':
+        command = '`maintenance`'
+    elif activity == 'eternity-sealing':
+        command = '`eternity sealing`'
+    elif activity == 'hunt-partner':
+        command = await functions.get_slash_command(user_settings, 'hunt', False)
+        command = f'{command} `({user_settings.partner_name})`'
+    else:
+        command = await functions.get_slash_command(user_settings, strings.ACTIVITIES_SLASH_COMMANDS[activity], False)
+
+    if activity == 'lootbox':
+        lootbox_name = '[lootbox]' if user_settings.last_lootbox == '' else f'{user_settings.last_lootbox} lootbox'
+        if user_settings.slash_mentions_enabled:
+            command = f"{command} `item: {lootbox_name}`"
+        else:
+            command = f"{command} `{lootbox_name}`"
+    elif activity == 'adventure' and user_settings.last_adventure_mode != '':
+        if user_settings.slash_mentions_enabled:
+            command = f"{command} `mode: {user_settings.last_adventure_mode}`"
+        else:
+            command = f"{command} `{user_settings.last_adventure_mode}`"
+    elif activity == 'hunt' and user_settings.last_hunt_mode != '':
+        if user_settings.slash_mentions_enabled:
+            command = f"{command} `mode: {user_settings.last_hunt_mode}`"
+        else:
+            command = f"{command} `{user_settings.last_hunt_mode}`"
+    elif activity == 'eternal-presents':
+        if user_settings.slash_mentions_enabled:
+            command = f"{command} `eternal`"
+        else:
+            command = f"{command} `eternal`"
+    elif activity == 'farm':
+        command = await functions.get_farm_command(user_settings, False)
+    return command.replace('` `', ' ')
+
+
 # -- Embeds ---
 async def embed_reminders_list(bot: bridge.AutoShardedBot, user: discord.User,
                                show_timestamps: Optional[bool] = False) -> discord.Embed:
     """Embed with active reminders"""
     user_settings: users.User = await users.get_user(user.id)
-    try:
-        user_reminders = list(await reminders.get_active_user_reminders(user.id))
-    except:
-        user_reminders = []
-    clan_reminders = []
+    clan = None
     try:
         clan: clans.Clan = await clans.get_clan_by_user_id(user.id)
-        clan_reminders = list(await reminders.get_active_clan_reminders(clan.clan_name))
     except exceptions.NoDataFoundError:
         pass
+    reminder_snapshot: reminders.ReminderSnapshot = (
+        await reminders.get_reminder_snapshot(user.id, getattr(clan, 'clan_name', None))
+    )
+    user_reminders = list(reminder_snapshot.user_reminders)
+    clan_reminders = list(reminder_snapshot.clan_reminders)
 
     current_time = utils.utcnow()
     reminders_commands_list = []
@@ -242,7 +383,6 @@ async def embed_reminders_list(bot: bridge.AutoShardedBot, user: discord.User,
         embed.add_field(name='EPIC SHOP RESTOCKS', value=field_epic_shop_reminders.strip(), inline=False)
     if clan_reminders:
         reminder = clan_reminders[0]
-        clan: clans.Clan = await clans.get_clan_by_clan_name(reminder.clan_name)
         if clan.quest_user_id is not None:
             if clan.quest_user_id != user.id: time_left = time_left + timedelta(minutes=5)
         if show_timestamps:
@@ -300,87 +440,23 @@ async def embed_ready(bot: bridge.AutoShardedBot, user: discord.User, auto_ready
     """Embed with ready commands"""
 
     user_settings: users.User = await users.get_user(user.id)
-    try:
-        user_reminders = await reminders.get_active_user_reminders(user_settings.user_id)
-    except exceptions.NoDataFoundError:
-        user_reminders = []
-    clan_reminders = []
     clan = None
     try:
         clan: clans.Clan = await clans.get_clan_by_user_id(user_settings.user_id)
-        clan_reminders = await reminders.get_active_clan_reminders(clan.clan_name)
     except exceptions.NoDataFoundError:
         pass
+    reminder_snapshot: reminders.ReminderSnapshot = (
+        await reminders.get_reminder_snapshot(user_settings.user_id, getattr(clan, 'clan_name', None),
+                                              user_settings.partner_id)
+    )
+    user_reminders = reminder_snapshot.user_reminders
+    clan_reminders = reminder_snapshot.clan_reminders
 
-    async def get_command_from_activity(activity:str) -> str:
-        if activity == 'dungeon-miniboss':
-            command_dungeon = await functions.get_slash_command(user_settings, 'dungeon', False)
-            command_miniboss = await functions.get_slash_command(user_settings, 'miniboss', False)
-            command = (
-                f"{command_dungeon} or {command_miniboss}"
-            )
-        elif activity == 'epic':
-            command_use = await functions.get_slash_command(user_settings, 'use', False)
-            command_options = 'item: <EPIC item>' if user_settings.slash_mentions_enabled else '<EPIC item>'
-            command = f"{command_use} `{command_options}`"
-        elif activity == 'party-popper':
-            command_use = await functions.get_slash_command(user_settings, 'use', False)
-            command_options = 'item: party popper' if user_settings.slash_mentions_enabled else 'party popper'
-            command = f"{command_use} `{command_options}`"
-        elif activity == 'guild':
-            command = clan_command
-        elif activity == 'quest':
-            command = await functions.get_slash_command(user_settings, user_settings.last_quest_command, False)
-            if command is None: command = await functions.get_slash_command(user_settings, 'quest', False)
-        elif activity == 'training':
-            command = await functions.get_slash_command(user_settings, user_settings.last_training_command, False)
-            if command is None: command = await functions.get_slash_command(user_settings, 'training', False)
-        elif activity == 'work':
-            command = await functions.get_slash_command(user_settings, user_settings.last_work_command, False)
-            if command is None: command = '`work command`'
-        elif activity == 'pets':
-            if user_settings.ready_pets_claim_active:
-                command = await functions.get_slash_command(user_settings, 'pets claim', False)
-            else:
-                command = await functions.get_slash_command(user_settings, 'pets adventure', False)
-        elif activity == 'custom':
-            command = '`custom reminder`'
-        elif activity == 'unstuck':
-            command = '`chimney unstuck lol`'
-        elif activity == 'maintenance':
-            command = '`maintenance`'
-        elif activity == 'eternity-sealing':
-            command = '`eternity sealing`'
-        elif activity == 'hunt-partner':
-            command = await functions.get_slash_command(user_settings, 'hunt', False)
-            command = f'{command} `({user_settings.partner_name})`'
-        else:
-            command = await functions.get_slash_command(user_settings, strings.ACTIVITIES_SLASH_COMMANDS[activity], False)
+    cached_ready_commands: dict[str, str] = get_cached_ready_commands(user_settings)
 
-        if activity == 'lootbox':
-            lootbox_name = '[lootbox]' if user_settings.last_lootbox == '' else f'{user_settings.last_lootbox} lootbox'
-            if user_settings.slash_mentions_enabled:
-                command = f"{command} `item: {lootbox_name}`"
-            else:
-                command = f"{command} `{lootbox_name}`"
-        elif activity == 'adventure' and user_settings.last_adventure_mode != '':
-            if user_settings.slash_mentions_enabled:
-                command = f"{command} `mode: {user_settings.last_adventure_mode}`"
-            else:
-                command = f"{command} `{user_settings.last_adventure_mode}`"
-        elif activity == 'hunt' and user_settings.last_hunt_mode != '':
-            if user_settings.slash_mentions_enabled:
-                command = f"{command} `mode: {user_settings.last_hunt_mode}`"
-            else:
-                command = f"{command} `{user_settings.last_hunt_mode}`"
-        elif activity == 'eternal-presents':
-            if user_settings.slash_mentions_enabled:
-                command = f"{command} `eternal`"
-            else:
-                command = f"{command} `eternal`"
-        elif activity == 'farm':
-            command = await functions.get_farm_command(user_settings, False)
-        return command.replace('` `', ' ')
+    async def get_command_from_activity(activity: str) -> str:
+        if activity == 'guild': return clan_command
+        return await get_ready_command(user_settings, activity, cached_ready_commands)
 
     clan_alert_enabled = getattr(clan, 'alert_enabled', False)
     clan_alert_visible = getattr(clan, 'alert_visible', False)
@@ -411,12 +487,8 @@ async def embed_ready(bot: bridge.AutoShardedBot, user: discord.User, auto_ready
     if 'hunt' in ready_command_activities and user_settings.partner_hunt_end_time > current_time:
         ready_command_activities.remove('hunt')
     if 'hunt-partner' in ready_command_activities:
-        if user_settings.partner_id is not None:
-            try:
-                partner_hunt_reminder: reminders.Reminder = await reminders.get_user_reminder(user_settings.partner_id, 'hunt')
-                ready_command_activities.remove('hunt-partner')
-            except exceptions.NoDataFoundError:
-                pass
+        if reminder_snapshot.partner_hunt_reminder is not None:
+            ready_command_activities.remove('hunt-partner')
         try:
             if user_settings.hunt_reminders_combined:
                 ready_command_activities.remove('hunt-partner')
@@ -646,13 +718,10 @@ async def embed_ready(bot: bridge.AutoShardedBot, user: discord.User, auto_ready
                 )
                 break
     if user_settings.ready_up_next_visible:
-        try:
-            active_reminders = await reminders.get_active_user_reminders(user.id)
-        except exceptions.NoDataFoundError:
-            active_reminders = []
+        current_time = utils.utcnow()
+        active_reminders = [reminder for reminder in user_reminders if reminder.end_time > current_time]
         if active_reminders:
             field_up_next = ''
-            current_time = utils.utcnow()
             for reminder in active_reminders:
                 if 'pets' in reminder.activity: continue
                 if (reminder.activity in strings.ACTIVITIES_BOOSTS or reminder.activity in strings.BOOSTS_ALIASES
@@ -8,7 +8,7 @@ from typing import Any, Optional
 import discord
 from discord.ext import bridge, commands
 
-from database import clans, guilds, portals, reminders, tracking, users
+from database import clans, executor, guilds, portals, reminders, tracking, users
 from resources import emojis, exceptions, functions, settings, strings, views
 
 
@@ -535,7 +535,6 @@ async def command_purge_data(bot: bridge.AutoShardedBot, ctx: bridge.BridgeConte
         if view.value is None:
             await interaction.edit(content=answer_timeout, view=None)
         elif view.value == 'confirm':
-            cur = settings.NAVI_DB.cursor()
             await interaction.edit(content='Purging user settings...', view=None)
             if user_settings.partner_id is not None:
                 try:
@@ -543,28 +542,26 @@ async def command_purge_data(bot: bridge.AutoShardedBot, ctx: bridge.BridgeConte
                     await partner_settings.update(partner_id=None)
                 except exceptions.FirstTimeUserError:
                     pass
-            cur.execute('DELETE FROM users WHERE user_id=?', (ctx.author.id,))
+            await executor.execute('DELETE FROM users WHERE user_id=?', (ctx.author.id,))
             await asyncio.sleep(1)
             await interaction.edit(content='Purging alts...', view=None)
-            cur.execute('DELETE FROM alts WHERE user1_id=? OR user2_id=?', (ctx.author.id, ctx.author.id))
+            await executor.execute('DELETE FROM alts WHERE user1_id=? OR user2_id=?', (ctx.author.id, ctx.author.id))
+            users.invalidate_user_cache(ctx.author.id)
+            for alt_id in user_settings.alts:
+                users.invalidate_user_cache(alt_id)
             await asyncio.sleep(1)
             await interaction.edit(content='Purging reminders...', view=None)
-            cur.execute('DELETE FROM reminders_users WHERE user_id=?', (ctx.author.id,))
+            await executor.execute('DELETE FROM reminders_users WHERE user_id=?', (ctx.author.id,))
+            await reminders.unschedule_user_reminders(ctx.author.id)
             await asyncio.sleep(1)
             await interaction.edit(content='Purging raid data...', view=None)
-            cur.execute('DELETE FROM clans_raids WHERE user_id=?', (ctx.author.id,))
+            await executor.execute('DELETE FROM clans_raids WHERE user_id=?', (ctx.author.id,))
             await asyncio.sleep(1)
             await interaction.edit(content='Purging portals...', view=None)
-            cur.execute('DELETE FROM users_portals WHERE user_id=?', (ctx.author.id,))
+            await executor.execute('DELETE FROM users_portals WHERE user_id=?', (ctx.author.id,))
             await asyncio.sleep(1)
             await interaction.edit(content='Purging tracking data... (this can take a while)', view=None)
-            try:
-                log_entries =  await tracking.get_all_log_entries(ctx.author.id)
-            except exceptions.NoDataFoundError:
-                log_entries = []
-            for log_entry in log_entries:
-                await log_entry.delete()
-                await asyncio.sleep(0.01)
+            await tracking.delete_user_tracking_data(ctx.author.id)
             await asyncio.sleep(1)
             await interaction.edit(
                 content=f'{emojis.ENABLED} **{ctx_author_name}**, you are now gone and forgotten. Thanks for using me!',
@@ -4,8 +4,8 @@
 
 import sqlite3
 
-from database import errors
-from resources import settings, strings
+from database import errors, executor
+from resources import strings
 
 
 # Read data
@@ -25,9 +25,7 @@ async def get_alts(user_id: int) -> tuple[int, ...]:
     function_name = 'get_alts'
     sql = f'SELECT user1_id, user2_id FROM {table} WHERE user1_id=? OR user2_id=? ORDER BY sort_index ASC'
     try:
-        cur=settings.NAVI_DB.cursor()
-        cur.execute(sql, (user_id, user_id))
-        records = cur.fetchall()
+        records = await executor.fetch_all(sql, (user_id, user_id))
     except sqlite3.Error as error:
         await errors.log_error(
             strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
@@ -44,6 +42,7 @@ async def get_alts(user_id: int) -> tuple[int, ...]:
 # Write data
 async def insert_alt(user_id: int, alt_id: int) -> None:
     """Inserts a record in the table "alts". Does NOT check if user-alt combination exists, so check that beforehand.
+    Also removes both users from the user cache.
 
     Raises
     ------
@@ -54,17 +53,19 @@ async def insert_alt(user_id: int, alt_id: int) -> None:
     table = 'alts'
     sql = f'INSERT INTO {table} (user1_id, user2_id) VALUES (?, ?)'
     try:
-        cur = settings.NAVI_DB.cursor()
-        cur.execute(sql, (user_id, alt_id))
+        await executor.execute(sql, (user_id, alt_id))
     except sqlite3.Error as error:
         await errors.log_error(
             strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
         )
         raise
+    from database import users
+    users.invalidate_user_cache(user_id)
+    users.invalidate_user_cache(alt_id)
 
 
 async def delete_alt(user_id: int, alt_id: int) -> None:
-    """Deletes alt record.
+    """Deletes alt record. Also removes both users from the user cache.
 
     Raises
     ------
@@ -75,10 +76,12 @@ async def delete_alt(user_id: int, alt_id: int) -> None:
     function_name = 'delete_alt'
     sql = f'DELETE FROM {table} WHERE (user1_id=? AND user2_id=?) OR (user1_id=? AND user2_id=?)'
     try:
-        cur = settings.NAVI_DB.cursor()
-        cur.execute(sql, (user_id, alt_id, alt_id, user_id))
+        await executor.execute(sql, (user_id, alt_id, alt_id, user_id))
     except sqlite3.Error as error:
         await errors.log_error(
             strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
         )
-        raise
\ No newline at end of file
+        raise
+    from database import users
+    users.invalidate_user_cache(user_id)
+    users.invalidate_user_cache(alt_id)
\ No newline at end of file
@@ -2,12 +2,14 @@
 """Provides access to the table "clans" in the database"""
 
 
-from dataclasses import dataclass
+import asyncio
+from copy import copy
+from dataclasses import dataclass, replace
 from datetime import datetime
 import sqlite3
 from typing import Any, NamedTuple, Optional, Union
 
-from database import errors
+from database import errors, executor
 from resources import exceptions, settings, strings
 
 
@@ -33,7 +35,7 @@ class ClanMember():
         self.member_type = new_settings.member_type
 
     async def update(self, **updated_settings) -> None:
-        """Updates the clan member record in the database. Also calls refresh().
+        """Updates the clan member record in the database and applies the updated settings to this object.
 
         Arguments
         ---------
@@ -48,7 +50,8 @@ class ClanMember():
         Also logs all errors to the database.
         """
         await _update_clan_member(self.user_id, **updated_settings)
-        await self.refresh()
+        for setting, value in updated_settings.items():
+            setattr(self, setting, value)
 
 @dataclass()
 class Clan():
@@ -100,7 +103,8 @@ class Clan():
         self.upgrade_quests_enabled = new_settings.upgrade_quests_enabled
 
     async def update(self, **updated_settings) -> None:
-        """Updates the clan record in the database. Also calls refresh().
+        """Updates the clan record in the database and applies the updated settings to this object.
+        The members are rebuilt locally from member_ids and leader_ids, so no reload is necessary.
 
         Arguments
         ---------
@@ -124,7 +128,24 @@ class Clan():
         Also logs all errors to the database.
         """
         await _update_clan(self.clan_name, **updated_settings)
-        await self.refresh()
+        member_ids: list[int] = updated_settings.pop('member_ids', [])
+        leader_ids: list[int] = updated_settings.pop('leader_ids', [])
+        for setting, value in updated_settings.items():
+            setattr(self, setting, value)
+        if member_ids:
+            self.members = tuple(
+                ClanMember(self.clan_name, 'leader' if member_id in leader_ids else 'member', member_id)
+                for member_id in member_ids
+            )
+        elif leader_ids:
+            self.members = tuple(
+                ClanMember(self.clan_name, 'leader' if member.user_id in leader_ids else 'member', member.user_id)
+                for member in self.members
+            )
+        elif 'clan_name' in updated_settings:
+            self.members = tuple(
+                ClanMember(self.clan_name, member.member_type, member.user_id) for member in self.members
+            )
 
 
 class ClanRaid(NamedTuple):
@@ -148,6 +169,44 @@ class ClanWeeklyReport(NamedTuple):
     worst_raid: ClanRaid | None
 
 
+# Clan cache
+# All clans and their members are loaded with a single query the first time a clan is needed. All writes in this module
+# go through the cache, so clans and members are read from memory after that.
+_CLAN_CACHE: dict[str, Clan] = {} # Clan name -> clan. The members of the cached clans are kept in the roster.
+_CLAN_ROSTER: dict[str, dict[int, ClanMember]] = {} # Clan name -> user ID -> clan member
+_CLAN_NAME_BY_USER_ID: dict[int, str] = {}
+_clan_cache_loaded: bool = False
+_clan_cache_lock: asyncio.Lock = asyncio.Lock()
+
+
+def _get_cached_clan(clan_name: str) -> Clan | None:
+    """Returns a copy of a cached clan and its members or None if the clan isn't cached"""
+    clan: Clan | None = _CLAN_CACHE.get(clan_name, None)
+    if clan is None: return None
+    return replace(clan, members=_get_cached_clan_members(clan_name))
+
+
+def _get_cached_clan_members(clan_name: str) -> tuple[ClanMember, ...]:
+    """Returns copies of all members of a clan in the roster"""
+    return tuple(copy(clan_member) for clan_member in _CLAN_ROSTER.get(clan_name, {}).values())
+
+
+def _cache_clan_member(clan_member: ClanMember) -> None:
+    """Adds a clan member to the roster. Moves the member if they are in the roster of another clan."""
+    _uncache_clan_member(clan_member.user_id)
+    _CLAN_ROSTER.setdefault(clan_member.clan_name, {})[clan_member.user_id] = copy(clan_member)
+    _CLAN_NAME_BY_USER_ID[clan_member.user_id] = clan_member.clan_name
+
+
+def _uncache_clan_member(user_id: int) -> None:
+    """Removes a clan member from the roster"""
+    clan_name: str | None = _CLAN_NAME_BY_USER_ID.pop(user_id, None)
+    if clan_name is None: return
+    clan_members: dict[int, ClanMember] = _CLAN_ROSTER.get(clan_name, {})
+    clan_members.pop(user_id, None)
+    if not clan_members: _CLAN_ROSTER.pop(clan_name, None)
+
+
 # Miscellaneous functions
 async def _dict_to_clan(record_clan: dict[str, Any], clan_members: tuple[ClanMember, ...]) -> Clan:
     """Creates a Clan object from a database record and a list of clan members
@@ -255,6 +314,58 @@ async def _dict_to_clan_raid(record: dict[str, Any]) -> ClanRaid:
 
 
 # Read Data
+async def load_clan_cache() -> int:
+    """Loads all clans and their members into the clan cache with a single query.
+    Does nothing if the cache is already loaded. Members of clans that don't exist (anymore) are added to the roster
+    as well, so get_clan_member() still finds them.
+
+    Returns
+    -------
+    Amount of cached clans: int
+
+    Raises
+    ------
+    sqlite3.Error if something happened within the database.
+    LookupError if something goes wrong reading the dict.
+    Also logs all errors to the database.
+    """
+    global _clan_cache_loaded
+    async with _clan_cache_lock:
+        if _clan_cache_loaded: return len(_CLAN_CACHE)
+        function_name: str = 'load_clan_cache'
+        table: str = 'clans'
+        sql: str = (
+            'SELECT clans.*, clan_members.user_id AS member_user_id, clan_members.clan_name AS member_clan_name, '
+            'clan_members.member_type AS member_type '
+            'FROM clans LEFT JOIN clan_members ON clan_members.clan_name = clans.clan_name '
+            'UNION ALL '
+            'SELECT clans.*, clan_members.user_id, clan_members.clan_name, clan_members.member_type '
+            'FROM clan_members LEFT JOIN clans ON clans.clan_name = clan_members.clan_name '
+            'WHERE clans.clan_name IS NULL'
+        )
+        try:
+            records: list[Any] = await executor.fetch_all(sql)
+        except sqlite3.Error as error:
+            await errors.log_error(
+                strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
+            )
+            raise
+        record: Any
+        for record in records:
+            record = dict(record)
+            if record['clan_name'] is not None and record['clan_name'] not in _CLAN_CACHE:
+                _CLAN_CACHE[record['clan_name']] = await _dict_to_clan(record, ())
+            if record['member_user_id'] is not None:
+                clan_member: ClanMember = await _dict_to_clan_member(
+                    {'clan_name': record['member_clan_name'], 'member_type': record['member_type'],
+                     'user_id': record['member_user_id']}
+                )
+                _cache_clan_member(clan_member)
+        _clan_cache_loaded = True
+
+    return len(_CLAN_CACHE)
+
+
 async def get_clan_by_user_id(user_id: int) -> Clan:
     """Gets all settings for a clan (EPIC RPG guild) from a user id. The provided user can be a member or the owner.
 
@@ -269,39 +380,14 @@ async def get_clan_by_user_id(user_id: int) -> Clan:
     LookupError if something goes wrong reading the dict.
     Also logs all errors to the database.
     """
-    function_name: str = 'get_clan_by_user_id'
-    table: str = 'clan_members'
-    sql: str = f'SELECT * FROM {table} WHERE user_id=?'
-    try:
-        cur: sqlite3.Cursor = settings.NAVI_DB.cursor()
-        cur.execute(sql, (user_id,))
-        record_clan_member: Any = cur.fetchone()
-    except sqlite3.Error as error:
-        await errors.log_error(
-            strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
-        )
-        raise
-    if not record_clan_member:
+    await load_clan_cache()
+    clan_name: str | None = _CLAN_NAME_BY_USER_ID.get(user_id, None)
+    if clan_name is None:
         raise exceptions.NoDataFoundError(f'No clan member found in database for user "{user_id}".')
-    
-    table = 'clans'
-    sql = f'SELECT * FROM {table} WHERE clan_name=?'
-    clan_name: str = dict(record_clan_member)['clan_name']
-    try:
-        cur = settings.NAVI_DB.cursor()
-        cur.execute(sql, (clan_name,))
-        record_clan: Any = cur.fetchone()
-    except sqlite3.Error as error:
-        await errors.log_error(
-            strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
-        )
-        raise
-    if not record_clan:
+    clan: Clan | None = _get_cached_clan(clan_name)
+    if clan is None:
         raise exceptions.NoDataFoundError(f'Clan "{clan_name}" not found in database.')
 
-    clan_members: tuple[ClanMember, ...] = await get_clan_members_by_clan_name(clan_name)
-    clan: Clan = await _dict_to_clan(dict(record_clan), clan_members)
-
     return clan
 
 
@@ -319,24 +405,10 @@ async def get_clan_by_clan_name(clan_name: str) -> Clan:
     LookupError if something goes wrong reading the dict.
     Also logs all errors to the database.
     """
-    function_name: str = 'get_clan_by_clan_name'    
-    table: str = 'clans'
-    sql: str = f'SELECT * FROM {table} WHERE clan_name=?'
-    try:
-        cur: sqlite3.Cursor = settings.NAVI_DB.cursor()
-        cur.execute(sql, (clan_name,))
-        record_clan: Any = cur.fetchone()
-    except sqlite3.Error as error:
-        await errors.log_error(
-            strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
-        )
-        raise
-
-    if not record_clan:
+    await load_clan_cache()
+    clan: Clan | None = _get_cached_clan(clan_name)
+    if clan is None:
         raise exceptions.NoDataFoundError(f'No clan found in database for clan name "{clan_name}".')
-
-    clan_members: tuple[ClanMember, ...] = await get_clan_members_by_clan_name(clan_name)
-    clan: Clan = await _dict_to_clan(dict(record_clan), clan_members)
     
     return clan
 
@@ -355,25 +427,12 @@ async def get_clan_member(user_id: int) -> ClanMember:
     LookupError if something goes wrong reading the dict.
     Also logs all errors to the database.
     """
-    function_name: str = 'get_clan_member'    
-    table: str = 'clan_members'
-    sql: str = f'SELECT * FROM {table} WHERE user_id=?'
-    try:
-        cur: sqlite3.Cursor = settings.NAVI_DB.cursor()
-        cur.execute(sql, (user_id,))
-        record: Any = cur.fetchone()
-    except sqlite3.Error as error:
-        await errors.log_error(
-            strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
-        )
-        raise
-    
-    if not record:
+    await load_clan_cache()
+    clan_name: str | None = _CLAN_NAME_BY_USER_ID.get(user_id, None)
+    if clan_name is None:
         raise exceptions.NoDataFoundError(f'No clan member found in database for user id "{user_id}".')
-   
-    clan_member: ClanMember = await _dict_to_clan_member(dict(record))
 
-    return clan_member
+    return copy(_CLAN_ROSTER[clan_name][user_id])
 
 
 async def get_all_clans() -> tuple[Clan, ...]:
@@ -390,31 +449,11 @@ async def get_all_clans() -> tuple[Clan, ...]:
     LookupError if something goes wrong reading the dict.
     Also logs all errors to the database.
     """
-    function_name: str = 'get_all_clans'
-    table: str = 'clans'
-    sql: str = f'SELECT * FROM {table}'
-    try:
-        cur: sqlite3.Cursor = settings.NAVI_DB.cursor()
-        cur.execute(sql)
-        records: list[Any] = cur.fetchall()
-    except sqlite3.Error as error:
-        await errors.log_error(
-            strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
-        )
-        raise
-
-    if not records:
+    await load_clan_cache()
+    if not _CLAN_CACHE:
         raise exceptions.NoDataFoundError('No clan data found in database.')
-    
-    clans: list[Clan] = []
-    record: Any
-    clan_members: tuple[ClanMember, ...]
-    for record in records:
-        clan_members = await get_clan_members_by_clan_name(record['clan_name'])
-        clan: Clan = await _dict_to_clan(dict(record), clan_members)
-        clans.append(clan)
 
-    return tuple(clans)
+    return tuple(_get_cached_clan(clan_name) for clan_name in list(_CLAN_CACHE))
 
 
 async def get_clan_members_by_clan_name(clan_name: str) -> tuple[ClanMember, ...]:
@@ -427,30 +466,12 @@ async def get_clan_members_by_clan_name(clan_name: str) -> tuple[ClanMember, ...
     Raises
     ------
     sqlite3.Error if something happened within the database.
-    exceptions.NoDataFoundError if no cooldown was found.
     LookupError if something goes wrong reading the dict.
     Also logs all errors to the database.
     """
-    function_name: str = 'get_clan_members_by_clan_name'
-    table: str = 'clan_members'
-    sql: str = f'SELECT * FROM {table} WHERE clan_name = ?'
-    try:
-        cur: sqlite3.Cursor = settings.NAVI_DB.cursor()
-        cur.execute(sql, (clan_name,))
-        records: list[Any] = cur.fetchall()
-    except sqlite3.Error as error:
-        await errors.log_error(
-            strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
-        )
-        raise
-
-    record: Any
-    clan_members: list[ClanMember] = []
-    for record in records:
-        clan_member: ClanMember = await _dict_to_clan_member(dict(record))
-        clan_members.append(clan_member)
+    await load_clan_cache()
 
-    return tuple(clan_members)
+    return _get_cached_clan_members(clan_name)
 
 
 async def get_clan_raid(clan_name: str, user_id: str, raid_time: datetime) -> ClanRaid:
@@ -472,9 +493,7 @@ async def get_clan_raid(clan_name: str, user_id: str, raid_time: datetime) -> Cl
     function_name: str = 'get_clan_raid'
     sql: str = f'SELECT * FROM {table} WHERE clan_name=? AND user_id=? AND raid_time=?'
     try:
-        cur: sqlite3.Cursor = settings.NAVI_DB.cursor()
-        cur.execute(sql, (clan_name, user_id, raid_time))
-        record: Any = cur.fetchone()
+        record: Any = await executor.fetch_one(sql, (clan_name, user_id, raid_time))
     except sqlite3.Error as error:
         await errors.log_error(
             strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
@@ -508,9 +527,7 @@ async def get_leaderboard(clan: Clan) -> ClanLeaderboard:
     stealth_threshold: int = 1000
     sql: str = f'SELECT * FROM {table} WHERE clan_name=? AND energy>={stealth_threshold} ORDER BY energy DESC LIMIT 5'
     try:
-        cur: sqlite3.Cursor = settings.NAVI_DB.cursor()
-        cur.execute(sql, (clan.clan_name,))
-        records_best: list[Any] = cur.fetchall()
+        records_best: list[Any] = await executor.fetch_all(sql, (clan.clan_name,))
     except sqlite3.Error as error:
         await errors.log_error(
             strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
@@ -518,9 +535,7 @@ async def get_leaderboard(clan: Clan) -> ClanLeaderboard:
         raise
     sql = f'SELECT * FROM {table} WHERE clan_name=? AND energy<{stealth_threshold} ORDER BY energy ASC LIMIT 5'
     try:
-        cur = settings.NAVI_DB.cursor()
-        cur.execute(sql, (clan.clan_name,))
-        records_worst: list[Any] = cur.fetchall()
+        records_worst: list[Any] = await executor.fetch_all(sql, (clan.clan_name,))
     except sqlite3.Error as error:
         await errors.log_error(
             strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
@@ -562,9 +577,7 @@ async def get_weekly_report(clan: Clan) -> ClanWeeklyReport:
     function_name: str = 'get_weekly_report'
     sql: str = f'SELECT text FROM {table} ORDER BY RANDOM() LIMIT 1'
     try:
-        cur: sqlite3.Cursor = settings.NAVI_DB.cursor()
-        cur.execute(sql)
-        praise_record: Any = cur.fetchone()
+        praise_record: Any = await executor.fetch_one(sql)
     except sqlite3.Error as error:
         await errors.log_error(
             strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
@@ -573,9 +586,7 @@ async def get_weekly_report(clan: Clan) -> ClanWeeklyReport:
     table = 'clans_leaderboard_roasts'
     sql = f'SELECT text FROM {table} ORDER BY RANDOM() LIMIT 1'
     try:
-        cur = settings.NAVI_DB.cursor()
-        cur.execute(sql)
-        roast_record: Any = cur.fetchone()
+        roast_record: Any = await executor.fetch_one(sql)
     except sqlite3.Error as error:
         await errors.log_error(
             strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
@@ -584,9 +595,7 @@ async def get_weekly_report(clan: Clan) -> ClanWeeklyReport:
     table = 'clans_raids'
     sql = f'SELECT energy FROM {table} WHERE clan_name=?'
     try:
-        cur = settings.NAVI_DB.cursor()
-        cur.execute(sql, (clan.clan_name,))
-        all_raids_records: list[Any] = cur.fetchall()
+        all_raids_records: list[Any] = await executor.fetch_all(sql, (clan.clan_name,))
     except:
         raise exceptions.NoDataFoundError(f'No raids found for clan {clan.clan_name}')
     energy_total: int = 0
@@ -617,14 +626,15 @@ async def _delete_clan(clan_name: str) -> None:
     table: str = 'clans'
     function_name: str = '_delete_clan'
     sql: str = f'DELETE FROM {table} WHERE clan_name=?'
+    await load_clan_cache()
     try:
-        cur = settings.NAVI_DB.cursor()
-        cur.execute(sql, (clan_name,))
+        await executor.execute(sql, (clan_name,))
     except sqlite3.Error as error:
         await errors.log_error(
             strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
         )
         raise
+    _CLAN_CACHE.pop(clan_name, None)
     await delete_clan_members(clan_name)
     await delete_clan_leaderboard(clan_name)
 
@@ -640,14 +650,81 @@ async def delete_clan_members(clan_name: str) -> None:
     table: str = 'clan_members'
     function_name: str = '_delete_clan_members'
     sql: str = f'DELETE FROM {table} WHERE clan_name=?'
+    await load_clan_cache()
     try:
-        cur = settings.NAVI_DB.cursor()
-        cur.execute(sql, (clan_name,))
+        await executor.execute(sql, (clan_name,))
     except sqlite3.Error as error:
         await errors.log_error(
             strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
         )
         raise
+    user_id: int
+    for user_id in list(_CLAN_ROSTER.get(clan_name, {})):
+        _uncache_clan_member(user_id)
+
+
+def _replace_clan_members(current_clan_name: str, clan_name: str, clan_members: list[tuple[int, str, str]]) -> None:
+    """Deletes all members of a clan and inserts the new members in a single transaction. Members that are
+    registered in another clan are moved. Runs on the write thread.
+
+    Arguments
+    ---------
+    current_clan_name: Name of the clan before a rename. The members of this clan are deleted as well.
+    clan_name: Name of the clan.
+    clan_members: List of (user_id, clan_name, member_type) tuples.
+    """
+    cur: sqlite3.Cursor = settings.NAVI_DB.cursor()
+    cur.execute('BEGIN IMMEDIATE')
+    try:
+        cur.execute('DELETE FROM clan_members WHERE clan_name IN (?, ?)', (current_clan_name, clan_name))
+        cur.executemany(
+            'INSERT INTO clan_members (user_id, clan_name, member_type) VALUES (?, ?, ?) '
+            'ON CONFLICT (user_id) DO UPDATE SET clan_name = excluded.clan_name, member_type = excluded.member_type',
+            clan_members
+        )
+        cur.execute('COMMIT')
+    except:
+        cur.execute('ROLLBACK')
+        raise
+
+
+async def _set_clan_members(current_clan_name: str, clan_name: str, member_ids: list[int],
+                            leader_ids: list[int]) -> None:
+    """Replaces all members of a clan. Members not in member_ids are deleted.
+
+    Arguments
+    ---------
+    current_clan_name: Name of the clan before a rename. Use clan_name if the clan isn't renamed.
+    clan_name: Name of the clan.
+    member_ids: IDs of ALL members of the clan.
+    leader_ids: IDs of the members that are leaders.
+
+    Raises
+    ------
+    sqlite3.Error if something happened within the database.
+    Also logs all errors to the database.
+    """
+    table: str = 'clan_members'
+    function_name: str = '_set_clan_members'
+    clan_members: list[tuple[int, str, str]] = [
+        (member_id, clan_name, 'leader' if member_id in leader_ids else 'member') for member_id in member_ids
+    ]
+    await load_clan_cache()
+    try:
+        await executor.run(_replace_clan_members, current_clan_name, clan_name, clan_members)
+    except sqlite3.Error as error:
+        await errors.log_error(
+            strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name,
+                                                  sql='_replace_clan_members')
+        )
+        raise
+    user_id: int
+    for user_id in list(_CLAN_ROSTER.get(current_clan_name, {})) + list(_CLAN_ROSTER.get(clan_name, {})):
+        _uncache_clan_member(user_id)
+    member_clan_name: str
+    member_type: str
+    for user_id, member_clan_name, member_type in clan_members:
+        _cache_clan_member(ClanMember(member_clan_name, member_type, user_id))
 
 
 async def _update_clan(current_clan_name: str, **updated_settings) -> None:
@@ -692,50 +769,64 @@ async def _update_clan(current_clan_name: str, **updated_settings) -> None:
 
     member_ids: list[int] = updated_settings.pop('member_ids', [])
     leader_ids: list[int] = updated_settings.pop('leader_ids', [])
+    await load_clan_cache()
 
     if updated_settings:
         try:
-            cur: sqlite3.Cursor = settings.NAVI_DB.cursor()
             sql: str = f'UPDATE {table} SET'
             for updated_setting in updated_settings:
                 sql = f'{sql} {updated_setting} = :{updated_setting},'
-            updated_settings['clan_name_old'] = current_clan_name
             sql = sql.strip(",")
             sql = f'{sql} WHERE clan_name = :clan_name_old'
-            cur.execute(sql, updated_settings)
+            await executor.execute(sql, {**updated_settings, 'clan_name_old': current_clan_name})
         except sqlite3.Error as error:
             await errors.log_error(
                 strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
             )
             raise
+        cached_clan: Clan | None = _CLAN_CACHE.pop(current_clan_name, None)
+        if cached_clan is not None:
+            for setting, value in updated_settings.items():
+                setattr(cached_clan, setting, value)
+            _CLAN_CACHE[cached_clan.clan_name] = cached_clan
 
     clan_name = updated_settings['clan_name'] if 'clan_name' in updated_settings else current_clan_name
 
-    if clan_name != current_clan_name and not member_ids:
-        clan_members: tuple[ClanMember, ...] = await get_clan_members_by_clan_name(current_clan_name)
-        clan_member: ClanMember
-        for clan_member in clan_members:
-            await clan_member.update(clan_name=clan_name)
+    if member_ids:
+        await _set_clan_members(current_clan_name, clan_name, member_ids, leader_ids)
+        return
 
-    member_type: str
-    if leader_ids and not member_ids:
-        clan_members: tuple[ClanMember, ...] = await get_clan_members_by_clan_name(clan_name)
+    table = 'clan_members'
+    if clan_name != current_clan_name:
+        sql = f'UPDATE {table} SET clan_name = ? WHERE clan_name = ?'
+        try:
+            await executor.execute(sql, (clan_name, current_clan_name))
+        except sqlite3.Error as error:
+            await errors.log_error(
+                strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
+            )
+            raise
         clan_member: ClanMember
-        for clan_member in clan_members:
-            member_type = 'leader' if clan_member.user_id in leader_ids else 'member'
-            await clan_member.update(member_type=member_type)
+        for clan_member in _get_cached_clan_members(current_clan_name):
+            _cache_clan_member(replace(clan_member, clan_name=clan_name))
+
+    if leader_ids:
+        sql = (
+            f'UPDATE {table} SET member_type = CASE WHEN user_id IN ({",".join("?" * len(leader_ids))}) '
+            f'THEN \'leader\' ELSE \'member\' END WHERE clan_name = ?'
+        )
+        try:
+            await executor.execute(sql, (*leader_ids, clan_name))
+        except sqlite3.Error as error:
+            await errors.log_error(
+                strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
+            )
+            raise
+        for clan_member in _get_cached_clan_members(clan_name):
+            member_type: str = 'leader' if clan_member.user_id in leader_ids else 'member'
+            _cache_clan_member(replace(clan_member, member_type=member_type))
+
 
-    if member_ids:
-        await delete_clan_members(clan_name)
-        member_id: int
-        for member_id in member_ids:
-            member_type = 'leader' if member_id in leader_ids else 'member'
-            try:
-                clan_member = await get_clan_member(member_id)
-                await clan_member.update(clan_name=clan_name, member_type=member_type)
-            except exceptions.NoDataFoundError:
-                await insert_clan_member(clan_name, member_id, member_type)
-        
 
 async def _update_clan_member(user_id: str, **updated_settings) -> None:
     """Updates a clan member record. Use ClanMember.update() to trigger this function.
@@ -761,20 +852,21 @@ async def _update_clan_member(user_id: str, **updated_settings) -> None:
         )
         raise exceptions.NoArgumentsError('You need to specify at least one keyword argument.')
     
+    await load_clan_cache()
     try:
-        cur: sqlite3.Cursor = settings.NAVI_DB.cursor()
         sql: str = f'UPDATE {table} SET'
         for updated_setting in updated_settings:
             sql = f'{sql} {updated_setting} = :{updated_setting},'
         updated_settings['user_id'] = user_id
         sql = sql.strip(",")
-        sql = f'{sql} WHERE user_id = :user_id'
-        cur.execute(sql, updated_settings)
+        sql = f'{sql} WHERE user_id = :user_id RETURNING *'
+        record: Any = await executor.fetch_one(sql, updated_settings, read_only=False)
     except sqlite3.Error as error:
         await errors.log_error(
             strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
         )
         raise
+    if record: _cache_clan_member(await _dict_to_clan_member(dict(record)))
 
 
 async def delete_clan_leaderboard(clan_name: Optional[str] = None) -> None:
@@ -789,8 +881,10 @@ async def delete_clan_leaderboard(clan_name: Optional[str] = None) -> None:
     function_name: str = 'delete_clan_leaderboard'
     sql: str = f'DELETE FROM {table}' if clan_name is None else f'DELETE FROM {table} WHERE clan_name=?'
     try:
-        cur: sqlite3.Cursor = settings.NAVI_DB.cursor()
-        cur.execute(sql) if clan_name is None else cur.execute(sql, (clan_name,))
+        if clan_name is None:
+            await executor.execute(sql)
+        else:
+            await executor.execute(sql, (clan_name,))
     except sqlite3.Error as error:
         await errors.log_error(
             strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
@@ -819,25 +913,19 @@ async def insert_clan(clan_name: str, leader_ids: list[int], member_ids: list[in
     function_name: str = 'insert_clan'
     table: str = 'clans'
     sql: str = (
-        f'INSERT INTO {table} (clan_name, stealth_current, stealth_threshold) VALUES (?, ?, ?)'
+        f'INSERT INTO {table} (clan_name, stealth_current, stealth_threshold) VALUES (?, ?, ?) RETURNING *'
     )
+    await load_clan_cache()
     try:
-        cur: sqlite3.Cursor = settings.NAVI_DB.cursor()
-        cur.execute(sql, (clan_name, 1, settings.CLAN_DEFAULT_STEALTH_THRESHOLD))
+        record: Any = await executor.fetch_one(sql, (clan_name, 1, settings.CLAN_DEFAULT_STEALTH_THRESHOLD),
+                                               read_only=False)
     except sqlite3.Error as error:
         await errors.log_error(
             strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
         )
         raise
-
-    member_id: int
-    for member_id in member_ids:
-        member_type = 'leader' if member_id in leader_ids else 'member'
-        try:
-            clan_member: ClanMember = await get_clan_member(member_id)
-            await clan_member.update(clan_name=clan_name, member_type=member_type)
-        except exceptions.NoDataFoundError:
-            await insert_clan_member(clan_name, member_id, member_type)
+    _CLAN_CACHE[clan_name] = await _dict_to_clan(dict(record), ())
+    await _set_clan_members(clan_name, clan_name, member_ids, leader_ids)
     
     clan: Clan = await get_clan_by_clan_name(clan_name)
 
@@ -858,16 +946,17 @@ async def insert_clan_member(clan_name: str, user_id: int, member_type: str) ->
     """
     function_name: str = 'insert_clan_member'
     table: str = 'clan_members'
-    sql: str = f'INSERT INTO {table} (user_id, clan_name, member_type) VALUES (?, ?, ?)'
+    sql: str = f'INSERT INTO {table} (user_id, clan_name, member_type) VALUES (?, ?, ?) RETURNING *'
+    await load_clan_cache()
     try:
-        cur: sqlite3.Cursor = settings.NAVI_DB.cursor()
-        cur.execute(sql, (user_id, clan_name, member_type))
+        record: Any = await executor.fetch_one(sql, (user_id, clan_name, member_type), read_only=False)
     except sqlite3.Error as error:
         await errors.log_error(
             strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
         )
         raise
-    clan_member: ClanMember = await get_clan_member(user_id)
+    clan_member: ClanMember = await _dict_to_clan_member(dict(record))
+    _cache_clan_member(clan_member)
 
     return clan_member
 
@@ -888,8 +977,7 @@ async def insert_clan_raid(clan_name: str, user_id: int, energy: int, raid_time:
     table: str = 'clans_raids'
     sql: str = f'INSERT INTO {table} (clan_name, user_id, energy, raid_time) VALUES (?, ?, ?, ?)'
     try:
-        cur: sqlite3.Cursor = settings.NAVI_DB.cursor()
-        cur.execute(sql, (clan_name, user_id, energy, raid_time))
+        await executor.execute(sql, (clan_name, user_id, energy, raid_time))
     except sqlite3.Error as error:
         await errors.log_error(
             strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
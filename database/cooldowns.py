@@ -2,11 +2,14 @@
 """Provides access to the table "cooldowns" in the database"""
 
 
+from copy import copy
 from dataclasses import dataclass
 from math import ceil
 import sqlite3
+from types import MappingProxyType
+from typing import Mapping, NamedTuple, Optional
 
-from database import errors
+from database import errors, executor
 from resources import exceptions, settings, strings
 
 
@@ -28,16 +31,18 @@ class Cooldown():
         """Returns the actual slash cooldown, factoring in the event_reduction"""
         return ceil(self.base_cooldown * ((100 - self.event_reduction_slash) / 100))
 
-    async def refresh(self) -> None:
-        """Refreshes cooldown data from the database."""
-        new_settings = await get_cooldown(self.activity)
+    async def refresh(self, new_settings: Optional['Cooldown'] = None) -> None:
+        """Refreshes cooldown data from the database.
+        If new_settings is passed, the values are copied from there instead of reading the record."""
+        if new_settings is None: new_settings = await get_cooldown(self.activity)
         self.base_cooldown = new_settings.base_cooldown
         self.donor_affected = new_settings.donor_affected
         self.event_reduction_mention = new_settings.event_reduction_mention
         self.event_reduction_slash = new_settings.event_reduction_slash
 
     async def update(self, **updated_settings) -> None:
-        """Updates the cooldown record in the database. Also calls refresh().
+        """Updates the cooldown record in the database and applies the updated record returned by the database.
+        Also replaces the cooldown in the cooldown snapshot.
 
         Arguments
         ---------
@@ -47,8 +52,84 @@ class Cooldown():
             event_reduction_mention: float
             event_reduction_slash: float
         """
-        await _update_cooldown(self.activity, **updated_settings)
-        await self.refresh()
+        updated_cooldown = await _update_cooldown(self.activity, **updated_settings)
+        await self.refresh(updated_cooldown)
+
+
+class CooldownTimes(NamedTuple):
+    """Object that contains the effective cooldowns of an activity in seconds.
+    The index of the tuples is the donor tier. The donor tier is only factored in if the cooldown is donor affected."""
+    activity: str
+    donor_affected: bool
+    mention: tuple[float, ...]
+    slash: tuple[float, ...]
+
+class CachedCooldown(NamedTuple):
+    """Object that represents a cooldown in the cooldown snapshot"""
+    cooldown: Cooldown
+    times: CooldownTimes
+
+
+# Cooldown snapshot
+# The whole table is kept in memory. Writes replace the snapshot instead of changing it.
+# The snapshot is built on first access, after update_database() ran, and Cooldown.update() is the only writer after
+# that. Changes made to the table while the bot runs need a restart (or "dev reload database.cooldowns").
+_COOLDOWN_SNAPSHOT: Mapping[str, CachedCooldown] | None = None
+
+
+def _create_cached_cooldown(cooldown: Cooldown) -> CachedCooldown:
+    """Creates a snapshot entry with the precomputed cooldown times of a cooldown"""
+    actual_cooldown_mention: int = cooldown.actual_cooldown_mention()
+    actual_cooldown_slash: int = cooldown.actual_cooldown_slash()
+    donor_multipliers: tuple[float, ...] = (
+        settings.DONOR_COOLDOWNS if cooldown.donor_affected else (1.0,) * len(settings.DONOR_COOLDOWNS)
+    )
+    times = CooldownTimes(
+        activity = cooldown.activity,
+        donor_affected = cooldown.donor_affected,
+        mention = tuple(actual_cooldown_mention * multiplier for multiplier in donor_multipliers),
+        slash = tuple(actual_cooldown_slash * multiplier for multiplier in donor_multipliers),
+    )
+    return CachedCooldown(cooldown=copy(cooldown), times=times)
+
+
+def _replace_cooldown_in_snapshot(cooldown: Cooldown) -> None:
+    """Replaces the snapshot with a new one that contains the updated cooldown"""
+    global _COOLDOWN_SNAPSHOT
+    if _COOLDOWN_SNAPSHOT is None: return
+    cooldowns: dict[str, CachedCooldown] = dict(_COOLDOWN_SNAPSHOT)
+    cooldowns[cooldown.activity] = _create_cached_cooldown(cooldown)
+    _COOLDOWN_SNAPSHOT = MappingProxyType(cooldowns)
+
+
+async def _get_cooldown_snapshot() -> Mapping[str, CachedCooldown]:
+    """Returns the cooldown snapshot. Reads the table "cooldowns" if there is no snapshot yet.
+
+    Raises
+    ------
+    sqlite3.Error if something happened within the database.
+    LookupError if something goes wrong reading the dict.
+    Also logs all errors to the database.
+    """
+    global _COOLDOWN_SNAPSHOT
+    if _COOLDOWN_SNAPSHOT is not None: return _COOLDOWN_SNAPSHOT
+    table = 'cooldowns'
+    function_name = '_get_cooldown_snapshot'
+    sql = f'SELECT * FROM {table} ORDER BY activity ASC'
+    try:
+        records = await executor.fetch_all(sql)
+    except sqlite3.Error as error:
+        await errors.log_error(
+            strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
+        )
+        raise
+    cooldowns: dict[str, CachedCooldown] = {}
+    for record in records:
+        cooldown = await _dict_to_cooldown(dict(record))
+        cooldowns[cooldown.activity] = _create_cached_cooldown(cooldown)
+    _COOLDOWN_SNAPSHOT = MappingProxyType(cooldowns)
+
+    return _COOLDOWN_SNAPSHOT
 
 
 # Miscellaneous functions
@@ -87,7 +168,7 @@ async def _dict_to_cooldown(record: dict) -> Cooldown:
 
 # Read Data
 async def get_cooldown(activity: str) -> Cooldown:
-    """Gets the cooldown settings for an activity.
+    """Gets the cooldown settings for an activity. Cooldowns are served from the cooldown snapshot.
 
     Returns
     -------
@@ -101,28 +182,47 @@ async def get_cooldown(activity: str) -> Cooldown:
     """
     table = 'cooldowns'
     function_name = 'get_cooldown'
-    sql = f'SELECT * FROM {table} WHERE activity=?'
-    try:
-        cur = settings.NAVI_DB.cursor()
-        cur.execute(sql, (activity,))
-        record = cur.fetchone()
-    except sqlite3.Error as error:
+    cooldown_snapshot = await _get_cooldown_snapshot()
+    cached_cooldown: CachedCooldown | None = cooldown_snapshot.get(activity, None)
+    if cached_cooldown is None:
         await errors.log_error(
-            strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
+            strings.INTERNAL_ERROR_NO_DATA_FOUND.format(table=table, function=function_name,
+                                                        sql=f'Cooldown snapshot, activity "{activity}"')
         )
-        raise
-    if not record:
+        raise exceptions.NoDataFoundError(f'No cooldown data found in database for activity "{activity}".')
+
+    return copy(cached_cooldown.cooldown)
+
+
+async def get_cooldown_times(activity: str) -> CooldownTimes:
+    """Gets the precomputed cooldown times for an activity from the cooldown snapshot.
+
+    Returns
+    -------
+    CooldownTimes object
+
+    Raises
+    ------
+    sqlite3.Error if something happened within the database.
+    exceptions.NoDataFoundError if no cooldown was found.
+    Also logs all errors to the database.
+    """
+    table = 'cooldowns'
+    function_name = 'get_cooldown_times'
+    cooldown_snapshot = await _get_cooldown_snapshot()
+    cached_cooldown: CachedCooldown | None = cooldown_snapshot.get(activity, None)
+    if cached_cooldown is None:
         await errors.log_error(
-            strings.INTERNAL_ERROR_NO_DATA_FOUND.format(table=table, function=function_name, sql=sql)
+            strings.INTERNAL_ERROR_NO_DATA_FOUND.format(table=table, function=function_name,
+                                                        sql=f'Cooldown snapshot, activity "{activity}"')
         )
         raise exceptions.NoDataFoundError(f'No cooldown data found in database for activity "{activity}".')
-    cooldown = await _dict_to_cooldown(dict(record))
 
-    return cooldown
+    return cached_cooldown.times
 
 
 async def get_all_cooldowns() -> tuple[Cooldown, ...]:
-    """Gets the cooldown settings for all activities.
+    """Gets the cooldown settings for all activities. Cooldowns are served from the cooldown snapshot.
 
     Returns
     -------
@@ -135,34 +235,20 @@ async def get_all_cooldowns() -> tuple[Cooldown, ...]:
     LookupError if something goes wrong reading the dict.
     Also logs all errors to the database.
     """
-    table = f'cooldowns'
+    table = 'cooldowns'
     function_name = 'get_all_cooldowns'
-    sql = f'SELECT * FROM {table} ORDER BY activity ASC'
-    try:
-        cur = settings.NAVI_DB.cursor()
-        cur.execute(sql)
-        records = cur.fetchall()
-    except sqlite3.Error as error:
+    cooldown_snapshot = await _get_cooldown_snapshot()
+    if not cooldown_snapshot:
         await errors.log_error(
-            strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
-        )
-        raise
-
-    if not records:
-        await errors.log_error(
-            strings.INTERNAL_ERROR_NO_DATA_FOUND.format(table=table, function=function_name, sql=sql)
+            strings.INTERNAL_ERROR_NO_DATA_FOUND.format(table=table, function=function_name, sql='Cooldown snapshot')
         )
         raise exceptions.NoDataFoundError('No cooldown data found in database.')
-    cooldowns = []
-    for record in records:
-        cooldown = await _dict_to_cooldown(dict(record))
-        cooldowns.append(cooldown)
 
-    return tuple(cooldowns)
+    return tuple(copy(cooldown_snapshot[activity].cooldown) for activity in sorted(cooldown_snapshot))
 
 
 # Write Data
-async def _update_cooldown(activity: str, **updated_settings) -> None:
+async def _update_cooldown(activity: str, **updated_settings) -> Cooldown:
     """Updates cooldown record. Use Cooldown.update() to trigger this function.
 
     Arguments
@@ -174,10 +260,15 @@ async def _update_cooldown(activity: str, **updated_settings) -> None:
         event_reduction_mention: float
         event_reduction_slash: float
 
+    Returns
+    -------
+    Cooldown object with the updated record.
+
     Raises
     ------
     sqlite3.Error if something happened within the database.
     NoArgumentsError if no updated_settings are passed (need to pass at least one).
+    NoDataFoundError if the cooldown doesn't exist.
     Also logs all errors to the database.
     """
     table = 'cooldowns'
@@ -188,16 +279,24 @@ async def _update_cooldown(activity: str, **updated_settings) -> None:
         )
         raise exceptions.NoArgumentsError('You need to specify at least one keyword argument.')
     try:
-        cur = settings.NAVI_DB.cursor()
         sql = f'UPDATE {table} SET'
         for updated_setting in updated_settings:
             sql = f'{sql} {updated_setting} = :{updated_setting},'
         sql = sql.strip(",")
         updated_settings['activity'] = activity
-        sql = f'{sql} WHERE activity = :activity'
-        cur.execute(sql, updated_settings)
+        sql = f'{sql} WHERE activity = :activity RETURNING *'
+        record = await executor.fetch_one(sql, updated_settings, read_only=False)
     except sqlite3.Error as error:
         await errors.log_error(
             strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
         )
-        raise
\ No newline at end of file
+        raise
+    if not record:
+        await errors.log_error(
+            strings.INTERNAL_ERROR_NO_DATA_FOUND.format(table=table, function=function_name, sql=sql)
+        )
+        raise exceptions.NoDataFoundError(f'No cooldown data found in database for activity "{activity}".')
+    cooldown = await _dict_to_cooldown(dict(record))
+    _replace_cooldown_in_snapshot(cooldown)
+
+    return cooldown
\ No newline at end of file
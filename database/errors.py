@@ -9,6 +9,7 @@ import discord
 from discord import utils
 from discord.ext import bridge, commands
 
+from database import executor
 from resources import exceptions, logs, settings, strings
 
 
@@ -89,8 +90,7 @@ async def log_error(error: Union[Exception, str], ctx: Optional[Union[bridge.Bri
         jump_url = 'N/A'
         user_settings = 'N/A'
     try:
-        cur = settings.NAVI_DB.cursor()
-        cur.execute(sql, (date_time, message_content, error_message, user_settings, jump_url))
+        await executor.execute(sql, (date_time, message_content, error_message, user_settings, jump_url))
         logs.logger.error(f'\n{error_message}\n>> Jump URL: {jump_url}')
     except sqlite3.Error as error:
         if ctx is not None:
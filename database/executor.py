@@ -0,0 +1,167 @@
+# executor.py
+"""Runs all database access on dedicated worker threads so sqlite never blocks the event loop.
+
+All functions in database/*.py use the helpers in here instead of calling settings.NAVI_DB directly.
+Writes run on a single thread using settings.NAVI_DB. In WAL mode, reads run on a pool of read only connections
+(see DB_READ_CONNECTIONS in the .env file), otherwise they run on the write thread as well.
+If no event loop is running (e.g. during startup), the queries are executed synchronously.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import sqlite3
+import threading
+from time import perf_counter
+from typing import Any, Callable, NamedTuple, TypeVar
+
+from resources import settings
+
+
+T = TypeVar('T')
+
+
+class ExecutorStats(NamedTuple):
+    """Object that summarizes the database executor activity"""
+    query_count: int
+    query_time_total: float
+    query_time_max: float
+    read_connections: int
+
+
+# The write connection isn't thread safe, so there is only one write worker. This also serializes all writes.
+_DB_EXECUTOR: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='navi_db')
+_DB_READ_EXECUTOR: ThreadPoolExecutor | None = (
+    ThreadPoolExecutor(max_workers=settings.DB_READ_CONNECTIONS, thread_name_prefix='navi_db_read')
+    if settings.DB_READ_CONNECTIONS > 0 else None
+)
+_read_connections: threading.local = threading.local()
+_read_connection_count: int = 0
+_stats_lock: threading.Lock = threading.Lock()
+_query_count: int = 0
+_query_time_total: float = 0
+_query_time_max: float = 0
+
+
+def _get_read_connection() -> sqlite3.Connection:
+    """Returns the read only connection of the current thread. Opens it if necessary."""
+    global _read_connection_count
+    connection: sqlite3.Connection | None = getattr(_read_connections, 'connection', None)
+    if connection is None:
+        connection = sqlite3.connect(settings.DB_FILE, isolation_level=None, detect_types=sqlite3.PARSE_DECLTYPES)
+        connection.row_factory = sqlite3.Row
+        settings.apply_db_pragmas(connection, read_only=True)
+        _read_connections.connection = connection
+        with _stats_lock:
+            _read_connection_count += 1
+    return connection
+
+
+def _get_connection(read_only: bool) -> sqlite3.Connection:
+    """Returns the connection to use for a query"""
+    if read_only and _DB_READ_EXECUTOR is not None: return _get_read_connection()
+    return settings.NAVI_DB
+
+
+def _track_query(start_time: float) -> None:
+    """Updates the executor stats with a finished query"""
+    global _query_count, _query_time_total, _query_time_max
+    query_time: float = perf_counter() - start_time
+    with _stats_lock:
+        _query_count += 1
+        _query_time_total += query_time
+        if query_time > _query_time_max: _query_time_max = query_time
+
+
+def _fetch_one(sql: str, parameters: Any, read_only: bool) -> sqlite3.Row | None:
+    start_time: float = perf_counter()
+    try:
+        cur: sqlite3.Cursor = _get_connection(read_only).cursor()
+        cur.execute(sql, parameters)
+        return cur.fetchone()
+    finally:
+        _track_query(start_time)
+
+
+def _fetch_all(sql: str, parameters: Any, read_only: bool) -> list[sqlite3.Row]:
+    start_time: float = perf_counter()
+    try:
+        cur: sqlite3.Cursor = _get_connection(read_only).cursor()
+        cur.execute(sql, parameters)
+        return cur.fetchall()
+    finally:
+        _track_query(start_time)
+
+
+def _execute(sql: str, parameters: Any) -> int:
+    start_time: float = perf_counter()
+    try:
+        cur: sqlite3.Cursor = settings.NAVI_DB.cursor()
+        cur.execute(sql, parameters)
+        return cur.rowcount
+    finally:
+        _track_query(start_time)
+
+
+async def _run_in(executor: ThreadPoolExecutor | None, function: Callable[..., T], *args: Any) -> T:
+    """Runs a function in an executor. If no event loop is running, the function is called directly."""
+    try:
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+    except RuntimeError:
+        return function(*args)
+    return await loop.run_in_executor(executor, function, *args)
+
+
+async def run(function: Callable[..., T], *args: Any) -> T:
+    """Runs a function on the write thread and returns its result.
+    Use this for everything that needs the write connection itself (e.g. backups or several statements in a row).
+    If no event loop is running, the function is called directly.
+    """
+    return await _run_in(_DB_EXECUTOR, function, *args)
+
+
+async def fetch_one(sql: str, parameters: Any = (), read_only: bool = True) -> sqlite3.Row | None:
+    """Executes a query and returns the first record or None.
+    Set read_only to False for statements that write and return records (e.g. RETURNING).
+
+    Raises
+    ------
+    sqlite3.Error if something happened within the database.
+    """
+    executor: ThreadPoolExecutor | None = (
+        _DB_READ_EXECUTOR if read_only and _DB_READ_EXECUTOR is not None else _DB_EXECUTOR
+    )
+    return await _run_in(executor, _fetch_one, sql, parameters, read_only)
+
+
+async def fetch_all(sql: str, parameters: Any = (), read_only: bool = True) -> list[sqlite3.Row]:
+    """Executes a query and returns all records.
+    Set read_only to False for statements that write and return records (e.g. RETURNING).
+
+    Raises
+    ------
+    sqlite3.Error if something happened within the database.
+    """
+    executor: ThreadPoolExecutor | None = (
+        _DB_READ_EXECUTOR if read_only and _DB_READ_EXECUTOR is not None else _DB_EXECUTOR
+    )
+    return await _run_in(executor, _fetch_all, sql, parameters, read_only)
+
+
+async def execute(sql: str, parameters: Any = ()) -> int:
+    """Executes a statement on the write thread and returns the amount of affected rows.
+
+    Raises
+    ------
+    sqlite3.Error if something happened within the database.
+    """
+    return await run(_execute, sql, parameters)
+
+
+def get_executor_stats() -> ExecutorStats:
+    """Returns the query counters of the database executor."""
+    return ExecutorStats(
+        query_count=_query_count,
+        query_time_total=_query_time_total,
+        query_time_max=_query_time_max,
+        read_connections=_read_connection_count,
+    )
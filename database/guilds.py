@@ -2,16 +2,17 @@
 """Provides access to the table "guilds" in the database"""
 
 
+from copy import copy
 from dataclasses import dataclass
 import itertools
 import sqlite3
-from typing import NamedTuple, Union
+from typing import Iterable, NamedTuple, Optional, Union
 
 import discord
 from discord.ext import bridge, commands
 
-from database import errors
-from resources import exceptions, settings, strings
+from database import errors, executor
+from resources import exceptions, strings
 
 
 # Containers
@@ -76,9 +77,10 @@ class Guild():
     event_rare_hunt_monster: EventPing
     guild_id: int
 
-    async def refresh(self) -> None:
-        """Refreshes guild data from the database."""
-        new_settings = await get_guild(self.guild_id)
+    async def refresh(self, new_settings: Optional['Guild'] = None) -> None:
+        """Refreshes guild data from the database.
+        If new_settings is passed, the values are copied from there instead of reading the record."""
+        if new_settings is None: new_settings = await get_guild(self.guild_id)
         self.auto_flex_brew_electronical_enabled = new_settings.auto_flex_brew_electronical_enabled
         self.auto_flex_channel_id = new_settings.auto_flex_channel_id
         self.auto_flex_enabled = new_settings.auto_flex_enabled
@@ -133,7 +135,7 @@ class Guild():
         self.event_rare_hunt_monster = new_settings.event_rare_hunt_monster
 
     async def update(self, **updated_settings) -> None:
-        """Updates the guild record in the database. Also calls refresh().
+        """Updates the guild record in the database and applies the updated record returned by the database.
 
         Arguments
         ---------
@@ -199,8 +201,19 @@ class Guild():
             event_rare_hunt_monster_enabled: bool
             event_rare_hunt_monster_message: str
         """
-        await _update_guild(self.guild_id, **updated_settings)
-        await self.refresh()
+        updated_guild = await _update_guild(self.guild_id, **updated_settings)
+        await self.refresh(updated_guild)
+
+
+# Guild cache
+# Guild settings are cached for all guilds the bot is in. Guild.update() writes through to the cache.
+_GUILD_CACHE: dict[int, Guild] = {}
+
+
+def invalidate_guild_cache(guild_id: int) -> None:
+    """Removes a guild from the guild cache. Use this when the bot leaves a guild or after changing the guild record
+    outside of Guild.update()."""
+    _GUILD_CACHE.pop(guild_id, None)
 
 
 # Miscellaneous functions
@@ -300,37 +313,74 @@ async def get_guild(guild_id: int) -> Guild:
     LookupError if something goes wrong reading the dict.
     Also logs all errors to the database.
     """
+    cached_guild: Guild | None = _GUILD_CACHE.get(guild_id, None)
+    if cached_guild is not None: return copy(cached_guild)
     table = 'guilds'
     function_name = 'get_guild'
     sql_select = f'SELECT * FROM {table} WHERE guild_id=?'
     try:
-        cur = settings.NAVI_DB.cursor()
-        cur.execute(sql_select, (guild_id,))
-        record = cur.fetchone()
+        record = await executor.fetch_one(sql_select, (guild_id,))
     except sqlite3.Error as error:
         await errors.log_error(
             strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql_select)
         )
         raise
     if not record:
-        sql = f'INSERT INTO {table} (guild_id,) VALUES (?,)'
+        # Concurrent calls can both miss a new guild, only the first insert creates the record
+        sql = f'INSERT INTO {table} (guild_id) VALUES (?) ON CONFLICT (guild_id) DO NOTHING'
         try:
-            cur.execute(sql, (guild_id,))
+            await executor.execute(sql, (guild_id,))
             sql = sql_select
-            cur.execute(sql, (guild_id,))
-            record = cur.fetchone()
+            record = await executor.fetch_one(sql, (guild_id,), read_only=False)
         except sqlite3.Error as error:
             await errors.log_error(
                 strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
             )
             raise
     guild = await _dict_to_guild(dict(record))
+    # Guild.update() or another call may have cached a newer record while this one was read
+    cached_guild = _GUILD_CACHE.get(guild_id, None)
+    if cached_guild is not None: return copy(cached_guild)
+    _GUILD_CACHE[guild_id] = copy(guild)
 
     return guild
 
 
+async def load_guild_cache(guild_ids: Iterable[int]) -> int:
+    """Loads the settings of the given guilds into the guild cache with a single query.
+    Guilds without a record are not created here, get_guild() creates them when they are first needed.
+
+    Returns
+    -------
+    Amount of cached guilds: int
+
+    Raises
+    ------
+    sqlite3.Error if something happened within the database.
+    LookupError if something goes wrong reading the dict.
+    Also logs all errors to the database.
+    """
+    table = 'guilds'
+    function_name = 'load_guild_cache'
+    guild_ids = set(guild_ids)
+    sql = f'SELECT * FROM {table}'
+    try:
+        records = await executor.fetch_all(sql)
+    except sqlite3.Error as error:
+        await errors.log_error(
+            strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
+        )
+        raise
+    for record in records:
+        if record['guild_id'] not in guild_ids: continue
+        guild = await _dict_to_guild(dict(record))
+        _GUILD_CACHE[guild.guild_id] = guild
+
+    return len(_GUILD_CACHE)
+
+
 # Write Data
-async def _update_guild(guild_id: int, **updated_settings) -> None:
+async def _update_guild(guild_id: int, **updated_settings) -> Guild:
     """Updates guild record. Use Guild.update() to trigger this function.
 
     Arguments
@@ -396,10 +446,15 @@ async def _update_guild(guild_id: int, **updated_settings) -> None:
         event_rare_hunt_monster_enabled: bool
         event_rare_hunt_monster_message: str
 
+    Returns
+    -------
+    Guild object with the updated record.
+
     Raises
     ------
     sqlite3.Error if something happened within the database.
     NoArgumentsError if no updated_settings are passed (need to pass at least one)
+    NoDataFoundError if the guild doesn't exist.
     Also logs all errors to the database.
     """
     table = 'guilds'
@@ -410,16 +465,24 @@ async def _update_guild(guild_id: int, **updated_settings) -> None:
         )
         raise exceptions.NoArgumentsError('You need to specify at least one keyword argument.')
     try:
-        cur = settings.NAVI_DB.cursor()
         sql = f'UPDATE {table} SET'
         for updated_setting in updated_settings:
             sql = f'{sql} {updated_setting} = :{updated_setting},'
         sql = sql.strip(",")
         updated_settings['guild_id'] = guild_id
-        sql = f'{sql} WHERE guild_id = :guild_id'
-        cur.execute(sql, updated_settings)
+        sql = f'{sql} WHERE guild_id = :guild_id RETURNING *'
+        record = await executor.fetch_one(sql, updated_settings, read_only=False)
     except sqlite3.Error as error:
         await errors.log_error(
             strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
         )
-        raise
\ No newline at end of file
+        raise
+    if not record:
+        await errors.log_error(
+            strings.INTERNAL_ERROR_NO_DATA_FOUND.format(table=table, function=function_name, sql=sql)
+        )
+        raise exceptions.NoDataFoundError(f'No guild data found in database for guild "{guild_id}".')
+    guild = await _dict_to_guild(dict(record))
+    _GUILD_CACHE[guild_id] = copy(guild)
+
+    return guild
\ No newline at end of file
@@ -4,8 +4,8 @@
 from dataclasses import dataclass
 import sqlite3
 
-from database import errors
-from resources import exceptions, settings, strings
+from database import errors, executor
+from resources import exceptions, strings
 
 
 # Containers
@@ -104,9 +104,7 @@ async def get_portal(user_id: int, channel_id: int) -> Portal:
     function_name = 'get_portal'
     sql = f'SELECT * FROM {table} WHERE user_id=? AND channel_id=?'
     try:
-        cur = settings.NAVI_DB.cursor()
-        cur.execute(sql, (user_id, channel_id))
-        record = cur.fetchone()
+        record = await executor.fetch_one(sql, (user_id, channel_id))
     except sqlite3.Error as error:
         await errors.log_error(
             strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
@@ -143,9 +141,7 @@ async def get_portals(user_id: int) -> tuple[Portal, ...]:
     function_name = 'get_portals'
     sql = f'SELECT * FROM {table} WHERE user_id=? ORDER BY sort_index ASC'
     try:
-        cur = settings.NAVI_DB.cursor()
-        cur.execute(sql, (user_id,))
-        records = cur.fetchall()
+        records = await executor.fetch_all(sql, (user_id,))
     except sqlite3.Error as error:
         await errors.log_error(
             strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
@@ -176,8 +172,7 @@ async def _delete_portal(portal: Portal) -> None:
     table = 'users_portals'
     sql = f'DELETE FROM {table} WHERE user_id=? AND channel_id=?'
     try:
-        cur = settings.NAVI_DB.cursor()
-        cur.execute(sql, (portal.user_id, portal.channel_id))
+        await executor.execute(sql, (portal.user_id, portal.channel_id))
     except sqlite3.Error as error:
         await errors.log_error(
             strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
@@ -211,12 +206,11 @@ async def _update_portal(portal: Portal, **updated_settings) -> None:
     updated_settings['user_id_old'] = portal.user_id
     updated_settings['channel_id_old'] = portal.channel_id
     try:
-        cur = settings.NAVI_DB.cursor()
         sql = f'UPDATE {table} SET'
         for updated_setting in updated_settings:
             sql = f'{sql} {updated_setting} = :{updated_setting},'
         sql = f'{sql} WHERE user_id = :user_id_old AND channel_id = :channel_id_old'
-        cur.execute(sql, updated_settings)
+        await executor.execute(sql, updated_settings)
     except sqlite3.Error as error:
         await errors.log_error(
             strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
@@ -244,10 +238,9 @@ async def insert_portal(user_id: int, channel_id: int) -> Portal:
     """
     function_name = 'insert_portal'
     table = 'users_portals'
-    cur = settings.NAVI_DB.cursor()
     sql = f'INSERT INTO {table} (user_id, channel_id) VALUES (?, ?)'
     try:
-        cur.execute(sql, (user_id, channel_id))
+        await executor.execute(sql, (user_id, channel_id))
     except sqlite3.Error as error:
         await errors.log_error(
             strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
@@ -1,21 +1,34 @@
 # reminders.py
 """Provides access to the tables "reminders_users" and "reminders_clans" in the database"""
 
+import asyncio
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+import heapq
+import itertools
 import sqlite3
-from typing import Any, Optional, Union
+from typing import Any, Awaitable, Callable, Iterable, NamedTuple, Optional, Union
 
 from discord import utils
 from discord.ext import tasks
 
-from database import cooldowns, errors
-from resources import exceptions, settings, strings
+from database import cooldowns, errors, executor
+from resources import exceptions, strings
 
 
-# Reminders scheduled for task creation / deletion
-scheduled_for_tasks = {}
-scheduled_for_deletion = {}
+# Reminder scheduler
+# Reminders are kept in a heap sorted by end time and handed to the task handler SCHEDULE_LEAD_TIME before they end.
+# Rescheduling a reminder pushes a new heap entry, outdated entries are skipped when they come up.
+SCHEDULE_LEAD_TIME = timedelta(seconds=15)
+# Reminders that ended longer ago than this are not claimed anymore, they are removed by the delete_old_reminders task.
+# This matches the 20 seconds of get_old_user_reminders() and get_old_clan_reminders().
+CLAIM_GRACE_PERIOD = timedelta(seconds=20)
+_scheduler_heap: list[tuple[datetime, int, str]] = []
+_scheduled_reminders: dict[str, tuple[int, 'Reminder']] = {}
+_scheduler_sequence = itertools.count()
+_scheduler_wakeup = asyncio.Event()
+_create_tasks_handler: Optional[Callable[[list['Reminder']], Awaitable[None]]] = None
+_delete_task_handler: Optional[Callable[[str], Awaitable[None]]] = None
 
 
 # Containers
@@ -37,7 +50,7 @@ class Reminder():
 
     async def delete(self) -> None:
         """Deletes the reminder record from the database. Also calls refresh().
-        Also cancels and deletes an active task for this reminder.
+        Also removes the reminder from the scheduler and cancels an active task for this reminder.
 
         Raises
         ------
@@ -45,25 +58,28 @@ class Reminder():
         Also logs all errors to the database.
         """
         await _delete_reminder(self)
+        await unschedule_reminder(self.task_name)
         await self.refresh()
         if self.record_exists:
             error_message = f'Reminder got deleted but record still exists.\n{self}'
             await errors.log_error(error_message)
             raise exceptions.RecordExistsError(error_message)
 
-    async def refresh(self) -> None:
+    async def refresh(self, new_settings: Optional['Reminder'] = None) -> None:
         """Refreshes clan data from the database.
+        If new_settings is passed, the values are copied from there instead of reading the record.
         If the record doesn't exist anymore, "record_exists" will be set to False.
         All other values will stay on their old values before deletion (!).
         """
-        try:
-            if self.reminder_type == 'clan':
-                new_settings = await get_clan_reminder(self.clan_name)
-            else:
-                new_settings = await get_user_reminder(self.user_id, self.activity, self.custom_id)
-        except exceptions.NoDataFoundError as error:
-            self.record_exists = False
-            return
+        if new_settings is None:
+            try:
+                if self.reminder_type == 'clan':
+                    new_settings = await get_clan_reminder(self.clan_name)
+                else:
+                    new_settings = await get_user_reminder(self.user_id, self.activity, self.custom_id)
+            except exceptions.NoDataFoundError as error:
+                self.record_exists = False
+                return
         self.activity = new_settings.activity
         self.channel_id = new_settings.channel_id
         self.clan_name = new_settings.clan_name
@@ -76,7 +92,8 @@ class Reminder():
         self.user_id = new_settings.user_id
 
     async def update(self, **updated_settings) -> None:
-        """Updates the clan record in the database. Also calls refresh().
+        """Updates the clan record in the database and applies the updated record returned by the database.
+        Also reschedules the reminder.
 
         Arguments
         ---------
@@ -91,31 +108,133 @@ class Reminder():
             triggered: bool
             user_id: int
         """
-        await _update_reminder(self, **updated_settings)
-        await self.refresh()
+        task_name_old = self.task_name
+        updated_reminder = await _update_reminder(self, **updated_settings)
+        if updated_reminder is None:
+            self.record_exists = False
+        else:
+            await self.refresh(updated_reminder)
+        if self.task_name != task_name_old: await unschedule_reminder(task_name_old)
+        if self.record_exists: await schedule_reminder(self)
+
+class ReminderSnapshot(NamedTuple):
+    """Object that contains all reminders /ready and /list need for a user. Created by get_reminder_snapshot()."""
+    clan_reminders: tuple[Reminder, ...] # Active reminders of the clan of the user, sorted by end time
+    partner_hunt_reminder: Reminder | None # Hunt reminder of the partner of the user, active or not
+    user_reminders: tuple[Reminder, ...] # Active reminders of the user, sorted by end time
+
+
+# Scheduler
+def register_task_handlers(create_tasks: Callable[[list[Reminder]], Awaitable[None]],
+                           delete_task: Callable[[str], Awaitable[None]]) -> None:
+    """Registers the functions the scheduler uses to create tasks for due reminders and to cancel running tasks"""
+    global _create_tasks_handler, _delete_task_handler
+    _create_tasks_handler = create_tasks
+    _delete_task_handler = delete_task
+
+
+async def schedule_reminder(reminder: Reminder) -> None:
+    """Adds a reminder to the scheduler or reschedules it if it is already scheduled.
+    Cancels a running task for this reminder, the scheduler will create a new one when the reminder is due.
+    """
+    await schedule_multiple_reminders((reminder,))
+
+
+async def schedule_multiple_reminders(reminders: Iterable[Reminder]) -> None:
+    """Adds multiple reminders to the scheduler or reschedules them if they are already scheduled.
+    Cancels running tasks for these reminders. Wakes up the scheduler at most once.
+    """
+    first_sequence = None
+    for reminder in reminders:
+        if _delete_task_handler is not None: await _delete_task_handler(reminder.task_name)
+        sequence = next(_scheduler_sequence)
+        if first_sequence is None: first_sequence = sequence
+        _scheduled_reminders[reminder.task_name] = (sequence, reminder)
+        heapq.heappush(_scheduler_heap, (reminder.end_time, sequence, reminder.task_name))
+    if first_sequence is None: return
+    if len(_scheduler_heap) > len(_scheduled_reminders) * 2 + 1_000:
+        _scheduler_heap[:] = [entry for entry in _scheduler_heap
+                              if _scheduled_reminders.get(entry[2], (None,))[0] == entry[1]]
+        heapq.heapify(_scheduler_heap)
+    if _scheduler_heap and _scheduler_heap[0][1] >= first_sequence: _scheduler_wakeup.set()
+
+
+async def unschedule_reminder(task_name: str) -> None:
+    """Removes a reminder from the scheduler and cancels a running task for this reminder"""
+    _scheduled_reminders.pop(task_name, None)
+    if _delete_task_handler is not None: await _delete_task_handler(task_name)
+
+
+async def unschedule_user_reminders(user_id: int) -> None:
+    """Removes all reminders of a user from the scheduler and cancels their running tasks"""
+    for task_name, (_, reminder) in list(_scheduled_reminders.items()):
+        if reminder.user_id == user_id: await unschedule_reminder(task_name)
+
+
+async def _pop_due_reminders(due_time: datetime) -> list[Reminder]:
+    """Removes all reminders that end before due_time from the scheduler and returns them"""
+    due_reminders = []
+    while _scheduler_heap and _scheduler_heap[0][0] <= due_time:
+        _, sequence, task_name = heapq.heappop(_scheduler_heap)
+        scheduled_reminder = _scheduled_reminders.get(task_name, None)
+        if scheduled_reminder is None or scheduled_reminder[0] != sequence: continue
+        _scheduled_reminders.pop(task_name)
+        due_reminders.append(scheduled_reminder[1])
+    return due_reminders
 
 
 # Tasks
-@tasks.loop(seconds=10.0)
+@tasks.loop()
 async def schedule_reminders():
-    """Task that reads all due reminders from the database and schedules them for task creation"""
+    """Task that waits until the next reminders are due and hands them to the task handler.
+    Doesn't poll the database, the scheduler is loaded once on start and kept up to date by the write functions.
+    """
+    _scheduler_wakeup.clear()
+    due_time = utils.utcnow() + SCHEDULE_LEAD_TIME
+    due_reminders = {reminder.task_name: reminder for reminder in await _pop_due_reminders(due_time)}
+    if due_reminders:
+        # Reminders claimed from the database replace the scheduled ones, so the tasks get the current record
+        try:
+            claimed_reminders = await claim_due_user_reminders(due_time) + await claim_due_clan_reminders(due_time)
+        except (sqlite3.Error, LookupError):
+            claimed_reminders = ()
+        for reminder in claimed_reminders:
+            _scheduled_reminders.pop(reminder.task_name, None)
+            due_reminders[reminder.task_name] = reminder
+        due_reminders = list(due_reminders.values())
+        for reminder in due_reminders:
+            reminder.triggered = True
+        try:
+            if _create_tasks_handler is not None: await _create_tasks_handler(due_reminders)
+        except Exception as error:
+            await errors.log_error(
+                f'Error scheduling reminders.\nFunction: schedule_reminders\nReminders: {due_reminders}\nError: {error}'
+            )
+        return
+    while _scheduler_heap and _scheduler_heap[0][1] != _scheduled_reminders.get(_scheduler_heap[0][2], (None,))[0]:
+        heapq.heappop(_scheduler_heap)
+    timeout = None
+    if _scheduler_heap:
+        timeout = (_scheduler_heap[0][0] - SCHEDULE_LEAD_TIME - utils.utcnow()).total_seconds()
+    try:
+        await asyncio.wait_for(_scheduler_wakeup.wait(), timeout)
+    except asyncio.TimeoutError:
+        pass
+
+
+@schedule_reminders.before_loop
+async def load_reminders():
+    """Loads all active reminders into the scheduler before the scheduler starts"""
     try:
-        due_user_reminders = await get_due_user_reminders()
+        active_user_reminders = await get_active_user_reminders()
     except exceptions.NoDataFoundError:
-        due_user_reminders = ()
+        active_user_reminders = ()
     try:
-        due_clan_reminders = await get_due_clan_reminders()
+        active_clan_reminders = await get_active_clan_reminders()
     except exceptions.NoDataFoundError:
-        due_clan_reminders = ()
-    due_reminders = list(due_user_reminders) + list(due_clan_reminders)
-    for reminder in due_reminders:
-        try:
-            scheduled_for_tasks[reminder.task_name] = reminder
-            await reminder.update(triggered=True)
-        except Exception as error:
-            await errors.log_error(
-                f'Error scheduling a reminder.\nFunction: schedule_reminders\nReminder: {reminder}\nError: {error}'
-        )
+        active_clan_reminders = ()
+    for reminder in list(active_user_reminders) + list(active_clan_reminders):
+        await schedule_reminder(reminder)
 
 
 # Miscellaneous functions
@@ -198,9 +317,10 @@ async def get_user_reminder(user_id: int, activity: str, custom_id: Optional[int
     sql = f'SELECT * FROM {table} WHERE user_id=? AND activity=?'
     if custom_id is not None: sql = f'{sql} AND custom_id=?'
     try:
-        cur = settings.NAVI_DB.cursor()
-        cur.execute(sql, (user_id, activity)) if custom_id is None else cur.execute(sql, (user_id, activity, custom_id))
-        record = cur.fetchone()
+        if custom_id is None:
+            record = await executor.fetch_one(sql, (user_id, activity))
+        else:
+            record = await executor.fetch_one(sql, (user_id, activity, custom_id))
     except sqlite3.Error as error:
         await errors.log_error(
             strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
@@ -233,9 +353,7 @@ async def get_clan_reminder(clan_name: str) -> Reminder:
     function_name = 'get_clan_reminder'
     sql = f'SELECT * FROM {table} WHERE clan_name=?'
     try:
-        cur = settings.NAVI_DB.cursor()
-        cur.execute(sql, (clan_name,))
-        record = cur.fetchone()
+        record = await executor.fetch_one(sql, (clan_name,))
     except sqlite3.Error as error:
         await errors.log_error(
             strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
@@ -285,9 +403,7 @@ async def get_active_user_reminders(user_id: Optional[int] = None, activity: Opt
         queries.append(f'{activity}%')
     sql = f'{sql} ORDER BY end_time'
     try:
-        cur = settings.NAVI_DB.cursor()
-        cur.execute(sql, queries)
-        records = cur.fetchall()
+        records = await executor.fetch_all(sql, queries)
     except sqlite3.Error as error:
         await errors.log_error(
             strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
@@ -327,10 +443,11 @@ async def get_active_clan_reminders(clan_name: Optional[str] = None) -> tuple[Re
     else:
         sql = f'SELECT * FROM {table} WHERE clan_name=? AND end_time>? ORDER BY end_time'
     try:
-        cur = settings.NAVI_DB.cursor()
         current_time = utils.utcnow()
-        cur.execute(sql, (current_time,)) if clan_name is None else cur.execute(sql, (clan_name, current_time))
-        records = cur.fetchall()
+        if clan_name is None:
+            records = await executor.fetch_all(sql, (current_time,))
+        else:
+            records = await executor.fetch_all(sql, (clan_name, current_time))
     except sqlite3.Error as error:
         await errors.log_error(
             strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
@@ -349,46 +466,94 @@ async def get_active_clan_reminders(clan_name: Optional[str] = None) -> tuple[Re
     return tuple(reminders)
 
 
-async def get_due_user_reminders(user_id: Optional[int] = None) -> tuple[Reminder, ...]:
-    """Gets all reminders for all users or - if the argument user_id is set - for one user that are due within
-    the next 15 seconds.
+async def get_reminder_snapshot(user_id: int, clan_name: Optional[str] = None,
+                                partner_id: Optional[int] = None) -> ReminderSnapshot:
+    """Gets the active reminders of a user, the active reminders of their clan and the hunt reminder of their partner
+    with a single query.
+
+    Arguments
+    ---------
+    user_id: int
+    clan_name: str - Name of the clan of the user. No clan reminders are read if this is None.
+    partner_id: int - ID of the partner of the user. No partner reminder is read if this is None.
 
     Returns
     -------
-    Tuple[Reminder, ...]
+    ReminderSnapshot object. Unlike the other read functions, this doesn't raise NoDataFoundError if there are
+    no reminders.
+
     Raises
     ------
     sqlite3.Error if something happened within the database.
-    exceptions.NoDataFoundError if no cooldown was found.
     LookupError if something goes wrong reading the dict.
     Also logs all errors to the database.
     """
     table = 'reminders_users'
-    function_name = 'get_due_user_reminders'
-    if user_id is None:
-        sql = f'SELECT * FROM {table} WHERE triggered=? AND end_time BETWEEN ? AND ?'
-    else:
-        sql = f'SELECT * FROM {table} WHERE user_id=? AND triggered=? AND end_time BETWEEN ? AND ?'
+    function_name = 'get_reminder_snapshot'
+    sql = (
+        f'SELECT \'user\' AS snapshot_type, user_id, NULL AS clan_name, activity, channel_id, custom_id, end_time, '
+        f'message, triggered FROM {table} WHERE user_id = :user_id AND end_time > :current_time '
+        f'UNION ALL '
+        f'SELECT \'partner\', user_id, NULL, activity, channel_id, custom_id, end_time, message, triggered '
+        f'FROM {table} WHERE user_id = :partner_id AND activity = \'hunt\' '
+        f'UNION ALL '
+        f'SELECT \'clan\', NULL, clan_name, activity, channel_id, NULL, end_time, message, triggered '
+        f'FROM reminders_clans WHERE clan_name = :clan_name AND end_time > :current_time '
+        f'ORDER BY end_time'
+    )
+    parameters = {
+        'clan_name': clan_name,
+        'current_time': utils.utcnow(),
+        'partner_id': partner_id,
+        'user_id': user_id,
+    }
     try:
-        cur = settings.NAVI_DB.cursor()
-        current_time = utils.utcnow()
-        end_time = current_time + timedelta(seconds=15)
-        triggered = False
-        if user_id is None:
-            cur.execute(sql, (triggered, current_time, end_time))
-        else:
-            cur.execute(sql, (user_id, triggered, current_time, end_time))
-        records = cur.fetchall()
+        records = await executor.fetch_all(sql, parameters)
     except sqlite3.Error as error:
         await errors.log_error(
             strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
         )
         raise
+    snapshot_reminders: dict[str, list[Reminder]] = {'clan': [], 'partner': [], 'user': []}
+    for record in records:
+        record = dict(record)
+        snapshot_reminders[record.pop('snapshot_type')].append(await _dict_to_reminder(record))
 
-    if not records:
-        error_message = 'No due user reminders found in database.'
-        if user_id is not None: error_message = f'{error_message} User: {user_id}'
-        raise exceptions.NoDataFoundError(error_message)
+    return ReminderSnapshot(
+        clan_reminders = tuple(snapshot_reminders['clan']),
+        partner_hunt_reminder = snapshot_reminders['partner'][0] if snapshot_reminders['partner'] else None,
+        user_reminders = tuple(snapshot_reminders['user']),
+    )
+
+
+async def claim_due_user_reminders(due_time: datetime) -> tuple[Reminder, ...]:
+    """Sets all user reminders that are not triggered yet and end before due_time to triggered and returns them.
+    This includes reminders that ended less than CLAIM_GRACE_PERIOD ago, e.g. when the scheduler hands them over late.
+    Reminders that ended while the bot was offline are left to the delete_old_reminders task.
+    Uses a single statement, so every reminder can only be claimed once.
+
+    Returns
+    -------
+    Tuple[Reminder, ...]. Empty if no reminders were due.
+
+    Raises
+    ------
+    sqlite3.Error if something happened within the database.
+    LookupError if something goes wrong reading the dict.
+    Also logs all errors to the database.
+    """
+    table = 'reminders_users'
+    function_name = 'claim_due_user_reminders'
+    sql = f'UPDATE {table} SET triggered=? WHERE triggered=? AND end_time > ? AND end_time <= ? RETURNING *'
+    try:
+        records = await executor.fetch_all(
+            sql, (True, False, utils.utcnow() - CLAIM_GRACE_PERIOD, due_time), read_only=False
+        )
+    except sqlite3.Error as error:
+        await errors.log_error(
+            strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
+        )
+        raise
     reminders = []
     for record in records:
         reminder = await _dict_to_reminder(dict(record))
@@ -397,47 +562,34 @@ async def get_due_user_reminders(user_id: Optional[int] = None) -> tuple[Reminde
     return tuple(reminders)
 
 
-async def get_due_clan_reminders(clan_name: Optional[str] = None) -> tuple[Reminder, ...]:
-    """Gets all reminders for all clans or - if the argument clan_name is set - for one clan that are due within
-    the next 15 seconds.
+async def claim_due_clan_reminders(due_time: datetime) -> tuple[Reminder, ...]:
+    """Sets all clan reminders that are not triggered yet and end before due_time to triggered and returns them.
+    This includes reminders that ended less than CLAIM_GRACE_PERIOD ago, e.g. when the scheduler hands them over late.
+    Reminders that ended while the bot was offline are left to the delete_old_reminders task.
+    Uses a single statement, so every reminder can only be claimed once.
 
     Returns
     -------
-    Tuple[Reminder, ...]
+    Tuple[Reminder, ...]. Empty if no reminders were due.
 
     Raises
     ------
     sqlite3.Error if something happened within the database.
-    exceptions.NoDataFoundError if no cooldown was found.
     LookupError if something goes wrong reading the dict.
     Also logs all errors to the database.
     """
     table = 'reminders_clans'
-    function_name = 'get_due_clan_reminders'
-    if clan_name is None:
-        sql = f'SELECT * FROM {table} WHERE triggered=? AND end_time BETWEEN ? AND ?'
-    else:
-        sql = f'SELECT * FROM {table} WHERE clan_name=? AND triggered=? AND end_time BETWEEN ? AND ?'
+    function_name = 'claim_due_clan_reminders'
+    sql = f'UPDATE {table} SET triggered=? WHERE triggered=? AND end_time > ? AND end_time <= ? RETURNING *'
     try:
-        cur = settings.NAVI_DB.cursor()
-        current_time = utils.utcnow()
-        end_time  = current_time + timedelta(seconds=15)
-        triggered = False
-        if clan_name is None:
-            cur.execute(sql, (triggered, current_time, end_time))
-        else:
-            cur.execute(sql, (clan_name, triggered, current_time, end_time))
-        records = cur.fetchall()
+        records = await executor.fetch_all(
+            sql, (True, False, utils.utcnow() - CLAIM_GRACE_PERIOD, due_time), read_only=False
+        )
     except sqlite3.Error as error:
         await errors.log_error(
             strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
         )
         raise
-
-    if not records:
-        error_message = 'No due clan reminders found in database.'
-        if clan_name is not None: error_message = f'{error_message} Clan: {clan_name}'
-        raise exceptions.NoDataFoundError(error_message)
     reminders = []
     for record in records:
         reminder = await _dict_to_reminder(dict(record))
@@ -468,10 +620,11 @@ async def get_old_user_reminders(user_id: Optional[int] = None) -> tuple[Reminde
     else:
         sql = f'SELECT * FROM {table} WHERE user_id=? AND end_time < ?'
     try:
-        cur = settings.NAVI_DB.cursor()
         end_time = utils.utcnow() - timedelta(seconds=20)
-        cur.execute(sql, (end_time,)) if user_id is None else cur.execute(sql, (user_id, end_time))
-        records = cur.fetchall()
+        if user_id is None:
+            records = await executor.fetch_all(sql, (end_time,))
+        else:
+            records = await executor.fetch_all(sql, (user_id, end_time))
     except sqlite3.Error as error:
         await errors.log_error(
             strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
@@ -512,10 +665,11 @@ async def get_old_clan_reminders(clan_name: Optional[str] = None) -> tuple[Remin
     else:
         sql = f'SELECT * FROM {table} WHERE clan_name=? AND end_time < ?'
     try:
-        cur = settings.NAVI_DB.cursor()
         end_time = utils.utcnow() - timedelta(seconds=20)
-        cur.execute(sql, (end_time_str,)) if clan_name is None else cur.execute(sql, (clan_name, end_time))
-        records = cur.fetchall()
+        if clan_name is None:
+            records = await executor.fetch_all(sql, (end_time,))
+        else:
+            records = await executor.fetch_all(sql, (clan_name, end_time))
     except sqlite3.Error as error:
         await errors.log_error(
             strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
@@ -554,12 +708,11 @@ async def _delete_reminder(reminder: Reminder) -> None:
         sql = f'DELETE FROM {table} WHERE clan_name=? AND activity=?'
     if reminder.activity == 'custom': sql = f'{sql} AND custom_id=?'
     try:
-        cur = settings.NAVI_DB.cursor()
         reminder_id = reminder.user_id if reminder.reminder_type == 'user' else reminder.clan_name
         if reminder.activity == 'custom':
-            cur.execute(sql, (reminder_id, reminder.activity, reminder.custom_id))
+            await executor.execute(sql, (reminder_id, reminder.activity, reminder.custom_id))
         else:
-            cur.execute(sql, (reminder_id, reminder.activity))
+            await executor.execute(sql, (reminder_id, reminder.activity))
     except sqlite3.Error as error:
         await errors.log_error(
             strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
@@ -567,7 +720,7 @@ async def _delete_reminder(reminder: Reminder) -> None:
         raise
 
 
-async def _update_reminder(reminder: Reminder, **updated_settings) -> None:
+async def _update_reminder(reminder: Reminder, **updated_settings) -> Reminder | None:
     """Updates reminder record. Use Reminder.update() to trigger this function.
 
     Arguments
@@ -584,6 +737,10 @@ async def _update_reminder(reminder: Reminder, **updated_settings) -> None:
         triggered: bool
         user_id: int
 
+    Returns
+    -------
+    Reminder object with the updated record or None if the record doesn't exist.
+
     Raises
     ------
     sqlite3.Error if something happened within the database.
@@ -602,7 +759,6 @@ async def _update_reminder(reminder: Reminder, **updated_settings) -> None:
     triggered = False if time_left.total_seconds() > 15 else True
     if 'triggered' not in updated_settings: updated_settings['triggered'] = triggered
     try:
-        cur = settings.NAVI_DB.cursor()
         sql = f'UPDATE {table} SET'
         for updated_setting in updated_settings:
             sql = f'{sql} {updated_setting} = :{updated_setting},'
@@ -618,21 +774,23 @@ async def _update_reminder(reminder: Reminder, **updated_settings) -> None:
         if reminder.activity == 'custom':
             updated_settings['custom_id_old'] = reminder.custom_id
             sql = f'{sql} AND custom_id = :custom_id_old'
-        cur.execute(sql, updated_settings)
+        sql = f'{sql} RETURNING *'
+        record = await executor.fetch_one(sql, updated_settings, read_only=False)
     except sqlite3.Error as error:
         await errors.log_error(
             strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
         )
         raise
-    if triggered: scheduled_for_tasks[reminder.task_name] = reminder
+    if record is None: return None
+    return await _dict_to_reminder(dict(record))
 
 
 async def insert_user_reminder(user_id: int, activity: str, time_left: timedelta,
                                channel_id: int, message: str, overwrite_message: Optional[bool] = True) -> Reminder:
     """Inserts a user reminder record.
-    This function first checks if a reminder exists. If yes, the existing reminder will be updated instead and
-    no new record is inserted.
-    If end_time is less than 16 seconds in the future, this also creates a background task.
+    If a reminder of this activity exists, the existing reminder will be updated instead and no new record is inserted.
+    Reminders that aren't custom reminders are upserted with insert_user_reminders_bulk().
+    The reminder is added to the scheduler.
 
     Arguments
     ---------
@@ -647,80 +805,109 @@ async def insert_user_reminder(user_id: int, activity: str, time_left: timedelta
     sqlite3.Error if something happened within the database.
     Also logs all errors to the database.
     """
+    if activity != 'custom':
+        (reminder,) = await insert_user_reminders_bulk(user_id, channel_id, ((activity, time_left, message),),
+                                                       overwrite_message)
+        return reminder
     function_name = 'insert_user_reminder'
     table = 'reminders_users'
     end_time = (utils.utcnow() + time_left)
     end_time = end_time.replace(microsecond=999_999)
-    custom_id = None
     triggered = False if time_left.total_seconds() > 15 else True
+    # The custom ID is the lowest free ID of the user. It is calculated in the insert itself, so concurrent inserts
+    # can't pick the same ID. The primary key (user_id, activity, custom_id) keeps the IDs unique.
+    sql = (
+        f'INSERT INTO {table} (user_id, activity, end_time, channel_id, message, custom_id, triggered) '
+        f'SELECT :user_id, :activity, :end_time, :channel_id, :message, MIN(free_id), :triggered FROM ('
+        f'SELECT 1 AS free_id UNION ALL '
+        f'SELECT custom_id + 1 FROM {table} WHERE user_id = :user_id AND activity = :activity'
+        f') WHERE free_id NOT IN ('
+        f'SELECT custom_id FROM {table} WHERE user_id = :user_id AND activity = :activity AND custom_id IS NOT NULL'
+        f') RETURNING *'
+    )
     try:
-        cur = settings.NAVI_DB.cursor()
-        if activity == 'custom':
-            sql = f'SELECT custom_id FROM {table} WHERE user_id = ? AND activity = ? ORDER BY custom_id ASC'
-            cur.execute(sql, (user_id, 'custom',))
-            record_custom_reminders = cur.fetchall()
-            if not record_custom_reminders:
-                custom_id = 1
-            else:
-                highest_custom_id = record_custom_reminders[-1]['custom_id']
-                if highest_custom_id is None:
-                    custom_id = 1
-                else:
-                    if highest_custom_id > len(record_custom_reminders):
-                        reminder_count = 1
-                        for record in record_custom_reminders:
-                            if reminder_count == record['custom_id']:
-                                custom_id = reminder_count = reminder_count + 1
-                            else:
-                                custom_id = reminder_count
-                                break
-                    else:
-                        custom_id = highest_custom_id + 1
-
+        record = await executor.fetch_one(
+            sql,
+            {'user_id': user_id, 'activity': activity, 'end_time': end_time, 'channel_id': channel_id,
+             'message': message, 'triggered': triggered},
+            read_only=False
+        )
     except sqlite3.Error as error:
         await errors.log_error(
             strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
         )
         raise
-    reminder = None
-    if activity != 'custom':
-        try:
-            reminder = await get_user_reminder(user_id, activity)
-        except exceptions.NoDataFoundError:
-            pass
-    if reminder is not None:
-        if overwrite_message:
-            await reminder.update(end_time=end_time, channel_id=channel_id, message=message)
-        else:
-            await reminder.update(end_time=end_time, channel_id=channel_id)
-    else:
-        sql = (
-            f'INSERT INTO {table} (user_id, activity, end_time, channel_id, message, custom_id, triggered) '
-            f'VALUES (?, ?, ?, ?, ?, ?, ?)'
-        )
-        try:
-            cur.execute(sql, (user_id, activity, end_time, channel_id, message, custom_id, triggered))
-        except sqlite3.Error as error:
-            await errors.log_error(
-                strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
-            )
-            raise
-        reminder = await get_user_reminder(user_id, activity, custom_id)
-
-    # Create background task if necessary
-    if triggered:
-        scheduled_for_tasks[reminder.task_name] = reminder
-    else:
-        scheduled_for_deletion[reminder.task_name] = reminder
+    reminder = await _dict_to_reminder(dict(record))
+    await schedule_reminder(reminder)
 
     return reminder
 
 
+async def insert_user_reminders_bulk(user_id: int, channel_id: int, new_reminders: Iterable[tuple[str, timedelta, str]],
+                                     overwrite_message: Optional[bool] = True) -> tuple[Reminder, ...]:
+    """Inserts multiple user reminders with a single upsert. Existing reminders of the same activities are updated
+    the same way insert_user_reminder() updates them. All reminders are added to the scheduler in one step.
+    Custom reminders are not supported, use insert_user_reminder() for them.
+
+    Arguments
+    ---------
+    new_reminders: Iterable with tuples of (activity, time_left, message). If an activity appears more than once,
+    the last one is used.
+    overwrite_message: bool - If a reminder exists, this controls if the message gets updated or not.
+
+    Returns
+    -------
+    Tuple with the Reminder objects of all inserted or updated reminders.
+
+    Raises
+    ------
+    sqlite3.Error if something happened within the database.
+    ValueError if one of the activities is "custom".
+    Also logs all errors to the database.
+    """
+    function_name = 'insert_user_reminders_bulk'
+    table = 'reminders_users'
+    current_time = utils.utcnow()
+    reminder_values = {}
+    for activity, time_left, message in new_reminders:
+        if activity == 'custom':
+            raise ValueError('Custom reminders can not be inserted in bulk.')
+        end_time = (current_time + time_left).replace(microsecond=999_999)
+        triggered = False if time_left.total_seconds() > 15 else True
+        reminder_values[activity] = (user_id, activity, end_time, channel_id, message, triggered)
+    if not reminder_values: return ()
+    message_update = ', message = excluded.message' if overwrite_message else ''
+    sql = (
+        f'INSERT INTO {table} (user_id, activity, end_time, channel_id, message, custom_id, triggered) '
+        f'VALUES {", ".join(["(?, ?, ?, ?, ?, NULL, ?)"] * len(reminder_values))} '
+        f'ON CONFLICT (user_id, activity) WHERE custom_id IS NULL DO UPDATE SET '
+        f'end_time = excluded.end_time, channel_id = excluded.channel_id, triggered = excluded.triggered'
+        f'{message_update} '
+        f'RETURNING *'
+    )
+    try:
+        records = await executor.fetch_all(
+            sql, list(itertools.chain.from_iterable(reminder_values.values())), read_only=False
+        )
+    except sqlite3.Error as error:
+        await errors.log_error(
+            strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
+        )
+        raise
+    reminders = []
+    for record in records:
+        reminder = await _dict_to_reminder(dict(record))
+        reminders.append(reminder)
+    await schedule_multiple_reminders(reminders)
+
+    return tuple(reminders)
+
+
 async def insert_clan_reminder(clan_name: str, time_left: timedelta, channel_id: int, message: str) -> Reminder:
     """Inserts a clan reminder record.
     This function first checks if a reminder exists. If yes, the existing reminder will be updated instead and
     no new record is inserted.
-    If end_time is less than 16 seconds in the future, this also creates a background task.
+    The reminder is added to the scheduler.
 
     Returns
     -------
@@ -745,28 +932,25 @@ async def insert_clan_reminder(clan_name: str, time_left: timedelta, channel_id:
     else:
         sql = (
             f'INSERT INTO {table} (clan_name, activity, end_time, channel_id, message, triggered) '
-            f'VALUES (?, ?, ?, ?, ?, ?)'
+            f'VALUES (?, ?, ?, ?, ?, ?) RETURNING *'
         )
         try:
-            cur = settings.NAVI_DB.cursor()
-            cur.execute(sql, (clan_name, 'guild', end_time, channel_id, message, triggered))
+            record = await executor.fetch_one(
+                sql, (clan_name, 'guild', end_time, channel_id, message, triggered), read_only=False
+            )
         except sqlite3.Error as error:
             await errors.log_error(
                 strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
             )
             raise
-        reminder = await get_clan_reminder(clan_name)
-    # Create background task if necessary
-    if triggered:
-        scheduled_for_tasks[reminder.task_name] = reminder
-    else:
-        scheduled_for_deletion[reminder.task_name] = reminder
+        reminder = await _dict_to_reminder(dict(record))
+        await schedule_reminder(reminder)
     return reminder
 
 
 async def reduce_reminder_time(user_settings, time_reduction: Union[timedelta, str], activities: list[str]) -> None:
     """Reduces the end time of all user reminders affected by sleepy potions of one user by a certain amount.
-    If the new end time is within the next 15 seconds, the reminder is immediately scheduled.
+    The scheduler picks up the new end times.
     If the new end time is in the past, the reminder is deleted.
 
     Arguments
@@ -822,18 +1006,16 @@ async def reduce_reminder_time(user_settings, time_reduction: Union[timedelta, s
                 reminder_message = user_settings.alert_hunt.message.replace('{command}', last_hunt_mode)
             await user_settings.update(last_hunt_mode=last_hunt_mode)
         if time_left.total_seconds() <= 0:
-            scheduled_for_deletion[reminder.task_name] = reminder
             await reminder.delete()
         elif 1 <= time_left.total_seconds() <= 15:
             await reminder.update(end_time=new_end_time, triggered=True, message=reminder_message)
-            scheduled_for_tasks[reminder.task_name] = reminder
         else:
             await reminder.update(end_time=new_end_time, message=reminder_message)
 
 
 async def reduce_reminder_time_percentage(user_settings, percentage: float, activities: list[str]) -> None:
     """Reduces the end time of user reminders by a certain percentage of the cooldown.
-    If the new end time is within the next 15 seconds, the reminder is immediately scheduled.
+    The scheduler picks up the new end times.
     If the new end time is in the past, the reminder is deleted.
     Note that the percentage is calculated based on the full cooldown.
 
@@ -845,13 +1027,9 @@ async def reduce_reminder_time_percentage(user_settings, percentage: float, acti
     """
     current_time = utils.utcnow()
     if 'hunt' in activities and user_settings.hunt_end_time > current_time:
-        cooldown = await cooldowns.get_cooldown('hunt')
+        cooldown_times = await cooldowns.get_cooldown_times('hunt')
         user_donor_tier = 3 if user_settings.user_donor_tier > 3 else user_settings.user_donor_tier
-        if cooldown.donor_affected:
-            cooldown_seconds = (cooldown.actual_cooldown_mention()
-                                * settings.DONOR_COOLDOWNS[user_donor_tier])
-        else:
-            cooldown_seconds = cooldown.actual_cooldown_mention()
+        cooldown_seconds = cooldown_times.mention[user_donor_tier]
         time_left = user_settings.hunt_end_time - current_time
         time_left_new_seconds = time_left.total_seconds() - (cooldown_seconds * ((percentage) / 100))
         time_left_new = timedelta(seconds=time_left_new_seconds)
@@ -863,32 +1041,24 @@ async def reduce_reminder_time_percentage(user_settings, percentage: float, acti
         return
     for reminder in reminders:
         if reminder.activity not in activities: continue
-        cooldown = await cooldowns.get_cooldown(reminder.activity)
+        cooldown_times = await cooldowns.get_cooldown_times(reminder.activity)
         user_donor_tier = 3 if user_settings.user_donor_tier > 3 else user_settings.user_donor_tier
-        if cooldown.donor_affected:
-            cooldown_seconds = (cooldown.actual_cooldown_mention()
-                                * settings.DONOR_COOLDOWNS[user_donor_tier])
-        else:
-            cooldown_seconds = cooldown.actual_cooldown_mention()
+        cooldown_seconds = cooldown_times.mention[user_donor_tier]
         time_left = reminder.end_time - current_time
         time_left_new_seconds = time_left.total_seconds() - (cooldown_seconds * ((percentage) / 100))
         time_left_new = timedelta(seconds=time_left_new_seconds)
         new_end_time = current_time + time_left_new
         if time_left_new_seconds <= 0:
-            reminder.end_time = current_time + timedelta(seconds=1)
-            scheduled_for_tasks[reminder.task_name] = reminder
-            scheduled_for_deletion[reminder.task_name] = reminder
             await reminder.delete()
         elif 1 <= time_left.total_seconds() <= 15:
             await reminder.update(end_time=new_end_time, triggered=True)
-            scheduled_for_tasks[reminder.task_name] = reminder
         else:
             await reminder.update(end_time=new_end_time)
 
 
 async def increase_reminder_time_percentage(user_settings, percentage: float, activities: list[str]) -> None:
     """Increases the end time of user reminders by a certain percentage of the cooldown.
-    Doesn't affect reminders already scheduled.
+    Cancels running tasks of affected reminders, the scheduler creates new ones when they are due.
     Note that the percentage is calculated based on the full cooldown.
 
     Arguments
@@ -904,13 +1074,9 @@ async def increase_reminder_time_percentage(user_settings, percentage: float, ac
     """
     current_time = utils.utcnow()
     if 'hunt' in activities and user_settings.hunt_end_time > current_time:
-        cooldown = await cooldowns.get_cooldown('hunt')
+        cooldown_times = await cooldowns.get_cooldown_times('hunt')
         user_donor_tier = 3 if user_settings.user_donor_tier > 3 else user_settings.user_donor_tier
-        if cooldown.donor_affected:
-            cooldown_seconds = (cooldown.actual_cooldown_mention()
-                                * settings.DONOR_COOLDOWNS[user_donor_tier])
-        else:
-            cooldown_seconds = cooldown.actual_cooldown_mention()
+        cooldown_seconds = cooldown_times.mention[user_donor_tier]
         time_left = user_settings.hunt_end_time - current_time
         time_left_new_seconds = time_left.total_seconds() + (cooldown_seconds * ((percentage) / 100))
         time_left_new = timedelta(seconds=time_left_new_seconds)
@@ -922,17 +1088,11 @@ async def increase_reminder_time_percentage(user_settings, percentage: float, ac
         return
     for reminder in reminders:
         if reminder.activity not in activities: continue
-        cooldown = await cooldowns.get_cooldown(reminder.activity)
+        cooldown_times = await cooldowns.get_cooldown_times(reminder.activity)
         user_donor_tier = 3 if user_settings.user_donor_tier > 3 else user_settings.user_donor_tier
-        if cooldown.donor_affected:
-            cooldown_seconds = (cooldown.actual_cooldown_mention()
-                                * settings.DONOR_COOLDOWNS[user_donor_tier])
-        else:
-            cooldown_seconds = cooldown.actual_cooldown_mention()
+        cooldown_seconds = cooldown_times.mention[user_donor_tier]
         time_left = reminder.end_time - current_time
         time_left_new_seconds = time_left.total_seconds() + (cooldown_seconds * ((percentage) / 100))
         time_left_new = timedelta(seconds=time_left_new_seconds)
         new_end_time = current_time + time_left_new
-        if reminder.triggered:
-            scheduled_for_deletion[reminder.task_name] = reminder
         await reminder.update(end_time=new_end_time, triggered=False)
\ No newline at end of file
@@ -4,47 +4,80 @@
 
 from argparse import ArgumentError
 import sqlite3
-from typing import Any
+from typing import Any, Awaitable, Callable
 
-from database import errors
-from resources import exceptions, settings, strings
+from database import errors, executor
+from resources import exceptions, strings
 
 
-# Read Data
-async def get_settings() -> dict[str, str]:
-    """Returns all setting from table "settings".
+# Settings registry
+# The settings are loaded once and kept up to date by update_setting(). Handlers registered with
+# register_setting_handler() are called with the name and the new value whenever a setting changes.
+SettingHandler = Callable[[str, str], Awaitable[None]]
+_SETTINGS: dict[str, str] = {}
+_SETTING_HANDLERS: dict[str, list[SettingHandler]] = {}
+_settings_loaded: bool = False
+
+
+def register_setting_handler(name: str, handler: SettingHandler) -> None:
+    """Registers a handler that is called with the name and the new value when the setting changes"""
+    _SETTING_HANDLERS.setdefault(name, []).append(handler)
 
-    Returns:
-       dict with all settings.
+
+def unregister_setting_handler(name: str, handler: SettingHandler) -> None:
+    """Removes a handler registered with register_setting_handler()"""
+    handlers: list[SettingHandler] = _SETTING_HANDLERS.get(name, [])
+    if handler in handlers: handlers.remove(handler)
+
+
+async def _load_settings() -> None:
+    """Loads all settings from table "settings" into the settings registry.
 
     Raises:
         sqlite3.Error if something goes wrong.
-        NoDataFound if no data was found.
     """
+    global _settings_loaded
     table = 'settings'
-    function_name = 'get_settings'
+    function_name = '_load_settings'
     sql = f'SELECT * FROM {table}'
     try:
-        cur=settings.NAVI_DB.cursor()
-        cur.execute(sql)
-        records = cur.fetchall()
+        records = await executor.fetch_all(sql)
     except sqlite3.Error as error:
         await errors.log_error(
             strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
         )
         raise
-    if not records:
+    _SETTINGS.clear()
+    _SETTINGS.update(dict(records))
+    _settings_loaded = True
+
+
+# Read Data
+async def get_settings() -> dict[str, str]:
+    """Returns all setting from table "settings". The settings are read from the settings registry, only the first
+    call reads the table.
+
+    Returns:
+       dict with all settings.
+
+    Raises:
+        sqlite3.Error if something goes wrong.
+        NoDataFound if no data was found.
+    """
+    if not _settings_loaded: await _load_settings()
+    if not _SETTINGS:
         await errors.log_error(
-            strings.INTERNAL_ERROR_NO_DATA_FOUND.format(table=table, function=function_name, sql=sql)
+            strings.INTERNAL_ERROR_NO_DATA_FOUND.format(table='settings', function='get_settings',
+                                                        sql='SELECT * FROM settings')
         )
         raise exceptions.NoDataFoundError('No settings not found in database.')
 
-    return dict(records)
+    return dict(_SETTINGS)
 
 
 # Write Data
 async def update_setting(name: str, value: Any) -> None:
-    """Updates a setting record.
+    """Updates a setting record and the settings registry. Calls the handlers of the setting if the value changed.
 
     Arguments
     ---------
@@ -62,18 +95,27 @@ async def update_setting(name: str, value: Any) -> None:
     if name is None or value is None:
         await errors.log_error(f'Function {function_name} needs at least one defined argument.')
         raise ArgumentError(None, 'Arguments can\'t be None.')
-    cur = settings.NAVI_DB.cursor()
-    all_settings = await get_settings()
-    setting = all_settings.get(name, 'No record')
+    if not _settings_loaded: await _load_settings()
     try:
-        if setting == 'No record':
-            sql = f'INSERT INTO {table} (name, value) VALUES (?, ?)'
-            cur.execute(sql, (name, value))
+        if name not in _SETTINGS:
+            sql = f'INSERT INTO {table} (name, value) VALUES (?, ?) RETURNING value'
+            record = await executor.fetch_one(sql, (name, value), read_only=False)
         else:
-            sql = f'UPDATE {table} SET value = ? WHERE name = ?'
-            cur.execute(sql, (value, name))
+            sql = f'UPDATE {table} SET value = ? WHERE name = ? RETURNING value'
+            record = await executor.fetch_one(sql, (value, name), read_only=False)
     except sqlite3.Error as error:
         await errors.log_error(
             strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
         )
-        raise
\ No newline at end of file
+        raise
+    old_value: str | None = _SETTINGS.get(name, None)
+    _SETTINGS[name] = record['value']
+    if old_value == _SETTINGS[name]: return
+    handler: SettingHandler
+    for handler in list(_SETTING_HANDLERS.get(name, [])):
+        try:
+            await handler(name, _SETTINGS[name])
+        except Exception as error:
+            await errors.log_error(
+                f'Error in setting handler.\nFunction: {function_name}\nSetting: {name}\nError: {error}'
+            )
@@ -10,8 +10,24 @@ from typing import NamedTuple, Optional
 from discord import utils
 from discord.ext import tasks
 
-from database import errors, users
-from resources import exceptions, settings, strings
+from database import errors, executor
+from resources import exceptions, logs, settings, strings
+
+
+# Leaderboard
+# The counters in "tracking_leaderboard" are increased with every new log entry. log_to_leaderboard() subtracts the
+# entries that left a timeframe since its last run, so it only reads the log entries of these short time ranges.
+LEADERBOARD_TIMEFRAMES: dict[str, timedelta] = {
+    'last_1h': timedelta(hours=1),
+    'last_12h': timedelta(hours=12),
+    'last_24h': timedelta(hours=24),
+    'last_7d': timedelta(days=7),
+    'last_4w': timedelta(weeks=4),
+    'last_1y': timedelta(weeks=52),
+}
+# Summary entries are stored at the last microsecond of their day, but leave a timeframe with the start of their day
+_SUMMARY_TIME_OFFSET: timedelta = timedelta(days=1, microseconds=-1)
+_leaderboard_updated: Optional[datetime] = None # Time up to which the leaderboard timeframes are current
 
 
 # Containers
@@ -40,16 +56,18 @@ class LogEntry():
             await errors.log_error(error_message)
             raise exceptions.RecordExistsError(error_message)
 
-    async def refresh(self) -> None:
+    async def refresh(self, new_settings: Optional['LogEntry'] = None) -> None:
         """Refreshes the log entry from the database.
+        If new_settings is passed, the values are copied from there instead of reading the record.
         If the record doesn't exist anymore, "record_exists" will be set to False.
         All other values will stay on their old values before deletion (!).
         """
-        try:
-            new_settings = await get_log_entry(self.user_id, self.guild_id, self.command, self.date_time)
-        except exceptions.NoDataFoundError as error:
-            self.record_exists = False
-            return
+        if new_settings is None:
+            try:
+                new_settings = await get_log_entry(self.user_id, self.guild_id, self.command, self.date_time)
+            except exceptions.NoDataFoundError as error:
+                self.record_exists = False
+                return
         self.command = new_settings.command
         self.command_count = new_settings.command_count
         self.entry_type = new_settings.entry_type
@@ -58,7 +76,7 @@ class LogEntry():
         self.user_id = new_settings.user_id
 
     async def update(self, **updated_settings) -> None:
-        """Updates the log entry record in the database. Also calls refresh().
+        """Updates the log entry record in the database and applies the updated record returned by the database.
 
         Arguments
         ---------
@@ -69,8 +87,11 @@ class LogEntry():
             entry_type: Literal['single', 'summary']
             guild_id: int
         """
-        await _update_log_entry(self, **updated_settings)
-        await self.refresh()
+        updated_log_entry = await _update_log_entry(self, **updated_settings)
+        if updated_log_entry is None:
+            self.record_exists = False
+        else:
+            await self.refresh(updated_log_entry)
 
 class LogReport(NamedTuple):
     """Object that represents a report based on a certain amount of log entries."""
@@ -98,9 +119,10 @@ class LogLeaderboardUser():
     last_24h: int
     last_7d: int
     last_4w: int
-    last_12m: int
-    updated: int
+    last_1y: int
+    updated: datetime
     user_id: int
+    record_exists: bool = True
 
     async def refresh(self) -> None:
         """Refreshes leaderboard user data from the database.
@@ -121,7 +143,7 @@ class LogLeaderboardUser():
         self.last_24h = new_settings.last_24h
         self.last_7d = new_settings.last_7d
         self.last_4w = new_settings.last_4w
-        self.last_12m = new_settings.last_12m
+        self.last_1y = new_settings.last_1y
         self.updated = new_settings.updated
         self.user_id = new_settings.user_id
 
@@ -149,40 +171,16 @@ class LogLeaderboardUser():
 # Tasks
 @tasks.loop(minutes=5.0)
 async def log_to_leaderboard():
-    """Task that converts the tracking log entries into leaderboard entries"""
-    async def count_commands(log_entries: tuple[LogEntry, ...]) -> dict:
-        """Returns dict with total command count for each guild for a tuple of log entries
+    """Task that removes log entries that left a timeframe from the leaderboard counters.
+    The leaderboard is rebuilt from the log on the first run."""
+    global _leaderboard_updated
+    current_time = utils.utcnow()
+    if _leaderboard_updated is None:
+        await rebuild_log_leaderboard(current_time)
+    else:
+        await _remove_expired_log_entries_from_leaderboard(_leaderboard_updated, current_time)
+    _leaderboard_updated = current_time
 
-        Returns
-        ---------
-        dict with command count per guild
-        key: value --> guild_id: command count
-        """
-        guild_command_count = {}
-        for log_entry in log_entries:
-            if log_entry.guild_id in guild_command_count:
-                guild_command_count[log_entry.guild_id] += log_entry.command_count
-            else:
-                guild_command_count[log_entry.guild_id] = log_entry.command_count
-        return guild_command_count
-
-    all_users: users.User = await users.get_all_users()
-    for user in all_users:
-        log_entries_1h = await get_log_entries(user.user_id, 'hunt', timedelta(hours=1))
-        count_1h = await count_commands(log_entries_1h)
-        log_entries_12h = await get_log_entries(user.user_id, 'hunt', timedelta(hours=12))
-        count_12h = await count_commands(log_entries_12h)
-        log_entries_24h = await get_log_entries(user.user_id, 'hunt', timedelta(hours=24))
-        count_24h = await count_commands(log_entries_24h)
-        log_entries_7d = await get_log_entries(user.user_id, 'hunt', timedelta(days=7))
-        count_7d = await count_commands(log_entries_7d)
-        log_entries_4w = await get_log_entries(user.user_id, 'hunt', timedelta(weeks=4))
-        count_4w = await count_commands(log_entries_4w)
-        log_entries_1y = await get_log_entries(user.user_id, 'hunt', timedelta(weeks=52))
-        count_1y = await count_commands(log_entries_1y)
-        for guild_id in count_1h:
-            pass
-        await insert_log_leaderboard_user(user.user_id, )
 
 # Miscellaneous functions
 async def _dict_to_log_entry(record: dict) -> LogEntry:
@@ -219,7 +217,7 @@ async def _dict_to_log_entry(record: dict) -> LogEntry:
     return log_entry
 
 
-async def _dict_to_leaderboard_user(record: dict) -> LogEntry:
+async def _dict_to_leaderboard_user(record: dict) -> LogLeaderboardUser:
     """Creates a LogLeaderboardUser object from a database record
 
     Arguments
@@ -238,16 +236,16 @@ async def _dict_to_leaderboard_user(record: dict) -> LogEntry:
     try:
         log_leaderboard_user = LogLeaderboardUser(
             all_time =  record['all_time'],
-            command = record['commmand'],
+            command = record['command'],
             guild_id = record['guild_id'],
             last_1h = record['last_1h'],
             last_12h = record['last_12h'],
             last_24h = record['last_24h'],
             last_7d = record['last_7d'],
             last_4w = record['last_4w'],
-            last_12m = record['last_12m'],
+            last_1y = record['last_1y'],
             report_type = 'global' if record['guild_id'] is None else 'guild',
-            updated = record['updated'],
+            updated = record['updated'].replace(tzinfo=timezone.utc),
             user_id = record['user_id'],
         )
 
@@ -280,9 +278,7 @@ async def get_log_entry(user_id: int, guild_id: int, command: str, date_time: da
     function_name = 'get_log_entry'
     sql = f'SELECT * FROM {table} WHERE user_id=? AND guild_id=? AND command=? AND date_time=? AND type=?'
     try:
-        cur = settings.NAVI_DB.cursor()
-        cur.execute(sql, (user_id, guild_id, command, date_time, entry_type))
-        record = cur.fetchone()
+        record = await executor.fetch_one(sql, (user_id, guild_id, command, date_time, entry_type))
     except sqlite3.Error as error:
         await errors.log_error(
             strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
@@ -328,12 +324,10 @@ async def get_log_entries(user_id: int, command: str, timeframe: timedelta,
     date_time = utils.utcnow() - timeframe
     if guild_id is not None: sql = f'{sql} AND guild_id=?'
     try:
-        cur = settings.NAVI_DB.cursor()
         if guild_id is None:
-            cur.execute(sql, (user_id, date_time, command))
+            records = await executor.fetch_all(sql, (user_id, date_time, command))
         else:
-            cur.execute(sql, (user_id, date_time, command, guild_id))
-        records = cur.fetchall()
+            records = await executor.fetch_all(sql, (user_id, date_time, command, guild_id))
     except sqlite3.Error as error:
         await errors.log_error(
             strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
@@ -375,9 +369,7 @@ async def get_all_log_entries(user_id: int) -> tuple[LogEntry, ...]:
         f'SELECT * FROM {table} WHERE user_id=?'
     )
     try:
-        cur = settings.NAVI_DB.cursor()
-        cur.execute(sql, (user_id,))
-        records = cur.fetchall()
+        records = await executor.fetch_all(sql, (user_id,))
     except sqlite3.Error as error:
         await errors.log_error(
             strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
@@ -422,9 +414,7 @@ async def get_old_log_entries(days: int) -> tuple[LogEntry, ...]:
     date_time = utils.utcnow() - timedelta(days=days)
     date_time = date_time.replace(hour=0, minute=0, second=0)
     try:
-        cur = settings.NAVI_DB.cursor()
-        cur.execute(sql, (date_time, 'single'))
-        records = cur.fetchall()
+        records = await executor.fetch_all(sql, (date_time, 'single'))
     except sqlite3.Error as error:
         await errors.log_error(
             strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
@@ -441,10 +431,42 @@ async def get_old_log_entries(days: int) -> tuple[LogEntry, ...]:
     return tuple(log_entries)
 
 
+def _get_log_report_ranges(timeframe: timedelta) -> list[tuple[str, datetime, Optional[datetime]]]:
+    """Splits the timeframe up to now into the ranges get_log_report() reads from each table.
+    Full days are read from "tracking_log_daily", full hours from "tracking_log_hourly" and only the partial hours at
+    the start and the end from "tracking_log".
+
+    Returns
+    -------
+    List of tuples (table, start, end). The end of the last range is None.
+    """
+    current_time = utils.utcnow()
+    start_time = current_time - timeframe
+    first_hour = start_time.replace(minute=0, second=0, microsecond=0)
+    if first_hour < start_time: first_hour += timedelta(hours=1)
+    if first_hour > current_time: return [('tracking_log', start_time, None)]
+    first_day = start_time.replace(hour=0, minute=0, second=0, microsecond=0)
+    if first_day < start_time: first_day += timedelta(days=1)
+    last_day = current_time.replace(hour=0, minute=0, second=0, microsecond=0)
+    last_hour = current_time.replace(minute=0, second=0, microsecond=0)
+    ranges = [('tracking_log', start_time, first_hour)]
+    if first_day < last_day:
+        ranges += [
+            ('tracking_log_hourly', first_hour, first_day),
+            ('tracking_log_daily', first_day, last_day),
+            ('tracking_log_hourly', last_day, last_hour),
+        ]
+    else:
+        ranges.append(('tracking_log_hourly', first_hour, last_hour))
+    ranges.append(('tracking_log', last_hour, None))
+    return [log_range for log_range in ranges if log_range[2] is None or log_range[1] < log_range[2]]
+
+
 async def get_log_report(user_id: int, timeframe: timedelta,
                          guild_id: Optional[int] = None) -> LogReport:
     """Gets a summary log report for all commands for a certain amount of time from a user id.
     If the guild_id is specified, the report is limited to that guild.
+    The report is read from the hourly and daily rollups wherever they cover the timeframe.
 
     Returns
     -------
@@ -458,17 +480,22 @@ async def get_log_report(user_id: int, timeframe: timedelta,
     """
     table = 'tracking_log'
     function_name = 'get_log_report'
-    sql = f'SELECT command, SUM(command_count) FROM {table} WHERE user_id=? AND date_time>=?'
-    date_time = utils.utcnow() - timeframe
-    if guild_id is not None: sql = f'{sql} AND guild_id=?'
-    sql = f'{sql} GROUP BY command'
+    parameters = {'user_id': user_id, 'guild_id': guild_id}
+    selects = []
+    for index, (range_table, range_start, range_end) in enumerate(_get_log_report_ranges(timeframe)):
+        range_sql = (
+            f'SELECT command, command_count FROM {range_table} WHERE user_id = :user_id '
+            f'AND date_time >= :start_{index}'
+        )
+        parameters[f'start_{index}'] = range_start
+        if range_end is not None:
+            range_sql = f'{range_sql} AND date_time < :end_{index}'
+            parameters[f'end_{index}'] = range_end
+        if guild_id is not None: range_sql = f'{range_sql} AND guild_id = :guild_id'
+        selects.append(range_sql)
+    sql = f'SELECT command, SUM(command_count) FROM ({" UNION ALL ".join(selects)}) GROUP BY command'
     try:
-        cur = settings.NAVI_DB.cursor()
-        if guild_id is None:
-            cur.execute(sql, (user_id, date_time))
-        else:
-            cur.execute(sql, (user_id, date_time, guild_id))
-        records = cur.fetchall()
+        records = await executor.fetch_all(sql, parameters)
     except sqlite3.Error as error:
         await errors.log_error(
             strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
@@ -526,9 +553,7 @@ async def get_log_leaderboard_user(user_id: int, guild_id: int, command: str) ->
     function_name = 'get_log_leaderboard_user'
     sql = f'SELECT * FROM {table} WHERE user_id=? AND guild_id=? AND command=?'
     try:
-        cur = settings.NAVI_DB.cursor()
-        cur.execute(sql, (user_id, guild_id, command))
-        record = cur.fetchone()
+        record = await executor.fetch_one(sql, (user_id, guild_id, command))
     except sqlite3.Error as error:
         await errors.log_error(
             strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
@@ -568,9 +593,10 @@ async def get_log_leaderboard(command: str, guild_id: Optional[int] = None) -> t
     sql = f'SELECT * FROM {table} WHERE command=?'
     if guild_id is not None: sql = f'{sql} AND guild_id=?'
     try:
-        cur = settings.NAVI_DB.cursor()
-        cur.execute(sql, (command,)) if guild_id is None else cur.execute(sql, (command, guild_id))
-        records = cur.fetchall()
+        if guild_id is None:
+            records = await executor.fetch_all(sql, (command,))
+        else:
+            records = await executor.fetch_all(sql, (command, guild_id))
     except sqlite3.Error as error:
         await errors.log_error(
             strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
@@ -602,9 +628,8 @@ async def _delete_log_entry(log_entry: LogEntry) -> None:
     function_name = '_delete_log_entry'
     sql = f'DELETE FROM {table} WHERE user_id=? AND guild_id=? AND command=? AND date_time=? AND type=?'
     try:
-        cur = settings.NAVI_DB.cursor()
-        cur.execute(sql, (log_entry.user_id, log_entry.guild_id, log_entry.command, log_entry.date_time,
-                          log_entry.entry_type))
+        await executor.execute(sql, (log_entry.user_id, log_entry.guild_id, log_entry.command, log_entry.date_time,
+                                     log_entry.entry_type))
     except sqlite3.Error as error:
         await errors.log_error(
             strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
@@ -637,7 +662,7 @@ async def _update_log_leaderboard_user(log_leaderboard_user: LogLeaderboardUser,
     NoArgumentsError if no updated_settings are passed (need to pass at least one)
     Also logs all errors to the database.
     """
-    table = 'log_leaderboard'
+    table = 'tracking_leaderboard'
     function_name = '_update_log_leaderboard_user'
     if not updated_settings:
         await errors.log_error(
@@ -647,7 +672,6 @@ async def _update_log_leaderboard_user(log_leaderboard_user: LogLeaderboardUser,
     if 'updated' not in updated_settings:
         updated_settings['updated'] = utils.utcnow()
     try:
-        cur = settings.NAVI_DB.cursor()
         sql = f'UPDATE {table} SET'
         for updated_setting in updated_settings:
             sql = f'{sql} {updated_setting} = :{updated_setting},'
@@ -656,7 +680,7 @@ async def _update_log_leaderboard_user(log_leaderboard_user: LogLeaderboardUser,
         updated_settings['guild_id_old'] = log_leaderboard_user.guild_id
         updated_settings['command_old'] = log_leaderboard_user.command
         sql = f'{sql} WHERE user_id = :user_id_old AND guild_id = :guild_id_old AND command = :command_old'
-        cur.execute(sql, updated_settings)
+        await executor.execute(sql, updated_settings)
     except sqlite3.Error as error:
         await errors.log_error(
             strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
@@ -664,7 +688,7 @@ async def _update_log_leaderboard_user(log_leaderboard_user: LogLeaderboardUser,
         raise
 
 
-async def _update_log_entry(log_entry: LogEntry, **updated_settings) -> None:
+async def _update_log_entry(log_entry: LogEntry, **updated_settings) -> LogEntry | None:
     """Updates tracking_log record. Use LogEntry.update() to trigger this function.
 
     Arguments
@@ -678,6 +702,10 @@ async def _update_log_entry(log_entry: LogEntry, **updated_settings) -> None:
         guild_id: int
         user_id: int
 
+    Returns
+    -------
+    LogEntry object with the updated record or None if the record doesn't exist.
+
     Raises
     ------
     sqlite3.Error if something happened within the database.
@@ -692,7 +720,6 @@ async def _update_log_entry(log_entry: LogEntry, **updated_settings) -> None:
         )
         raise exceptions.NoArgumentsError('You need to specify at least one keyword argument.')
     try:
-        cur = settings.NAVI_DB.cursor()
         sql = f'UPDATE {table} SET'
         for updated_setting in updated_settings:
             sql = f'{sql} {updated_setting} = :{updated_setting},'
@@ -703,19 +730,74 @@ async def _update_log_entry(log_entry: LogEntry, **updated_settings) -> None:
         updated_settings['entry_type_old'] = log_entry.entry_type
         sql = (
             f'{sql} WHERE user_id = :user_id_old AND type = :entry_type_old AND command = :command_old '
-            f'AND date_time = :date_time_old'
+            f'AND date_time = :date_time_old RETURNING *'
         )
-        cur.execute(sql, updated_settings)
+        record = await executor.fetch_one(sql, updated_settings, read_only=False)
     except sqlite3.Error as error:
         await errors.log_error(
             strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
         )
         raise
+    if record is None: return None
+    return await _dict_to_log_entry(dict(record))
+
+
+_LEADERBOARD_COLUMNS = ['all_time'] + list(LEADERBOARD_TIMEFRAMES.keys())
+_SQL_INSERT_LOG_ENTRY = (
+    'INSERT INTO tracking_log (user_id, guild_id, command, command_count, date_time) VALUES (?, ?, ?, ?, ?) '
+    'RETURNING *'
+)
+_SQL_INCREASE_LEADERBOARD_USER = (
+    f'INSERT INTO tracking_leaderboard (user_id, guild_id, command, {", ".join(_LEADERBOARD_COLUMNS)}, updated) '
+    f'VALUES (:user_id, :guild_id, :command, {", ".join([":amount"] * len(_LEADERBOARD_COLUMNS))}, :updated) '
+    f'ON CONFLICT (user_id, guild_id, command) DO UPDATE SET '
+    f'{", ".join([f"{column} = {column} + :amount" for column in _LEADERBOARD_COLUMNS])}, updated = :updated'
+)
+_SQL_INCREASE_LOG_HOURLY = (
+    'INSERT INTO tracking_log_hourly (user_id, guild_id, command, date_time, command_count) VALUES (?, ?, ?, ?, ?) '
+    'ON CONFLICT (user_id, date_time, guild_id, command) DO UPDATE SET '
+    'command_count = command_count + excluded.command_count'
+)
+_SQL_INCREASE_LOG_DAILY = (
+    'INSERT INTO tracking_log_daily (user_id, guild_id, command, date_time, command_count) VALUES (?, ?, ?, ?, ?) '
+    'ON CONFLICT (user_id, date_time, guild_id, command) DO UPDATE SET '
+    'command_count = command_count + excluded.command_count'
+)
+
+
+def _insert_log_entry(user_id: int, guild_id: int, command: str, date_time: datetime) -> sqlite3.Row:
+    """Inserts a single log entry and increases the counters of the user in the tables "tracking_leaderboard",
+    "tracking_log_hourly" and "tracking_log_daily" in a single transaction. Runs on the write thread.
+
+    Returns
+    -------
+    The inserted record.
+    """
+    date_time_utc = date_time.astimezone(timezone.utc)
+    hour_start = date_time_utc.replace(minute=0, second=0, microsecond=0)
+    day_start = hour_start.replace(hour=0)
+    cur: sqlite3.Cursor = settings.NAVI_DB.cursor()
+    cur.execute('BEGIN IMMEDIATE')
+    try:
+        cur.execute(_SQL_INSERT_LOG_ENTRY, (user_id, guild_id, command, 1, date_time))
+        record = cur.fetchone()
+        cur.execute(
+            _SQL_INCREASE_LEADERBOARD_USER,
+            {'user_id': user_id, 'guild_id': guild_id, 'command': command, 'amount': 1, 'updated': utils.utcnow()}
+        )
+        cur.execute(_SQL_INCREASE_LOG_HOURLY, (user_id, guild_id, command, hour_start, 1))
+        cur.execute(_SQL_INCREASE_LOG_DAILY, (user_id, guild_id, command, day_start, 1))
+        cur.execute('COMMIT')
+    except:
+        cur.execute('ROLLBACK')
+        raise
+    return record
 
 
 async def insert_log_entry(user_id: int, guild_id: int,
                            command: str, date_time: datetime) -> LogEntry:
-    """Inserts a single record to the table "tracking_log".
+    """Inserts a single record to the table "tracking_log". Also increases the counters of the user in the tables
+    "tracking_leaderboard", "tracking_log_hourly" and "tracking_log_daily". All four writes run in one transaction.
 
     Returns
     -------
@@ -728,18 +810,15 @@ async def insert_log_entry(user_id: int, guild_id: int,
     """
     function_name = 'insert_log_entry'
     table = 'tracking_log'
-    sql = (
-        f'INSERT INTO {table} (user_id, guild_id, command, command_count, date_time) VALUES (?, ?, ?, ?, ?)'
-    )
     try:
-        cur = settings.NAVI_DB.cursor()
-        cur.execute(sql, (user_id, guild_id, command, 1, date_time))
+        record = await executor.run(_insert_log_entry, user_id, guild_id, command, date_time)
     except sqlite3.Error as error:
         await errors.log_error(
-            strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
+            strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name,
+                                                  sql=_SQL_INSERT_LOG_ENTRY)
         )
         raise
-    log_entry = await get_log_entry(user_id, guild_id, command, date_time)
+    log_entry = await _dict_to_log_entry(dict(record))
 
     return log_entry
 
@@ -767,63 +846,110 @@ async def insert_log_summary(user_id: int, guild_id: int, command: str, date_tim
         await log_entry.update(command_count=log_entry.command_count + amount)
     else:
         sql = (
-            f'INSERT INTO {table} (user_id, guild_id, command, command_count, date_time, type) VALUES (?, ?, ?, ?, ?, ?)'
+            f'INSERT INTO {table} (user_id, guild_id, command, command_count, date_time, type) VALUES (?, ?, ?, ?, ?, ?) '
+            f'RETURNING *'
         )
         try:
-            cur = settings.NAVI_DB.cursor()
-            cur.execute(sql, (user_id, guild_id, command, amount, date_time, 'summary'))
+            record = await executor.fetch_one(
+                sql, (user_id, guild_id, command, amount, date_time, 'summary'), read_only=False
+            )
         except sqlite3.Error as error:
             await errors.log_error(
                 strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
             )
             raise
-        log_entry = await get_log_entry(user_id, guild_id, command, date_time, 'summary')
+        log_entry = await _dict_to_log_entry(dict(record))
 
     return log_entry
 
 
-async def insert_log_leaderboard_user(user_id: int, guild_id: int, command: str, all_time: int, last_1h: int,
-                                      last_12h: int, last_24h: int, last_7d: int, last_4w: int, last_12m: int,
-                                      updated: datetime,) -> LogEntry:
-    """Inserts a a record to the table "tracking_leaderboard".
-    This function first checks if a record exists. If yes, the existing record will be updated instead and
-    no new record is inserted.
-
-    Returns
-    -------
-    LogLeaderBoardUser object with the newly created entry.
+async def _remove_expired_log_entries_from_leaderboard(last_update: datetime, current_time: datetime) -> None:
+    """Subtracts all log entries that left a timeframe between last_update and current_time from the counters in
+    the table "tracking_leaderboard". Only reads the log entries of these time ranges.
+    Summary entries leave a timeframe with the start of their day. Otherwise the summary of single entries that
+    already left a timeframe would be subtracted a second time.
+    Called by log_to_leaderboard().
 
     Raises
     ------
     sqlite3.Error if something happened within the database.
     Also logs all errors to the database.
     """
-    function_name = 'insert_log_leaderboard_user'
+    function_name = '_remove_expired_log_entries_from_leaderboard'
     table = 'tracking_leaderboard'
-    log_leaderboard_user = None
+    parameters = {'updated': current_time, 'single': 'single', 'summary': 'summary'}
+    expired_counts = []
+    expired_ranges = []
+    for column, timeframe in LEADERBOARD_TIMEFRAMES.items():
+        parameters[f'{column}_start'] = last_update - timeframe
+        parameters[f'{column}_end'] = current_time - timeframe
+        parameters[f'{column}_summary_start'] = last_update - timeframe + _SUMMARY_TIME_OFFSET
+        parameters[f'{column}_summary_end'] = current_time - timeframe + _SUMMARY_TIME_OFFSET
+        expired_range = (
+            f'((type = :single AND date_time >= :{column}_start AND date_time < :{column}_end) '
+            f'OR (type = :summary AND date_time >= :{column}_summary_start AND date_time < :{column}_summary_end))'
+        )
+        expired_counts.append(f'SUM(CASE WHEN {expired_range} THEN command_count ELSE 0 END) AS {column}')
+        expired_ranges.append(expired_range)
+    sql = (
+        f'UPDATE {table} SET '
+        f'{", ".join([f"{column} = {table}.{column} - expired.{column}" for column in LEADERBOARD_TIMEFRAMES])}, '
+        f'updated = :updated '
+        f'FROM (SELECT user_id, guild_id, command, {", ".join(expired_counts)} FROM tracking_log '
+        f'WHERE {" OR ".join(expired_ranges)} GROUP BY user_id, guild_id, command) AS expired '
+        f'WHERE {table}.user_id = expired.user_id AND {table}.guild_id = expired.guild_id '
+        f'AND {table}.command = expired.command'
+    )
     try:
-        log_leaderboard_user = await get_log_leaderboard_user(user_id, guild_id, command)
-    except exceptions.NoDataFoundError:
-        pass
-    if log_leaderboard_user is not None:
-        await log_leaderboard_user.update(all_time=all_time, last_1h=last_1h, last_12h=last_12h, last_24h=last_24h,
-                                          last_7d=last_7d, last_4w=last_4w, last_12m=last_12m, updated=updated)
-    else:
-        sql = (
-            f'INSERT INTO {table} (user_id, guild_id, command, command_count, date_time) VALUES (?, ?, ?, ?, ?)'
+        await executor.execute(sql, parameters)
+    except sqlite3.Error as error:
+        await errors.log_error(
+            strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
         )
-        try:
-            cur = settings.NAVI_DB.cursor()
-            cur.execute(sql, (user_id, guild_id, command, all_time, last_1h, last_12h, last_24h, last_7d, last_4w,
-                            last_12h, updated))
-        except sqlite3.Error as error:
-            await errors.log_error(
-                strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
-            )
-            raise
-        log_leaderboard_user = await get_log_leaderboard_user(user_id, guild_id, command)
+        raise
 
-    return log_leaderboard_user
+
+async def rebuild_log_leaderboard(current_time: datetime) -> None:
+    """Recalculates all counters in the table "tracking_leaderboard" from the table "tracking_log".
+    The all time counters are only increased, because the log doesn't contain entries older than a year.
+    Summary entries count for a timeframe as long as the start of their day is in it.
+
+    Raises
+    ------
+    sqlite3.Error if something happened within the database.
+    Also logs all errors to the database.
+    """
+    function_name = 'rebuild_log_leaderboard'
+    table = 'tracking_leaderboard'
+    parameters = {'updated': current_time, 'single': 'single', 'summary': 'summary'}
+    counts = []
+    for column, timeframe in LEADERBOARD_TIMEFRAMES.items():
+        parameters[f'{column}_start'] = current_time - timeframe
+        parameters[f'{column}_summary_start'] = current_time - timeframe + _SUMMARY_TIME_OFFSET
+        counts.append(
+            f'SUM(CASE WHEN (type = :single AND date_time >= :{column}_start) '
+            f'OR (type = :summary AND date_time >= :{column}_summary_start) THEN command_count ELSE 0 END)'
+        )
+    sql_reset = (
+        f'UPDATE {table} SET {", ".join([f"{column} = 0" for column in LEADERBOARD_TIMEFRAMES])}, updated = :updated'
+    )
+    sql_insert = (
+        f'INSERT INTO {table} (user_id, guild_id, command, all_time, {", ".join(LEADERBOARD_TIMEFRAMES.keys())}, '
+        f'updated) '
+        f'SELECT user_id, guild_id, command, SUM(command_count), {", ".join(counts)}, :updated FROM tracking_log '
+        f'GROUP BY user_id, guild_id, command '
+        f'ON CONFLICT (user_id, guild_id, command) DO UPDATE SET all_time = MAX(all_time, excluded.all_time), '
+        f'{", ".join([f"{column} = excluded.{column}" for column in LEADERBOARD_TIMEFRAMES])}, '
+        f'updated = excluded.updated'
+    )
+    try:
+        for sql in (sql_reset, sql_insert):
+            await executor.execute(sql, parameters)
+    except sqlite3.Error as error:
+        await errors.log_error(
+            strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
+        )
+        raise
 
 
 async def delete_log_entries(user_id: int, guild_id: int, command: str, date_time_min: datetime,
@@ -840,10 +966,181 @@ async def delete_log_entries(user_id: int, guild_id: int, command: str, date_tim
     function_name = '_delete_log_entries'
     sql = f'DELETE FROM {table} WHERE user_id=? AND guild_id=? AND command=? AND type=? AND date_time BETWEEN ? AND ?'
     try:
-        cur = settings.NAVI_DB.cursor()
-        cur.execute(sql, (user_id, guild_id, command, 'single', date_time_min, date_time_max))
+        await executor.execute(sql, (user_id, guild_id, command, 'single', date_time_min, date_time_max))
+    except sqlite3.Error as error:
+        await errors.log_error(
+            strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
+        )
+        raise
+
+
+USER_LOG_ENTRIES_DELETE_BATCH_SIZE = 10_000 # Log entries delete_user_tracking_data() deletes per transaction
+_SQL_DELETE_USER_LOG_ENTRIES = (
+    'DELETE FROM tracking_log WHERE rowid IN (SELECT rowid FROM tracking_log WHERE user_id = ? LIMIT ?)'
+)
+_SQL_DELETE_USER_LOG_HOURLY = 'DELETE FROM tracking_log_hourly WHERE user_id = ?'
+_SQL_DELETE_USER_LOG_DAILY = 'DELETE FROM tracking_log_daily WHERE user_id = ?'
+_SQL_DELETE_USER_LEADERBOARD = 'DELETE FROM tracking_leaderboard WHERE user_id = ?'
+
+
+def _delete_user_tracking_data_batch(user_id: int) -> int:
+    """Deletes up to USER_LOG_ENTRIES_DELETE_BATCH_SIZE log entries of a user in a single transaction. The batch that
+    deletes the last log entries also deletes the rollups and leaderboard counters of the user.
+    Runs on the write thread.
+
+    Returns
+    -------
+    Amount of deleted log entries.
+    """
+    cur: sqlite3.Cursor = settings.NAVI_DB.cursor()
+    cur.execute('BEGIN IMMEDIATE')
+    try:
+        cur.execute(_SQL_DELETE_USER_LOG_ENTRIES, (user_id, USER_LOG_ENTRIES_DELETE_BATCH_SIZE))
+        log_entry_count = cur.rowcount
+        if log_entry_count < USER_LOG_ENTRIES_DELETE_BATCH_SIZE:
+            cur.execute(_SQL_DELETE_USER_LOG_HOURLY, (user_id,))
+            cur.execute(_SQL_DELETE_USER_LOG_DAILY, (user_id,))
+            cur.execute(_SQL_DELETE_USER_LEADERBOARD, (user_id,))
+        cur.execute('COMMIT')
+    except:
+        cur.execute('ROLLBACK')
+        raise
+    return log_entry_count
+
+
+async def delete_user_tracking_data(user_id: int) -> None:
+    """Deletes all tracking data of a user from the tables "tracking_log", "tracking_log_hourly",
+    "tracking_log_daily" and "tracking_leaderboard". Used when a user purges their data.
+    Log entries are deleted in batches, each in its own transaction, so other writes can run in between.
+
+    Raises
+    ------
+    sqlite3.Error if something happened within the database.
+    Also logs all errors to the database.
+    """
+    table = 'tracking_log'
+    function_name = 'delete_user_tracking_data'
+    log_entry_count = USER_LOG_ENTRIES_DELETE_BATCH_SIZE
+    try:
+        while log_entry_count == USER_LOG_ENTRIES_DELETE_BATCH_SIZE:
+            log_entry_count = await executor.run(_delete_user_tracking_data_batch, user_id)
+    except sqlite3.Error as error:
+        await errors.log_error(
+            strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name,
+                                                  sql=_SQL_DELETE_USER_LOG_ENTRIES)
+        )
+        raise
+
+
+_SQL_COUNT_DAY_LOG_ENTRIES = (
+    'SELECT COUNT(*) FILTER (WHERE type = ?), MAX(rowid) FROM tracking_log WHERE date_time >= ? AND date_time < ?'
+)
+_SQL_INSERT_DAY_SUMMARIES = (
+    'INSERT INTO tracking_log (user_id, guild_id, command, command_count, date_time, type) '
+    'SELECT user_id, guild_id, command, SUM(command_count), ?, ? FROM tracking_log '
+    'WHERE date_time >= ? AND date_time < ? GROUP BY user_id, guild_id, command'
+)
+# The unary + keeps sqlite from scanning the rowid range instead of using the date_time index
+_SQL_DELETE_DAY_LOG_ENTRIES = 'DELETE FROM tracking_log WHERE date_time >= ? AND date_time < ? AND +rowid <= ?'
+
+
+def _consolidate_log_entries_of_day(day_start: datetime) -> int:
+    """Replaces all log entries of one day with one summary entry per user, guild and command in a single transaction.
+    Existing summaries of that day are merged into the new ones. Runs on the write thread.
+
+    Returns
+    -------
+    Amount of single log entries that were consolidated.
+    """
+    day_end = day_start + timedelta(days=1)
+    summary_time = day_start + _SUMMARY_TIME_OFFSET
+    cur: sqlite3.Cursor = settings.NAVI_DB.cursor()
+    cur.execute('BEGIN IMMEDIATE')
+    try:
+        cur.execute(_SQL_COUNT_DAY_LOG_ENTRIES, ('single', day_start, day_end))
+        single_entry_count, max_rowid = cur.fetchone()
+        if single_entry_count > 0:
+            cur.execute(_SQL_INSERT_DAY_SUMMARIES, (summary_time, 'summary', day_start, day_end))
+            cur.execute(_SQL_DELETE_DAY_LOG_ENTRIES, (day_start, day_end, max_rowid))
+        cur.execute('COMMIT')
+    except:
+        cur.execute('ROLLBACK')
+        raise
+    return single_entry_count
+
+
+def _incremental_vacuum() -> int:
+    """Frees the pages of deleted records. Runs on the write thread.
+
+    Returns
+    -------
+    Amount of freed pages.
+    """
+    cur: sqlite3.Cursor = settings.NAVI_DB.cursor()
+    freelist_count = cur.execute('PRAGMA freelist_count').fetchone()[0]
+    cur.execute('PRAGMA incremental_vacuum').fetchall() # Frees one page per step
+    return freelist_count - cur.execute('PRAGMA freelist_count').fetchone()[0]
+
+
+async def consolidate_log_entries(days: int) -> int:
+    """Consolidates all single log entries older than a certain amount of days into one summary per user, guild,
+    command and day. Each day is consolidated in its own transaction, so other writes can run in between.
+    Afterwards, log entries and rollups older than a year are deleted and the freed pages are returned with an incremental vacuum.
+
+    Arguments
+    ---------
+    days: amount of days that should be kept as single entries
+
+    Returns
+    -------
+    Amount of single log entries that were consolidated.
+
+    Raises
+    ------
+    sqlite3.Error if something happened within the database.
+    Also logs all errors to the database.
+    """
+    table = 'tracking_log'
+    function_name = 'consolidate_log_entries'
+    cutoff_time = (utils.utcnow() - timedelta(days=days)).replace(hour=0, minute=0, second=0, microsecond=0)
+    sql = f'SELECT date_time FROM {table} WHERE date_time < ? AND type = ? ORDER BY date_time LIMIT 1'
+    try:
+        record = await executor.fetch_one(sql, (cutoff_time, 'single'))
     except sqlite3.Error as error:
         await errors.log_error(
             strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
         )
-        raise
\ No newline at end of file
+        raise
+    log_entry_count = 0
+    if record is not None:
+        day_start = record['date_time'].replace(hour=0, minute=0, second=0, microsecond=0, tzinfo=timezone.utc)
+        day_count = (cutoff_time - day_start).days
+        sql = _SQL_INSERT_DAY_SUMMARIES
+        for day_index in range(day_count):
+            try:
+                log_entry_count += await executor.run(_consolidate_log_entries_of_day, day_start)
+            except sqlite3.Error as error:
+                await errors.log_error(
+                    strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
+                )
+                raise
+            logs.logger.info(
+                f'Consolidating tracking log: {day_start:%Y-%m-%d} done ({day_index + 1}/{day_count}), '
+                f'{log_entry_count:,} log entries consolidated.'
+            )
+            day_start += timedelta(days=1)
+    delete_time = (utils.utcnow() - timedelta(days=366)).replace(hour=0, minute=0, second=0, microsecond=0)
+    try:
+        for table in ('tracking_log', 'tracking_log_hourly', 'tracking_log_daily'):
+            sql = f'DELETE FROM {table} WHERE date_time < ?'
+            await executor.execute(sql, (delete_time,))
+        sql = 'PRAGMA incremental_vacuum'
+        freed_pages = await executor.run(_incremental_vacuum)
+    except sqlite3.Error as error:
+        await errors.log_error(
+            strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
+        )
+        raise
+    logs.logger.info(f'Consolidating tracking log: Freed {freed_pages:,} database pages.')
+
+    return log_entry_count
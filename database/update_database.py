@@ -27,6 +27,40 @@ def get_user_version() -> int:
         logs.logger.error(f'Database: Unable to read database version. Error: {error}')
         raise
 
+def verify_connection_settings() -> bool:
+    """Checks if the connection profile in settings.DB_PRAGMAS is active on the database connection.
+    Logs every setting that differs. Returns True if all settings are active.
+    """
+    synchronous_values: dict[int, str] = {0: 'OFF', 1: 'NORMAL', 2: 'FULL', 3: 'EXTRA'}
+    temp_store_values: dict[int, str] = {0: 'DEFAULT', 1: 'FILE', 2: 'MEMORY'}
+    all_settings_active: bool = True
+    cur: sqlite3.Cursor = settings.NAVI_DB.cursor()
+    pragma: str
+    expected_value: str | int
+    for pragma, expected_value in settings.DB_PRAGMAS.items():
+        try:
+            cur.execute(f'PRAGMA {pragma}')
+            record: Any = cur.fetchone()
+        except sqlite3.Error as error:
+            logs.logger.error(f'Database: Unable to read PRAGMA {pragma}. Error: {error}')
+            raise
+        active_value: str | int = record[0]
+        if pragma == 'synchronous':
+            active_value = synchronous_values.get(active_value, active_value)
+        elif pragma == 'temp_store':
+            active_value = temp_store_values.get(active_value, active_value)
+        elif pragma == 'journal_mode':
+            active_value = str(active_value).upper()
+        if active_value != expected_value:
+            logs.logger.warning(
+                f'Database: PRAGMA {pragma} is {active_value}, expected {expected_value}. '
+                f'Check the database settings in your .env file.'
+            )
+            all_settings_active = False
+
+    return all_settings_active
+
+
 def update_database() -> bool:
     """Updates the database. Returns True if the db_version after the update equals NACVI_DB_VERSION."""
     cur: sqlite3.Cursor = settings.NAVI_DB.cursor()
@@ -632,6 +666,69 @@ def update_database() -> bool:
             "ALTER TABLE guilds ADD auto_flex_lb_galaxy_enabled INTEGER NOT NULL DEFAULT (1)",
             "ALTER TABLE guilds ADD auto_flex_work_walkingnormiefish_enabled INTEGER NOT NULL DEFAULT (1)",
         ]
+
+    if db_version < 32:
+        # custom_id is NULL for all reminders except custom ones and NULLs never conflict in the primary key,
+        # so non-custom reminders need their own unique index for upserts.
+        sqls += [
+            "DELETE FROM reminders_users WHERE custom_id IS NULL AND rowid NOT IN "
+            "(SELECT MAX(rowid) FROM reminders_users WHERE custom_id IS NULL GROUP BY user_id, activity)",
+            "CREATE UNIQUE INDEX IF NOT EXISTS user_id_activity_unique ON reminders_users (user_id, activity) "
+            "WHERE custom_id IS NULL",
+        ]
+
+    if db_version < 33:
+        # The leaderboard was never filled and its primary key was missing the command
+        sqls += [
+            "DROP TABLE IF EXISTS tracking_leaderboard",
+            "CREATE TABLE tracking_leaderboard (user_id INTEGER NOT NULL, guild_id INTEGER NOT NULL, "
+            "command TEXT NOT NULL, all_time INTEGER NOT NULL DEFAULT (0), last_1h INTEGER NOT NULL DEFAULT (0), "
+            "last_12h INTEGER NOT NULL DEFAULT (0), last_24h INTEGER NOT NULL DEFAULT (0), "
+            "last_7d INTEGER NOT NULL DEFAULT (0), last_4w INTEGER NOT NULL DEFAULT (0), "
+            "last_1y INTEGER NOT NULL DEFAULT (0), updated DATETIME NOT NULL, "
+            "PRIMARY KEY (user_id, guild_id, command))",
+            "CREATE INDEX IF NOT EXISTS date_time ON tracking_log (date_time)",
+        ]
+
+    if db_version < 34:
+        # Takes effect with the VACUUM below. Allows returning freed pages with PRAGMA incremental_vacuum.
+        sqls += [
+            "PRAGMA auto_vacuum = INCREMENTAL",
+        ]
+
+    if db_version < 35:
+        sqls += [
+            "CREATE TABLE IF NOT EXISTS tracking_log_hourly (user_id INTEGER NOT NULL, guild_id INTEGER NOT NULL, "
+            "command TEXT NOT NULL, date_time DATETIME NOT NULL, command_count INTEGER NOT NULL, "
+            "PRIMARY KEY (user_id, date_time, guild_id, command)) WITHOUT ROWID",
+            "CREATE TABLE IF NOT EXISTS tracking_log_daily (user_id INTEGER NOT NULL, guild_id INTEGER NOT NULL, "
+            "command TEXT NOT NULL, date_time DATETIME NOT NULL, command_count INTEGER NOT NULL, "
+            "PRIMARY KEY (user_id, date_time, guild_id, command)) WITHOUT ROWID",
+            "INSERT OR IGNORE INTO tracking_log_hourly (user_id, guild_id, command, date_time, command_count) "
+            "SELECT user_id, guild_id, command, strftime('%Y-%m-%d %H:00:00+00:00', date_time), SUM(command_count) "
+            "FROM tracking_log GROUP BY 1, 2, 3, 4",
+            "INSERT OR IGNORE INTO tracking_log_daily (user_id, guild_id, command, date_time, command_count) "
+            "SELECT user_id, guild_id, command, strftime('%Y-%m-%d 00:00:00+00:00', date_time), SUM(command_count) "
+            "FROM tracking_log GROUP BY 1, 2, 3, 4",
+            "CREATE INDEX IF NOT EXISTS user_id_date_time ON tracking_log (user_id, date_time)",
+        ]
+
+    if db_version < 36:
+        sqls += [
+            "CREATE INDEX IF NOT EXISTS user2_id ON alts (user2_id, user1_id)",
+            "CREATE INDEX IF NOT EXISTS clan_name ON clan_members (clan_name)",
+            "CREATE INDEX IF NOT EXISTS clan_name_energy ON clans_raids (clan_name, energy)",
+            "CREATE INDEX IF NOT EXISTS clan_triggered_end_time ON reminders_clans (triggered, end_time)",
+            "CREATE INDEX IF NOT EXISTS user_triggered_end_time ON reminders_users (triggered, end_time)",
+            "CREATE INDEX IF NOT EXISTS user_id_end_time ON reminders_users (user_id, end_time)",
+            "CREATE INDEX IF NOT EXISTS command_guild_id ON tracking_leaderboard (command, guild_id)",
+            "CREATE INDEX IF NOT EXISTS hourly_date_time ON tracking_log_hourly (date_time)",
+            "CREATE INDEX IF NOT EXISTS daily_date_time ON tracking_log_daily (date_time)",
+            # Covers the partial hours get_log_report() reads from the log
+            "DROP INDEX IF EXISTS user_id_date_time",
+            "CREATE INDEX IF NOT EXISTS user_id_date_time_covering ON tracking_log "
+            "(user_id, date_time, guild_id, command, command_count)",
+        ]
     
     # Run SQLs
     sql: str
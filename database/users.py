@@ -1,17 +1,20 @@
 # users.py
 """Provides access to the table "users" in the database"""
 
+from collections import OrderedDict
+from copy import copy
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from math import ceil
 import sqlite3
-from typing import Any, NamedTuple
+from time import monotonic
+from typing import Any, Callable, Iterable, NamedTuple, Optional
 
 from discord import utils
 
 from database import alts as alts_db
-from database import errors, reminders
-from resources import exceptions, settings, strings
+from database import errors, executor, reminders
+from resources import exceptions, logs, settings, strings
 
 
 # Containers
@@ -33,9 +36,280 @@ class UserInventory(NamedTuple):
     seed_carrot: int
     seed_potato: int
 
-@dataclass()
+# Decoders for the attributes of User. Each attribute is decoded from the record the first time it is accessed.
+_NONE_DATE: datetime = datetime(1970, 1, 1, 0, 0, 0)
+_USER_DECODERS: dict[str, Callable[[dict[str, Any]], Any]] = {
+    'alert_advent': lambda record: UserAlert(enabled=bool(record['alert_advent_enabled']),
+                                             message=record['alert_advent_message'],
+                                             multiplier=1.0,
+                                             visible=bool(record['alert_advent_visible'])),
+    'alert_adventure': lambda record: UserAlert(enabled=bool(record['alert_adventure_enabled']),
+                                                message=record['alert_adventure_message'],
+                                                multiplier=float(record['alert_adventure_multiplier']),
+                                                visible=bool(record['alert_adventure_visible'])),
+    'alert_arena': lambda record: UserAlert(enabled=bool(record['alert_arena_enabled']),
+                                            message=record['alert_arena_message'],
+                                            multiplier=1.0,
+                                            visible=bool(record['alert_arena_visible'])),
+    'alert_big_arena': lambda record: UserAlert(enabled=bool(record['alert_big_arena_enabled']),
+                                                message=record['alert_big_arena_message'],
+                                                multiplier=1.0,
+                                                visible=bool(record['alert_big_arena_visible'])),
+    'alert_boo': lambda record: UserAlert(enabled=bool(record['alert_boo_enabled']),
+                                            message=record['alert_boo_message'],
+                                            multiplier=record['alert_boo_multiplier'],
+                                            visible=bool(record['alert_boo_visible'])),
+    'alert_boosts': lambda record: UserAlert(enabled=bool(record['alert_boosts_enabled']),
+                                             message=record['alert_boosts_message'],
+                                             multiplier=1.0,
+                                             visible=bool(record['alert_boosts_visible'])),
+    'alert_card_hand': lambda record: UserAlert(enabled=bool(record['alert_card_hand_enabled']),
+                                                message=record['alert_card_hand_message'],
+                                                multiplier=float(record['alert_card_hand_multiplier']),
+                                                visible=bool(record['alert_card_hand_visible'])),
+    'alert_cel_dailyquest': lambda record: UserAlert(enabled=bool(record['alert_cel_dailyquest_enabled']),
+                                                     message=record['alert_cel_dailyquest_message'],
+                                                     multiplier=1.0,
+                                                     visible=bool(record['alert_cel_dailyquest_visible'])),
+    'alert_cel_multiply': lambda record: UserAlert(enabled=bool(record['alert_cel_multiply_enabled']),
+                                                   message=record['alert_cel_multiply_message'],
+                                                   multiplier=1.0,
+                                                   visible=bool(record['alert_cel_multiply_visible'])),
+    'alert_cel_sacrifice': lambda record: UserAlert(enabled=bool(record['alert_cel_sacrifice_enabled']),
+                                                   message=record['alert_cel_sacrifice_message'],
+                                                   multiplier=1.0,
+                                                   visible=bool(record['alert_cel_sacrifice_visible'])),
+    'alert_chimney': lambda record: UserAlert(enabled=bool(record['alert_chimney_enabled']),
+                                              message=record['alert_chimney_message'],
+                                              multiplier=record['alert_chimney_multiplier'],
+                                              visible=bool(record['alert_chimney_visible'])),
+    'alert_color_tournament': lambda record: UserAlert(enabled=bool(record['alert_color_tournament_enabled']),
+                                              message=record['alert_color_tournament_message'],
+                                              multiplier=record['alert_color_tournament_multiplier'],
+                                              visible=bool(record['alert_color_tournament_visible'])),
+    'alert_daily': lambda record: UserAlert(enabled=bool(record['alert_daily_enabled']),
+                                            message=record['alert_daily_message'],
+                                            multiplier=float(record['alert_daily_multiplier']),
+                                            visible=bool(record['alert_daily_visible'])),
+    'alert_duel': lambda record: UserAlert(enabled=bool(record['alert_duel_enabled']),
+                                           message=record['alert_duel_message'],
+                                           multiplier=float(record['alert_duel_multiplier']),
+                                           visible=bool(record['alert_duel_visible'])),
+    'alert_dungeon_miniboss': lambda record: UserAlert(enabled=bool(record['alert_dungeon_miniboss_enabled']),
+                                                       message=record['alert_dungeon_miniboss_message'],
+                                                       multiplier=1.0,
+                                                       visible=bool(record['alert_dungeon_miniboss_visible'])),
+    'alert_epic': lambda record: UserAlert(enabled=bool(record['alert_epic_enabled']),
+                                           message=record['alert_epic_message'],
+                                           multiplier=float(record['alert_epic_multiplier']),
+                                           visible=bool(record['alert_epic_visible'])),
+    'alert_epic_shop': lambda record: UserAlert(enabled=bool(record['alert_epic_shop_enabled']),
+                                                message=record['alert_epic_shop_message'],
+                                                multiplier=1,
+                                                visible=bool(record['alert_epic_shop_visible'])),
+    'alert_eternal_present': lambda record: UserAlert(enabled=bool(record['alert_eternal_present_enabled']),
+                                                      message=record['alert_eternal_present_message'],
+                                                      multiplier=1.0,
+                                                      visible=bool(record['alert_eternal_present_visible'])),
+    'alert_eternity_sealing': lambda record: UserAlert(enabled=bool(record['alert_eternity_sealing_enabled']),
+                                                       message=record['alert_eternity_sealing_message'],
+                                                       multiplier=1.0,
+                                                       visible=False),
+    'alert_farm': lambda record: UserAlert(enabled=bool(record['alert_farm_enabled']),
+                                           message=record['alert_farm_message'],
+                                           multiplier=float(record['alert_farm_multiplier']),
+                                           visible=bool(record['alert_farm_visible'])),
+    'alert_guild': lambda record: UserAlert(enabled=bool(record['alert_guild_enabled']),
+                                           message=record['alert_guild_message'],
+                                           multiplier=1.0,
+                                           visible=bool(record['alert_guild_visible'])),
+    'alert_horse_breed': lambda record: UserAlert(enabled=bool(record['alert_horse_breed_enabled']),
+                                                  message=record['alert_horse_breed_message'],
+                                                  multiplier=1.0,
+                                                  visible=bool(record['alert_horse_breed_visible'])),
+    'alert_horse_race': lambda record: UserAlert(enabled=bool(record['alert_horse_race_enabled']),
+                                                 message=record['alert_horse_race_message'],
+                                                 multiplier=1.0,
+                                                 visible=bool(record['alert_horse_race_visible'])),
+    'alert_hunt': lambda record: UserAlert(enabled=bool(record['alert_hunt_enabled']),
+                                           message=record['alert_hunt_message'],
+                                           multiplier=float(record['alert_hunt_multiplier']),
+                                           visible=bool(record['alert_hunt_visible'])),
+    'alert_hunt_partner': lambda record: UserAlert(enabled=bool(record['alert_hunt_partner_enabled']),
+                                           message=record['alert_hunt_partner_message'],
+                                           multiplier=float(record['alert_hunt_partner_multiplier']),
+                                           visible=bool(record['alert_hunt_partner_visible'])),
+    'alert_lootbox': lambda record: UserAlert(enabled=bool(record['alert_lootbox_enabled']),
+                                              message=record['alert_lootbox_message'],
+                                              multiplier=float(record['alert_lootbox_multiplier']),
+                                              visible=bool(record['alert_lootbox_visible'])),
+    'alert_lottery': lambda record: UserAlert(enabled=bool(record['alert_lottery_enabled']),
+                                              message=record['alert_lottery_message'],
+                                              multiplier=1.0,
+                                              visible=bool(record['alert_lottery_visible'])),
+    'alert_love_share': lambda record: UserAlert(enabled=bool(record['alert_love_share_enabled']),
+                                                 message=record['alert_love_share_message'],
+                                                 multiplier=1.0,
+                                                 visible=bool(record['alert_love_share_visible'])),
+    'alert_maintenance': lambda record: UserAlert(enabled=bool(record['alert_maintenance_enabled']),
+                                                  message=record['alert_maintenance_message'],
+                                                  multiplier=1.0,
+                                                  visible=False),
+    'alert_megarace': lambda record: UserAlert(enabled=bool(record['alert_megarace_enabled']),
+                                               message=record['alert_megarace_message'],
+                                               multiplier=1.0,
+                                               visible=bool(record['alert_megarace_visible'])),
+    'alert_minirace': lambda record: UserAlert(enabled=bool(record['alert_minirace_enabled']),
+                                               message=record['alert_minirace_message'],
+                                               multiplier=1.0,
+                                               visible=bool(record['alert_minirace_visible'])),
+    'alert_not_so_mini_boss': lambda record: UserAlert(enabled=bool(record['alert_not_so_mini_boss_enabled']),
+                                                       message=record['alert_not_so_mini_boss_message'],
+                                                       multiplier=1.0,
+                                                       visible=bool(record['alert_not_so_mini_boss_visible'])),
+    'alert_partner': lambda record: UserAlert(enabled=bool(record['alert_partner_enabled']),
+                                              message=record['alert_partner_message'],
+                                              multiplier=1.0,
+                                              visible=True),
+    'alert_pet_tournament': lambda record: UserAlert(enabled=bool(record['alert_pet_tournament_enabled']),
+                                                     message=record['alert_pet_tournament_message'],
+                                                     multiplier=1.0,
+                                                     visible=bool(record['alert_pet_tournament_visible'])),
+    'alert_pets': lambda record: UserAlert(enabled=bool(record['alert_pets_enabled']),
+                                           message=record['alert_pets_message'],
+                                           multiplier=1.0,
+                                           visible=bool(record['alert_pets_visible'])),
+    'alert_produce': lambda record: UserAlert(enabled=bool(record['alert_produce_enabled']),
+                                              message=record['alert_produce_message'],
+                                              multiplier=float(record['alert_produce_multiplier']),
+                                              visible=bool(record['alert_produce_visible'])),
+    'alert_produce_unlocked': lambda record: bool(record['alert_produce_unlocked']),
+    'alert_quest': lambda record: UserAlert(enabled=bool(record['alert_quest_enabled']),
+                                            message=record['alert_quest_message'],
+                                            multiplier=float(record['alert_quest_multiplier']),
+                                            visible=bool(record['alert_quest_visible'])),
+    'alert_surf': lambda record: UserAlert(enabled=bool(record['alert_surf_enabled']),
+                                            message=record['alert_surf_message'],
+                                            multiplier=float(record['alert_surf_multiplier']),
+                                            visible=bool(record['alert_surf_visible'])),
+    'alert_training': lambda record: UserAlert(enabled=bool(record['alert_training_enabled']),
+                                               message=record['alert_training_message'],
+                                               multiplier=float(record['alert_training_multiplier']),
+                                               visible=bool(record['alert_training_visible'])),
+    'alert_vote': lambda record: UserAlert(enabled=bool(record['alert_vote_enabled']),
+                                           message=record['alert_vote_message'],
+                                           multiplier=1.0,
+                                           visible=bool(record['alert_vote_visible'])),
+    'alert_weekly': lambda record: UserAlert(enabled=bool(record['alert_weekly_enabled']),
+                                            message=record['alert_weekly_message'],
+                                            multiplier=float(record['alert_weekly_multiplier']),
+                                            visible=bool(record['alert_weekly_visible'])),
+    'alert_work': lambda record: UserAlert(enabled=bool(record['alert_work_enabled']),
+                                           message=record['alert_work_message'],
+                                           multiplier=float(record['alert_work_multiplier']),
+                                           visible=bool(record['alert_work_visible'])),
+    'alts': lambda record: record['alts'],
+    'area_20_cooldowns_enabled': lambda record: bool(record['area_20_cooldowns_enabled']),
+    'ascended': lambda record: bool(record['ascended']),
+    'auto_flex_enabled': lambda record: bool(record['auto_flex_enabled']),
+    'auto_flex_ping_enabled': lambda record: bool(record['auto_flex_ping_enabled']),
+    'auto_flex_tip_read': lambda record: bool(record['auto_flex_tip_read']),
+    'auto_healing_active': lambda record: bool(record['auto_healing_active']),
+    'auto_ready_enabled': lambda record: bool(record['auto_ready_enabled']),
+    'bot_enabled': lambda record: bool(record['bot_enabled']),
+    'chocolate_box_unlocked': lambda record: bool(record['chocolate_box_unlocked']),
+    'christmas_area_enabled': lambda record: bool(record['christmas_area_enabled']),
+    'cmd_cd_visible': lambda record: record['cmd_cd_visible'],
+    'cmd_inventory_visible': lambda record: record['cmd_inventory_visible'],
+    'cmd_ready_visible': lambda record: record['cmd_ready_visible'],
+    'cmd_slashboard_visible': lambda record: record['cmd_slashboard_visible'],
+    'context_helper_enabled': lambda record: bool(record['context_helper_enabled']),
+    'current_area': lambda record: -1 if record['current_area'] is None else record['current_area'],
+    'dnd_mode_enabled': lambda record: bool(record['dnd_mode_enabled']),
+    'eternal_boosts_tier': lambda record: record['eternal_boosts_tier'],
+    'farm_helper_mode': lambda record: record['farm_helper_mode'],
+    'guild_quest_prompt_active': lambda record: bool(record['guild_quest_prompt_active']),
+    'halloween_helper_enabled': lambda record: bool(record['halloween_helper_enabled']),
+    'hardmode_mode_enabled': lambda record: bool(record['hardmode_mode_enabled']),
+    'heal_warning_enabled': lambda record: bool(record['heal_warning_enabled']),
+    'hunt_end_time': lambda record: record['hunt_end_time'].replace(tzinfo=timezone.utc),
+    'hunt_reminders_combined': lambda record: bool(record['hunt_reminders_combined']),
+    'inventory': lambda record: UserInventory(bread=(record['inventory_bread']), carrot=(record['inventory_carrot']),
+                                              potato=(record['inventory_potato']),
+                                              present_eternal=(record['inventory_present_eternal']),
+                                              ruby=(record['inventory_ruby']), seed_bread=(record['inventory_seed_bread']),
+                                              seed_carrot=(record['inventory_seed_carrot']),
+                                              seed_potato=(record['inventory_seed_potato'])),
+    'last_adventure_mode': lambda record: '' if record['last_adventure_mode'] is None else record['last_adventure_mode'],
+    'last_farm_seed': lambda record: '' if record['last_farm_seed'] is None else record['last_farm_seed'],
+    'last_hunt_mode': lambda record: '' if record['last_hunt_mode'] is None else record['last_hunt_mode'],
+    'last_lootbox': lambda record: '' if record['last_lootbox'] is None else record['last_lootbox'],
+    'last_quest_command': lambda record: '' if record['last_quest_command'] is None else record['last_quest_command'],
+    'last_training_command': lambda record: record['last_training_command'],
+    'last_tt': lambda record: record['last_tt'] if record['last_tt'] is not None else _NONE_DATE,
+    'last_work_command': lambda record: '' if record['last_work_command'] is None else record['last_work_command'],
+    'megarace_helper_enabled': lambda record: bool(record['megarace_helper_enabled']),
+    'multiplier_management_enabled': lambda record: bool(record['multiplier_management_enabled']),
+    'partner_alert_threshold': lambda record: record['partner_alert_threshold'],
+    'partner_channel_id': lambda record: record['partner_channel_id'],
+    'partner_chocolate_box_unlocked': lambda record: bool(record['partner_chocolate_box_unlocked']),
+    'partner_donor_tier': lambda record: record['partner_donor_tier'],
+    'partner_hunt_end_time': lambda record: record['partner_hunt_end_time'].replace(tzinfo=timezone.utc),
+    'partner_id': lambda record: record['partner_id'],
+    'partner_name': lambda record: record['partner_name'],
+    'partner_pocket_watch_multiplier': lambda record: float(record['partner_pocket_watch_multiplier']),
+    'pet_helper_enabled': lambda record: record['pet_helper_enabled'],
+    'pet_helper_icon_mode': lambda record: bool(record['pet_helper_icon_mode']),
+    'pet_tip_read': lambda record: bool(record['pet_tip_read']),
+    'ping_after_message': lambda record: bool(record['ping_after_message']),
+    'portals_as_embed': lambda record: bool(record['portals_as_embed']),
+    'portals_spacing_enabled': lambda record: bool(record['portals_spacing_enabled']),
+    'potion_dragon_breath_active': lambda record: bool(record['potion_dragon_breath_active']),
+    'potion_flask_active': lambda record: bool(record['potion_flask_active']),
+    'reactions_enabled': lambda record: bool(record['reactions_enabled']),
+    'ready_after_all_commands': lambda record: bool(record['ready_after_all_commands']),
+    'ready_as_embed': lambda record: bool(record['ready_as_embed']),
+    'ready_channel_arena': lambda record: record['ready_channel_arena'],
+    'ready_channel_duel': lambda record: record['ready_channel_duel'],
+    'ready_channel_dungeon': lambda record: record['ready_channel_dungeon'],
+    'ready_channel_horse': lambda record: record['ready_channel_horse'],
+    'ready_embed_color': lambda record: record['ready_embed_color'],
+    'ready_eternity_visible': lambda record: bool(record['ready_eternity_visible']),
+    'ready_other_on_top': lambda record: bool(record['ready_other_on_top']),
+    'ready_pets_claim_active': lambda record: bool(record['ready_pets_claim_active']),
+    'ready_pets_claim_after_every_pet': lambda record: bool(record['ready_pets_claim_after_every_pet']),
+    'ready_ping_user': lambda record: bool(record['ready_ping_user']),
+    'ready_trade_daily_completed_visible': lambda record: bool(record['ready_trade_daily_completed_visible']),
+    'ready_trade_daily_visible': lambda record: bool(record['ready_trade_daily_visible']),
+    'ready_up_next_as_timestamp': lambda record: bool(record['ready_up_next_as_timestamp']),
+    'ready_up_next_show_hidden_reminders': lambda record: bool(record['ready_up_next_show_hidden_reminders']),
+    'ready_up_next_visible': lambda record: bool(record['ready_up_next_visible']),
+    'reminder_channel_id': lambda record: record['reminder_channel_id'],
+    'round_card_active': lambda record: bool(record['round_card_active']),
+    'ruby_counter_button_mode': lambda record: bool(record['ruby_counter_button_mode']),
+    'ruby_counter_enabled': lambda record: bool(record['ruby_counter_enabled']),
+    'slash_mentions_enabled': lambda record: bool(record['slash_mentions_enabled']),
+    'surf_helper_enabled': lambda record: bool(record['surf_helper_enabled']),
+    'time_potion_warning_enabled': lambda record: bool(record['time_potion_warning_enabled']),
+    'time_travel_count': lambda record: 0 if record['time_travel_count'] is None else record['time_travel_count'],
+    'top_hat_unlocked': lambda record: bool(record['top_hat_unlocked']),
+    'tracking_enabled': lambda record: bool(record['tracking_enabled']),
+    'trade_daily_done': lambda record: record['trade_daily_done'],
+    'trade_daily_total': lambda record: record['trade_daily_total'],
+    'training_helper_button_mode': lambda record: bool(record['training_helper_button_mode']),
+    'training_helper_enabled': lambda record: bool(record['training_helper_enabled']),
+    'user_donor_tier': lambda record: record['user_donor_tier'],
+    'user_id': lambda record: record['user_id'],
+    'user_pocket_watch_multiplier': lambda record: float(record['user_pocket_watch_multiplier']),
+}
+
+
 class User():
-    """Object that represents a record from table "user"."""
+    """Object that represents a record from table "user".
+    The attributes are decoded from the record the first time they are accessed (see _USER_DECODERS). Decoded values
+    are shared by all copies of the same record, so the copies handed out by the user cache only decode them once.
+    """
+    __slots__ = ('_decoded_names', '_decoded_values', '_record', *_USER_DECODERS)
     alert_advent: UserAlert
     alert_adventure: UserAlert
     alert_arena: UserAlert
@@ -168,150 +442,74 @@ class User():
     user_id: int
     user_pocket_watch_multiplier: float
 
+    def __init__(self, record: dict[str, Any]) -> None:
+        object.__setattr__(self, '_decoded_names', [])
+        object.__setattr__(self, '_decoded_values', {})
+        object.__setattr__(self, '_record', record)
+
+    def __getattr__(self, name: str) -> Any:
+        """Decodes an attribute from the record and stores it in its slot. Only called if the slot is still empty.
+
+        Raises
+        ------
+        AttributeError if the attribute doesn't exist.
+        LookupError if something goes wrong reading the record. Also logs this error to the logfile.
+        """
+        decoded_values: dict[str, Any] = self._decoded_values
+        if name in decoded_values:
+            value: Any = decoded_values[name]
+        else:
+            decoder: Callable[[dict[str, Any]], Any] | None = _USER_DECODERS.get(name, None)
+            if decoder is None:
+                raise AttributeError(f'\'{type(self).__name__}\' object has no attribute \'{name}\'')
+            try:
+                value = decoded_values[name] = decoder(self._record)
+            except Exception as error:
+                logs.logger.error(
+                    strings.INTERNAL_ERROR_DICT_TO_OBJECT.format(function='User.__getattr__', record=self._record)
+                )
+                raise LookupError(error) from error
+        object.__setattr__(self, name, value)
+        self._decoded_names.append(name)
+        return value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name in _USER_DECODERS and name not in self._decoded_names: self._decoded_names.append(name)
+
+    def __copy__(self) -> 'User':
+        """Returns a shallow copy. Attributes that aren't decoded yet stay undecoded in the copy."""
+        user_copy: User = User.__new__(User)
+        object.__setattr__(user_copy, '_decoded_names', [])
+        _copy_user_attributes(self, user_copy)
+        return user_copy
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__: return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in _USER_DECODERS)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        attributes: str = ', '.join(f'{name}={getattr(self, name)!r}' for name in _USER_DECODERS)
+        return f'{type(self).__name__}({attributes})'
+
     def __str__(self) -> str:
         """Returns all attributes of the User object separated by newlines."""
         response: str = ''
         attribute_name: str
         for attribute_name in dir(self):
-            if attribute_name.startswith('__'): continue
+            if attribute_name.startswith('_'): continue
             attribute_value = getattr(self, attribute_name)
             if 'method' in str(attribute_value): continue
             response = f'{response}\n{attribute_name}: {attribute_value}'
         return response.strip()
             
-    async def refresh(self) -> None:
-        """Refreshes user data from the database."""
-        new_settings: User = await get_user(self.user_id)
-        self.alert_advent = new_settings.alert_advent
-        self.alert_adventure = new_settings.alert_adventure
-        self.alert_arena = new_settings.alert_arena
-        self.alert_boo = new_settings.alert_boo
-        self.alert_boosts = new_settings.alert_boosts
-        self.alert_card_hand = new_settings.alert_card_hand
-        self.alert_cel_dailyquest = new_settings.alert_cel_dailyquest
-        self.alert_cel_multiply = new_settings.alert_cel_multiply
-        self.alert_cel_sacrifice = new_settings.alert_cel_sacrifice
-        self.alert_chimney = new_settings.alert_chimney
-        self.alert_big_arena = new_settings.alert_big_arena
-        self.alert_color_tournament = new_settings.alert_color_tournament
-        self.alert_daily = new_settings.alert_daily
-        self.alert_duel = new_settings.alert_duel
-        self.alert_dungeon_miniboss = new_settings.alert_dungeon_miniboss
-        self.alert_epic = new_settings.alert_epic
-        self.alert_epic_shop = new_settings.alert_epic_shop
-        self.alert_eternal_present = new_settings.alert_eternal_present
-        self.alert_eternity_sealing = new_settings.alert_eternity_sealing
-        self.alert_farm = new_settings.alert_farm
-        self.alert_guild = new_settings.alert_guild
-        self.alert_horse_breed = new_settings.alert_horse_breed
-        self.alert_horse_race = new_settings.alert_horse_race
-        self.alert_hunt = new_settings.alert_hunt
-        self.alert_hunt_partner = new_settings.alert_hunt_partner
-        self.alert_lootbox = new_settings.alert_lootbox
-        self.alert_lottery = new_settings.alert_lottery
-        self.alert_love_share = new_settings.alert_love_share
-        self.alert_maintenance = new_settings.alert_maintenance
-        self.alert_megarace = new_settings.alert_megarace
-        self.alert_minirace = new_settings.alert_minirace
-        self.alert_not_so_mini_boss = new_settings.alert_not_so_mini_boss
-        self.alert_partner = new_settings.alert_partner
-        self.alert_pet_tournament = new_settings.alert_pet_tournament
-        self.alert_pets = new_settings.alert_pets
-        self.alert_produce = new_settings.alert_produce
-        self.alert_produce_unlocked = new_settings.alert_produce_unlocked
-        self.alert_quest = new_settings.alert_quest
-        self.alert_surf = new_settings.alert_surf
-        self.alert_training = new_settings.alert_training
-        self.alert_vote = new_settings.alert_vote
-        self.alert_weekly = new_settings.alert_weekly
-        self.alert_work = new_settings.alert_work
-        self.alts = new_settings.alts
-        self.ascended = new_settings.ascended
-        self.area_20_cooldowns_enabled = new_settings.area_20_cooldowns_enabled
-        self.auto_flex_enabled = new_settings.auto_flex_enabled
-        self.auto_flex_ping_enabled = new_settings.auto_flex_ping_enabled
-        self.auto_flex_tip_read = new_settings.auto_flex_tip_read
-        self.auto_healing_active = new_settings.auto_healing_active
-        self.auto_ready_enabled = new_settings.auto_ready_enabled
-        self.bot_enabled = new_settings.bot_enabled
-        self.chocolate_box_unlocked = new_settings.chocolate_box_unlocked
-        self.christmas_area_enabled = new_settings.christmas_area_enabled
-        self.cmd_cd_visible = new_settings.cmd_cd_visible
-        self.cmd_inventory_visible = new_settings.cmd_inventory_visible
-        self.cmd_ready_visible = new_settings.cmd_ready_visible
-        self.cmd_slashboard_visible = new_settings.cmd_slashboard_visible
-        self.context_helper_enabled = new_settings.context_helper_enabled
-        self.current_area = new_settings.current_area
-        self.dnd_mode_enabled = new_settings.dnd_mode_enabled
-        self.eternal_boosts_tier = new_settings.eternal_boosts_tier
-        self.farm_helper_mode = new_settings.farm_helper_mode
-        self.guild_quest_prompt_active = new_settings.guild_quest_prompt_active
-        self.halloween_helper_enabled = new_settings.halloween_helper_enabled
-        self.hardmode_mode_enabled = new_settings.hardmode_mode_enabled
-        self.heal_warning_enabled = new_settings.heal_warning_enabled
-        self.hunt_end_time = new_settings.hunt_end_time
-        self.hunt_reminders_combined = new_settings.hunt_reminders_combined
-        self.inventory = new_settings.inventory
-        self.last_adventure_mode = new_settings.last_adventure_mode
-        self.last_farm_seed = new_settings.last_farm_seed
-        self.last_hunt_mode = new_settings.last_hunt_mode
-        self.last_lootbox = new_settings.last_lootbox
-        self.last_quest_command = new_settings.last_quest_command
-        self.last_training_command = new_settings.last_training_command
-        self.last_tt = new_settings.last_tt
-        self.last_work_command = new_settings.last_work_command
-        self.megarace_helper_enabled = new_settings.megarace_helper_enabled
-        self.multiplier_management_enabled = new_settings.multiplier_management_enabled
-        self.partner_alert_threshold = new_settings.partner_alert_threshold
-        self.partner_channel_id = new_settings.partner_channel_id
-        self.partner_chocolate_box_unlocked = new_settings.partner_chocolate_box_unlocked
-        self.partner_donor_tier = new_settings.partner_donor_tier
-        self.partner_hunt_end_time = new_settings.partner_hunt_end_time
-        self.partner_id = new_settings.partner_id
-        self.partner_name = new_settings.partner_name
-        self.partner_pocket_watch_multiplier = new_settings.partner_pocket_watch_multiplier
-        self.pet_helper_enabled = new_settings.pet_helper_enabled
-        self.pet_helper_icon_mode = new_settings.pet_helper_icon_mode
-        self.pet_tip_read = new_settings.pet_tip_read
-        self.ping_after_message = new_settings.ping_after_message
-        self.portals_as_embed = new_settings.portals_as_embed
-        self.portals_spacing_enabled = new_settings.portals_spacing_enabled
-        self.potion_dragon_breath_active = new_settings.potion_dragon_breath_active
-        self.potion_flask_active = new_settings.potion_flask_active
-        self.reactions_enabled = new_settings.reactions_enabled
-        self.ready_after_all_commands = new_settings.ready_after_all_commands
-        self.ready_as_embed = new_settings.ready_as_embed
-        self.ready_channel_arena = new_settings.ready_channel_arena
-        self.ready_channel_duel = new_settings.ready_channel_duel
-        self.ready_channel_dungeon = new_settings.ready_channel_dungeon
-        self.ready_channel_horse = new_settings.ready_channel_horse
-        self.ready_embed_color = new_settings.ready_embed_color
-        self.ready_eternity_visible = new_settings.ready_eternity_visible
-        self.ready_pets_claim_active = new_settings.ready_pets_claim_active
-        self.ready_pets_claim_after_every_pet = new_settings.ready_pets_claim_after_every_pet
-        self.ready_other_on_top = new_settings.ready_other_on_top
-        self.ready_ping_user = new_settings.ready_ping_user
-        self.ready_trade_daily_completed_visible = new_settings.ready_trade_daily_completed_visible
-        self.ready_trade_daily_visible = new_settings.ready_trade_daily_visible
-        self.ready_up_next_as_timestamp = new_settings.ready_up_next_as_timestamp
-        self.ready_up_next_show_hidden_reminders = new_settings.ready_up_next_show_hidden_reminders
-        self.ready_up_next_visible = new_settings.ready_up_next_visible
-        self.reminder_channel_id = new_settings.reminder_channel_id
-        self.round_card_active = new_settings.round_card_active
-        self.ruby_counter_button_mode = new_settings.ruby_counter_button_mode
-        self.ruby_counter_enabled = new_settings.ruby_counter_enabled
-        self.slash_mentions_enabled = new_settings.slash_mentions_enabled
-        self.surf_helper_enabled = new_settings.surf_helper_enabled
-        self.time_potion_warning_enabled = new_settings.time_potion_warning_enabled
-        self.time_travel_count = new_settings.time_travel_count
-        self.top_hat_unlocked = new_settings.top_hat_unlocked
-        self.tracking_enabled = new_settings.tracking_enabled
-        self.trade_daily_done = new_settings.trade_daily_done
-        self.trade_daily_total = new_settings.trade_daily_total
-        self.training_helper_button_mode = new_settings.training_helper_button_mode
-        self.training_helper_enabled = new_settings.training_helper_enabled
-        self.user_donor_tier = new_settings.user_donor_tier
-        self.user_pocket_watch_multiplier = new_settings.user_pocket_watch_multiplier
+    async def refresh(self, new_settings: Optional['User'] = None) -> None:
+        """Refreshes user data from the database.
+        If new_settings is passed, the values are copied from there instead of reading the record."""
+        if new_settings is None: new_settings = await get_user(self.user_id)
+        _copy_user_attributes(new_settings, self)
 
     async def add_alt(self, alt_id: int) -> None:
         """Adds an alt to the database. Also calls refresh().
@@ -334,7 +532,7 @@ class User():
         await self.refresh()
         
     async def update(self, **updated_settings) -> None:
-        """Updates the user record in the database. Also calls refresh().
+        """Updates the user record in the database and applies the updated record returned by the database.
         If user_donor_tier is updated and a partner is set, the partner's partner_donor_tier is updated as well.
 
         Arguments
@@ -577,8 +775,8 @@ class User():
             user_donor_tier: int
             user_pocket_watch_multiplier: float
         """
-        await _update_user(self, **updated_settings)
-        await self.refresh()
+        updated_user: User = await _update_user(self, **updated_settings)
+        await self.refresh(updated_user)
 
     async def update_multiplier(self, activity: str, time_left: timedelta) -> None:
         """
@@ -640,9 +838,119 @@ class User():
             await self.update(**updated_settings)
 
 
+def _copy_user_attributes(source: User, target: User) -> None:
+    """Replaces the record and the attributes of target with the ones of source. Attributes that aren't decoded
+    in source are cleared in target, so they are decoded from the new record when they are accessed."""
+    name: str
+    for name in target._decoded_names:
+        object.__delattr__(target, name)
+    for name in source._decoded_names:
+        object.__setattr__(target, name, getattr(source, name))
+    object.__setattr__(target, '_decoded_names', list(source._decoded_names))
+    object.__setattr__(target, '_decoded_values', source._decoded_values)
+    object.__setattr__(target, '_record', source._record)
+
+
+class UserCacheStats(NamedTuple):
+    """Object that summarizes the state of the user cache"""
+    hits: int
+    misses: int
+    size: int
+
+@dataclass(eq=False)
+class PendingUserLoad():
+    """Object that represents a cache miss that is loading a user. Stale if the user was written in the meantime."""
+    stale: bool = False
+
+class CachedUser(NamedTuple):
+    """Object that represents a cached user record together with the User object built from it"""
+    cached_at: float
+    record: dict[str, Any]
+    user: User
+
+class ScheduledColumnReset(NamedTuple):
+    """Object that represents columns of all users that are reset to a value every day at a certain time (UTC)"""
+    hour: int
+    minute: int
+    values: dict[str, Any] # column: value
+
+
+# Columns that are reset for all users with one statement by reset_user_columns(). Run by cogs.tasks.
+SCHEDULED_COLUMN_RESETS: tuple[ScheduledColumnReset, ...] = (
+    ScheduledColumnReset(hour=0, minute=0, values={'trade_daily_done': 0}),
+)
+
+
+# User cache
+_USER_CACHE: OrderedDict[int, CachedUser] = OrderedDict()
+# Cache misses that are still loading, per user. Writes and invalidations mark them as stale, so a miss that read
+# the record before the write doesn't replace the newer cache entry.
+_PENDING_USER_LOADS: dict[int, list[PendingUserLoad]] = {}
+_user_cache_hits: int = 0
+_user_cache_misses: int = 0
+
+
+def _cache_user(record: dict[str, Any], user: User) -> None:
+    """Adds or replaces a user in the user cache and evicts the least recently used users if the cache is full.
+    Marks all pending loads of the user as stale."""
+    _mark_pending_user_loads_stale(user.user_id)
+    _USER_CACHE[user.user_id] = CachedUser(cached_at=monotonic(), record=record, user=user)
+    _USER_CACHE.move_to_end(user.user_id)
+    while len(_USER_CACHE) > settings.USER_CACHE_MAX_SIZE:
+        _USER_CACHE.popitem(last=False)
+
+
+def _get_cached_user(user_id: int) -> CachedUser | None:
+    """Returns the cached user if it exists and is not older than USER_CACHE_TTL. Updates the hit/miss counters."""
+    global _user_cache_hits, _user_cache_misses
+    cached_user: CachedUser | None = _USER_CACHE.get(user_id, None)
+    if cached_user is not None and monotonic() - cached_user.cached_at > settings.USER_CACHE_TTL:
+        del _USER_CACHE[user_id]
+        cached_user = None
+    if cached_user is None:
+        _user_cache_misses += 1
+        return None
+    _USER_CACHE.move_to_end(user_id)
+    _user_cache_hits += 1
+    return cached_user
+
+
+def invalidate_user_cache(user_id: int) -> None:
+    """Removes a user from the user cache. Use this after changing the user record (or its alts) outside of User.update()."""
+    _mark_pending_user_loads_stale(user_id)
+    _USER_CACHE.pop(user_id, None)
+
+
+def _start_user_load(user_id: int) -> PendingUserLoad:
+    """Registers a cache miss that starts loading a user"""
+    pending_load: PendingUserLoad = PendingUserLoad()
+    _PENDING_USER_LOADS.setdefault(user_id, []).append(pending_load)
+    return pending_load
+
+
+def _finish_user_load(user_id: int, pending_load: PendingUserLoad) -> None:
+    """Removes a cache miss that finished loading a user"""
+    pending_loads: list[PendingUserLoad] = _PENDING_USER_LOADS.get(user_id, [])
+    if pending_load in pending_loads: pending_loads.remove(pending_load)
+    if not pending_loads: _PENDING_USER_LOADS.pop(user_id, None)
+
+
+def _mark_pending_user_loads_stale(user_id: int) -> None:
+    """Marks all cache misses that are loading a user as stale"""
+    pending_load: PendingUserLoad
+    for pending_load in _PENDING_USER_LOADS.get(user_id, []):
+        pending_load.stale = True
+
+
+def get_user_cache_stats() -> UserCacheStats:
+    """Returns the hit and miss counters and the current size of the user cache."""
+    return UserCacheStats(hits=_user_cache_hits, misses=_user_cache_misses, size=len(_USER_CACHE))
+
+
 # Miscellaneous functions
 async def _dict_to_user(record: dict[str, Any]) -> User:
-    """Creates a User object from a database record
+    """Creates a User object from a database record. The attributes are not decoded here, each attribute is decoded
+    the first time it is accessed (see User.__getattr__). Errors in the record only show up then, as a LookupError.
 
     Arguments
     ---------
@@ -651,290 +959,13 @@ async def _dict_to_user(record: dict[str, Any]) -> User:
     Returns
     -------
     User object.
-
-    Raises
-    ------
-    LookupError if something goes wrong reading the dict. Also logs this error to the database.
     """
-    function_name: str = '_dict_to_user'
-    none_date: datetime = datetime(1970, 1, 1, 0, 0, 0)
-    try:
-        user = User(
-            alert_advent = UserAlert(enabled=bool(record['alert_advent_enabled']),
-                                     message=record['alert_advent_message'],
-                                     multiplier=1.0,
-                                     visible=bool(record['alert_advent_visible'])),
-            alert_adventure = UserAlert(enabled=bool(record['alert_adventure_enabled']),
-                                        message=record['alert_adventure_message'],
-                                        multiplier=float(record['alert_adventure_multiplier']),
-                                        visible=bool(record['alert_adventure_visible'])),
-            alert_arena = UserAlert(enabled=bool(record['alert_arena_enabled']),
-                                    message=record['alert_arena_message'],
-                                    multiplier=1.0,
-                                    visible=bool(record['alert_arena_visible'])),
-            alert_boo = UserAlert(enabled=bool(record['alert_boo_enabled']),
-                                    message=record['alert_boo_message'],
-                                    multiplier=record['alert_boo_multiplier'],
-                                    visible=bool(record['alert_boo_visible'])),
-            alert_boosts = UserAlert(enabled=bool(record['alert_boosts_enabled']),
-                                     message=record['alert_boosts_message'],
-                                     multiplier=1.0,
-                                     visible=bool(record['alert_boosts_visible'])),
-            alert_card_hand = UserAlert(enabled=bool(record['alert_card_hand_enabled']),
-                                        message=record['alert_card_hand_message'],
-                                        multiplier=float(record['alert_card_hand_multiplier']),
-                                        visible=bool(record['alert_card_hand_visible'])),
-            alert_chimney = UserAlert(enabled=bool(record['alert_chimney_enabled']),
-                                      message=record['alert_chimney_message'],
-                                      multiplier=record['alert_chimney_multiplier'],
-                                      visible=bool(record['alert_chimney_visible'])),
-            alert_color_tournament = UserAlert(enabled=bool(record['alert_color_tournament_enabled']),
-                                      message=record['alert_color_tournament_message'],
-                                      multiplier=record['alert_color_tournament_multiplier'],
-                                      visible=bool(record['alert_color_tournament_visible'])),
-            alert_big_arena = UserAlert(enabled=bool(record['alert_big_arena_enabled']),
-                                        message=record['alert_big_arena_message'],
-                                        multiplier=1.0,
-                                        visible=bool(record['alert_big_arena_visible'])),
-            alert_cel_dailyquest = UserAlert(enabled=bool(record['alert_cel_dailyquest_enabled']),
-                                             message=record['alert_cel_dailyquest_message'],
-                                             multiplier=1.0,
-                                             visible=bool(record['alert_cel_dailyquest_visible'])),
-            alert_cel_multiply = UserAlert(enabled=bool(record['alert_cel_multiply_enabled']),
-                                           message=record['alert_cel_multiply_message'],
-                                           multiplier=1.0,
-                                           visible=bool(record['alert_cel_multiply_visible'])),
-            alert_cel_sacrifice = UserAlert(enabled=bool(record['alert_cel_sacrifice_enabled']),
-                                           message=record['alert_cel_sacrifice_message'],
-                                           multiplier=1.0,
-                                           visible=bool(record['alert_cel_sacrifice_visible'])),
-            alert_daily = UserAlert(enabled=bool(record['alert_daily_enabled']),
-                                    message=record['alert_daily_message'],
-                                    multiplier=float(record['alert_daily_multiplier']),
-                                    visible=bool(record['alert_daily_visible'])),
-            alert_duel = UserAlert(enabled=bool(record['alert_duel_enabled']),
-                                   message=record['alert_duel_message'],
-                                   multiplier=float(record['alert_duel_multiplier']),
-                                   visible=bool(record['alert_duel_visible'])),
-            alert_dungeon_miniboss = UserAlert(enabled=bool(record['alert_dungeon_miniboss_enabled']),
-                                               message=record['alert_dungeon_miniboss_message'],
-                                               multiplier=1.0,
-                                               visible=bool(record['alert_dungeon_miniboss_visible'])),
-            alert_epic = UserAlert(enabled=bool(record['alert_epic_enabled']),
-                                   message=record['alert_epic_message'],
-                                   multiplier=float(record['alert_epic_multiplier']),
-                                   visible=bool(record['alert_epic_visible'])),
-            alert_epic_shop = UserAlert(enabled=bool(record['alert_epic_shop_enabled']),
-                                        message=record['alert_epic_shop_message'],
-                                        multiplier=1,
-                                        visible=bool(record['alert_epic_shop_visible'])),
-            alert_eternal_present = UserAlert(enabled=bool(record['alert_eternal_present_enabled']),
-                                              message=record['alert_eternal_present_message'],
-                                              multiplier=1.0,
-                                              visible=bool(record['alert_eternal_present_visible'])),
-            alert_eternity_sealing = UserAlert(enabled=bool(record['alert_eternity_sealing_enabled']),
-                                               message=record['alert_eternity_sealing_message'],
-                                               multiplier=1.0,
-                                               visible=False),
-            alert_farm = UserAlert(enabled=bool(record['alert_farm_enabled']),
-                                   message=record['alert_farm_message'],
-                                   multiplier=float(record['alert_farm_multiplier']),
-                                   visible=bool(record['alert_farm_visible'])),
-            alert_guild = UserAlert(enabled=bool(record['alert_guild_enabled']),
-                                   message=record['alert_guild_message'],
-                                   multiplier=1.0,
-                                   visible=bool(record['alert_guild_visible'])),
-            alert_horse_breed = UserAlert(enabled=bool(record['alert_horse_breed_enabled']),
-                                          message=record['alert_horse_breed_message'],
-                                          multiplier=1.0,
-                                          visible=bool(record['alert_horse_breed_visible'])),
-            alert_horse_race = UserAlert(enabled=bool(record['alert_horse_race_enabled']),
-                                         message=record['alert_horse_race_message'],
-                                         multiplier=1.0,
-                                         visible=bool(record['alert_horse_race_visible'])),
-            alert_hunt = UserAlert(enabled=bool(record['alert_hunt_enabled']),
-                                   message=record['alert_hunt_message'],
-                                   multiplier=float(record['alert_hunt_multiplier']),
-                                   visible=bool(record['alert_hunt_visible'])),
-            alert_hunt_partner = UserAlert(enabled=bool(record['alert_hunt_partner_enabled']),
-                                   message=record['alert_hunt_partner_message'],
-                                   multiplier=float(record['alert_hunt_partner_multiplier']),
-                                   visible=bool(record['alert_hunt_partner_visible'])),
-            alert_lootbox = UserAlert(enabled=bool(record['alert_lootbox_enabled']),
-                                      message=record['alert_lootbox_message'],
-                                      multiplier=float(record['alert_lootbox_multiplier']),
-                                      visible=bool(record['alert_lootbox_visible'])),
-            alert_lottery = UserAlert(enabled=bool(record['alert_lottery_enabled']),
-                                      message=record['alert_lottery_message'],
-                                      multiplier=1.0,
-                                      visible=bool(record['alert_lottery_visible'])),
-            alert_love_share = UserAlert(enabled=bool(record['alert_love_share_enabled']),
-                                         message=record['alert_love_share_message'],
-                                         multiplier=1.0,
-                                         visible=bool(record['alert_love_share_visible'])),
-            alert_maintenance = UserAlert(enabled=bool(record['alert_maintenance_enabled']),
-                                          message=record['alert_maintenance_message'],
-                                          multiplier=1.0,
-                                          visible=False),
-            alert_megarace = UserAlert(enabled=bool(record['alert_megarace_enabled']),
-                                       message=record['alert_megarace_message'],
-                                       multiplier=1.0,
-                                       visible=bool(record['alert_megarace_visible'])),
-            alert_minirace = UserAlert(enabled=bool(record['alert_minirace_enabled']),
-                                       message=record['alert_minirace_message'],
-                                       multiplier=1.0,
-                                       visible=bool(record['alert_minirace_visible'])),
-            alert_not_so_mini_boss = UserAlert(enabled=bool(record['alert_not_so_mini_boss_enabled']),
-                                               message=record['alert_not_so_mini_boss_message'],
-                                               multiplier=1.0,
-                                               visible=bool(record['alert_not_so_mini_boss_visible'])),
-            alert_partner = UserAlert(enabled=bool(record['alert_partner_enabled']),
-                                      message=record['alert_partner_message'],
-                                      multiplier=1.0,
-                                      visible=True),
-            alert_pet_tournament = UserAlert(enabled=bool(record['alert_pet_tournament_enabled']),
-                                             message=record['alert_pet_tournament_message'],
-                                             multiplier=1.0,
-                                             visible=bool(record['alert_pet_tournament_visible'])),
-            alert_pets = UserAlert(enabled=bool(record['alert_pets_enabled']),
-                                   message=record['alert_pets_message'],
-                                   multiplier=1.0,
-                                   visible=bool(record['alert_pets_visible'])),
-            alert_produce = UserAlert(enabled=bool(record['alert_produce_enabled']),
-                                      message=record['alert_produce_message'],
-                                      multiplier=float(record['alert_produce_multiplier']),
-                                      visible=bool(record['alert_produce_visible'])),
-            alert_produce_unlocked = bool(record['alert_produce_unlocked']),
-            alert_quest = UserAlert(enabled=bool(record['alert_quest_enabled']),
-                                    message=record['alert_quest_message'],
-                                    multiplier=float(record['alert_quest_multiplier']),
-                                    visible=bool(record['alert_quest_visible'])),
-            alert_surf = UserAlert(enabled=bool(record['alert_surf_enabled']),
-                                    message=record['alert_surf_message'],
-                                    multiplier=float(record['alert_surf_multiplier']),
-                                    visible=bool(record['alert_surf_visible'])),
-            alert_training = UserAlert(enabled=bool(record['alert_training_enabled']),
-                                       message=record['alert_training_message'],
-                                       multiplier=float(record['alert_training_multiplier']),
-                                       visible=bool(record['alert_training_visible'])),
-            alert_vote = UserAlert(enabled=bool(record['alert_vote_enabled']),
-                                   message=record['alert_vote_message'],
-                                   multiplier=1.0,
-                                   visible=bool(record['alert_vote_visible'])),
-            alert_weekly = UserAlert(enabled=bool(record['alert_weekly_enabled']),
-                                    message=record['alert_weekly_message'],
-                                    multiplier=float(record['alert_weekly_multiplier']),
-                                    visible=bool(record['alert_weekly_visible'])),
-            alert_work = UserAlert(enabled=bool(record['alert_work_enabled']),
-                                   message=record['alert_work_message'],
-                                   multiplier=float(record['alert_work_multiplier']),
-                                   visible=bool(record['alert_work_visible'])),
-            alts = record['alts'],
-            ascended = bool(record['ascended']),
-            area_20_cooldowns_enabled = bool(record['area_20_cooldowns_enabled']),
-            auto_flex_enabled = bool(record['auto_flex_enabled']),
-            auto_flex_ping_enabled = bool(record['auto_flex_ping_enabled']),
-            auto_healing_active = bool(record['auto_healing_active']),
-            auto_ready_enabled = bool(record['auto_ready_enabled']),
-            auto_flex_tip_read = bool(record['auto_flex_tip_read']),
-            bot_enabled = bool(record['bot_enabled']),
-            chocolate_box_unlocked = bool(record['chocolate_box_unlocked']),
-            christmas_area_enabled = bool(record['christmas_area_enabled']),
-            cmd_cd_visible = record['cmd_cd_visible'],
-            cmd_inventory_visible = record['cmd_inventory_visible'],
-            cmd_ready_visible = record['cmd_ready_visible'],
-            cmd_slashboard_visible = record['cmd_slashboard_visible'],
-            context_helper_enabled = bool(record['context_helper_enabled']),
-            current_area = -1 if record['current_area'] is None else record['current_area'],
-            dnd_mode_enabled = bool(record['dnd_mode_enabled']),
-            eternal_boosts_tier = record['eternal_boosts_tier'],
-            farm_helper_mode = record['farm_helper_mode'],
-            guild_quest_prompt_active = bool(record['guild_quest_prompt_active']),
-            halloween_helper_enabled = bool(record['halloween_helper_enabled']),
-            hardmode_mode_enabled = bool(record['hardmode_mode_enabled']),
-            heal_warning_enabled = bool(record['heal_warning_enabled']),
-            hunt_end_time = record['hunt_end_time'].replace(tzinfo=timezone.utc),
-            hunt_reminders_combined = bool(record['hunt_reminders_combined']),
-            inventory = UserInventory(bread=(record['inventory_bread']), carrot=(record['inventory_carrot']),
-                                      potato=(record['inventory_potato']),
-                                      present_eternal=(record['inventory_present_eternal']),
-                                      ruby=(record['inventory_ruby']), seed_bread=(record['inventory_seed_bread']),
-                                      seed_carrot=(record['inventory_seed_carrot']),
-                                      seed_potato=(record['inventory_seed_potato'])),
-            last_adventure_mode = '' if record['last_adventure_mode'] is None else record['last_adventure_mode'],
-            last_farm_seed = '' if record['last_farm_seed'] is None else record['last_farm_seed'],
-            last_hunt_mode = '' if record['last_hunt_mode'] is None else record['last_hunt_mode'],
-            last_lootbox = '' if record['last_lootbox'] is None else record['last_lootbox'],
-            last_quest_command = '' if record['last_quest_command'] is None else record['last_quest_command'],
-            last_training_command = record['last_training_command'],
-            last_tt = record['last_tt'] if record['last_tt'] is not None else none_date,
-            last_work_command = '' if record['last_work_command'] is None else record['last_work_command'],
-            megarace_helper_enabled = bool(record['megarace_helper_enabled']),
-            multiplier_management_enabled = bool(record['multiplier_management_enabled']),
-            partner_alert_threshold = record['partner_alert_threshold'],
-            partner_channel_id = record['partner_channel_id'],
-            partner_chocolate_box_unlocked = bool(record['partner_chocolate_box_unlocked']),
-            partner_donor_tier = record['partner_donor_tier'],
-            partner_hunt_end_time = record['partner_hunt_end_time'].replace(tzinfo=timezone.utc),
-            partner_id = record['partner_id'],
-            partner_name = record['partner_name'],
-            partner_pocket_watch_multiplier = float(record['partner_pocket_watch_multiplier']),
-            pet_helper_enabled = record['pet_helper_enabled'],
-            pet_helper_icon_mode = bool(record['pet_helper_icon_mode']),
-            pet_tip_read = bool(record['pet_tip_read']),
-            ping_after_message = bool(record['ping_after_message']),
-            portals_as_embed = bool(record['portals_as_embed']),
-            portals_spacing_enabled = bool(record['portals_spacing_enabled']),
-            potion_dragon_breath_active = bool(record['potion_dragon_breath_active']),
-            potion_flask_active = bool(record['potion_flask_active']),
-            reactions_enabled = bool(record['reactions_enabled']),
-            ready_after_all_commands = bool(record['ready_after_all_commands']),
-            ready_as_embed = bool(record['ready_as_embed']),
-            ready_channel_arena = record['ready_channel_arena'],
-            ready_channel_duel = record['ready_channel_duel'],
-            ready_channel_dungeon = record['ready_channel_dungeon'],
-            ready_channel_horse = record['ready_channel_horse'],
-            ready_embed_color = record['ready_embed_color'],
-            ready_eternity_visible = bool(record['ready_eternity_visible']),
-            ready_other_on_top = bool(record['ready_other_on_top']),
-            ready_pets_claim_active = bool(record['ready_pets_claim_active']),
-            ready_pets_claim_after_every_pet = bool(record['ready_pets_claim_after_every_pet']),
-            ready_ping_user = bool(record['ready_ping_user']),
-            ready_trade_daily_completed_visible = bool(record['ready_trade_daily_completed_visible']),
-            ready_trade_daily_visible = bool(record['ready_trade_daily_visible']),
-            ready_up_next_as_timestamp = bool(record['ready_up_next_as_timestamp']),
-            ready_up_next_show_hidden_reminders = bool(record['ready_up_next_show_hidden_reminders']),
-            ready_up_next_visible = bool(record['ready_up_next_visible']),
-            reminder_channel_id = record['reminder_channel_id'],
-            round_card_active = bool(record['round_card_active']),
-            ruby_counter_button_mode = bool(record['ruby_counter_button_mode']),
-            ruby_counter_enabled = bool(record['ruby_counter_enabled']),
-            slash_mentions_enabled = bool(record['slash_mentions_enabled']),
-            surf_helper_enabled = bool(record['surf_helper_enabled']),
-            time_potion_warning_enabled = bool(record['time_potion_warning_enabled']),
-            time_travel_count = 0 if record['time_travel_count'] is None else record['time_travel_count'],
-            top_hat_unlocked = bool(record['top_hat_unlocked']),
-            tracking_enabled = bool(record['tracking_enabled']),
-            trade_daily_done = record['trade_daily_done'],
-            trade_daily_total = record['trade_daily_total'],
-            training_helper_button_mode = bool(record['training_helper_button_mode']),
-            training_helper_enabled = bool(record['training_helper_enabled']),
-            user_donor_tier = record['user_donor_tier'],
-            user_id = record['user_id'],
-            user_pocket_watch_multiplier = float(record['user_pocket_watch_multiplier']),
-        )
-    except Exception as error:
-        await errors.log_error(
-            strings.INTERNAL_ERROR_DICT_TO_OBJECT.format(function=function_name, record=record)
-        )
-        raise LookupError(error)
-
-    return user
+    return User(record)
 
 
 # Get data
 async def get_user(user_id: int) -> User:
-    """Gets all user settings.
+    """Gets all user settings. Users are served from the user cache if possible.
 
     Returns
     -------
@@ -949,23 +980,33 @@ async def get_user(user_id: int) -> User:
     """
     table: str = 'users'
     function_name: str = 'get_user'
+    cached_user: CachedUser | None = _get_cached_user(user_id)
+    if cached_user is not None:
+        return copy(cached_user.user)
     sql: str = f'SELECT * FROM {table} WHERE user_id=?'
+    pending_load: PendingUserLoad = _start_user_load(user_id)
     try:
-        cur: sqlite3.Cursor = settings.NAVI_DB.cursor()
-        cur.execute(sql, (user_id,))
-        record: Any = cur.fetchone()
-    except sqlite3.Error as error:
-        await errors.log_error(
-            strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
-        )
-        raise
-    if not record:
-        raise exceptions.FirstTimeUserError(f'No user data found in database for user "{user_id}".')
-    record: dict[str, Any] = dict(record)
-    record['alts'] = await alts_db.get_alts(user_id)
+        try:
+            record: Any = await executor.fetch_one(sql, (user_id,))
+        except sqlite3.Error as error:
+            await errors.log_error(
+                strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
+            )
+            raise
+        if not record:
+            raise exceptions.FirstTimeUserError(f'No user data found in database for user "{user_id}".')
+        record: dict[str, Any] = dict(record)
+        record['alts'] = await alts_db.get_alts(user_id)
+    finally:
+        _finish_user_load(user_id, pending_load)
     user: User = await _dict_to_user(record)
+    if pending_load.stale:
+        # The user was written while the record was read, the cache entry of the write is newer
+        cached_user: CachedUser | None = _USER_CACHE.get(user_id, None)
+        return copy(cached_user.user) if cached_user is not None else user
+    _cache_user(record, user)
 
-    return user
+    return copy(user)
 
 
 async def get_all_users() -> tuple[User,...]:
@@ -986,9 +1027,7 @@ async def get_all_users() -> tuple[User,...]:
     function_name: str = 'get_all_users'
     sql: str = f'SELECT * FROM {table}'
     try:
-        cur: sqlite3.Cursor = settings.NAVI_DB.cursor()
-        cur.execute(sql)
-        records: list[Any] = cur.fetchall()
+        records: list[Any] = await executor.fetch_all(sql)
     except sqlite3.Error as error:
         await errors.log_error(
             strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
@@ -1021,9 +1060,7 @@ async def get_user_count() -> int:
     function_name: str = 'get_user_count'
     sql: str = f'SELECT COUNT(user_id) FROM {table}'
     try:
-        cur: sqlite3.Cursor = settings.NAVI_DB.cursor()
-        cur.execute(sql)
-        record: Any = cur.fetchone()
+        record: Any = await executor.fetch_one(sql)
     except sqlite3.Error as error:
         await errors.log_error(
             strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
@@ -1035,9 +1072,46 @@ async def get_user_count() -> int:
     return user_count
 
 
+async def get_registered_user_ids(user_ids: Iterable[int]) -> set[int]:
+    """Checks which of the given users are registered. Users in the user cache are not looked up again, all others
+    are checked with a single query.
+
+    Returns
+    -------
+    Set with the IDs of all registered users: set[int]
+
+    Raises
+    ------
+    sqlite3.Error if something happened within the database. Also logs this error to the log file.
+    """
+    table: str = 'users'
+    function_name: str = 'get_registered_user_ids'
+    registered_user_ids: set[int] = set()
+    unknown_user_ids: list[int] = []
+    user_id: int
+    for user_id in set(user_ids):
+        if user_id in _USER_CACHE:
+            registered_user_ids.add(user_id)
+        else:
+            unknown_user_ids.append(user_id)
+    if not unknown_user_ids: return registered_user_ids
+    sql: str = f'SELECT user_id FROM {table} WHERE user_id IN ({",".join("?" * len(unknown_user_ids))})'
+    try:
+        records: Any = await executor.fetch_all(sql, unknown_user_ids)
+    except sqlite3.Error as error:
+        await errors.log_error(
+            strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
+        )
+        raise
+    registered_user_ids.update(record['user_id'] for record in records)
+
+    return registered_user_ids
+
+
 # Write Data
-async def _update_user(user: User, **updated_settings) -> None:
+async def _update_user(user: User, **updated_settings) -> User:
     """Updates user record. Use User.update() to trigger this function.
+    The updated record is returned by the database and written to the user cache.
     If user_donor_tier is updated and a partner is set, the partner's partner_donor_tier is updated as well.
 
     Arguments
@@ -1281,10 +1355,15 @@ async def _update_user(user: User, **updated_settings) -> None:
         user_donor_tier: int
         user_pocket_watch_multiplier: float
 
+    Returns
+    -------
+    User object with the updated record.
+
     Raises
     ------
     sqlite3.Error if something happened within the database.
     NoArgumentsError if no updated_settings are passed (need to pass at least one)
+    FirstTimeUserError if the user doesn't exist.
     Also logs all errors to the database.
     """
     table: str = 'users'
@@ -1295,22 +1374,72 @@ async def _update_user(user: User, **updated_settings) -> None:
         )
         raise exceptions.NoArgumentsError('You need to specify at least one keyword argument.')
     try:
-        cur: sqlite3.Cursor = settings.NAVI_DB.cursor()
         sql: str = f'UPDATE {table} SET'
         for updated_setting in updated_settings:
             sql = f'{sql} {updated_setting} = :{updated_setting},'
         sql = sql.strip(",")
         updated_settings['user_id'] = user.user_id
-        sql = f'{sql} WHERE user_id = :user_id'
-        cur.execute(sql, updated_settings)
-        if 'user_donor_tier' in updated_settings and user.partner_id is not None:
-            partner: User = await get_user(user.partner_id)
-            await partner.update(partner_donor_tier=updated_settings['user_donor_tier'])
+        sql = f'{sql} WHERE user_id = :user_id RETURNING *'
+        record: Any = await executor.fetch_one(sql, updated_settings, read_only=False)
     except sqlite3.Error as error:
         await errors.log_error(
             strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
         )
         raise
+    if not record:
+        invalidate_user_cache(user.user_id)
+        raise exceptions.FirstTimeUserError(f'No user data found in database for user "{user.user_id}".')
+    record: dict[str, Any] = dict(record)
+    record['alts'] = user.alts
+    updated_user: User = await _dict_to_user(record)
+    _cache_user(record, updated_user)
+    if 'user_donor_tier' in updated_settings and user.partner_id is not None:
+        partner: User = await get_user(user.partner_id)
+        await partner.update(partner_donor_tier=updated_settings['user_donor_tier'])
+
+    return copy(updated_user)
+
+
+async def reset_user_columns(**column_values) -> int:
+    """Sets columns of all users to the given values with a single statement. Only users that actually change are
+    written and removed from the user cache.
+
+    Arguments
+    ---------
+    column_values (column=value)
+
+    Returns
+    -------
+    Amount of updated users: int
+
+    Raises
+    ------
+    sqlite3.Error if something happened within the database.
+    NoArgumentsError if no column_values are passed (need to pass at least one)
+    Also logs all errors to the database.
+    """
+    table: str = 'users'
+    function_name: str = 'reset_user_columns'
+    if not column_values:
+        await errors.log_error(
+            strings.INTERNAL_ERROR_NO_ARGUMENTS.format(table=table, function=function_name)
+        )
+        raise exceptions.NoArgumentsError('You need to specify at least one keyword argument.')
+    sql: str = (
+        f'UPDATE {table} SET {", ".join([f"{column} = :{column}" for column in column_values])} '
+        f'WHERE {" OR ".join([f"{column} IS NOT :{column}" for column in column_values])} RETURNING user_id'
+    )
+    try:
+        records: list[Any] = await executor.fetch_all(sql, column_values, read_only=False)
+    except sqlite3.Error as error:
+        await errors.log_error(
+            strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
+        )
+        raise
+    for record in records:
+        invalidate_user_cache(record['user_id'])
+
+    return len(records)
 
 
 async def insert_user(user_id: int) -> User:
@@ -1342,15 +1471,17 @@ async def insert_user(user_id: int) -> User:
     value: int
     for value in values:
         sql = f'{sql}?,'
-    sql = f'{sql.strip(",")})'
+    sql = f'{sql.strip(",")}) RETURNING *'
     try:
-        cur: sqlite3.Cursor = settings.NAVI_DB.cursor()
-        cur.execute(sql, values)
+        record: Any = await executor.fetch_one(sql, values, read_only=False)
     except sqlite3.Error as error:
         await errors.log_error(
             strings.INTERNAL_ERROR_SQLITE3.format(error=error, table=table, function=function_name, sql=sql)
         )
         raise
-    user: User = await get_user(user_id)
+    record: dict[str, Any] = dict(record)
+    record['alts'] = await alts_db.get_alts(user_id)
+    user: User = await _dict_to_user(record)
+    _cache_user(record, user)
 
-    return user
\ No newline at end of file
+    return copy(user)
\ No newline at end of file
@@ -4,7 +4,7 @@ from argparse import ArgumentError
 from datetime import datetime, timedelta
 from math import ceil, floor
 import re
-from typing import Any, Coroutine
+from typing import Any, Coroutine, Iterable
 
 import discord
 from discord import utils
@@ -15,6 +15,7 @@ from discord.utils import MISSING
 from database import cooldowns, errors, reminders, users
 from database import settings as settings_db
 from resources import emojis, exceptions, logs, settings, strings
+from resources import regex as regex_patterns
 
 # --- Get discord data ---
 async def get_interaction(message: discord.Message) -> discord.MessageInteraction | None:
@@ -96,7 +97,7 @@ async def get_message_from_channel_history(channel: discord.TextChannel, regex:
             if regex is None:
                 return message
             else:
-                message_content: str = re.sub(rf'<@!?{settings.EPIC_RPG_ID}>', '', message.content.lower())
+                message_content: str = regex_patterns.EPIC_RPG_MENTION.sub('', message.content.lower())
                 match: re.Match | None = re.search(regex, message_content)
                 if match: return message
     return None
@@ -148,57 +149,61 @@ async def add_warning_reaction(message: discord.Message) -> None:
 
 
 # --- Regex ---
-async def get_match_from_patterns(patterns: list[str], string: str) -> re.Match | None:
+async def get_match_from_patterns(patterns: Iterable[str | re.Pattern], string: str) -> re.Match | None:
     """Searches a string for a regex patterns out of a list of patterns and returns the first match.
+    Static pattern groups are compiled at import in resources.regex. Patterns that are still strings (e.g. built from
+    player names) are searched case insensitive.
     Returns None if no match is found.
     """
-    pattern: str
+    pattern: str | re.Pattern
     for pattern in patterns:
-        match: re.Match | None = re.search(pattern, string, re.IGNORECASE)
-        if match: break
-    return match
+        if isinstance(pattern, re.Pattern):
+            match: re.Match | None = pattern.search(string)
+        else:
+            match = re.search(pattern, string, re.IGNORECASE)
+        if match: return match
+    return None
 
 
 # --- Get members ---
 async def get_member_by_name(bot: discord.AutoShardedBot, guild: discord.Guild | None, user_name: str) -> list[discord.Member]:
-    """Returns all guild members with the given name
+    """Returns all registered guild members with the given name. Members are looked up in the member name index.
     If no guild member with the name is found, this function searches in all members the bot can see.
     """
+    from cache import members as members_cache
     members: list[discord.Member] = []
     if guild is None: return members
-    for member in guild.members:
-        if await encode_text(member.name) == await encode_text(user_name) and not member.bot:
-            try:
-                await users.get_user(member.id)
-            except exceptions.FirstTimeUserError:
-                continue
-            members.append(member)
+    member_ids: set[int] = await members_cache.get_member_ids(guild, user_name)
+    if member_ids:
+        registered_user_ids: set[int] = await users.get_registered_user_ids(member_ids)
+        members = [guild.get_member(member_id) for member_id in registered_user_ids]
     if not members:
-        for member in bot.get_all_members():
-            if await encode_text(member.name) == await encode_text(user_name) and not member.bot:
-                try:
-                    await users.get_user(member.id)
-                except exceptions.FirstTimeUserError:
-                    continue
-                members.append(member)
-    return members
+        guild_member_ids: dict[int, set[int]] = await members_cache.get_member_ids_in_all_guilds(bot.guilds, user_name)
+        registered_user_ids: set[int] = await users.get_registered_user_ids(
+            member_id for member_ids in guild_member_ids.values() for member_id in member_ids
+        )
+        for guild_id, member_ids in guild_member_ids.items():
+            member_guild: discord.Guild | None = bot.get_guild(guild_id)
+            if member_guild is None: continue
+            members += [member_guild.get_member(member_id) for member_id in member_ids & registered_user_ids]
+    return [member for member in members if member is not None]
 
 
 # --- Time calculations ---
 async def calculate_time_left_from_cooldown(message: discord.Message, user_settings: users.User, activity: str) -> timedelta:
     """Returns the time left for a reminder based on a cooldown."""
     slash_command: bool = True if message.interaction_metadata is not None else False
-    cooldown: cooldowns.Cooldown = await cooldowns.get_cooldown(activity)
+    cooldown_times: cooldowns.CooldownTimes = await cooldowns.get_cooldown_times(activity)
     bot_answer_time: datetime = message.edited_at if message.edited_at else message.created_at
     time_elapsed: timedelta = utils.utcnow() - bot_answer_time
     user_donor_tier: int = 3 if user_settings.user_donor_tier > 3 else user_settings.user_donor_tier
-    actual_cooldown: int = cooldown.actual_cooldown_slash() if slash_command else cooldown.actual_cooldown_mention()
+    actual_cooldown: float = cooldown_times.slash[0] if slash_command else cooldown_times.mention[0]
     activity: str
     if activity in strings.POCKET_WATCH_AFFECTED_ACTIVITIES:
         pocket_watch_multiplier: float = user_settings.user_pocket_watch_multiplier
     else:
         pocket_watch_multiplier: float = 1
-    if cooldown.donor_affected:
+    if cooldown_times.donor_affected:
         time_left_seconds: float = (actual_cooldown
                              * (settings.DONOR_COOLDOWNS[user_donor_tier] - (1 - pocket_watch_multiplier))
                              - floor(time_elapsed.total_seconds()))
@@ -1188,13 +1193,26 @@ async def update_area(user_settings: users.User, new_area: int) -> None:
     await user_settings.update(**updated_settings)
 
 
+_READY_COMMAND_ACTIVITIES: dict[str, tuple[str, ...]] = {} # Seasonal event -> ready command activities
+
+
+async def _reset_ready_command_activities(name: str, value: str) -> None:
+    """Clears the ready command activities when the seasonal event changes"""
+    _READY_COMMAND_ACTIVITIES.clear()
+
+
+settings_db.register_setting_handler('seasonal_event', _reset_ready_command_activities)
+
+
 async def get_ready_command_activities(seasonal_event: str) -> list[str]:
     """
     Returns the currently visible ready command activities according to the currently active seasonal event.
+    The activities are only built once per seasonal event.
 
     Returns:
         list[str]: List of activities
     """
+    if seasonal_event in _READY_COMMAND_ACTIVITIES: return list(_READY_COMMAND_ACTIVITIES[seasonal_event])
 
     activities_commands: list[str] = [
         'adventure',
@@ -1233,5 +1251,6 @@ async def get_ready_command_activities(seasonal_event: str) -> list[str]:
             activities_commands += ['love-share',]
 
     activities_commands.sort()
+    _READY_COMMAND_ACTIVITIES[seasonal_event] = tuple(activities_commands)
     
     return activities_commands
\ No newline at end of file
@@ -1,15 +1,458 @@
 # regex.py
 
 import re
+from typing import Iterable
+
+from resources import settings, strings
+
+
+def compile_patterns(patterns: Iterable[str], flags: int = re.IGNORECASE) -> tuple[re.Pattern, ...]:
+    """Returns the compiled patterns of a pattern group. Used for the pattern groups below, so they are compiled
+    once at import.
+    """
+    return tuple(re.compile(pattern, flags) for pattern in patterns)
 
-from resources import strings
 
 # --- Cooldown timestring ---
-PATTERNS_COOLDOWN_TIMESTRING: tuple[str, ...] = (
+PATTERNS_COOLDOWN_TIMESTRING: tuple[re.Pattern, ...] = compile_patterns((
     r"wait at least \*\*(.+?)\*\*...", #English
     r"espera al menos \*\*(.+?)\*\*...", #Spanish
     r"espere pelo menos \*\*(.+?)\*\*...", #Portuguese
-)
+))
+
+
+# --- Pattern groups ---
+PATTERNS_ADVENTURE_USER_NAME: tuple[re.Pattern, ...] = compile_patterns((
+    r"^\*\*(.+?)\*\* found a", #English
+    r"^\*\*(.+?)\*\* encontr", #Spanish, Portuguese
+))
+
+PATTERNS_ARTIFACTS_POCKET_WATCH: tuple[re.Pattern, ...] = compile_patterns((
+    r'adds a cooldown reduction of ([0-9\.]+)% and doubles', #English
+    r'adds a cooldown reduction of ([0-9\.]+)% and doubles', #TODO: Spanish
+    r'adds a cooldown reduction of ([0-9\.]+)% and doubles', #TODO: Portuguese
+))
+
+PATTERNS_AUTO_FLEX_EPIC_SNOWBALL: tuple[re.Pattern, ...] = compile_patterns((
+    r' \*\*(.+?)\*\* also got (.+?) (.+?) \*\*EPIC snowball\*\*', #English
+))
+
+PATTERNS_AUTO_FLEX_EVENT_ENCHANT: tuple[re.Pattern, ...] = compile_patterns((
+    r'\*\*(.+?)\*\* tries', #English
+))
+
+PATTERNS_AUTO_FLEX_EVENT_FARM: tuple[re.Pattern, ...] = compile_patterns((
+    r'\*\*(.+?)\*\* hits', #English
+))
+
+PATTERNS_AUTO_FLEX_EVENT_FARM_LEVELS: tuple[re.Pattern, ...] = compile_patterns((
+    r'up (\d+?) times', #English
+))
+
+PATTERNS_AUTO_FLEX_EVENT_HEAL: tuple[re.Pattern, ...] = compile_patterns((
+    r'\*\*(.+?)\*\* killed', #English
+))
+
+PATTERNS_AUTO_FLEX_EVENT_LOOTBOX: tuple[re.Pattern, ...] = compile_patterns((
+    r'\*\*(.+?)\*\* uses', #English
+))
+
+PATTERNS_AUTO_FLEX_EVENT_TRAINING: tuple[re.Pattern, ...] = compile_patterns((
+    r"in \*\*(.+?)\*\*'s back", #English
+))
+
+PATTERNS_AUTO_FLEX_EVENT_TRAINING_AMOUNT: tuple[re.Pattern, ...] = compile_patterns((
+    r'became \*\*(\d+?) ', #English
+))
+
+PATTERNS_AUTO_FLEX_FORGE_COOKIE: tuple[re.Pattern, ...] = compile_patterns((
+    r'\*\*(.+?)\*\* press', #English
+))
+
+PATTERNS_AUTO_FLEX_HALLOWEEN_LOOT: tuple[re.Pattern, ...] = compile_patterns((
+    r" \*\*(.+?)\*\* scared", #English
+    r"scared by \*\*(.+?)\*\*", #English
+))
+
+PATTERNS_AUTO_FLEX_PET_CATCH: tuple[re.Pattern, ...] = compile_patterns((
+    r'\*\*(\w+?)\*\* is now following \*\*(.+?)\*\*!', #English
+))
+
+PATTERNS_AUTO_FLEX_TIME_TRAVEL: tuple[re.Pattern, ...] = compile_patterns((
+    'this will be your time travel #(.+?)\n', #English
+    'esta será sua viagem no tempo #(.+?)$', #Spanish, Portuguese
+))
+
+PATTERNS_AUTO_FLEX_TIME_TRAVEL_PROFILE: tuple[re.Pattern, ...] = compile_patterns((
+    r'time travels\*\*: (.+?)\n', #English
+    r'extra pet slots\*\*: (.+?)\n', #English
+    r'viajes en el tiempo\*\*: (.+?)\n', #Spanish
+    r'espacio adicional para mascotas\*\*: (.+?)\n', #Spanish
+    r'viagem no tempo\*\*: (.+?)\n', #Portuguese
+    r'espaços extras para pets\*\*: (.+?)\n', #Portuguese
+))
+
+PATTERNS_AUTO_FLEX_WORK_LOOT: tuple[re.Pattern, ...] = compile_patterns((
+    r'\?\? \*\*(.+?)\*\* got (.+?) (.+?) (?:__)?\*\*(.+?)(?:\n|__|$)', #English ULTRA log
+    r'!!1 (.+?)\*\* got (.+?) (.+?) (?:__)?\*\*(.+?)(?:\n|__|$)', #English HYPER log
+    r' \*\*(.+?)\*\* got (.+?) (.+?) __\*\*(ultimate log)\*\*__', #English ULTIMATE log
+    r'\*\*(.+?)\*\* also got (.+?) (.+?) \*\*(epic berry)\*\*', #English EPIC berry
+    r'\*\*(.+?)\*\* got (.+?) (.+?) (?:__)?\*\*(.+?)(?:\n|__|$)', #English SUPER fish, watermelon
+    r'\*\*(.+?)\*\* also got (.+?) (.+?) __\*\*(walking normie fish)\*\*__', #English walking normie fish
+    r'\?\? \*\*(.+?)\*\* cons(?:e|i)gui(?:ó|u) (.+?) (.+?) (?:__)?\*\*(.+?)(?:\n|__|$)', #Spanish/Portuguese ULTRA log
+    r'!!1 (.+?)\*\* cons(?:e|i)gui(?:ó|u) (.+?) (.+?) (?:__)?\*\*(.+?)(?:\n|__|$)', #Spanish/Portuguese HYPER log
+    r'\*\*(.+?)\*\* cons(?:e|i)gui(?:ó|u) (.+?) (.+?) (?:__)?\*\*(.+?)(?:\n|__|$)', #Spanish/Portuguese ULTIMATE log, SUPER fish, watermelon
+))
+
+PATTERNS_AUTO_FLEX_XMAS_CHIMNEY: tuple[re.Pattern, ...] = compile_patterns((
+    r'\*\*(.+?)\*\*\ went', #English
+))
+
+PATTERNS_AUTO_FLEX_XMAS_LOOT: tuple[re.Pattern, ...] = compile_patterns((
+    r'\*\*(.+?)\*\* got (.+?) (.+?) (\bgodly\b \bpresent\b|\bvoid\b \bpresent\b|\beternal\b \bpresent\b|\bepic\b \bsnowball\b)', #English
+    r'\*\*(.+?)\*\*\ went.+?found (.+?) (.+?) \*\*(\bgodly\b \bpresent\b|\bvoid\b \bpresent\b|\beternal\b \bpresent\b)\*\*', #English godly and void present, chimney
+    r'\*\*(.+?)\*\* cons(?:e|i)gui(?:ó|u) (.+?) (.+?) (\bgodly\b \bpresent\b|\bvoid\b \bpresent\b|\beternal\b \bpresent\b|\bepic\b \bsnowball\b)', #Spanish/Portuguese
+    r'\*\*(.+?)\*\* se metió.+encontró (.+?) (.+?) \*\*(\bgodly\b \bpresent\b|\bvoid\b \bpresent\b|\beternal\b \bpresent\b|\bepic\b \bsnowball\b)\*\*', #Spanish/Portuguese, chimney
+))
+
+PATTERNS_AUTO_FLEX_XMAS_LOOT_EMBED: tuple[re.Pattern, ...] = compile_patterns((
+    r'\*\*(.+?)\*\* got (.+?) (.+?) (\bgodly\b \bpresent\b|\bvoid\b \bpresent\b|\bepic\b \bsnowball\b)', #English
+    r'\*\*(.+?)\*\* cons(?:e|i)gui(?:ó|u) (.+?) (.+?) (\bgodly\b \bpresent\b|\bvoid\b \bpresent\b|\bepic\b \bsnowball\b)', #Spanish/Portuguese
+))
+
+PATTERNS_AUTO_FLEX_XMAS_PRESENTS: tuple[re.Pattern, ...] = compile_patterns((
+    r'\*\*(.+?)\*\* got (.+?) (.+?) (\bgodly\b|\bvoid\b) \bpresent\b', #English godly and void present
+    r'\*\*(.+?)\*\* cons(?:e|i)gui(?:ó|u) (.+?) (.+?) (godly\b|void\b) \bpresent', #Spanish/Portuguese godly and void present
+))
+
+PATTERNS_BOOSTS_EASTERNG_BOOST: tuple[re.Pattern, ...] = compile_patterns((
+    r'the \*\*(.+?)\*\*!', #English
+    r'the \*\*(.+?)\*\*!', #TODO: Spanish
+    r'the \*\*(.+?)\*\*!', #TODO: Portuguese
+))
+
+PATTERNS_BOOSTS_EGG_BLESSING_USER_NAME: tuple[re.Pattern, ...] = compile_patterns((
+    r"blessed \*\*(.+?)\*\*!", #English
+    r"blessed \*\*(.+?)\*\*!", #TODO: Spanish
+    r"blessed \*\*(.+?)\*\*!", #TODO: Portuguese
+))
+
+PATTERNS_CLAN_RAID_ENERGY: tuple[re.Pattern, ...] = compile_patterns((
+    r"earned \*\*(.+?)\*\*", #English
+    r"ganó \*\*(.+?)\*\*", #Spanish
+    r"ganhou \*\*(.+?)\*\*", #Portuguese
+))
+
+PATTERNS_CLAN_RAID_USER_NAME: tuple[re.Pattern, ...] = compile_patterns((
+    r"\*\*(.+?)\*\* throws", #English
+    r"\*\*(.+?)\*\* tiró", #Spanish
+    r"\*\*(.+?)\*\* jogou", #Portuguese
+))
+
+PATTERNS_CLAN_STEALTH: tuple[re.Pattern, ...] = compile_patterns((
+    r"STEALTH\*\*: (.+?)\n", #English
+    r"SIGILO\*\*: (.+?)\n", #Spanish
+    r"FURTIVIDADE\*\*: (.+?)\n", #Portuguese
+))
+
+PATTERNS_COOLDOWNS_ANNIVERSARY_EVENT: tuple[re.Pattern, ...] = compile_patterns((
+    r'anniversary event cooldown reduction\*\*: (\d+?)%',
+    r'reducción de cooldown del evento de aniversario\*\*: (\d+?)%',
+    r'redução do cooldown do evento de aniversário\*\*: (\d+?)%',
+))
+
+PATTERNS_COOLDOWNS_WORK: tuple[re.Pattern, ...] = compile_patterns((
+    r'mine`\*\* \(\*\*(.+?)\*\*',
+    r'pickaxe`\*\* \(\*\*(.+?)\*\*',
+    r'drill`\*\* \(\*\*(.+?)\*\*',
+    r'dynamite`\*\* \(\*\*(.+?)\*\*',
+))
+
+PATTERNS_CURRENT_AREA_MOB_NAME: tuple[re.Pattern, ...] = compile_patterns((
+    r"found and killed (.+?) \*\*(.+?)\*\*(?: \(but| \(way|\n)", #English
+    r"found (the) \*\*(.+?)\*\*(?:, | \(but| \(way|\n)", #English
+    r"found an? (.+?) \*\*(.+?)\*\*", #English
+    r"encontró un (.+?) \*\*(.+?)\*\*(?:, | \(pero| \(mucho|\n)", #Spanish
+    r"encontró y mató (.+?) \*\*(.+?)\*\*(?:, | \(pero| \(mucho|\n)", #Spanish
+    r"encontrou e matou (.+?) \*\*(.+?)\*\*(?:, | \(só| \(muito|\n)", #Portuguese
+    r"encontrou um (.+?) \*\*(.+?)\*\*, mas", #Portuguese
+))
+
+PATTERNS_CURRENT_AREA_USER_NAME_TOGETHER: tuple[re.Pattern, ...] = compile_patterns((
+    r"\*\*(.+?)\*\* and \*\*", #English
+    r"\*\*(.+?)\*\* y \*\*", #Spanish
+    r"\*\*(.+?)\*\* e \*\*", #Portuguese
+))
+
+PATTERNS_EPIC_ITEMS_USER_NAME: tuple[re.Pattern, ...] = compile_patterns((
+    r"^\*\*(.+?)\*\*,", #All languages
+))
+
+PATTERNS_FARM_CROP: tuple[re.Pattern, ...] = compile_patterns((
+    r'give you ([0-9,]+) <.+> (.+?), ', #English, TOP
+    r'regalarte ([0-9,]+) <.+> (.+?), ', #Spanish, TOP
+    r'give you ([0-9,]+) <.+> (.+?), ', #TODO: Portuguese, TOP
+))
+
+PATTERNS_FARM_SEED_RETURNED: tuple[re.Pattern, ...] = compile_patterns((
+    r'also got (\d+?) \*\*(?:.+?) (.+?) ', #English
+    r'también consiguió (\d+?) \*\*(?:.+?) (.+?) ', #Spanish
+    r'também conseguiu(\d+?) \*\*(?:.+?) (.+?) ', #Portuguese
+))
+
+PATTERNS_FARM_USER_NAME: tuple[re.Pattern, ...] = compile_patterns((
+    r"^\*\*(.+?)\*\* plant", #English, Spanish, Portuguese
+))
+
+PATTERNS_FUN_USER_NAME_COOLNESS: tuple[re.Pattern, ...] = compile_patterns((
+    r"\*\*(.+?)\*\* (also )?earned [0-9,]+ <:coolness", #English
+    r"\*\*(.+?)\*\* found", #English 2
+))
+
+PATTERNS_FUN_USER_NAME_LOOTBOX: tuple[re.Pattern, ...] = compile_patterns((
+    r"\*\*(.+?)\*\* uses? ", #English, Portuguese
+))
+
+PATTERNS_HALLOWEEN_ATTACK: tuple[re.Pattern, ...] = compile_patterns((
+    r'(?:attacking you) (?:from )?(?:the )?(\w.+)!', #English
+))
+
+PATTERNS_HALLOWEEN_SCROLL_BOSS: tuple[re.Pattern, ...] = compile_patterns((
+    r'\*\*(.+?)\*\* hits \*\*(.+?)\*\*',
+    r'\*\*(.+?)\*\* has summoned \*\*(.+?)\*\*',
+))
+
+PATTERNS_HALLOWEEN_USER_NAME: tuple[re.Pattern, ...] = compile_patterns((
+    r" \*\*(.+?)\*\* scared", #English
+    r" \*\*(.+?)\*\* failed", #English
+    r" scared by \*\*(.+?)\*\*", #English
+))
+
+PATTERNS_HELPER_FARM_SPECIAL_SEED: tuple[re.Pattern, ...] = compile_patterns((
+    r"\*\*(.+?)\*\* got (\d+) (?:.+?) \*\*(.+?) seed", #English
+    r"\*\*(.+?)\*\* cons[ie]gui[óu] (\d+) (?:.+?) \*\*(.+?) seed", #Spanish & Portuguese
+))
+
+PATTERNS_HELPER_HEAL_HEALTH: tuple[re.Pattern, ...] = compile_patterns((
+    r'lost (.+?) hp, remaining hp is (.+?)/', #English
+    r'(?:perdió|perdiste) (.+?) hp, la hp restante es (.+?)/', #Spanish
+    r'perdeu (.+?) hp, restam (.+?)/', #Spanish
+))
+
+PATTERNS_HELPER_PETS_HAPPINESS: tuple[re.Pattern, ...] = compile_patterns((
+    r'happiness\**: (.+?)\n', #English
+    r'felicidade?\**: (.+?)\n', #Spanish, Portuguese
+))
+
+PATTERNS_HELPER_PETS_HUNGER: tuple[re.Pattern, ...] = compile_patterns((
+    r'hunger\**: (.+?)$', #English
+    r'hambre\**: (.+?)$', #Spanish
+    r'fome\**: (.+?)$', #Portuguese
+))
+
+PATTERNS_HELPER_PETS_USER_NAME: tuple[re.Pattern, ...] = compile_patterns((
+    r"APPROACHING \*\*(.+?)\*\*", #English
+    r"ACERCANDO A \*\*(.+?)\*\*", #Spanish
+    r"APROXIMANDO DE \*\*(.+?)\*\*", #Portuguese
+))
+
+PATTERNS_HELPER_RUBY_TRADE_RUBY_COUNT: tuple[re.Pattern, ...] = compile_patterns((
+    r'more than (.+?) <:ruby', #English
+    r'más de (.+?) <:ruby', #Spanish
+    r'mais de (.+?) <:ruby', #Portuguese
+))
+
+PATTERNS_HELPER_RUBY_WORK_RUBY_COUNT: tuple[re.Pattern, ...] = compile_patterns((
+    r'\*\* got (.+?) <:ruby', #English mine commands
+    r' had (.+?) <:ruby', #English proc pickup commands
+    r'\*\* cons(?:e|i)gui(?:ó|u) (.+?) <:ruby', #Spanish, Portuguese mine commands
+    r'llevaba dentro (.+?) <:ruby', #Spanish proc pickup commands
+    r'deles tinha (.+?) <:ruby', #Portuguese proc pickup commands
+))
+
+PATTERNS_HELPER_RUBY_WORK_USER_NAME: tuple[re.Pattern, ...] = compile_patterns((
+    r'\*\*(.+?)\*\* got', #English
+    r'\*\*(.+?)\*\* cons(?:e|i)gui(?:ó|u)', #Spanish, Portuguese
+))
+
+PATTERNS_HORSE_FESTIVAL_MEGARACE: tuple[re.Pattern, ...] = compile_patterns((
+    r'be there in \*\*(.+?)\*\*', #English
+    r'allí en \*\*(.+?)\*\*', #Spanish
+    r'lá em \*\*(.+?)\*\*', #Portuguese
+))
+
+PATTERNS_HORSE_FESTIVAL_MEGARACE_BOOST_DONE: tuple[re.Pattern, ...] = compile_patterns((
+    r'(?:increased|reduced)__: \*\*(.+?)\*\*', #English
+    r'(?:incrementado|aumentado|reducido)__: \*\*(.+?)\*\*', #Spanish, increased one UNCONFIRMED
+    r'(?:incrementado|aumentado|reduzido)__: \*\*(.+?)\*\*', #TODO: Portuguese
+))
+
+PATTERNS_HORSE_FESTIVAL_MEGARACE_OVERVIEW: tuple[re.Pattern, ...] = compile_patterns((
+    r'time remaining\*\*: (.+?)\n', #English
+    r'ti?empo restante\*\*: (.+?)\n', #Spanish, Portuguese
+))
+
+PATTERNS_HORSE_FESTIVAL_MEGARACE_STAGE: tuple[re.Pattern, ...] = compile_patterns((
+    r' \*\*(.+?)\*\* ', #English, Spanish, Portuguese
+))
+
+PATTERNS_HORSE_FESTIVAL_USER_NAME: tuple[re.Pattern, ...] = compile_patterns((
+    r'\*\*(.+?)\*\* rides', #English
+    r'\*\*(.+?)\*\* viaja', #Spanish, Portuguese
+))
+
+PATTERNS_HORSE_RACE_NEXT_RACE: tuple[re.Pattern, ...] = compile_patterns((
+    r'next race is in \*\*(.+?)\*\*', #English
+    r'la siguiente carrera es en \*\*(.+?)\*\*', #Spanish
+    r'próxima corrida é em \*\*(.+?)\*\*', #Portuguese
+))
+
+PATTERNS_LOTTERY_BUY: tuple[re.Pattern, ...] = compile_patterns((
+    r'the winner in \*\*(.+?)\*\*', #English
+    r'el ganador en \*\*(.+?)\*\*', #Spanish
+    r'o vencedor em \*\*(.+?)\*\*', #Portuguese
+))
+
+PATTERNS_LOTTERY_NEXT_DRAW: tuple[re.Pattern, ...] = compile_patterns((
+    r'next draw\*\*: (.+?)$', #English
+    r'siguiente ronda\*\*: (.+?)$', #Spanish
+    r'próximo sorteio\*\*: (.+?)$', #Portuguese
+))
+
+PATTERNS_NSMB_BIGARENA_EVENT: tuple[re.Pattern, ...] = compile_patterns((
+        r'in \*\*(.+?)\*\*', #English
+        r'en \*\*(.+?)\*\*', #Spanish
+        r'em \*\*(.+?)\*\*', #Portuguese
+))
+
+PATTERNS_NSMB_BIGARENA_REGISTERED: tuple[re.Pattern, ...] = compile_patterns((
+        r'next event is in \*\*(.+?)\*\*', #English
+        r'siguiente evento es en \*\*(.+?)\*\*', #Spanish
+        r'próximo evento (?:será|é) em \*\*(.+?)\*\*', #Portuguese
+))
+
+PATTERNS_PETS_ADVENTURE_AMOUNT: tuple[re.Pattern, ...] = compile_patterns((
+    r'adventure__\*\*: (\d+?)/\d+\n', #English
+    r'aventura__\*\*: (\d+?)/\d+\n', #Spanish & Portuguese
+))
+
+PATTERNS_PETS_CLAIM_AMOUNT: tuple[re.Pattern, ...] = compile_patterns((
+    r'claim\*\*: (\d+?)/(\d+?)\n', #English
+    r'reclamar\*\*: (\d+?)/(\d+?)\n', #Spanish
+    r'coletar\*\*: (\d+?)/(\d+?)\n', #Portuguese
+))
+
+PATTERNS_PETS_TIME_LEFT_MAX: tuple[re.Pattern, ...] = compile_patterns((
+    r'max time left\*\*: (.+?)$', #English
+    r'tiempo máximo restante\*\*: (.+?)$', #Spanish
+    r'tempo máximo restante\*\*: (.+?)$', #Portuguese
+))
+
+PATTERNS_PETS_TIME_LEFT_MIN: tuple[re.Pattern, ...] = compile_patterns((
+    r'min time left\*\*: (.+?)\n', #English
+    r'tiempo mínimo restante\*\*: (.+?)\n', #Spanish
+    r'tempo restante\*\*: (.+?)\n', #Portuguese
+))
+
+PATTERNS_PETS_TOURNAMENT_NEXT_TOURNAMENT: tuple[re.Pattern, ...] = compile_patterns((
+    r'next pet tournament is in \*\*(.+?)\*\*', #English
+    r'el siguiente torneo es el \*\*(.+?)\*\*', #Spanish
+    r'o próximo torneio é em \*\*(.+?)\*\*', #Portuguese
+))
+
+PATTERNS_PETS_TOURNAMENT_PET_ID: tuple[re.Pattern, ...] = compile_patterns((
+    r'pet id "(.+?)" is registered', #English
+    r'la mascota "(.+?)" está registrada', #Spanish
+    r'de pet "(.+?)" está registrado', #Portuguese
+))
+
+PATTERNS_PRODUCE_USER_NAME: tuple[re.Pattern, ...] = compile_patterns((
+    r"^\*\*(.+?)\*\* is producing", #English
+    r"^\*\*(.+?)\*\* is producing", #Spanish, missing because no slash command
+    r"^\*\*(.+?)\*\* is producing", #Portuguese, missing because no slash command
+))
+
+PATTERNS_PROFILE_TIME_TRAVELS: tuple[re.Pattern, ...] = compile_patterns((
+    r'time travels\*\*: (.+?)(?:$|\n)', #English
+    r'el tiempo\*\*: (.+?)(?:$|\n)', #Spanish
+    r'no tempo\*\*: (.+?)(?:$|\n)', #Portuguese
+))
+
+PATTERNS_SETTINGS_CLAN_LEADER: tuple[re.Pattern, ...] = compile_patterns((
+    r'owner: (.+?)$', #English
+    r'líder: (.+?)$', #Spanish, Portuguese
+))
+
+PATTERNS_SETTINGS_CLAN_NAME: tuple[re.Pattern, ...] = compile_patterns((
+    r'^\*\*(.+?)\*\* members', #English
+    r'^Mi?embros de \*\*(.+?)\*\*', #Spanish, Portuguese
+))
+
+PATTERNS_SLEEPY_POTION_USER_NAME: tuple[re.Pattern, ...] = compile_patterns((
+    r'^\*\*(.+?)\*\* drinks', #English
+    r'^\*\*(.+?)\*\* bebe', #Spanish, Portuguese
+))
+
+PATTERNS_TIME_COOKIE_MINUTES: tuple[re.Pattern, ...] = compile_patterns((
+    r'! (\d+?) minut[eo]s', #English, Spanish, Portuguese
+))
+
+PATTERNS_TIME_COOKIE_USER_NAME: tuple[re.Pattern, ...] = compile_patterns((
+    r'^\*\*(.+?)\*\* eats', #English
+    r'^\*\*(.+?)\*\* come', #Spanish, Portuguese
+))
+
+PATTERNS_USER_NAMES_TOGETHER: tuple[re.Pattern, ...] = compile_patterns((
+    r"\*\*(.+?)\*\* and \*\*(.+?)\*\*", #English
+    r"\*\*(.+?)\*\* y \*\*(.+?)\*\*", #Spanish
+    r"\*\*(.+?)\*\* e \*\*(.+?)\*\*", #Portuguese
+))
+
+PATTERNS_USER_NAME_FOUND: tuple[re.Pattern, ...] = compile_patterns((
+    r"\*\*(.+?)\*\* found a", #English
+    r"\*\*(.+?)\*\* encontr", #Spanish, Portuguese
+))
+
+PATTERNS_USER_NAME_TIME_TRAVEL: tuple[re.Pattern, ...] = compile_patterns((
+    r'\*\*(.+?)\*\* has', #English
+    r'\*\*(.+?)\*\* viajó', #English
+    r'\*\*(.+?)\*\* tempo', #Portuguese
+))
+
+PATTERNS_VOTE_COOLDOWN: tuple[re.Pattern, ...] = compile_patterns((
+    r'cooldown: \*\*(.+?)\*\*', #All languages
+))
+
+PATTERNS_WORK_USER_NAME: tuple[re.Pattern, ...] = compile_patterns((
+    r'[!1] \*\*(.+?)\*\* got', #English 1
+    r'\?\?\?\?\? \*\*(.+?)\*\* got', #English 2
+    r'WOOAAAA!! (.+?)\*\* got', #English 3
+    r'WwWOoOOoOAAa!!!1 (.+?)\*\* got', #English 4
+    r'\.\.\. \*\*(.+?)\*\* got', #English 5
+    r'\*\*(.+?)\*\* got', #English 6
+    r'[!1] \*\*(.+?)\*\* consiguió', #Spanish 1, UNCONFIRMED
+    r'\?\?\?\?\? \*\*(.+?)\*\* consiguió', #Spanish 2, UNCONFIRMED
+    r'WOOAAAA!! (.+?)\*\* consiguió', #Spanish 3, UNCONFIRMED
+    r'WwWOoOOoOAAa!!!1 (.+?)\*\* consiguió', #Spanish 4, UNCONFIRMED
+    r'\.\.\. \*\*(.+?)\*\* consiguió', #Spanish 5, UNCONFIRMED
+    r'\*\*(.+?)\*\* consiguió', #Spanish 6
+    r'[!1] \*\*(.+?)\*\* (?:recebeu|conseguiu)', #Portuguese 1, UNCONFIRMED
+    r'\?\?\?\?\? \*\*(.+?)\*\* (?:recebeu|conseguiu)', #Portuguese 2, UNCONFIRMED
+    r'WOOAAAA!! (.+?)\*\* (?:recebeu|conseguiu)', #Portuguese 3, UNCONFIRMED
+    r'WwWOoOOoOAAa!!!1 (.+?)\*\* (?:recebeu|conseguiu)', #Portuguese 4, UNCONFIRMED
+    r'\.\.\. \*\*(.+?)\*\* (?:recebeu|conseguiu)', #Portuguese 5, UNCONFIRMED
+    r'\*\*(.+?)\*\* (?:recebeu|conseguiu)', #Portuguese 6
+))
+
+PATTERNS_XMAS_ACTIVITIES: tuple[re.Pattern, ...] = compile_patterns((
+    r'reset: (.+?)$', #English
+    r'cooldown\(s\): (.+?)$', #Spanish
+    r'resetados: (.+?)$', #Portuguese
+))
+
+
+# --- Mentions ---
+EPIC_RPG_MENTION: re.Pattern = re.compile(rf"<@!?{settings.EPIC_RPG_ID}>")
 
 
 # --- User data extraction ---
@@ -0,0 +1,266 @@
+# router.py
+"""Contains the registry of the message handlers. Messages are dispatched by cogs.router.
+
+Cogs that react to EPIC RPG messages register their handlers in here instead of adding their own on_message and
+on_message_edit listeners. This way the author check, the edit filter and the parsing of the message only happen
+once per message, and a handler with triggers is only called if at least one of its triggers appears in the message.
+
+Triggers are registered as a dict of trigger IDs and the strings that belong to them. All triggers of all handlers are
+compiled into one Aho-Corasick automaton that finds all of them in a single pass over each part of the message.
+Trigger IDs are shared by all handlers, so prefix them with the name of the cog (e.g. "hunt_cooldown").
+"""
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Iterable, NamedTuple
+
+import discord
+
+from resources import functions
+
+
+MessageHandler = Callable[[discord.Message], Awaitable[None]]
+EditHandler = Callable[[discord.Message, discord.Message], Awaitable[None]]
+
+
+# Containers
+@dataclass()
+class ParsedMessage():
+    """Object that contains the normalized content of a message. Created once per message by the router."""
+    content: str
+    embed_author: str
+    embed_description: str
+    embed_fields: tuple[tuple[str, str], ...]
+    embed_footer: str
+    embed_icon_url: str
+    embed_title: str
+    message: discord.Message
+    matched_triggers: dict[str, frozenset[str]] # Trigger IDs found per part ("content", "title", "field0_value", ...)
+    triggers: frozenset[str] # Trigger IDs found anywhere in the message
+    _interaction_user: discord.User | None = field(default=None, repr=False)
+    _interaction_user_loaded: bool = field(default=False, repr=False)
+
+    async def get_interaction_user(self) -> discord.User | None:
+        """Returns the user that triggered the message with a slash command. The result is only looked up once."""
+        if not self._interaction_user_loaded:
+            self._interaction_user = await functions.get_interaction_user(self.message)
+            self._interaction_user_loaded = True
+        return self._interaction_user
+
+    def matches(self, trigger_id: str, *parts: str) -> bool:
+        """Checks if a trigger appears in the message.
+
+        Arguments
+        ---------
+        trigger_id: ID of the trigger.
+        parts: Parts of the message to check: "author", "content", "description", "footer", "title",
+        "field<n>_name", "field<n>_value" or "fields" for all fields. If no part is given, the whole message is checked.
+        """
+        if not parts: return trigger_id in self.triggers
+        part: str
+        for part in parts:
+            if part == 'fields':
+                if any(trigger_id in triggers for key, triggers in self.matched_triggers.items()
+                       if key.startswith('field')):
+                    return True
+            elif trigger_id in self.matched_triggers.get(part, ()):
+                return True
+        return False
+
+class TriggerMatcher():
+    """Aho-Corasick automaton that finds all trigger strings in a text in a single pass.
+    Matching is case insensitive, the texts passed to find() need to be lowercased already.
+    """
+    def __init__(self, triggers: dict[str, Iterable[str]]) -> None:
+        self._goto: list[dict[str, int]] = [{}]
+        outputs: list[set[str]] = [set()]
+        trigger_id: str
+        for trigger_id, trigger_strings in triggers.items():
+            for trigger_string in trigger_strings:
+                state: int = 0
+                for char in trigger_string.lower():
+                    next_state: int | None = self._goto[state].get(char, None)
+                    if next_state is None:
+                        self._goto.append({})
+                        outputs.append(set())
+                        next_state = len(self._goto) - 1
+                        self._goto[state][char] = next_state
+                    state = next_state
+                if state > 0: outputs[state].add(trigger_id)
+        self._fail: list[int] = [0] * len(self._goto)
+        queue: deque[int] = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail_state: int = self._fail[state]
+                while fail_state and char not in self._goto[fail_state]:
+                    fail_state = self._fail[fail_state]
+                self._fail[next_state] = self._goto[fail_state].get(char, 0) if state else 0
+                outputs[next_state] |= outputs[self._fail[next_state]]
+        self._outputs: list[frozenset[str]] = [frozenset(output) for output in outputs]
+
+    def find(self, text: str) -> frozenset[str]:
+        """Returns the IDs of all triggers that appear in the (lowercased) text."""
+        goto: list[dict[str, int]] = self._goto
+        fail: list[int] = self._fail
+        outputs: list[frozenset[str]] = self._outputs
+        found: set[str] = set()
+        state: int = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if outputs[state]: found.update(outputs[state])
+        return frozenset(found)
+
+class RegisteredHandler(NamedTuple):
+    """Object that represents the message handlers of a cog"""
+    edits: bool
+    name: str
+    on_message: MessageHandler | None
+    on_message_edit: EditHandler | None
+    triggers: dict[str, tuple[str, ...]]
+
+
+_MESSAGE_HANDLERS: dict[str, RegisteredHandler] = {}
+_TRIGGER_INDEX: dict[str, tuple[RegisteredHandler, ...]] = {}
+_TRIGGER_MATCHER: TriggerMatcher = TriggerMatcher({})
+_UNTRIGGERED_HANDLERS: tuple[RegisteredHandler, ...] = ()
+_PARSED_MESSAGES: dict[int, ParsedMessage] = {}
+
+
+# Registry
+def register_message_handler(name: str, on_message: MessageHandler | None = None,
+                             on_message_edit: EditHandler | None = None, edits: bool = True,
+                             triggers: dict[str, Iterable[str]] | None = None) -> None:
+    """Registers the message handlers of a cog. Registering a name again replaces the old handlers.
+
+    Arguments
+    ---------
+    name: Unique name of the handler. Use the qualified name of the cog.
+    on_message: Called with every new message of EPIC RPG that contains one of the triggers.
+    on_message_edit: Called with message_before and message_after for every edited message of EPIC RPG. Replaces the
+    default edit handling and the edit filter of the router.
+    edits: If True and on_message_edit is not set, on_message is also called with message_after for every relevant
+    edit (see cogs.router).
+    triggers: Dict with trigger IDs and their strings. At least one of the strings has to appear in the message for
+    on_message to be called. If None, on_message is called for every message.
+    """
+    triggers = (
+        {trigger_id: tuple(trigger_strings) for trigger_id, trigger_strings in triggers.items()}
+        if triggers is not None else {}
+    )
+    _MESSAGE_HANDLERS[name] = RegisteredHandler(
+        edits = edits,
+        name = name,
+        on_message = on_message,
+        on_message_edit = on_message_edit,
+        triggers = triggers,
+    )
+    _build_trigger_index()
+
+
+def unregister_message_handler(name: str) -> None:
+    """Removes the message handlers of a cog."""
+    _MESSAGE_HANDLERS.pop(name, None)
+    _build_trigger_index()
+
+
+def _build_trigger_index() -> None:
+    """Rebuilds the trigger index and the trigger matcher from the registered handlers"""
+    global _TRIGGER_INDEX, _TRIGGER_MATCHER, _UNTRIGGERED_HANDLERS
+    trigger_index: dict[str, list[RegisteredHandler]] = {}
+    trigger_strings: dict[str, set[str]] = {}
+    untriggered_handlers: list[RegisteredHandler] = []
+    handler: RegisteredHandler
+    for handler in _MESSAGE_HANDLERS.values():
+        for trigger_id, strings in handler.triggers.items():
+            trigger_strings.setdefault(trigger_id, set()).update(strings)
+        if handler.on_message is None: continue
+        if not handler.triggers:
+            untriggered_handlers.append(handler)
+            continue
+        for trigger_id in handler.triggers:
+            trigger_index.setdefault(trigger_id, []).append(handler)
+    _TRIGGER_INDEX = {trigger_id: tuple(handlers) for trigger_id, handlers in trigger_index.items()}
+    _TRIGGER_MATCHER = TriggerMatcher(trigger_strings)
+    _UNTRIGGERED_HANDLERS = tuple(untriggered_handlers)
+
+
+def get_message_handlers(parsed_message: ParsedMessage) -> list[RegisteredHandler]:
+    """Returns all handlers that need to be called for a message, in the order they were registered."""
+    handler_names: set[str] = {handler.name for handler in _UNTRIGGERED_HANDLERS}
+    trigger_id: str
+    for trigger_id in parsed_message.triggers:
+        handler_names.update(handler.name for handler in _TRIGGER_INDEX.get(trigger_id, ()))
+    return [handler for name, handler in _MESSAGE_HANDLERS.items() if name in handler_names]
+
+
+def get_edit_handlers() -> list[RegisteredHandler]:
+    """Returns all handlers that have their own edit handling."""
+    return [handler for handler in _MESSAGE_HANDLERS.values() if handler.on_message_edit is not None]
+
+
+# Parsed messages
+def parse_message(message: discord.Message) -> ParsedMessage:
+    """Parses the content and the first embed of a message into a ParsedMessage."""
+    embed_author = embed_description = embed_footer = embed_icon_url = embed_title = ''
+    embed_fields: tuple[tuple[str, str], ...] = ()
+    if message.embeds:
+        embed: discord.Embed = message.embeds[0]
+        if embed.author:
+            if embed.author.name: embed_author = str(embed.author.name)
+            if embed.author.icon_url: embed_icon_url = str(embed.author.icon_url)
+        if embed.description: embed_description = str(embed.description)
+        if embed.fields:
+            embed_fields = tuple((str(embed_field.name), str(embed_field.value)) for embed_field in embed.fields)
+        if embed.footer and embed.footer.text: embed_footer = str(embed.footer.text)
+        if embed.title: embed_title = str(embed.title)
+    content: str = message.content if message.content is not None else ''
+    parts: dict[str, str] = {
+        'author': embed_author,
+        'content': content,
+        'description': embed_description,
+        'footer': embed_footer,
+        'title': embed_title,
+    }
+    index: int
+    for index, (field_name, field_value) in enumerate(embed_fields):
+        parts[f'field{index}_name'] = field_name
+        parts[f'field{index}_value'] = field_value
+    matched_triggers: dict[str, frozenset[str]] = {
+        part: _TRIGGER_MATCHER.find(text.lower()) for part, text in parts.items() if text
+    }
+    return ParsedMessage(
+        content = content,
+        embed_author = embed_author,
+        embed_description = embed_description,
+        embed_fields = embed_fields,
+        embed_footer = embed_footer,
+        embed_icon_url = embed_icon_url,
+        embed_title = embed_title,
+        matched_triggers = matched_triggers,
+        message = message,
+        triggers = frozenset().union(*matched_triggers.values()),
+    )
+
+
+def get_parsed_message(message: discord.Message) -> ParsedMessage:
+    """Returns the parsed message the router created for the message that is currently dispatched.
+    If the message isn't being dispatched, it is parsed again.
+    """
+    parsed_message: ParsedMessage | None = _PARSED_MESSAGES.get(message.id, None)
+    if parsed_message is None or parsed_message.message is not message: parsed_message = parse_message(message)
+    return parsed_message
+
+
+def add_parsed_message(parsed_message: ParsedMessage) -> None:
+    """Makes a parsed message available to the handlers while it is dispatched."""
+    _PARSED_MESSAGES[parsed_message.message.id] = parsed_message
+
+
+def remove_parsed_message(parsed_message: ParsedMessage) -> None:
+    """Removes a parsed message after it was dispatched."""
+    if _PARSED_MESSAGES.get(parsed_message.message.id, None) is parsed_message:
+        del _PARSED_MESSAGES[parsed_message.message.id]
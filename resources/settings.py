@@ -17,7 +17,7 @@ ENV_VARIABLE_MISSING: Final[str] = (
 )
 
 PYTHON_VERSION: Final[float] = 3.12
-NAVI_DB_VERSION: Final[int] = 31
+NAVI_DB_VERSION: Final[int] = 36
 
 # Files and directories
 BOT_DIR: Final[str] = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -51,7 +51,8 @@ sqlite3.register_converter("date", convert_date)
 sqlite3.register_converter("datetime", convert_datetime)
 
 if os.path.isfile(DB_FILE):
-    NAVI_DB: Final[sqlite3.Connection] = sqlite3.connect(DB_FILE, isolation_level=None, detect_types=sqlite3.PARSE_DECLTYPES)
+    NAVI_DB: Final[sqlite3.Connection] = sqlite3.connect(DB_FILE, isolation_level=None, detect_types=sqlite3.PARSE_DECLTYPES,
+                                                        check_same_thread=False) # Queries run on the thread in database/executor.py
 else:
     print(f'Database {DB_FILE} does not exist. Please follow the setup instructions in the README first.')
     sys.exit()
@@ -166,6 +167,55 @@ if _suggestion_channel_id_env:
 else:
     SUGGESTION_CHANNEL_ID: Final[int | None] = None
 
+# Database connection profile
+def _get_int_env(var: str, default: int) -> int:
+    """Returns a non-negative integer from the .env file or the default if the variable is not set"""
+    value_env: str | None = os.getenv(var)
+    if not value_env: return default
+    try:
+        value: int = int(value_env.strip('" '))
+    except:
+        print(f'Value "{value_env}" of the .env variable {var} is not a number.')
+        sys.exit()
+    if value < 0:
+        print(f'Value "{value_env}" of the .env variable {var} can\'t be negative.')
+        sys.exit()
+    return value
+
+DB_WAL_MODE: Final[bool] = False if os.getenv('DB_WAL_MODE') == 'OFF' else True
+
+_db_synchronous_env: str | None = os.getenv('DB_SYNCHRONOUS')
+if not _db_synchronous_env:
+    DB_SYNCHRONOUS: Final[str] = 'NORMAL'
+elif _db_synchronous_env.strip('" ').upper() in ('OFF', 'NORMAL', 'FULL', 'EXTRA'):
+    DB_SYNCHRONOUS: Final[str] = _db_synchronous_env.strip('" ').upper()
+else:
+    print(f'Value "{_db_synchronous_env}" of the .env variable DB_SYNCHRONOUS has to be OFF, NORMAL, FULL or EXTRA.')
+    sys.exit()
+
+DB_CACHE_SIZE: Final[int] = _get_int_env('DB_CACHE_SIZE', 32) # MB per connection
+DB_MMAP_SIZE: Final[int] = _get_int_env('DB_MMAP_SIZE', 256) # MB
+DB_READ_CONNECTIONS: Final[int] = _get_int_env('DB_READ_CONNECTIONS', 4) if DB_WAL_MODE else 0
+
+DB_PRAGMAS: Final[dict[str, str | int]] = {
+    'journal_mode': 'WAL' if DB_WAL_MODE else 'DELETE',
+    'synchronous': DB_SYNCHRONOUS,
+    'cache_size': -DB_CACHE_SIZE * 1024, # Negative values are KiB
+    'mmap_size': DB_MMAP_SIZE * 1024 * 1024,
+    'temp_store': 'MEMORY',
+}
+
+def apply_db_pragmas(connection: sqlite3.Connection, read_only: bool = False) -> None:
+    """Applies the connection profile in DB_PRAGMAS to a connection.
+    Read only connections don't touch the journal mode and can't write to the database.
+    """
+    for pragma, value in DB_PRAGMAS.items():
+        if read_only and pragma == 'journal_mode': continue
+        connection.execute(f'PRAGMA {pragma} = {value}')
+    if read_only: connection.execute('PRAGMA query_only = ON')
+
+apply_db_pragmas(NAVI_DB)
+
 
 # Read bot version
 _version_file_stream: TextIO = open(_VERSION_FILE, 'r')
@@ -180,6 +230,9 @@ TESTY_ID: Final[int] = 1050765002950332456 # Miriel's test bot to test triggers
 
 INTERACTION_TIMEOUT: Final[int] = 300
 
+USER_CACHE_MAX_SIZE: Final[int] = 10_000 # Maximum amount of users kept in the user cache
+USER_CACHE_TTL: Final[int] = 900 # Time in seconds after which a cached user is read from the database again
+
 class ClanReset(NamedTuple):
     """Clan Reset time. Week starts at monday, UTC"""
     weekday: int = 5
@@ -0,0 +1,108 @@
+# benchmark_ready.py
+"""Benchmark for the embeds of /ready and /list.
+
+Creates a user with 10 command reminders and 5 custom reminders, a partner with an active hunt reminder and a clan
+with an active clan reminder in a temporary database. Then builds embed_ready() and embed_reminders_list() [builds]
+times each and prints the p50 and p99 build times and the database queries per build. Exits with 1 if an embed needs
+more queries than in MAX_QUERIES.
+
+Needs the same environment as the bot (.env and database/navi_db.db), the bot database itself is not touched.
+Usage: python scripts/benchmark_ready.py [builds]
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+from datetime import timedelta
+from time import perf_counter
+from types import SimpleNamespace
+from typing import Any, Awaitable, Callable
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from temp_database import create_database
+
+
+CHANNEL_ID: int = 1
+CLAN_NAME: str = 'Benchmark'
+COMMAND_ACTIVITIES: tuple[str, ...] = (
+    'adventure', 'daily', 'duel', 'farm', 'hunt', 'lootbox', 'quest', 'training', 'weekly', 'work',
+)
+CUSTOM_REMINDER_COUNT: int = 5
+# User, clan and settings come from their caches, the only query left is the reminder snapshot
+MAX_QUERIES: dict[str, int] = {
+    'embed_ready': 1,
+    'embed_reminders_list': 1,
+}
+PARTNER_ID: int = 2
+USER_ID: int = 1
+
+
+async def create_fixture() -> None:
+    """Creates the user, the partner, the clan and their reminders"""
+    from database import clans, reminders, users
+    user_settings: users.User = await users.insert_user(USER_ID)
+    await users.insert_user(PARTNER_ID)
+    await user_settings.update(partner_id=PARTNER_ID, partner_name='Partner', ready_up_next_visible=True)
+    index: int
+    activity: str
+    for index, activity in enumerate(COMMAND_ACTIVITIES):
+        await reminders.insert_user_reminder(USER_ID, activity, timedelta(minutes=10 + index), CHANNEL_ID, activity)
+    for index in range(CUSTOM_REMINDER_COUNT):
+        await reminders.insert_user_reminder(USER_ID, 'custom', timedelta(hours=1), CHANNEL_ID, f'Reminder {index}')
+    await reminders.insert_user_reminder(PARTNER_ID, 'hunt', timedelta(minutes=3), CHANNEL_ID, 'hunt')
+    clan: clans.Clan = await clans.insert_clan(CLAN_NAME, [USER_ID], [USER_ID, PARTNER_ID])
+    await clan.update(alert_enabled=True, channel_id=CHANNEL_ID)
+    await reminders.insert_clan_reminder(CLAN_NAME, timedelta(hours=2), CHANNEL_ID, 'guild')
+
+
+async def run(build_count: int) -> list[str]:
+    """Runs the benchmark and returns the failed checks"""
+    from resources import views # Has to be imported before the content modules, like the cogs do
+    from content import reminders_lists
+    from database import executor
+    failures: list[str] = []
+    await create_fixture()
+    # Stand-ins for the bot and the discord user with the attributes the embeds read
+    bot: Any = SimpleNamespace(application_commands=[])
+    user: Any = SimpleNamespace(id=USER_ID, name='Benchmark', global_name=None, mention=f'<@{USER_ID}>')
+    builds: dict[str, Callable[[], Awaitable[Any]]] = {
+        'embed_ready': lambda: reminders_lists.embed_ready(bot, user, False),
+        'embed_reminders_list': lambda: reminders_lists.embed_reminders_list(bot, user),
+    }
+    label: str
+    build: Callable[[], Awaitable[Any]]
+    for label, build in builds.items():
+        await build()
+        query_count_start: int = executor.get_executor_stats().query_count
+        build_times: list[float] = []
+        for _ in range(build_count):
+            start_time: float = perf_counter()
+            await build()
+            build_times.append((perf_counter() - start_time) * 1000)
+        query_count: float = (executor.get_executor_stats().query_count - query_count_start) / build_count
+        build_times.sort()
+        print(f'{label + ":":<22} p50 {build_times[len(build_times) // 2]:.2f} ms, '
+              f'p99 {build_times[int(len(build_times) * 0.99)]:.2f} ms, {query_count:g} queries per build')
+        if query_count > MAX_QUERIES[label]:
+            failures.append(f'{label} needs {query_count:g} queries per build, the limit is {MAX_QUERIES[label]}')
+    return failures
+
+
+def main() -> int:
+    build_count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    if build_count < 1:
+        print('Needs at least one build.')
+        return 1
+    with tempfile.TemporaryDirectory() as temp_dir:
+        connection = create_database(temp_dir)
+        failures: list[str] = asyncio.run(run(build_count))
+        connection.close()
+    for failure in failures:
+        print(f'FAILED: {failure}')
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
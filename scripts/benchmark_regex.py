@@ -0,0 +1,98 @@
+# benchmark_regex.py
+"""Benchmark for the pattern groups in resources/regex.py.
+
+Times one get_match_from_patterns() lookup of a cooldown message with two ways of getting the patterns:
+- uncompiled: re.search() with the pattern strings, like the cogs did with their inline pattern lists
+- precompiled: a pattern group that is compiled at import (PATTERNS_COOLDOWN_TIMESTRING)
+The uncompiled lookup is also timed with an empty re cache. That is what happens once more than 512 different
+patterns are in use and re starts evicting them.
+
+Then checks that every PATTERNS_* group in resources/regex.py is a tuple of compiled patterns. Exits with 1 if a
+check fails.
+
+Needs the same environment as the bot (.env).
+Usage: python scripts/benchmark_regex.py [runs]
+"""
+
+import os
+import re
+import sys
+from timeit import timeit
+from typing import Callable
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from resources import regex
+
+
+MESSAGE_CONTENT: str = '**Miri**, you have already looked around, wait at least **0h 0m 52s**...'
+MATCH: str = '0h 0m 52s'
+PATTERNS_INLINE: list[str] = [
+    r"wait at least \*\*(.+?)\*\*...", #English
+    r"espera al menos \*\*(.+?)\*\*...", #Spanish
+    r"espere pelo menos \*\*(.+?)\*\*...", #Portuguese
+]
+
+
+def search_uncompiled(patterns: list[str], string: str) -> re.Match | None:
+    """Returns the first match like get_match_from_patterns() does for pattern strings"""
+    pattern: str
+    for pattern in patterns:
+        match: re.Match | None = re.search(pattern, string, re.IGNORECASE)
+        if match: return match
+    return None
+
+
+def search_compiled(patterns: tuple[re.Pattern, ...], string: str) -> re.Match | None:
+    """Returns the first match of a compiled pattern group"""
+    pattern: re.Pattern
+    for pattern in patterns:
+        match: re.Match | None = pattern.search(string)
+        if match: return match
+    return None
+
+
+def get_time_per_call(function: Callable[[], object], runs: int) -> float:
+    """Returns the time of one call in microseconds"""
+    return timeit(function, number=runs) / runs * 1_000_000
+
+
+def main() -> int:
+    runs: int = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    failures: list[str] = []
+
+    lookups: dict[str, Callable[[], re.Match | None]] = {
+        'uncompiled': lambda: search_uncompiled(PATTERNS_INLINE, MESSAGE_CONTENT),
+        'precompiled': lambda: search_compiled(regex.PATTERNS_COOLDOWN_TIMESTRING, MESSAGE_CONTENT),
+    }
+    label: str
+    lookup: Callable[[], re.Match | None]
+    for label, lookup in lookups.items():
+        match: re.Match | None = lookup()
+        if match is None or match.group(1) != MATCH:
+            failures.append(f'{label}: lookup returned {match!r} instead of a match for {MATCH!r}')
+        print(f'{label + ":":<28} {get_time_per_call(lookup, runs):6.2f} us per lookup')
+
+    def search_uncompiled_purged() -> None:
+        re.purge()
+        search_uncompiled(PATTERNS_INLINE, MESSAGE_CONTENT)
+    purge_time: float = get_time_per_call(re.purge, runs // 10)
+    print(f'{"uncompiled, empty re cache:":<28} '
+          f'{get_time_per_call(search_uncompiled_purged, runs // 10) - purge_time:6.2f} us per lookup')
+
+    group_names: list[str] = [name for name in dir(regex) if name.startswith('PATTERNS_')]
+    name: str
+    for name in group_names:
+        patterns: object = getattr(regex, name)
+        if (not isinstance(patterns, tuple) or not patterns
+            or not all(isinstance(pattern, re.Pattern) for pattern in patterns)):
+            failures.append(f'{name} is not a tuple of compiled patterns')
+    print(f'{len(group_names):,} pattern groups compiled at import')
+
+    for failure in failures:
+        print(f'FAILED: {failure}')
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,199 @@
+# benchmark_tracking_report.py
+"""Benchmark for the tracking reports of /stats.
+
+Fills a temporary database with a year of synthetic tracking data: one heavy user with [entries] commands a day and
+[users] other users with 100 commands a day each. The rollups are filled the same way migration 35 backfills them.
+Then times get_log_report() of the heavy user for every /stats timeframe against the old query that summed the raw
+tracking_log rows, and checks that both return the same counts.
+
+Afterwards purges the tracking data of the heavy user with delete_user_tracking_data() and checks that
+get_log_report() returns zeros and that no rows of the user are left in the tracking tables.
+Exits with 1 if a check fails.
+
+Needs the same environment as the bot (.env and database/navi_db.db), the bot database itself is not touched.
+Usage: python scripts/benchmark_tracking_report.py [entries] [users] [runs]
+"""
+
+import asyncio
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from temp_database import create_database
+
+
+COMMANDS: dict[str, str] = {
+    'adventure': 'adventure_amount',
+    'epic guard': 'epic_guard_amount',
+    'farm': 'farm_amount',
+    'hunt': 'hunt_amount',
+    'hunt together': 'hunt_together_amount',
+    'training': 'training_amount',
+    'ultraining': 'ultraining_amount',
+    'work': 'work_amount',
+}
+DAYS: int = 365
+GUILD_ID: int = 1
+HEAVY_USER_ID: int = 1
+OTHER_USER_ENTRIES: int = 100 # Commands per day of each other user
+SQL_OLD_REPORT: str = (
+    'SELECT command, SUM(command_count) FROM tracking_log WHERE user_id=? AND date_time>=? GROUP BY command'
+)
+# Same statements as the backfill of migration 35
+SQLS_BACKFILL_ROLLUPS: tuple[str, ...] = (
+    "INSERT OR IGNORE INTO tracking_log_hourly (user_id, guild_id, command, date_time, command_count) "
+    "SELECT user_id, guild_id, command, strftime('%Y-%m-%d %H:00:00+00:00', date_time), SUM(command_count) "
+    "FROM tracking_log GROUP BY 1, 2, 3, 4",
+    "INSERT OR IGNORE INTO tracking_log_daily (user_id, guild_id, command, date_time, command_count) "
+    "SELECT user_id, guild_id, command, strftime('%Y-%m-%d 00:00:00+00:00', date_time), SUM(command_count) "
+    "FROM tracking_log GROUP BY 1, 2, 3, 4",
+)
+TIMEFRAMES: dict[str, timedelta] = {
+    '1h': timedelta(hours=1),
+    '5h17m': timedelta(hours=5, minutes=17),
+    '12h': timedelta(hours=12),
+    '24h': timedelta(hours=24),
+    '7d': timedelta(days=7),
+    '4w': timedelta(days=28),
+    '1y': timedelta(days=365),
+}
+
+
+def fill_database(connection: sqlite3.Connection, current_time: datetime, entry_count: int,
+                  user_count: int) -> int:
+    """Inserts a year of log entries and fills the rollups
+
+    Returns
+    -------
+    Amount of inserted log entries.
+    """
+    generator: random.Random = random.Random(0)
+    commands: list[str] = list(COMMANDS.keys())
+    # Entries are on whole minutes, see wait_for_minute_start()
+    first_time: datetime = (current_time - timedelta(days=DAYS)).replace(second=0, microsecond=0) + timedelta(minutes=1)
+    minutes_total: int = DAYS * 24 * 60 - 1
+    users: dict[int, int] = {HEAVY_USER_ID: entry_count}
+    users.update({user_id: OTHER_USER_ENTRIES for user_id in range(HEAVY_USER_ID + 1, HEAVY_USER_ID + 1 + user_count)})
+    row_count: int = 0
+    connection.execute('BEGIN')
+    user_id: int
+    entries_per_day: int
+    for user_id, entries_per_day in users.items():
+        rows: list[tuple[int, int, str, int, datetime]] = [
+            (user_id, GUILD_ID, generator.choice(commands), 1,
+             first_time + timedelta(minutes=generator.randint(0, minutes_total)))
+            for _ in range(entries_per_day * DAYS)
+        ]
+        connection.executemany(
+            'INSERT INTO tracking_log (user_id, guild_id, command, command_count, date_time) VALUES (?, ?, ?, ?, ?)',
+            rows
+        )
+        row_count += len(rows)
+    sql: str
+    for sql in SQLS_BACKFILL_ROLLUPS:
+        connection.execute(sql)
+    connection.execute('COMMIT')
+    connection.execute('ANALYZE')
+    return row_count
+
+
+async def wait_for_minute_start() -> None:
+    """Waits until the current minute is less than 50 seconds old. All log entries are on whole minutes, so the start of
+    a timeframe can't pass a log entry during the next 10 seconds and the old query and get_log_report() see the same
+    entries.
+    """
+    from discord import utils
+    second: int = utils.utcnow().second
+    if second >= 50: await asyncio.sleep(61 - second)
+
+
+def get_old_report(connection: sqlite3.Connection, user_id: int, timeframe: timedelta) -> dict[str, int]:
+    """Returns the command counts of a timeframe the way get_log_report() read them before the rollups"""
+    from discord import utils
+    records: list[sqlite3.Row] = connection.execute(
+        SQL_OLD_REPORT, (user_id, utils.utcnow() - timeframe)
+    ).fetchall()
+    return {record[0]: record[1] for record in records}
+
+
+async def run(connection: sqlite3.Connection, entry_count: int, user_count: int, runs: int) -> list[str]:
+    """Runs the benchmark and returns the failed checks"""
+    from discord import utils
+    from database import tracking
+    failures: list[str] = []
+
+    start_time: float = perf_counter()
+    row_count: int = fill_database(connection, utils.utcnow(), entry_count, user_count)
+    print(f'Filled {row_count:,} log entries for {user_count + 1:,} users: {perf_counter() - start_time:,.1f} s')
+    await tracking.rebuild_log_leaderboard(utils.utcnow())
+
+    time_old_total: float = 0
+    time_new_total: float = 0
+    label: str
+    timeframe: timedelta
+    for label, timeframe in TIMEFRAMES.items():
+        start_time = perf_counter()
+        for _ in range(runs):
+            get_old_report(connection, HEAVY_USER_ID, timeframe)
+        time_old: float = (perf_counter() - start_time) / runs
+        start_time = perf_counter()
+        for _ in range(runs):
+            await tracking.get_log_report(HEAVY_USER_ID, timeframe)
+        time_new: float = (perf_counter() - start_time) / runs
+        time_old_total += time_old
+        time_new_total += time_new
+        print(f'{label + " report:":<16} {time_old * 1000:8.1f} ms -> {time_new * 1000:6.1f} ms')
+        await wait_for_minute_start()
+        old_report: dict[str, int] = get_old_report(connection, HEAVY_USER_ID, timeframe)
+        report: tracking.LogReport = await tracking.get_log_report(HEAVY_USER_ID, timeframe)
+        command: str
+        field: str
+        for command, field in COMMANDS.items():
+            if getattr(report, field) != old_report.get(command, 0):
+                failures.append(f'{label} report: {command} is {getattr(report, field):,}, the log has '
+                                f'{old_report.get(command, 0):,}')
+    print(f'{"All timeframes:":<16} {time_old_total * 1000:8.1f} ms -> {time_new_total * 1000:6.1f} ms')
+
+    start_time = perf_counter()
+    await tracking.delete_user_tracking_data(HEAVY_USER_ID)
+    print(f'Purged the tracking data of the heavy user: {(perf_counter() - start_time) * 1000:,.0f} ms')
+    for label, timeframe in TIMEFRAMES.items():
+        report = await tracking.get_log_report(HEAVY_USER_ID, timeframe)
+        counts: dict[str, int] = {command: getattr(report, field) for command, field in COMMANDS.items()}
+        if any(counts.values()):
+            failures.append(f'{label} report after the purge is not empty: {counts}')
+    table: str
+    for table in ('tracking_log', 'tracking_log_hourly', 'tracking_log_daily', 'tracking_leaderboard'):
+        row_count = connection.execute(
+            f'SELECT COUNT(*) FROM {table} WHERE user_id = ?', (HEAVY_USER_ID,)
+        ).fetchone()[0]
+        if row_count: failures.append(f'{table} still has {row_count:,} rows of the heavy user after the purge')
+        row_count = connection.execute(
+            f'SELECT COUNT(*) FROM {table} WHERE user_id != ?', (HEAVY_USER_ID,)
+        ).fetchone()[0]
+        if not row_count: failures.append(f'The purge deleted the rows of the other users in {table}')
+    return failures
+
+
+def main() -> int:
+    entry_count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 3_000
+    user_count: int = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    runs: int = int(sys.argv[3]) if len(sys.argv) > 3 else 5
+    with tempfile.TemporaryDirectory() as temp_dir:
+        connection: sqlite3.Connection = create_database(temp_dir)
+        failures: list[str] = asyncio.run(run(connection, entry_count, user_count, runs))
+        connection.close()
+    for failure in failures:
+        print(f'FAILED: {failure}')
+    if not failures: print('Reports match the log, the purge removed all tracking data of the user.')
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,142 @@
+# benchmark_users.py
+"""Microbenchmark for the construction of User objects in database/users.py.
+
+Creates a user in a temporary database and times the following with its record:
+- _dict_to_user(): building a User, nothing is decoded
+- _dict_to_user() and reading 5 attributes, like most cogs do
+- reading all attributes, like str(), repr() and == do
+- copy() of a User with 5 decoded attributes, which the user cache does for every get_user()
+- get_user() with an empty user cache (two queries) and from the cache with 4 attribute reads
+It also measures the memory per User object with tracemalloc.
+
+Checks that every attribute decodes, that copies compare equal to the original, that decoding one attribute on a copy
+doesn't decode anything else and that updates show up in the next get_user(). Exits with 1 if a check fails.
+
+Needs the same environment as the bot (.env and database/navi_db.db), the bot database itself is not touched.
+Usage: python scripts/benchmark_users.py [runs]
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import tracemalloc
+from copy import copy
+from time import perf_counter
+from typing import Any, Awaitable, Callable
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from temp_database import create_database
+
+
+OBJECT_COUNT: int = 1_000 # Objects kept alive for the memory measurement
+USER_ID: int = 1
+# Attributes most cogs read from a user
+ATTRIBUTES_COMMON: tuple[str, ...] = ('bot_enabled', 'alert_hunt', 'partner_id', 'current_area', 'alts')
+
+
+def read_attributes(user: Any, names: tuple[str, ...]) -> None:
+    """Reads attributes of a user"""
+    name: str
+    for name in names:
+        getattr(user, name)
+
+
+async def get_time_per_call(function: Callable[[], Awaitable[object] | object], runs: int) -> float:
+    """Returns the time of one call in microseconds. Awaits the result if it is a coroutine."""
+    start_time: float = perf_counter()
+    for _ in range(runs):
+        result: Any = function()
+        if asyncio.iscoroutine(result): await result
+    return (perf_counter() - start_time) / runs * 1_000_000
+
+
+async def get_memory_per_object(create: Callable[[], Awaitable[Any]]) -> float:
+    """Returns the traced memory of one object in bytes"""
+    tracemalloc.start()
+    objects: list[Any] = [await create() for _ in range(OBJECT_COUNT)]
+    memory: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return memory / OBJECT_COUNT
+
+
+async def run(runs: int) -> list[str]:
+    """Runs the benchmark and returns the failed checks"""
+    from database import users
+    failures: list[str] = []
+    user_settings: users.User = await users.insert_user(USER_ID)
+    await user_settings.update(partner_id=2, partner_name='Partner', current_area=7, alert_hunt_multiplier=0.5)
+    await users.get_user(USER_ID)
+    record: dict[str, Any] = users._USER_CACHE[USER_ID].record
+    attributes_all: tuple[str, ...] = tuple(users._USER_DECODERS)
+
+    user: users.User = await users._dict_to_user(record)
+    name: str
+    for name in attributes_all:
+        try:
+            getattr(user, name)
+        except LookupError as error:
+            failures.append(f'{name} doesn\'t decode: {error!r}')
+    if copy(user) != user: failures.append('A copy doesn\'t compare equal to the original')
+    user_copy: users.User = copy(await users._dict_to_user(record))
+    user_copy.current_area
+    if user_copy._decoded_names != ['current_area']:
+        failures.append(f'Reading current_area on a copy decoded {user_copy._decoded_names}')
+
+    user_common: users.User = await users._dict_to_user(record)
+    read_attributes(user_common, ATTRIBUTES_COMMON)
+    async def create_and_read_common() -> None:
+        read_attributes(await users._dict_to_user(record), ATTRIBUTES_COMMON)
+    async def create_and_read_all() -> None:
+        read_attributes(await users._dict_to_user(record), attributes_all)
+    async def get_user_uncached() -> None:
+        users.invalidate_user_cache(USER_ID)
+        await users.get_user(USER_ID)
+    async def get_user_cached() -> None:
+        read_attributes(await users.get_user(USER_ID), ATTRIBUTES_COMMON[:4])
+    timings: dict[str, tuple[Callable[[], Any], int]] = {
+        '_dict_to_user()': (lambda: users._dict_to_user(record), runs),
+        f'_dict_to_user() + {len(ATTRIBUTES_COMMON)} attributes': (create_and_read_common, runs),
+        f'_dict_to_user() + all {len(attributes_all)} attributes': (create_and_read_all, runs // 10),
+        f'copy(), {len(ATTRIBUTES_COMMON)} attributes decoded': (lambda: copy(user_common), runs),
+        'get_user(), cache miss': (get_user_uncached, runs // 10),
+        'get_user() + 4 attributes, cache hit': (get_user_cached, runs),
+    }
+    label: str
+    function: Callable[[], Any]
+    call_count: int
+    for label, (function, call_count) in timings.items():
+        print(f'{label + ":":<42} {await get_time_per_call(function, max(call_count, 1)):8.2f} us')
+
+    async def create_user_with_common() -> users.User:
+        new_user: users.User = await users._dict_to_user(record)
+        read_attributes(new_user, ATTRIBUTES_COMMON)
+        return new_user
+    print(f'{"Memory per User, nothing decoded:":<42} '
+          f'{await get_memory_per_object(lambda: users._dict_to_user(record)):8,.0f} B')
+    print(f'{f"Memory per User, {len(ATTRIBUTES_COMMON)} attributes decoded:":<42} '
+          f'{await get_memory_per_object(create_user_with_common):8,.0f} B')
+
+    user_settings = await users.get_user(USER_ID)
+    await user_settings.update(current_area=10, alert_hunt_enabled=False)
+    user_settings = await users.get_user(USER_ID)
+    if user_settings.current_area != 10 or user_settings.alert_hunt.enabled:
+        failures.append('An update didn\'t show up in the next get_user()')
+    return failures
+
+
+def main() -> int:
+    runs: int = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    with tempfile.TemporaryDirectory() as temp_dir:
+        connection = create_database(temp_dir)
+        failures: list[str] = asyncio.run(run(runs))
+        connection.close()
+    for failure in failures:
+        print(f'FAILED: {failure}')
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,218 @@
+# check_query_plans.py
+"""Checks the query plans of all SQL statements in the database modules.
+
+Creates a temporary database from database/default_db.db, updates it to NAVI_DB_VERSION and runs
+EXPLAIN QUERY PLAN for every statement the database modules contain. Exits with 1 if a statement scans a whole
+table and isn't in ALLOWED_SCANS.
+
+Statements are read from the source code. Assignments of string literals and f-strings are followed through each
+function, so f'SELECT * FROM {table} WHERE user_id=?' is checked as "SELECT * FROM users WHERE user_id=?".
+Statements that are built from runtime values (e.g. the SET clauses of the update functions) can't be resolved and
+are listed as skipped.
+
+Needs the same environment as the bot (.env and database/navi_db.db), the bot database itself is not touched.
+Usage: python scripts/check_query_plans.py [-v]
+"""
+
+import ast
+import os
+import re
+import sqlite3
+import sys
+import tempfile
+from typing import Any, Iterator, NamedTuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from resources import settings
+from temp_database import create_database
+
+
+# Statements that are allowed to scan a whole table, by module and function
+ALLOWED_SCANS: dict[tuple[str, str], str] = {
+    ('clans', 'get_weekly_report'): 'Picks a random row of the praises and roasts, both tables are tiny',
+    ('clans', 'load_clan_cache'): 'Loads all clans and members into the clan cache',
+    ('cooldowns', '_get_cooldown_snapshot'): 'Loads all cooldowns into the cooldown snapshot',
+    ('guilds', 'load_guild_cache'): 'Loads all guilds into the guild cache',
+    ('reminders', 'get_active_clan_reminders'): 'One row per clan and activity, read once on startup',
+    ('reminders', 'get_old_clan_reminders'): 'One row per clan and activity, read by the cleanup task',
+    ('settings', '_load_settings'): 'Loads all settings into the settings registry',
+    ('settings', 'update_setting'): 'The settings table only has a handful of rows',
+    ('users', 'get_all_users'): 'Reads all users',
+    ('users', 'get_user_count'): 'Counts all users',
+}
+
+SKIPPED_MODULES: tuple[str, ...] = ('__init__.py', 'executor.py', 'update_database.py')
+BLOCK_FIELDS: tuple[str, ...] = ('body', 'finalbody', 'handlers', 'orelse')
+SQL_KEYWORDS: tuple[str, ...] = ('DELETE ', 'INSERT ', 'REPLACE ', 'SELECT ', 'UPDATE ', 'WITH ')
+
+
+class Statement(NamedTuple):
+    """Object that represents an SQL statement found in a database module"""
+    function: str
+    line: int
+    module: str
+    sql: str
+
+
+def _resolve(node: ast.AST, names: dict[str, str]) -> str | None:
+    """Returns the string value of an expression. Returns None if it depends on anything but known strings."""
+    if isinstance(node, ast.Constant):
+        return node.value if isinstance(node.value, str) else None
+    if isinstance(node, ast.Name):
+        return names.get(node.id, None)
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+        left, right = _resolve(node.left, names), _resolve(node.right, names)
+        return None if left is None or right is None else left + right
+    if isinstance(node, ast.JoinedStr):
+        parts: list[str] = []
+        for value in node.values:
+            if isinstance(value, ast.FormattedValue):
+                if value.conversion != -1 or value.format_spec is not None: return None
+                part: str | None = _resolve(value.value, names)
+            else:
+                part = _resolve(value, names)
+            if part is None: return None
+            parts.append(part)
+        return ''.join(parts)
+    return None
+
+
+def _is_sql(text: str) -> bool:
+    """Checks if a string is an SQL statement"""
+    return text.lstrip().upper().startswith(SQL_KEYWORDS)
+
+
+def _contains_sql(node: ast.AST) -> bool:
+    """Checks if an unresolved expression looks like the start of an SQL statement"""
+    if isinstance(node, ast.JoinedStr) and node.values and isinstance(node.values[0], ast.Constant):
+        return _is_sql(node.values[0].value)
+    return isinstance(node, ast.Constant) and isinstance(node.value, str) and _is_sql(node.value)
+
+
+def _get_statements(module: str, function: str, body: list[ast.stmt], names: dict[str, str],
+                    skipped: list[Statement]) -> Iterator[Statement]:
+    """Follows the string assignments in a block of code and yields all resolved SQL statements"""
+    for node in body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            yield from _get_statements(module, node.name, node.body, dict(names), skipped)
+            continue
+        target: ast.AST | None = None
+        value: ast.AST | None = None
+        if isinstance(node, ast.Assign) and len(node.targets) == 1:
+            target, value = node.targets[0], node.value
+        elif isinstance(node, ast.AnnAssign) and node.value is not None:
+            target, value = node.target, node.value
+        if isinstance(target, ast.Name) and value is not None:
+            text: str | None = _resolve(value, names)
+            if text is None:
+                names.pop(target.id, None)
+                if _contains_sql(value) or (isinstance(value, ast.JoinedStr) and target.id == 'sql'):
+                    skipped.append(Statement(function=function, line=node.lineno, module=module,
+                                             sql=ast.unparse(value)))
+            else:
+                names[target.id] = text
+                if _is_sql(text): yield Statement(function=function, line=node.lineno, module=module, sql=text)
+            continue
+        # Statements passed directly to a call. The blocks of compound statements are handled below.
+        calls: list[ast.Call] = [
+            call for field, child in ast.iter_fields(node) if field not in BLOCK_FIELDS
+            for child_node in (child if isinstance(child, list) else [child]) if isinstance(child_node, ast.AST)
+            for call in ast.walk(child_node) if isinstance(call, ast.Call) and call.args
+        ]
+        for call in calls:
+            if not isinstance(call.args[0], (ast.Constant, ast.JoinedStr)): continue
+            text = _resolve(call.args[0], names)
+            if text is not None and _is_sql(text):
+                yield Statement(function=function, line=call.lineno, module=module, sql=text)
+        if isinstance(node, ast.If):
+            # Only names that have the same value after both branches are known after the if statement
+            body_names: dict[str, str] = dict(names)
+            else_names: dict[str, str] = dict(names)
+            yield from _get_statements(module, function, node.body, body_names, skipped)
+            yield from _get_statements(module, function, node.orelse, else_names, skipped)
+            names.clear()
+            names.update({name: text for name, text in body_names.items() if else_names.get(name, None) == text})
+            continue
+        for field in ('body', 'orelse', 'finalbody'):
+            yield from _get_statements(module, function, getattr(node, field, []), names, skipped)
+        for handler in getattr(node, 'handlers', []):
+            yield from _get_statements(module, function, handler.body, names, skipped)
+
+
+def get_statements(skipped: list[Statement]) -> list[Statement]:
+    """Returns all SQL statements in the database modules that can be resolved from the source code"""
+    database_dir: str = os.path.join(settings.BOT_DIR, 'database')
+    statements: list[Statement] = []
+    file_name: str
+    for file_name in sorted(os.listdir(database_dir)):
+        if not file_name.endswith('.py') or file_name in SKIPPED_MODULES: continue
+        with open(os.path.join(database_dir, file_name), encoding='utf-8') as source_file:
+            tree: ast.Module = ast.parse(source_file.read())
+        statements.extend(_get_statements(file_name[:-3], '<module>', tree.body, {}, skipped))
+    return statements
+
+
+def get_parameters(sql: str) -> Any:
+    """Returns placeholder parameters for a statement. The values don't change the query plan."""
+    named_parameters: list[str] = re.findall(r':(\w+)', sql)
+    if named_parameters: return dict.fromkeys(named_parameters)
+    return (None,) * sql.count('?')
+
+
+def main() -> int:
+    verbose: bool = '-v' in sys.argv[1:]
+    skipped: list[Statement] = []
+    statements: list[Statement] = get_statements(skipped)
+    failed: list[tuple[Statement, list[str]]] = []
+    invalid: list[tuple[Statement, str]] = []
+    allowed_count: int = 0
+    checked_count: int = len(statements)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        connection: sqlite3.Connection = create_database(temp_dir)
+        table_names: set[str] = {
+            row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        }
+        statement: Statement
+        for statement in statements:
+            try:
+                plan: list[sqlite3.Row] = connection.execute(
+                    f'EXPLAIN QUERY PLAN {statement.sql}', get_parameters(statement.sql)
+                ).fetchall()
+            except sqlite3.Error as error:
+                if str(error) == 'incomplete input': # Start of a statement that is completed at runtime
+                    skipped.append(statement)
+                    checked_count -= 1
+                else:
+                    invalid.append((statement, str(error)))
+                continue
+            scans: list[str] = [
+                row['detail'] for row in plan
+                if row['detail'].startswith('SCAN ') and row['detail'].split()[1] in table_names
+            ]
+            if not scans: continue
+            if (statement.module, statement.function) in ALLOWED_SCANS:
+                allowed_count += 1
+                continue
+            failed.append((statement, scans))
+        connection.close()
+
+    for statement, scans in failed:
+        print(f'SCAN: database/{statement.module}.py:{statement.line} ({statement.function})\n'
+              f'  {statement.sql}\n  -> {", ".join(scans)}')
+    for statement, error in invalid:
+        print(f'INVALID: database/{statement.module}.py:{statement.line} ({statement.function})\n'
+              f'  {statement.sql}\n  -> {error}')
+    if verbose:
+        for statement in skipped:
+            print(f'SKIPPED: database/{statement.module}.py:{statement.line} ({statement.function})\n'
+                  f'  {statement.sql}')
+    print(
+        f'Checked {checked_count:,} statements: {len(failed):,} table scans, {allowed_count:,} allowed table scans, '
+        f'{len(invalid):,} invalid, {len(skipped):,} skipped (built at runtime).'
+    )
+    return 1 if failed or invalid else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,110 @@
+# stress_custom_reminder_ids.py
+"""Stress test for the allocation of custom reminder IDs.
+
+Runs concurrent insert_user_reminder() calls for custom reminders against a temporary database and checks that the IDs
+of every user are unique and gap-free. Then deletes some reminders and checks that concurrent inserts reuse the freed
+IDs, lowest first. Exits with 1 if a check fails.
+
+Needs the same environment as the bot (.env and database/navi_db.db), the bot database itself is not touched.
+Usage: python scripts/stress_custom_reminder_ids.py [inserts] [users]
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+from datetime import timedelta
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from temp_database import create_database
+
+
+CHANNEL_ID: int = 1
+DELETED_IDS: tuple[int, ...] = (2, 5, 9) # Deleted from the first user before the second round of inserts
+TIME_LEFT: timedelta = timedelta(hours=1)
+
+
+async def get_custom_ids(user_id: int) -> list[int]:
+    """Returns the custom IDs of all custom reminders of a user in the database"""
+    from database import executor
+    records = await executor.fetch_all(
+        'SELECT custom_id FROM reminders_users WHERE user_id = ? AND activity = ? ORDER BY custom_id',
+        (user_id, 'custom'), read_only=False
+    )
+    return [record['custom_id'] for record in records]
+
+
+async def run(insert_count: int, user_count: int) -> list[str]:
+    """Runs the stress test and returns the failed checks"""
+    from database import reminders
+    failures: list[str] = []
+    user_ids: list[int] = [user_id for user_id in range(1, user_count + 1)]
+
+    start_time: float = perf_counter()
+    results = await asyncio.gather(
+        *(reminders.insert_user_reminder(user_ids[index % user_count], 'custom', TIME_LEFT, CHANNEL_ID,
+                                         f'Reminder {index}')
+          for index in range(insert_count)),
+        return_exceptions=True
+    )
+    time_total: float = perf_counter() - start_time
+    errors: list[BaseException] = [result for result in results if isinstance(result, BaseException)]
+    if errors: failures.append(f'{len(errors):,} of {insert_count:,} inserts failed, first error: {errors[0]!r}')
+    print(f'{insert_count:,} concurrent inserts for {user_count:,} users: {time_total * 1000:,.0f} ms '
+          f'({insert_count / time_total:,.0f} inserts/s)')
+
+    user_id: int
+    for user_id in user_ids:
+        expected_count: int = len(range(user_id - 1, insert_count, user_count))
+        returned_ids: list[int] = sorted(
+            result.custom_id for result in results
+            if not isinstance(result, BaseException) and result.user_id == user_id
+        )
+        custom_ids: list[int] = await get_custom_ids(user_id)
+        if custom_ids != list(range(1, expected_count + 1)):
+            failures.append(f'User {user_id}: IDs in the database are not unique and gap-free: {custom_ids}')
+        if returned_ids != custom_ids:
+            failures.append(f'User {user_id}: returned IDs differ from the IDs in the database')
+
+    user_id = user_ids[0]
+    custom_id: int
+    for custom_id in DELETED_IDS:
+        reminder = await reminders.get_user_reminder(user_id, 'custom', custom_id)
+        await reminder.delete()
+    results = await asyncio.gather(
+        *(reminders.insert_user_reminder(user_id, 'custom', TIME_LEFT, CHANNEL_ID, f'Reused {index}')
+          for index in range(len(DELETED_IDS) + 1)),
+        return_exceptions=True
+    )
+    errors = [result for result in results if isinstance(result, BaseException)]
+    if errors: failures.append(f'{len(errors):,} inserts after deleting failed, first error: {errors[0]!r}')
+    expected_count = len(range(0, insert_count, user_count))
+    reused_ids: list[int] = sorted(result.custom_id for result in results if not isinstance(result, BaseException))
+    if reused_ids != sorted(DELETED_IDS) + [expected_count + 1]:
+        failures.append(f'User {user_id}: freed IDs {DELETED_IDS} were not reused lowest first: {reused_ids}')
+    custom_ids = await get_custom_ids(user_id)
+    if custom_ids != list(range(1, expected_count + 2)):
+        failures.append(f'User {user_id}: IDs after reusing are not unique and gap-free: {custom_ids}')
+    return failures
+
+
+def main() -> int:
+    insert_count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    user_count: int = int(sys.argv[2]) if len(sys.argv) > 2 else 2
+    if insert_count < len(DELETED_IDS) * user_count or user_count < 1:
+        print(f'Needs at least {len(DELETED_IDS) * user_count} inserts and one user.')
+        return 1
+    with tempfile.TemporaryDirectory() as temp_dir:
+        connection = create_database(temp_dir)
+        failures: list[str] = asyncio.run(run(insert_count, user_count))
+        connection.close()
+    for failure in failures:
+        print(f'FAILED: {failure}')
+    if not failures: print('IDs are unique and gap-free, freed IDs are reused lowest first.')
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
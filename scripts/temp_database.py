@@ -0,0 +1,40 @@
+# temp_database.py
+"""Creates a temporary database for the scripts in this folder"""
+
+import os
+import shutil
+import sqlite3
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from resources import settings
+
+
+def create_database(temp_dir: str) -> sqlite3.Connection:
+    """Copies the default database into temp_dir, updates it to NAVI_DB_VERSION and makes it the database of the bot
+    modules (settings.NAVI_DB and settings.DB_FILE). The database of the bot itself is not touched.
+
+    Returns
+    -------
+    The write connection of the temporary database.
+
+    Raises
+    ------
+    RuntimeError if the database can't be updated to NAVI_DB_VERSION.
+    """
+    os.mkdir(os.path.join(temp_dir, 'database'))
+    db_file: str = os.path.join(temp_dir, 'database/navi_db.db')
+    shutil.copyfile(os.path.join(settings.BOT_DIR, 'database/default_db.db'), db_file)
+    connection: sqlite3.Connection = sqlite3.connect(db_file, isolation_level=None,
+                                                     detect_types=sqlite3.PARSE_DECLTYPES, check_same_thread=False)
+    connection.row_factory = sqlite3.Row
+    settings.apply_db_pragmas(connection)
+    # update_database writes its backup to BOT_DIR
+    settings.NAVI_DB = connection
+    settings.DB_FILE = db_file
+    settings.BOT_DIR = temp_dir
+    from database import update_database
+    if not update_database.update_database():
+        raise RuntimeError(f'Unable to update the database to version {settings.NAVI_DB_VERSION}.')
+    return connection